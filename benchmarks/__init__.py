@@ -0,0 +1 @@
+"""Benchmarks for the repositories, services and routes against a real Postgres"""
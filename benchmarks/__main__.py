@@ -0,0 +1,168 @@
+"""
+Run the benchmarks against the configured database and store the results as JSON
+
+    python -m benchmarks --wipe --scale tiny
+    python -m benchmarks --wipe --baseline benchmarks/results/<commit>.json
+
+The configured database is emptied and loaded with db.synthetic first, so point
+it at a throwaway Postgres, never one holding data to keep.
+"""
+
+import argparse
+import platform
+import subprocess
+import sys
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+from fastapi.testclient import TestClient
+
+from benchmarks.harness import (
+    Case,
+    Ids,
+    QueryCounter,
+    Result,
+    compare,
+    read_results,
+    run_case,
+    write_results,
+)
+from benchmarks.repositories import repository_cases
+from benchmarks.routes import live_server, route_cases
+from benchmarks.services import service_cases
+from db.instance import async_db, db
+from db.synthetic import SCALES, SyntheticDataset
+from main import app
+
+GROUPS: tuple[str, ...] = ("repositories", "services", "testclient", "server")
+RESULTS_DIRECTORY: Path = Path("benchmarks/results")
+SERVER_VERSION_QUERY: str = "SHOW server_version;"
+
+
+def _commit() -> str:
+    """The commit being measured, marked dirty if the tree has changes"""
+    try:
+        commit = subprocess.run(  # noqa: S603
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(  # noqa: S603
+            ["git", "status", "--porcelain", "--untracked-files=no"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def _run(
+    cases: list[Case], counter: QueryCounter, args: argparse.Namespace
+) -> list[Result]:
+    results = []
+    for case in cases:
+        result = run_case(case, counter, iterations=args.iterations, warmup=args.warmup)
+        print(  # noqa: T201
+            f"{result.group:<13} {result.name:<60} "
+            f"{result.median_ms:>9.3f} ms {result.queries_per_call:>6.2f} q"
+        )
+        results.append(result)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the repositories, services and routes against the configured database",
+    )
+    parser.add_argument(
+        "--wipe",
+        action="store_true",
+        help="confirm the configured database may be emptied and reloaded",
+    )
+    parser.add_argument("--scale", choices=sorted(SCALES), default="tiny")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--groups", nargs="+", choices=GROUPS, default=list(GROUPS))
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="the growth in median time counted as a regression, 0.2 being 20%%",
+    )
+    parser.add_argument(
+        "--no-load",
+        action="store_true",
+        help="benchmark the rows already loaded instead of loading the dataset",
+    )
+    args = parser.parse_args()
+    if not args.wipe:
+        parser.error("--wipe is required: the benchmarks write to the database")
+
+    commit = _commit()
+    output = args.output or RESULTS_DIRECTORY / f"{commit}.json"
+    counter = QueryCounter()
+    db.hooks.append(counter)
+    async_db.hooks.append(counter)
+
+    db.connect()
+    try:
+        if not args.no_load:
+            SyntheticDataset(SCALES[args.scale], seed=args.seed).load(db)
+        ids = Ids.of(db, args.seed)
+        server_version = db.execute(SERVER_VERSION_QUERY, [], prepare=False)[0][
+            "server_version"
+        ]
+        results: list[Result] = []
+        if "repositories" in args.groups:
+            run = uuid.uuid4().hex[:8]
+            results += _run(repository_cases(db, ids, run), counter, args)
+        if "services" in args.groups:
+            results += _run(service_cases(db, ids), counter, args)
+        if "testclient" in args.groups:
+            with TestClient(app) as client:
+                results += _run(route_cases(client, "testclient", ids), counter, args)
+        if "server" in args.groups:
+            with (
+                live_server(app) as base_url,
+                httpx.Client(base_url=base_url) as client,
+            ):
+                results += _run(route_cases(client, "server", ids), counter, args)
+    finally:
+        db.close()
+
+    write_results(
+        output,
+        {
+            "commit": commit,
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "postgres": server_version,
+            "scale": args.scale,
+            "seed": args.seed,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+        },
+        results,
+    )
+    print(f"Wrote {output}")  # noqa: T201
+
+    if args.baseline:
+        regressions = compare(read_results(args.baseline), results, args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")  # noqa: T201
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""Times benchmark cases, counts their queries, and stores and compares the results"""
+
+import json
+import random
+import statistics
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from db.database_connection import DatabaseConnection
+from db.instrumentation import QueryEvent
+
+BATCH: int = 50
+BOUNDS_QUERY: str = "SELECT (SELECT max(user_id) FROM users) AS users, (SELECT max(apiary_id) FROM apiaries) AS apiaries, (SELECT max(hive_id) FROM hives) AS hives, (SELECT max(colony_id) FROM colonies) AS colonies, (SELECT max(queen_id) FROM queens) AS queens, (SELECT max(inspection_id) FROM inspections) AS inspections, (SELECT max(observation_id) FROM observations) AS observations, (SELECT max(action_id) FROM actions) AS actions;"
+
+
+class Ids:
+    """Picks ids of rows loaded before the run, the same ones for the same seed"""
+
+    def __init__(self, bounds: dict[str, int], seed: int) -> None:
+        self.bounds = bounds
+        self.rng = random.Random(seed)  # noqa: S311
+
+    @classmethod
+    def of(cls, db: DatabaseConnection, seed: int) -> "Ids":
+        """Reads the highest id in each table, so every id up to it exists"""
+        results = db.execute(BOUNDS_QUERY, [], prepare=False)
+        bounds = {table: highest or 0 for table, highest in results[0].items()}
+        empty = [table for table, highest in bounds.items() if not highest]
+        if empty:
+            error_message = f"No rows to benchmark against in {empty}"
+            raise ValueError(error_message)
+        return cls(bounds, seed)
+
+    def one(self, table: str) -> int:
+        return self.rng.randint(1, self.bounds[table])
+
+    def many(self, table: str, n: int = BATCH) -> list[int]:
+        return [self.one(table) for _ in range(n)]
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    One operation to time
+
+    call is passed the number of the iteration, counting from 0 across warmup
+    and timed iterations, so a case can work through rows it or an earlier case
+    created: a delete case can remove exactly the rows its create case wrote.
+    """
+
+    group: str
+    name: str
+    call: Callable[[int], object]
+
+
+@dataclass(frozen=True)
+class Result:
+    group: str
+    name: str
+    iterations: int
+    mean_ms: float
+    median_ms: float
+    p95_ms: float
+    max_ms: float
+    ops_per_second: float
+    queries_per_call: float
+
+
+class QueryCounter:
+    """A query hook counting every statement, from any thread"""
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, _event: QueryEvent) -> None:
+        with self._lock:
+            self.count += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.count = 0
+
+
+def crud_cases(
+    group: str,
+    name: str,
+    create: Callable[[int], int],
+    reads: dict[str, Callable[[int], object]],
+    update: Callable[[int, int], object] | None,
+    delete: Callable[[int], object],
+) -> list[Case]:
+    """
+    The cases for one repository or service, in the order they must run
+
+    create returns the id of the row it wrote. update and delete are handed the
+    ids create wrote, one per iteration, so the tables end the run as they began.
+    """
+    created: list[int] = []
+    cases = [Case(group, f"{name}.create", lambda i: created.append(create(i)))]
+    cases += [Case(group, f"{name}.{method}", call) for method, call in reads.items()]
+    if update is not None:
+        cases.append(Case(group, f"{name}.update", lambda i: update(created[i], i)))
+    cases.append(Case(group, f"{name}.delete", lambda i: delete(created[i])))
+    return cases
+
+
+def percentile(timings: list[float], fraction: float) -> float:
+    """The timing below which fraction of sorted timings fall, by nearest rank"""
+    rank = max(round(fraction * len(timings)) - 1, 0)
+    return timings[rank]
+
+
+def run_case(
+    case: Case, counter: QueryCounter, *, iterations: int, warmup: int
+) -> Result:
+    """Call the case warmup times untimed, then iterations times timed"""
+    for i in range(warmup):
+        case.call(i)
+    counter.reset()
+    timings: list[float] = []
+    for i in range(warmup, warmup + iterations):
+        started = time.perf_counter()
+        case.call(i)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    total = sum(timings)
+    return Result(
+        group=case.group,
+        name=case.name,
+        iterations=iterations,
+        mean_ms=total / iterations * 1000,
+        median_ms=statistics.median(timings) * 1000,
+        p95_ms=percentile(timings, 0.95) * 1000,
+        max_ms=timings[-1] * 1000,
+        ops_per_second=iterations / total if total else 0.0,
+        queries_per_call=counter.count / iterations,
+    )
+
+
+def write_results(path: Path, metadata: dict, results: list[Result]) -> None:
+    """Store a run as JSON: its metadata, and one entry per case"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {**metadata, "results": [asdict(result) for result in results]}
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def read_results(path: Path) -> dict[str, dict]:
+    """Load a stored run, keyed by group/name"""
+    document = json.loads(path.read_text())
+    return {
+        f"{result['group']}/{result['name']}": result for result in document["results"]
+    }
+
+
+def compare(
+    baseline: dict[str, dict], results: list[Result], tolerance: float
+) -> list[str]:
+    """
+    Find the cases that got worse than the baseline
+
+    A case regresses if its median time grew by more than tolerance (0.2 is
+    20%), or if it makes more queries per call at all: query counts do not
+    vary from run to run, so any increase is a real change.
+
+    Returns:
+        A line describing each regression
+
+    """
+    regressions: list[str] = []
+    for result in results:
+        key = f"{result.group}/{result.name}"
+        before = baseline.get(key)
+        if before is None:
+            continue
+        if result.queries_per_call > before["queries_per_call"]:
+            regressions.append(
+                f"{key}: {before['queries_per_call']:g} -> {result.queries_per_call:g} queries per call"
+            )
+        if result.median_ms > before["median_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{key}: median {before['median_ms']:.3f} -> {result.median_ms:.3f} ms"
+            )
+    return regressions
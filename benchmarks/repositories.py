@@ -0,0 +1,251 @@
+"""Benchmark cases for every repository's create, read, update and delete methods"""
+
+from datetime import UTC, datetime
+
+from benchmarks.harness import Case, Ids, crud_cases
+from db.database_connection import DatabaseConnection
+from repositories.action import ActionRepository
+from repositories.apiary import ApiaryRepository
+from repositories.colony import ColonyRepository
+from repositories.hive import HiveRepository
+from repositories.inspection import InspectionRepository
+from repositories.note_search import NoteSearchRepository
+from repositories.observation import ObservationRepository
+from repositories.queen import QueenRepository
+from repositories.session import SessionRepository
+from repositories.user import UserRepository
+
+GROUP: str = "repositories"
+PAGE: int = 100
+TIMESTAMP: datetime = datetime(2020, 6, 23, 12, 0, tzinfo=UTC)
+
+
+def _observation(inspection_id: int) -> dict:
+    return {
+        "queenright": True,
+        "queen_cells": 0,
+        "bias": True,
+        "brood_frames": 6,
+        "store_frames": 4,
+        "chalk_brood": False,
+        "foul_brood": False,
+        "varroa_count": 12,
+        "temper": 2,
+        "notes": "Benchmark",
+        "inspection_id": inspection_id,
+    }
+
+
+def repository_cases(db: DatabaseConnection, ids: Ids, run: str) -> list[Case]:
+    """
+    Every repository's cases, against rows loaded by db.synthetic
+
+    Args:
+        db: a connected DatabaseConnection
+        ids: picks the existing rows to read and to hang new rows from
+        run: a token unique to this run, keeping created usernames unique
+
+    """
+    users = UserRepository(db)
+    sessions = SessionRepository(db)
+    apiaries = ApiaryRepository(db)
+    hives = HiveRepository(db)
+    colonies = ColonyRepository(db)
+    queens = QueenRepository(db)
+    inspections = InspectionRepository(db)
+    observations = ObservationRepository(db)
+    actions = ActionRepository(db)
+    notes = NoteSearchRepository(db)
+
+    return [
+        *crud_cases(
+            GROUP,
+            "UserRepository",
+            lambda i: users.create(f"bench{run}n{i}", "hash").user_id,
+            {
+                "find_by_user_id": lambda _: users.find_by_user_id(ids.one("users")),
+                "find_by_ids": lambda _: users.find_by_ids(ids.many("users")),
+                "find_by_username": lambda _: users.find_by_username(
+                    f"user{ids.one('users')}"
+                ),
+                "read_page": lambda _: users.read(limit=PAGE, after=ids.one("users")),
+            },
+            lambda user_id, i: users.update(user_id, f"bench{run}u{i}", "hash"),
+            users.delete,
+        ),
+        *crud_cases(
+            GROUP,
+            "SessionRepository",
+            lambda _: sessions.create(TIMESTAMP, ids.one("users")).session_id,
+            {
+                "find_by_user_id": lambda _: sessions.find_by_user_id(ids.one("users")),
+            },
+            None,
+            sessions.delete_by_session_id,
+        ),
+        *crud_cases(
+            GROUP,
+            "ApiaryRepository",
+            lambda _: apiaries.create("Bench", "Kent", ids.one("users")).apiary_id,
+            {
+                "find_by_apiary_id": lambda _: apiaries.find_by_apiary_id(
+                    ids.one("apiaries")
+                ),
+                "find_by_ids": lambda _: apiaries.find_by_ids(ids.many("apiaries")),
+                "find_by_user_id": lambda _: apiaries.find_by_user_id(ids.one("users")),
+                "read_page": lambda _: apiaries.read(
+                    limit=PAGE, after=ids.one("apiaries")
+                ),
+            },
+            lambda apiary_id, _: apiaries.update(
+                apiary_id, "Benched", "Kent", ids.one("users")
+            ),
+            apiaries.delete,
+        ),
+        *crud_cases(
+            GROUP,
+            "HiveRepository",
+            lambda _: hives.create("Bench", ids.one("apiaries")).hive_id,
+            {
+                "find_by_hive_id": lambda _: hives.find_by_hive_id(ids.one("hives")),
+                "find_by_ids": lambda _: hives.find_by_ids(ids.many("hives")),
+                "find_by_apiary_id": lambda _: hives.find_by_apiary_id(
+                    ids.one("apiaries")
+                ),
+                "read_page": lambda _: hives.read(limit=PAGE, after=ids.one("hives")),
+            },
+            lambda hive_id, _: hives.update(hive_id, "Benched", ids.one("apiaries")),
+            hives.delete,
+        ),
+        *crud_cases(
+            GROUP,
+            "ColonyRepository",
+            lambda _: colonies.create(ids.one("hives")).colony_id,
+            {
+                "find_by_colony_id": lambda _: colonies.find_by_colony_id(
+                    ids.one("colonies")
+                ),
+                "find_by_ids": lambda _: colonies.find_by_ids(ids.many("colonies")),
+                "find_by_hive_id": lambda _: colonies.find_by_hive_id(ids.one("hives")),
+                "find_by_hive_ids": lambda _: colonies.find_by_hive_ids(
+                    ids.many("hives")
+                ),
+                "read_page": lambda _: colonies.read(
+                    limit=PAGE, after=ids.one("colonies")
+                ),
+            },
+            lambda colony_id, _: colonies.update(colony_id, ids.one("hives")),
+            colonies.delete,
+        ),
+        *crud_cases(
+            GROUP,
+            "QueenRepository",
+            lambda _: queens.create(
+                colour="Blue", clipped=True, colony_id=ids.one("colonies")
+            ).queen_id,
+            {
+                "find_by_queen_id": lambda _: queens.find_by_queen_id(
+                    ids.one("queens")
+                ),
+                "find_by_ids": lambda _: queens.find_by_ids(ids.many("queens")),
+                "find_by_colony_id": lambda _: queens.find_by_colony_id(
+                    ids.one("colonies")
+                ),
+                "find_by_colony_ids": lambda _: queens.find_by_colony_ids(
+                    ids.many("colonies")
+                ),
+                "read_page": lambda _: queens.read(limit=PAGE, after=ids.one("queens")),
+            },
+            lambda queen_id, _: queens.update(
+                queen_id=queen_id,
+                colour="Red",
+                clipped=False,
+                colony_id=ids.one("colonies"),
+            ),
+            queens.delete,
+        ),
+        *crud_cases(
+            GROUP,
+            "InspectionRepository",
+            lambda _: inspections.create(
+                inspection_timestamp=TIMESTAMP, colony_id=ids.one("colonies")
+            ).inspection_id,
+            {
+                "find_by_inspection_id": lambda _: inspections.find_by_inspection_id(
+                    ids.one("inspections")
+                ),
+                "find_by_ids": lambda _: inspections.find_by_ids(
+                    ids.many("inspections")
+                ),
+                "find_by_colony_id": lambda _: inspections.find_by_colony_id(
+                    ids.one("colonies")
+                ),
+                "find_latest_by_colony_ids": lambda _: (
+                    inspections.find_latest_by_colony_ids(ids.many("colonies"))
+                ),
+                "read_page": lambda _: inspections.read(
+                    limit=PAGE, after=ids.one("inspections")
+                ),
+            },
+            lambda inspection_id, _: inspections.update(
+                inspection_id, TIMESTAMP, ids.one("colonies")
+            ),
+            inspections.delete,
+        ),
+        *crud_cases(
+            GROUP,
+            "ObservationRepository",
+            lambda _: observations.create(
+                **_observation(ids.one("inspections"))
+            ).observation_id,
+            {
+                "find_by_observation_id": lambda _: (
+                    observations.find_by_observation_id(ids.one("observations"))
+                ),
+                "find_by_ids": lambda _: observations.find_by_ids(
+                    ids.many("observations")
+                ),
+                "find_by_inspection_id": lambda _: (
+                    observations.find_by_inspection_id(ids.one("inspections"))
+                ),
+                "find_by_inspection_ids": lambda _: (
+                    observations.find_by_inspection_ids(ids.many("inspections"))
+                ),
+                "read_page": lambda _: observations.read(
+                    limit=PAGE, after=ids.one("observations")
+                ),
+            },
+            lambda observation_id, _: observations.update(
+                observation_id=observation_id, **_observation(ids.one("inspections"))
+            ),
+            observations.delete,
+        ),
+        *crud_cases(
+            GROUP,
+            "ActionRepository",
+            lambda _: actions.create("Benchmark", ids.one("inspections")).action_id,
+            {
+                "find_by_action_id": lambda _: actions.find_by_action_id(
+                    ids.one("actions")
+                ),
+                "find_by_ids": lambda _: actions.find_by_ids(ids.many("actions")),
+                "find_by_inspection_id": lambda _: actions.find_by_inspection_id(
+                    ids.one("inspections")
+                ),
+                "read_page": lambda _: actions.read(
+                    limit=PAGE, after=ids.one("actions")
+                ),
+            },
+            lambda action_id, _: actions.update(
+                action_id, "Benched", ids.one("inspections")
+            ),
+            actions.delete,
+        ),
+        Case(
+            GROUP,
+            "NoteSearchRepository.search",
+            lambda _: notes.search(
+                "varroa OR syrup", "user_id", ids.one("users"), limit=PAGE + 1
+            ),
+        ),
+    ]
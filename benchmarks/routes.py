@@ -0,0 +1,168 @@
+"""Benchmark cases for routes, end to end through TestClient and a real ASGI server"""
+
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+from benchmarks.harness import BATCH, Case, Ids
+
+GROUP: str = "routes"
+INGEST_BATCH: int = 10
+TIMESTAMP: str = "2020-06-23T12:00:00+00:00"
+STARTUP_TIMEOUT: float = 10.0
+OBSERVATION: dict = {
+    "queenright": True,
+    "queen_cells": 0,
+    "bias": True,
+    "brood_frames": 6,
+    "store_frames": 4,
+    "chalk_brood": False,
+    "foul_brood": False,
+    "varroa_count": 12,
+    "temper": 2,
+    "notes": "Benchmark",
+}
+
+
+def _get(client: httpx.Client, url: str) -> None:
+    """Reads the whole response, failing on anything but success or a 404"""
+    response = client.get(url)
+    if response.status_code != httpx.codes.NOT_FOUND:
+        response.raise_for_status()
+
+
+def _post(client: httpx.Client, url: str, body: object) -> None:
+    client.post(url, json=body).raise_for_status()
+
+
+def route_cases(client: httpx.Client, transport: str, ids: Ids) -> list[Case]:
+    """
+    Reads and writes through the routes, against rows loaded by db.synthetic
+
+    A random parent may have no children, so reads pass on a 404 as well as a
+    200. Writes must succeed, and there are no delete routes to undo them: load
+    the dataset again to start the next run from the same rows.
+
+    Args:
+        client: sends the requests; TestClient, or an httpx.Client on a server
+        transport: names the client in each case, e.g. "testclient"
+        ids: picks the existing rows to read and to hang new rows from
+
+    """
+
+    def case(name: str, call: Callable[[int], object]) -> Case:
+        return Case(GROUP, f"{transport} {name}", call)
+
+    def batch() -> list[dict]:
+        return [
+            {
+                "inspection_timestamp": TIMESTAMP,
+                "colony_id": ids.one("colonies"),
+                "observations": [OBSERVATION],
+                "actions": [{"notes": "Benchmark"}],
+            }
+            for _ in range(INGEST_BATCH)
+        ]
+
+    return [
+        case(
+            "GET /apiaries/{apiary_id}",
+            lambda _: _get(client, f"/apiaries/{ids.one('apiaries')}"),
+        ),
+        case(
+            "GET /apiaries/{apiary_id}/tree",
+            lambda _: _get(client, f"/apiaries/{ids.one('apiaries')}/tree"),
+        ),
+        case(
+            "GET /apiaries/{apiary_id}/hives",
+            lambda _: _get(client, f"/apiaries/{ids.one('apiaries')}/hives"),
+        ),
+        case(
+            f"GET /hives?ids=[{BATCH}]",
+            lambda _: _get(
+                client, "/hives?ids=" + ",".join(map(str, ids.many("hives")))
+            ),
+        ),
+        case(
+            "GET /colonies/{colony_id}/inspections",
+            lambda _: _get(client, f"/colonies/{ids.one('colonies')}/inspections"),
+        ),
+        case(
+            "GET /colonies/{colony_id}/state",
+            lambda _: _get(client, f"/colonies/{ids.one('colonies')}/state"),
+        ),
+        case(
+            "GET /colonies/{colony_id}/health",
+            lambda _: _get(client, f"/colonies/{ids.one('colonies')}/health"),
+        ),
+        case(
+            "GET /search/notes?apiary_id",
+            lambda _: _get(
+                client, f"/search/notes?q=syrup&apiary_id={ids.one('apiaries')}"
+            ),
+        ),
+        case(
+            "POST /hives",
+            lambda _: _post(
+                client, "/hives", {"name": "Bench", "apiary_id": ids.one("apiaries")}
+            ),
+        ),
+        case(
+            "POST /observations",
+            lambda _: _post(
+                client,
+                "/observations",
+                {**OBSERVATION, "inspection_id": ids.one("inspections")},
+            ),
+        ),
+        case(
+            f"POST /inspections/bulk[{INGEST_BATCH}]",
+            lambda _: _post(client, "/inspections/bulk", batch()),
+        ),
+    ]
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+@contextmanager
+def live_server(app: FastAPI) -> Iterator[str]:
+    """
+    Serve app with uvicorn on a free local port, in a background thread
+
+    Runs the app's lifespan like any deployment, so it must not be open in a
+    TestClient at the same time: both would share the app's database pool.
+
+    Yields:
+        The server's base URL
+
+    Raises:
+        RuntimeError: if the server has not started within STARTUP_TIMEOUT seconds.
+
+    """
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            error_message = "The benchmark server did not start"
+            raise RuntimeError(error_message)
+        time.sleep(0.05)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
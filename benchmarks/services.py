@@ -0,0 +1,223 @@
+"""Benchmark cases for service-level writes, validation included"""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from benchmarks.harness import Case, Ids, crud_cases
+from db.database_connection import DatabaseConnection
+from repositories.action import ActionRepository
+from repositories.apiary import ApiaryRepository
+from repositories.colony import ColonyRepository
+from repositories.hive import HiveRepository
+from repositories.inspection import InspectionRepository
+from repositories.observation import ObservationRepository
+from repositories.queen import QueenRepository
+from repositories.user import UserRepository
+from schemas.action import ActionIngest
+from schemas.inspection import InspectionIngest
+from schemas.observation import ObservationIngest
+from services.action import ActionService
+from services.apiary import ApiaryService
+from services.colony import ColonyService
+from services.hive import HiveService
+from services.ingest import IngestService
+from services.inspection import InspectionService
+from services.observation import ObservationService
+from services.queen import QueenService
+
+GROUP: str = "services"
+INGEST_BATCH: int = 10
+TIMESTAMP: datetime = datetime(2020, 6, 23, 12, 0, tzinfo=UTC)
+OBSERVATION: dict = {
+    "queenright": True,
+    "queen_cells": 0,
+    "bias": True,
+    "brood_frames": 6,
+    "store_frames": 4,
+    "chalk_brood": False,
+    "foul_brood": False,
+    "varroa_count": 12,
+    "temper": 2,
+    "notes": "Benchmark",
+}
+
+
+def _rejected(call: Callable[[], object]) -> None:
+    """Runs a write the service must refuse, as it would for a client's bad id"""
+    try:
+        call()
+    except ValueError:
+        return
+    error_message = "The service accepted a write it should have refused"
+    raise AssertionError(error_message)
+
+
+def service_cases(db: DatabaseConnection, ids: Ids) -> list[Case]:
+    """
+    Every service's writes, against rows loaded by db.synthetic
+
+    UserService is left out: bcrypt hashing the password is deliberately slow,
+    and would be all a benchmark of it measured.
+
+    Args:
+        db: a connected DatabaseConnection
+        ids: picks the existing rows to hang new rows from
+
+    """
+    user_repo = UserRepository(db)
+    apiary_repo = ApiaryRepository(db)
+    hive_repo = HiveRepository(db)
+    colony_repo = ColonyRepository(db)
+    queen_repo = QueenRepository(db)
+    inspection_repo = InspectionRepository(db)
+    observation_repo = ObservationRepository(db)
+    action_repo = ActionRepository(db)
+
+    apiaries = ApiaryService(apiary_repo, user_repo)
+    hives = HiveService(hive_repo, apiary_repo)
+    colonies = ColonyService(colony_repo, hive_repo)
+    queens = QueenService(queen_repo, colony_repo)
+    inspections = InspectionService(inspection_repo, colony_repo)
+    observations = ObservationService(observation_repo, inspection_repo)
+    actions = ActionService(action_repo, inspection_repo)
+    ingest = IngestService(
+        db, inspection_repo, observation_repo, action_repo, colony_repo
+    )
+    # No row has an id past the highest loaded, so these parents never exist
+    missing = {table: highest + 1_000_000 for table, highest in ids.bounds.items()}
+
+    def batch() -> list[InspectionIngest]:
+        return [
+            InspectionIngest(
+                inspection_timestamp=TIMESTAMP,
+                colony_id=ids.one("colonies"),
+                observations=[ObservationIngest(**OBSERVATION)],
+                actions=[ActionIngest(notes="Benchmark")],
+            )
+            for _ in range(INGEST_BATCH)
+        ]
+
+    return [
+        *crud_cases(
+            GROUP,
+            "ApiaryService",
+            lambda _: apiaries.create_apiary(
+                "Bench", "Kent", ids.one("users")
+            ).apiary_id,
+            {
+                "create_missing_user": lambda _: _rejected(
+                    lambda: apiaries.create_apiary("Bench", "Kent", missing["users"])
+                ),
+            },
+            lambda apiary_id, _: apiaries.update_apiary(
+                apiary_id, "Benched", "Kent", ids.one("users")
+            ),
+            apiaries.delete_apiary,
+        ),
+        *crud_cases(
+            GROUP,
+            "HiveService",
+            lambda _: hives.create_hive("Bench", ids.one("apiaries")).hive_id,
+            {
+                "create_missing_apiary": lambda _: _rejected(
+                    lambda: hives.create_hive("Bench", missing["apiaries"])
+                ),
+            },
+            lambda hive_id, _: hives.update_hive(
+                hive_id, "Benched", ids.one("apiaries")
+            ),
+            hives.delete_hive,
+        ),
+        *crud_cases(
+            GROUP,
+            "ColonyService",
+            lambda _: colonies.create_colony(ids.one("hives")).colony_id,
+            {
+                "create_missing_hive": lambda _: _rejected(
+                    lambda: colonies.create_colony(missing["hives"])
+                ),
+            },
+            lambda colony_id, _: colonies.update_colony(colony_id, ids.one("hives")),
+            colonies.delete_colony,
+        ),
+        *crud_cases(
+            GROUP,
+            "QueenService",
+            lambda _: queens.create_queen(
+                colour="Blue", clipped=True, colony_id=ids.one("colonies")
+            ).queen_id,
+            {
+                "create_missing_colony": lambda _: _rejected(
+                    lambda: queens.create_queen(
+                        colour="Blue", clipped=True, colony_id=missing["colonies"]
+                    )
+                ),
+            },
+            lambda queen_id, _: queens.update_queen(
+                queen_id=queen_id,
+                colour="Red",
+                clipped=False,
+                colony_id=ids.one("colonies"),
+            ),
+            queens.delete_queen,
+        ),
+        *crud_cases(
+            GROUP,
+            "InspectionService",
+            lambda _: inspections.create_inspection(
+                TIMESTAMP, ids.one("colonies")
+            ).inspection_id,
+            {
+                "create_missing_colony": lambda _: _rejected(
+                    lambda: inspections.create_inspection(
+                        TIMESTAMP, missing["colonies"]
+                    )
+                ),
+            },
+            lambda inspection_id, _: inspections.update_inspection(
+                inspection_id, TIMESTAMP, ids.one("colonies")
+            ),
+            inspections.delete_inspection,
+        ),
+        *crud_cases(
+            GROUP,
+            "ObservationService",
+            lambda _: observations.create_observation(
+                **OBSERVATION, inspection_id=ids.one("inspections")
+            ).observation_id,
+            {
+                "create_missing_inspection": lambda _: _rejected(
+                    lambda: observations.create_observation(
+                        **OBSERVATION, inspection_id=missing["inspections"]
+                    )
+                ),
+            },
+            lambda observation_id, _: observations.update_observation(
+                observation_id=observation_id,
+                **OBSERVATION,
+                inspection_id=ids.one("inspections"),
+            ),
+            observations.delete_observation,
+        ),
+        *crud_cases(
+            GROUP,
+            "ActionService",
+            lambda _: actions.create_action(
+                "Benchmark", ids.one("inspections")
+            ).action_id,
+            {
+                "create_missing_inspection": lambda _: _rejected(
+                    lambda: actions.create_action("Benchmark", missing["inspections"])
+                ),
+            },
+            lambda action_id, _: actions.update_action(
+                action_id, "Benched", ids.one("inspections")
+            ),
+            actions.delete_action,
+        ),
+        Case(
+            GROUP,
+            f"IngestService.ingest_inspections[{INGEST_BATCH}]",
+            lambda _: ingest.ingest_inspections(batch()),
+        ),
+    ]
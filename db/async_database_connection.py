@@ -0,0 +1,402 @@
+"""Uses configuration values to connect to database via psycopg's asyncio interface"""
+
+import time
+from collections.abc import AsyncIterator, Iterable
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from uuid import uuid4
+
+import psycopg
+from psycopg.abc import Query
+from psycopg.errors import ForeignKeyViolation
+from psycopg.rows import AsyncRowFactory, dict_row
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+
+from db.database_configuration import DatabaseConfiguration
+from db.instrumentation import CheckoutHook, QueryHook, emit
+
+
+@dataclass
+class _Scope:
+    """
+    A request_scope() or unit_of_work() block, and the connection it took on its first query
+
+    A block nested in another borrows the outer block's connection. exits holds
+    whatever must be undone as the block ends: the transaction of a unit of
+    work, and returning a connection the block took from the pool itself.
+    """
+
+    transactional: bool = False
+    parent: "_Scope | None" = None
+    connection: psycopg.AsyncConnection | None = None
+    exits: AsyncExitStack = field(default_factory=AsyncExitStack)
+
+
+class AsyncDatabaseConnection:
+    """Asyncio counterpart of DatabaseConnection, always backed by a connection pool"""
+
+    def __init__(self, config: DatabaseConfiguration) -> None:
+        self.db: DatabaseConfiguration = config
+        self.pool: AsyncConnectionPool | None = None
+        # Called with a QueryEvent after every statement, see db.instrumentation
+        self.hooks: list[QueryHook] = []
+        self.checkout_hooks: list[CheckoutHook] = []
+        self._checked_out: ContextVar[psycopg.AsyncConnection | None] = ContextVar(
+            "async_checked_out", default=None
+        )
+        self._scope: ContextVar[_Scope | None] = ContextVar("async_scope", default=None)
+
+    async def connect(self) -> None:
+        """
+        Open a pool of connections to the database
+
+        Waits until the pool holds its minimum number of connections, so the first
+        requests are not left to pay for connection setup. Calling connect() on an
+        already open pool does nothing.
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+
+        """
+        if self.pool and not self.pool.closed:
+            return
+        self.pool = AsyncConnectionPool(
+            conninfo=self.db.url,
+            min_size=self.db.pool_min_size,
+            max_size=self.db.pool_max_size,
+            timeout=self.db.pool_timeout,
+            max_lifetime=self.db.pool_max_lifetime,
+            max_idle=self.db.pool_max_idle,
+            kwargs={
+                "row_factory": dict_row,
+                "autocommit": True,
+                "prepare_threshold": self.db.prepare_threshold,
+            },
+            configure=self._configure,
+            open=False,
+        )
+        try:
+            await self.pool.open(wait=True, timeout=self.db.pool_timeout)
+        except (psycopg.OperationalError, PoolTimeout) as e:
+            await self.pool.close()
+            error_message: str = f"Couldn't connect to {self.db.host}:{self.db.port}/{self.db.dbname}: {e}"
+            raise ConnectionError(error_message) from e
+
+    async def _configure(self, connection: psycopg.AsyncConnection) -> None:
+        connection.prepared_max = self.db.prepared_max
+
+    async def close(self) -> None:
+        """Close every connection in the pool."""
+        if self.pool and not self.pool.closed:
+            await self.pool.close()
+
+    async def ping(self) -> bool:
+        """Returns True if the pool is open and the database answers a trivial query."""
+        if not self.pool or self.pool.closed:
+            return False
+        try:
+            await self.execute("SELECT 1;", [])
+        except (ConnectionError, psycopg.Error):
+            return False
+        return True
+
+    async def _take(self) -> psycopg.AsyncConnection:
+        if not self.pool or self.pool.closed:
+            error_message = (
+                f"No connection to {self.db.host}:{self.db.port}/{self.db.dbname}"
+            )
+            raise ConnectionError(error_message)
+
+        started = time.perf_counter()
+        try:
+            return await self.pool.getconn()
+        except PoolTimeout as e:
+            error_message = f"No free connection to {self.db.host}:{self.db.port}/{self.db.dbname} after {self.db.pool_timeout}s"
+            raise ConnectionError(error_message) from e
+        finally:
+            for hook in self.checkout_hooks:
+                hook(time.perf_counter() - started)
+
+    async def _scope_connection(self, scope: _Scope) -> psycopg.AsyncConnection:
+        if scope.connection is not None:
+            return scope.connection
+        if scope.parent is not None:
+            connection = await self._scope_connection(scope.parent)
+        elif (checked_out := self._checked_out.get()) is not None:
+            connection = checked_out
+        else:
+            connection = await self._take()
+            # Kept for the rest of the scope, which hands it back as it ends
+            scope.exits.push_async_callback(self.pool.putconn, connection)
+        if scope.transactional:
+            # A savepoint, if a block around this one has a transaction open
+            await scope.exits.enter_async_context(connection.transaction())
+        scope.connection = connection
+        return connection
+
+    @asynccontextmanager
+    async def _borrow(
+        self, *, scoped: bool = True
+    ) -> AsyncIterator[psycopg.AsyncConnection]:
+        scope = self._scope.get() if scoped else None
+        if scope is not None:
+            yield await self._scope_connection(scope)
+            return
+        checked_out = self._checked_out.get()
+        if checked_out is not None:
+            yield checked_out
+            return
+
+        connection = await self._take()
+        try:
+            yield connection
+        finally:
+            await self.pool.putconn(connection)
+
+    @asynccontextmanager
+    async def _enter(self, scope: _Scope) -> AsyncIterator[None]:
+        token = self._scope.set(scope)
+        try:
+            async with scope.exits:
+                yield
+        finally:
+            self._scope.reset(token)
+
+    @asynccontextmanager
+    async def request_scope(self) -> AsyncIterator[None]:
+        """
+        Share one pooled connection between every query made inside the block
+
+        The first query takes a connection from the pool; every later one in the
+        same task reuses it, and it goes back to the pool as the block ends. A
+        block that makes no queries never touches the pool. stream() borrows a
+        connection of its own, as its iterator may outlive the block. Inside
+        another request_scope() or unit_of_work() block, it joins that block.
+        """
+        if self._scope.get() is not None:
+            yield
+            return
+        async with self._enter(_Scope()):
+            yield
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        """
+        Run every query made inside the block in one transaction, on one connection
+
+        The transaction begins with the block's first query, on the connection
+        of the request_scope() around it if there is one, else on one taken from
+        the pool. It commits as the block ends, or rolls back if the block
+        raises, so the block's writes land together at the cost of one commit.
+        A block that makes no queries never touches the pool. A unit of work
+        nested in another becomes a savepoint, undone alone if it raises.
+        stream() reads outside the transaction, on a connection of its own.
+
+        Raises:
+            ConnectionError: if there is no pool, or no connection is free within the pool timeout.
+
+        """
+        async with self._enter(_Scope(transactional=True, parent=self._scope.get())):
+            yield
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[psycopg.AsyncConnection]:
+        """
+        Borrow a connection from the pool for the duration of a block
+
+        Every execute() awaited inside the block, in the same task, reuses it.
+
+        Raises:
+            ConnectionError: if there is no pool, or no connection is free within the pool timeout.
+
+        """
+        async with self._borrow() as connection:
+            if self._checked_out.get() is connection:
+                yield connection
+                return
+            token = self._checked_out.set(connection)
+            try:
+                yield connection
+            finally:
+                self._checked_out.reset(token)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[psycopg.AsyncConnection]:
+        """
+        Run a block inside a single database transaction
+
+        Every query awaited inside the block, in the same task, commits together,
+        or not at all if the block raises.
+
+        Raises:
+            ConnectionError: if there is no pool, or no connection is free within the pool timeout.
+
+        """
+        async with self.checkout() as connection, connection.transaction():
+            yield connection
+
+    async def execute(
+        self,
+        query: Query,
+        params: list,
+        *,
+        prepare: bool | None = None,
+        row_factory: AsyncRowFactory | None = None,
+    ) -> list | None:
+        """
+        Execute queries on the database
+
+        Args:
+            query: SQL query formatted as a psycopg Query object
+            params: a list of parameters for the query
+            prepare: True prepares the statement server-side now and False never
+                does; by default it is prepared once it has run
+                POSTGRES_PREPARE_THRESHOLD times on the connection
+            row_factory: builds each row, e.g. class_row(Hive); dicts by default
+
+        Returns:
+            A list of results
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+            LookupError: if an insert or update references a row that does not exist.
+
+        """
+        async with (
+            self.checkout() as connection,
+            connection.cursor(row_factory=row_factory) as cursor,
+        ):
+            started = time.perf_counter()
+            try:
+                await cursor.execute(query, params, prepare=prepare)
+            except ForeignKeyViolation as e:
+                error_message = f"No row referenced by {e.diag.constraint_name}"
+                raise LookupError(error_message) from e
+            results = await cursor.fetchall() if cursor.description else None
+            emit(self.hooks, query, started, cursor.rowcount)
+            return results
+
+    async def stream(
+        self,
+        query: Query,
+        params: list,
+        *,
+        size: int | None = None,
+        row_factory: AsyncRowFactory | None = None,
+    ) -> AsyncIterator:
+        """
+        Yield the rows of a query as they arrive, through a server-side cursor
+
+        Rows are fetched from Postgres size at a time, so memory stays flat however
+        large the result. The connection is held until the iterator is exhausted or
+        closed. Unlike checkout(), it is not bound to the calling task, so the
+        iterator may be advanced from another task, e.g. by a StreamingResponse.
+
+        Args:
+            query: SQL query formatted as a psycopg Query object
+            params: a list of parameters for the query
+            size: rows fetched per round trip, POSTGRES_STREAM_ITERSIZE by default
+            row_factory: builds each row, e.g. class_row(Hive); dicts by default
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+
+        """
+        async with (
+            self._borrow(scoped=False) as connection,
+            connection.transaction(),
+            connection.cursor(
+                name=f"stream_{uuid4().hex}", row_factory=row_factory
+            ) as cursor,
+        ):
+            cursor.itersize = size or self.db.stream_itersize
+            started = time.perf_counter()
+            await cursor.execute(query, params)
+            rows = 0
+            async for row in cursor:
+                rows += 1
+                yield row
+            emit(self.hooks, query, started, rows)
+
+    async def executemany(
+        self, query: Query, params_seq: list[list], *, returning: bool = False
+    ) -> list:
+        """
+        Execute one query once per set of parameters, pipelined in a single round trip
+
+        Args:
+            query: SQL query formatted as a psycopg Query object
+            params_seq: a list of parameter lists, one per execution
+            returning: collect the rows returned by each execution
+
+        Returns:
+            The returned rows in the order of params_seq, or an empty list
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+            LookupError: if an insert or update references a row that does not exist.
+
+        """
+        results: list = []
+        async with self.checkout() as connection, connection.cursor() as cursor:
+            started = time.perf_counter()
+            try:
+                await cursor.executemany(query, params_seq, returning=returning)
+            except ForeignKeyViolation as e:
+                error_message = f"No row referenced by {e.diag.constraint_name}"
+                raise LookupError(error_message) from e
+            if returning:
+                results.extend(await cursor.fetchall())
+                while cursor.nextset():
+                    results.extend(await cursor.fetchall())
+            emit(self.hooks, query, started, len(results) or cursor.rowcount)
+        return results
+
+    async def copy(self, statement: Query, rows: Iterable[list]) -> int:
+        """
+        Load rows into a table with COPY FROM STDIN
+
+        Args:
+            statement: a COPY ... FROM STDIN statement naming the target columns
+            rows: the rows, each holding one value per column. Any iterable will
+                do, so a generator can stream rows in without holding them all
+
+        Returns:
+            The number of rows copied
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+
+        """
+        async with self.checkout() as connection, connection.cursor() as cursor:
+            started = time.perf_counter()
+            async with cursor.copy(statement) as copy:
+                for row in rows:
+                    await copy.write_row(row)
+            emit(self.hooks, statement, started, cursor.rowcount)
+            return cursor.rowcount
+
+    async def seed(self, sql_file_name: str) -> None:
+        """
+        Seeds the database
+
+        Args:
+            sql_file_name: string pointing to sql seed file.
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+            FileNotFoundError: if sql seed file cannot be found.
+
+        """
+        async with self.checkout() as connection:
+            sql_file_path = Path(sql_file_name)
+            try:
+                sql: str = sql_file_path.read_text()
+            except FileNotFoundError as e:
+                error_message = f"{sql_file_name} does not exist: {e}"
+                raise FileNotFoundError(error_message) from e
+
+            async with connection.cursor() as cursor:
+                await cursor.execute(sql, prepare=False)
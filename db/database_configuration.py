@@ -28,3 +28,20 @@ class DatabaseConfiguration:
             password=self.password,
             dbname=self.dbname,
         )
+        self.pool_min_size: int = int(config.get("POSTGRES_POOL_MIN_SIZE") or 1)
+        self.pool_max_size: int = int(config.get("POSTGRES_POOL_MAX_SIZE") or 10)
+        self.pool_timeout: float = float(config.get("POSTGRES_POOL_TIMEOUT") or 30)
+        self.pool_max_lifetime: float = float(
+            config.get("POSTGRES_POOL_MAX_LIFETIME") or 3600
+        )
+        self.pool_max_idle: float = float(config.get("POSTGRES_POOL_MAX_IDLE") or 600)
+        self.stream_itersize: int = int(config.get("POSTGRES_STREAM_ITERSIZE") or 1000)
+        self.slow_query_ms: float = float(config.get("POSTGRES_SLOW_QUERY_MS") or 200)
+        # Executions of a statement before it is prepared server-side; 0 prepares
+        # on first use, "none" never prepares (e.g. behind PgBouncer in transaction mode)
+        prepare_threshold: str = config.get("POSTGRES_PREPARE_THRESHOLD") or "0"
+        self.prepare_threshold: int | None = (
+            None if prepare_threshold.lower() == "none" else int(prepare_threshold)
+        )
+        # Prepared statements kept per connection, least recently used evicted first
+        self.prepared_max: int = int(config.get("POSTGRES_PREPARED_MAX") or 256)
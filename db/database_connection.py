@@ -1,65 +1,359 @@
 """Uses configuration values to connect to database via psycopg"""
 
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
+from uuid import uuid4
 
 import psycopg
 from psycopg.abc import Query
-from psycopg.rows import dict_row
+from psycopg.errors import ForeignKeyViolation
+from psycopg.rows import RowFactory, dict_row
+from psycopg_pool import ConnectionPool, PoolTimeout
 
 from db.database_configuration import DatabaseConfiguration
+from db.instrumentation import CheckoutHook, QueryHook, emit
+
+
+@dataclass
+class _Scope:
+    """A unit_of_work() block, and the connection it took on its first query"""
+
+    parent: "_Scope | None" = None
+    connection: psycopg.Connection | None = None
+    exits: ExitStack = field(default_factory=ExitStack)
 
 
 class DatabaseConnection:
-    def __init__(self, config: DatabaseConfiguration) -> None:
+    def __init__(self, config: DatabaseConfiguration, *, pooled: bool = False) -> None:
         self.db: DatabaseConfiguration = config
+        self.pooled: bool = pooled
         self.connection = None
+        self.pool: ConnectionPool | None = None
+        # Called with a QueryEvent after every statement, see db.instrumentation
+        self.hooks: list[QueryHook] = []
+        self.checkout_hooks: list[CheckoutHook] = []
+        self._checked_out: ContextVar[psycopg.Connection | None] = ContextVar(
+            "checked_out", default=None
+        )
+        self._scope: ContextVar[_Scope | None] = ContextVar("scope", default=None)
 
     def connect(self) -> None:
         """
-        Open a connection to the database
+        Open a connection, or a pool of connections, to the database
+
+        Calling connect() while already connected does nothing.
 
         Raises:
             ConnectionError: if no connection can be made to the configured database.
 
         """
+        if (self.pool and not self.pool.closed) or (
+            self.connection and not self.connection.closed
+        ):
+            return
         try:
-            self.connection = psycopg.connect(
-                conninfo=self.db.url,
-                row_factory=dict_row,
-            )
-            self.connection.autocommit = True
-        except psycopg.OperationalError as e:
+            if self.pooled:
+                self.pool = ConnectionPool(
+                    conninfo=self.db.url,
+                    min_size=self.db.pool_min_size,
+                    max_size=self.db.pool_max_size,
+                    timeout=self.db.pool_timeout,
+                    max_lifetime=self.db.pool_max_lifetime,
+                    max_idle=self.db.pool_max_idle,
+                    kwargs={
+                        "row_factory": dict_row,
+                        "autocommit": True,
+                        "prepare_threshold": self.db.prepare_threshold,
+                    },
+                    configure=self._configure,
+                    open=False,
+                )
+                self.pool.open(wait=True, timeout=self.db.pool_timeout)
+            else:
+                self.connection = psycopg.connect(
+                    conninfo=self.db.url,
+                    row_factory=dict_row,
+                    prepare_threshold=self.db.prepare_threshold,
+                )
+                self.connection.autocommit = True
+                self._configure(self.connection)
+        except (psycopg.OperationalError, PoolTimeout) as e:
+            if self.pool:
+                self.pool.close()
             error_message: str = f"Couldn't connect to {self.db.host}:{self.db.port}/{self.db.dbname}: {e}"
             raise ConnectionError(error_message) from e
 
+    def _configure(self, connection: psycopg.Connection) -> None:
+        connection.prepared_max = self.db.prepared_max
+
     def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connection, or every connection in the pool."""
+        if self.pool and not self.pool.closed:
+            self.pool.close()
         if self.connection and not self.connection.closed:
             self.connection.close()
 
-    def execute(self, query: Query, params: list) -> list | None:
+    def _take(self) -> psycopg.Connection:
+        if self.pool and not self.pool.closed:
+            started = time.perf_counter()
+            try:
+                return self.pool.getconn()
+            except PoolTimeout as e:
+                error_message = f"No free connection to {self.db.host}:{self.db.port}/{self.db.dbname} after {self.db.pool_timeout}s"
+                raise ConnectionError(error_message) from e
+            finally:
+                for hook in self.checkout_hooks:
+                    hook(time.perf_counter() - started)
+
+        if self.connection and not self.connection.closed:
+            return self.connection
+
+        error_message = (
+            f"No connection to {self.db.host}:{self.db.port}/{self.db.dbname}"
+        )
+        raise ConnectionError(error_message)
+
+    def _give_back(self, connection: psycopg.Connection) -> None:
+        if self.pool is not None:
+            self.pool.putconn(connection)
+
+    def _scope_connection(self, scope: _Scope) -> psycopg.Connection:
+        if scope.connection is not None:
+            return scope.connection
+        if scope.parent is not None:
+            connection = self._scope_connection(scope.parent)
+        elif (checked_out := self._checked_out.get()) is not None:
+            connection = checked_out
+        else:
+            connection = self._take()
+            scope.exits.callback(self._give_back, connection)
+        # A savepoint, if a block around this one has a transaction open
+        scope.exits.enter_context(connection.transaction())
+        scope.connection = connection
+        return connection
+
+    @contextmanager
+    def _borrow(self) -> Iterator[psycopg.Connection]:
+        scope = self._scope.get()
+        if scope is not None:
+            yield self._scope_connection(scope)
+            return
+        checked_out = self._checked_out.get()
+        if checked_out is not None:
+            yield checked_out
+            return
+
+        connection = self._take()
+        try:
+            yield connection
+        finally:
+            self._give_back(connection)
+
+    @contextmanager
+    def checkout(self) -> Iterator[psycopg.Connection]:
+        """
+        Borrow a connection for the duration of a block
+
+        In pooled mode the connection is taken from the pool and returned when the
+        block exits. Every execute() inside the block reuses it, so a unit of work
+        (e.g. one request) holds a single connection rather than one per query.
+
+        Raises:
+            ConnectionError: if there is no connection, or none is free within the pool timeout.
+
+        """
+        with self._borrow() as connection:
+            if not self.pooled or self._checked_out.get() is connection:
+                yield connection
+                return
+            token = self._checked_out.set(connection)
+            try:
+                yield connection
+            finally:
+                self._checked_out.reset(token)
+
+    @contextmanager
+    def transaction(self) -> Iterator[psycopg.Connection]:
+        """
+        Run a block inside a single database transaction
+
+        The connection is checked out for the whole block, so every execute(),
+        executemany() and copy() inside it commits together, or not at all if
+        the block raises.
+
+        Raises:
+            ConnectionError: if there is no connection, or none is free within the pool timeout.
+
+        """
+        with self.checkout() as connection, connection.transaction():
+            yield connection
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """
+        Run every query made inside the block in one transaction, on one connection
+
+        Unlike transaction(), nothing is taken from the pool or sent to the
+        database until the block's first query, so a block that makes none, e.g.
+        because validation rejected its input, costs nothing. It commits as the
+        block ends, or rolls back if the block raises. A unit of work nested in
+        another becomes a savepoint, undone alone if it raises.
+
+        Raises:
+            ConnectionError: if there is no connection, or none is free within the pool timeout.
+
+        """
+        scope = _Scope(parent=self._scope.get())
+        token = self._scope.set(scope)
+        try:
+            with scope.exits:
+                yield
+        finally:
+            self._scope.reset(token)
+
+    def execute(
+        self,
+        query: Query,
+        params: list,
+        *,
+        prepare: bool | None = None,
+        row_factory: RowFactory | None = None,
+    ) -> list | None:
         """
         Execute queries on the database
 
         Args:
             query: SQL query formatted as a psycopg Query object
             params: a list of parameters for the query
+            prepare: True prepares the statement server-side now and False never
+                does; by default it is prepared once it has run
+                POSTGRES_PREPARE_THRESHOLD times on the connection
+            row_factory: builds each row, e.g. class_row(Hive); dicts by default
 
         Returns:
             A list of results
 
         Raises:
             ConnectionError: if no connection can be made to the configured database.
+            LookupError: if an insert or update references a row that does not exist.
 
         """
-        if self.connection and not self.connection.closed:
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, params)
-                return cursor.fetchall() if cursor.description else None
-        error_message = (
-            f"No connection to {self.db.host}:{self.db.port}/{self.db.dbname}"
-        )
-        raise ConnectionError(error_message)
+        with (
+            self.checkout() as connection,
+            connection.cursor(row_factory=row_factory) as cursor,
+        ):
+            started = time.perf_counter()
+            try:
+                cursor.execute(query, params, prepare=prepare)
+            except ForeignKeyViolation as e:
+                error_message = f"No row referenced by {e.diag.constraint_name}"
+                raise LookupError(error_message) from e
+            results = cursor.fetchall() if cursor.description else None
+            emit(self.hooks, query, started, cursor.rowcount)
+            return results
+
+    def stream(
+        self,
+        query: Query,
+        params: list,
+        *,
+        size: int | None = None,
+        row_factory: RowFactory | None = None,
+    ) -> Iterator:
+        """
+        Yield the rows of a query as they arrive, through a server-side cursor
+
+        Rows are fetched from Postgres size at a time, so memory stays flat however
+        large the result. The connection is held until the iterator is exhausted or
+        closed.
+
+        Args:
+            query: SQL query formatted as a psycopg Query object
+            params: a list of parameters for the query
+            size: rows fetched per round trip, POSTGRES_STREAM_ITERSIZE by default
+            row_factory: builds each row, e.g. class_row(Hive); dicts by default
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+
+        """
+        with (
+            self._borrow() as connection,
+            connection.transaction(),
+            connection.cursor(
+                name=f"stream_{uuid4().hex}", row_factory=row_factory
+            ) as cursor,
+        ):
+            cursor.itersize = size or self.db.stream_itersize
+            started = time.perf_counter()
+            cursor.execute(query, params)
+            rows = 0
+            for row in cursor:
+                rows += 1
+                yield row
+            emit(self.hooks, query, started, rows)
+
+    def executemany(
+        self, query: Query, params_seq: list[list], *, returning: bool = False
+    ) -> list:
+        """
+        Execute one query once per set of parameters, pipelined in a single round trip
+
+        Args:
+            query: SQL query formatted as a psycopg Query object
+            params_seq: a list of parameter lists, one per execution
+            returning: collect the rows returned by each execution
+
+        Returns:
+            The returned rows in the order of params_seq, or an empty list
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+            LookupError: if an insert or update references a row that does not exist.
+
+        """
+        results: list = []
+        with self.checkout() as connection, connection.cursor() as cursor:
+            started = time.perf_counter()
+            try:
+                cursor.executemany(query, params_seq, returning=returning)
+            except ForeignKeyViolation as e:
+                error_message = f"No row referenced by {e.diag.constraint_name}"
+                raise LookupError(error_message) from e
+            if returning:
+                results.extend(cursor.fetchall())
+                while cursor.nextset():
+                    results.extend(cursor.fetchall())
+            emit(self.hooks, query, started, len(results) or cursor.rowcount)
+        return results
+
+    def copy(self, statement: Query, rows: Iterable[list]) -> int:
+        """
+        Load rows into a table with COPY FROM STDIN
+
+        Args:
+            statement: a COPY ... FROM STDIN statement naming the target columns
+            rows: the rows, each holding one value per column. Any iterable will
+                do, so a generator can stream rows in without holding them all
+
+        Returns:
+            The number of rows copied
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+
+        """
+        with self.checkout() as connection, connection.cursor() as cursor:
+            started = time.perf_counter()
+            with cursor.copy(statement) as copy:
+                for row in rows:
+                    copy.write_row(row)
+            emit(self.hooks, statement, started, cursor.rowcount)
+            return cursor.rowcount
 
     def seed(self, sql_file_name: str) -> None:
         """
@@ -73,19 +367,15 @@ class DatabaseConnection:
             FileNotFoundError: if sql seed file cannot be found.
 
         """
-        if not self.connection or self.connection.closed:
-            error_message = (
-                f"No connection to {self.db.host}:{self.db.port}/{self.db.dbname}"
-            )
-            raise ConnectionError(error_message)
-        sql_file_path = Path(sql_file_name)
-        try:
-            with sql_file_path.open() as file:
-                sql: str = file.read()
+        with self.checkout() as connection:
+            sql_file_path = Path(sql_file_name)
+            try:
+                with sql_file_path.open() as file:
+                    sql: str = file.read()
 
-            with self.connection.cursor() as cursor:
-                cursor.execute(sql)
+                with connection.cursor() as cursor:
+                    cursor.execute(sql, prepare=False)
 
-        except FileNotFoundError as e:
-            error_message = f"{sql_file_name} does not exist: {e}"
-            raise FileNotFoundError(error_message) from e
+            except FileNotFoundError as e:
+                error_message = f"{sql_file_name} does not exist: {e}"
+                raise FileNotFoundError(error_message) from e
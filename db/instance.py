@@ -1,8 +1,17 @@
-"""Creates an instance that can be shared across the codebase"""
+"""Creates instances that can be shared across the codebase"""
 
+from db.async_database_connection import AsyncDatabaseConnection
 from db.database_configuration import DatabaseConfiguration
 from db.database_connection import DatabaseConnection
+from db.instrumentation import QueryStats
 
+# Nothing connects at import: main.lifespan opens async_db, and scripts using
+# the sync stack call db.connect() themselves.
 config = DatabaseConfiguration(".env")
-db = DatabaseConnection(config=config)
-db.connect()
+db = DatabaseConnection(config=config, pooled=True)
+async_db = AsyncDatabaseConnection(config=config)
+
+# Every query, from either stack, is timed and aggregated in process
+query_stats = QueryStats(slow_query_threshold=config.slow_query_ms / 1000)
+db.hooks.append(query_stats.record)
+async_db.hooks.append(query_stats.record)
@@ -0,0 +1,269 @@
+"""Times every query and aggregates the results per route and statement"""
+
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator, MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from psycopg.abc import Query
+
+logger = logging.getLogger(__name__)
+
+# Queries issued outside a request, e.g. by scripts or the lifespan
+NO_ROUTE: str = "-"
+# Set on a route's endpoint by routes.instrumentation.query_budget
+BUDGET_ATTRIBUTE: str = "query_budget"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%(?:\(\w+\))?s")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def _fingerprint(text: str) -> str:
+    text = _STRING_LITERAL.sub("?", text)
+    text = _PLACEHOLDER.sub("?", text)
+    text = _NUMBER_LITERAL.sub("?", text)
+    text = _VALUE_LIST.sub("(...)", text)
+    return _WHITESPACE.sub(" ", text).strip().rstrip(";")
+
+
+def fingerprint(query: Query) -> str:
+    """
+    Normalise a statement so every execution of it aggregates under one key
+
+    Literals and placeholders become ?, lists of them collapse to (...), and
+    whitespace is squeezed, so the fingerprint does not depend on parameters.
+    """
+    text = query.decode() if isinstance(query, bytes) else str(query)
+    return _fingerprint(text)
+
+
+class QueryBudgetExceededError(RuntimeError):
+    """Raised, when budgets are strict, for a request making more queries than its route allows"""
+
+
+@dataclass(frozen=True)
+class QueryEvent:
+    """One executed statement, as seen by query hooks"""
+
+    statement: str
+    duration: float
+    rows: int
+
+
+QueryHook = Callable[[QueryEvent], None]
+
+# Called with the seconds spent waiting for a pooled connection
+CheckoutHook = Callable[[float], None]
+
+
+def emit(hooks: list[QueryHook], query: Query, started: float, rows: int) -> None:
+    """Report a statement that began at perf_counter() time started to every hook"""
+    if not hooks:
+        return
+    event = QueryEvent(fingerprint(query), time.perf_counter() - started, rows)
+    for hook in hooks:
+        hook(event)
+
+
+@dataclass
+class RequestQueries:
+    """Counts the queries made while serving one request"""
+
+    scope: MutableMapping
+    queries: int = 0
+    duration: float = 0.0
+
+    @property
+    def route(self) -> str:
+        """The matched route template, e.g. GET /apiaries/{apiary_id}"""
+        route = self.scope.get("route")
+        path = getattr(route, "path", None)
+        if path is None:
+            return NO_ROUTE
+        return f"{self.scope.get('method', '')} {path}".strip()
+
+    @property
+    def budget(self) -> int | None:
+        """The most queries the matched route allows per request, if it declares a budget"""
+        endpoint = getattr(self.scope.get("route"), "endpoint", None)
+        return getattr(endpoint, BUDGET_ATTRIBUTE, None)
+
+
+_current_request: ContextVar[RequestQueries | None] = ContextVar(
+    "current_request", default=None
+)
+
+
+@contextmanager
+def request_queries(scope: MutableMapping) -> Iterator[RequestQueries]:
+    """Attribute every query made inside the block to the request in scope"""
+    request = RequestQueries(scope)
+    token = _current_request.set(request)
+    try:
+        yield request
+    finally:
+        _current_request.reset(token)
+
+
+@dataclass
+class StatementStats:
+    calls: int = 0
+    rows: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+
+@dataclass
+class RouteStats:
+    requests: int = 0
+    queries: int = 0
+    max_queries: int = 0
+    db_time: float = 0.0
+    budget: int | None = None
+    over_budget: int = 0
+    statements: dict[str, StatementStats] = field(default_factory=dict)
+
+
+class QueryStats:
+    """
+    A query hook that aggregates timings per route and statement in process
+
+    Statements slower than slow_query_threshold seconds are logged as they
+    happen. top() ranks statements across routes, and routes() shows how many
+    queries each request makes, which is where N+1 patterns show up. A request
+    making more queries than its route's budget is logged too, or raises
+    QueryBudgetExceededError if strict_budgets is set, as it is in the tests.
+    """
+
+    def __init__(
+        self, slow_query_threshold: float, *, strict_budgets: bool = False
+    ) -> None:
+        self.slow_query_threshold: float = slow_query_threshold
+        self.strict_budgets: bool = strict_budgets
+        self._routes: dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def _route(self, route: str) -> RouteStats:
+        if route not in self._routes:
+            self._routes[route] = RouteStats()
+        return self._routes[route]
+
+    def record(self, event: QueryEvent) -> None:
+        request = _current_request.get()
+        route = request.route if request else NO_ROUTE
+        if request:
+            request.queries += 1
+            request.duration += event.duration
+        with self._lock:
+            stats = self._route(route).statements.setdefault(
+                event.statement, StatementStats()
+            )
+            stats.calls += 1
+            stats.rows += event.rows
+            stats.total_time += event.duration
+            stats.max_time = max(stats.max_time, event.duration)
+        if event.duration >= self.slow_query_threshold:
+            logger.warning(
+                "Slow query: %.1f ms, %d rows, %s: %s",
+                event.duration * 1000,
+                event.rows,
+                route,
+                event.statement,
+            )
+
+    def request_finished(
+        self, request: RequestQueries, *, failed: bool = False
+    ) -> None:
+        """
+        Count a served request and the queries it made against its route
+
+        A failed request, one whose handler raised, is counted and logged if
+        over budget but never raises, so its own exception is the one reported.
+
+        Raises:
+            QueryBudgetExceededError: if budgets are strict and the request
+                succeeded having made more queries than its route's budget.
+
+        """
+        route = request.route
+        budget = request.budget
+        over_budget = budget is not None and request.queries > budget
+        with self._lock:
+            stats = self._route(route)
+            stats.requests += 1
+            stats.queries += request.queries
+            stats.max_queries = max(stats.max_queries, request.queries)
+            stats.db_time += request.duration
+            stats.budget = budget
+            stats.over_budget += int(over_budget)
+        if not over_budget:
+            return
+        if self.strict_budgets and not failed:
+            error_message = (
+                f"{route} made {request.queries} queries, over its budget of {budget}"
+            )
+            raise QueryBudgetExceededError(error_message)
+        logger.warning(
+            "Query budget exceeded: %s made %d queries, over its budget of %d",
+            route,
+            request.queries,
+            budget,
+        )
+
+    def routes(self) -> list[dict]:
+        """Per-route request and query counts, the chattiest routes first"""
+        with self._lock:
+            rows = [
+                {
+                    "route": route,
+                    "requests": stats.requests,
+                    "queries": stats.queries,
+                    "queries_per_request": stats.queries / stats.requests
+                    if stats.requests
+                    else 0.0,
+                    "max_queries": stats.max_queries,
+                    "db_time": stats.db_time,
+                    "budget": stats.budget,
+                    "over_budget": stats.over_budget,
+                }
+                for route, stats in self._routes.items()
+            ]
+        return sorted(rows, key=lambda row: row["queries_per_request"], reverse=True)
+
+    def top(self, n: int = 10, by: str = "total_time") -> list[dict]:
+        """
+        The n statements with the highest value of by, per route
+
+        Args:
+            n: how many rows to return
+            by: one of calls, rows, total_time, max_time or mean_time
+
+        """
+        with self._lock:
+            rows = [
+                {
+                    "route": route,
+                    "statement": statement,
+                    "calls": stats.calls,
+                    "rows": stats.rows,
+                    "total_time": stats.total_time,
+                    "mean_time": stats.total_time / stats.calls,
+                    "max_time": stats.max_time,
+                }
+                for route, route_stats in self._routes.items()
+                for statement, stats in route_stats.statements.items()
+            ]
+        return sorted(rows, key=lambda row: row[by], reverse=True)[:n]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
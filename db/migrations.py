@@ -0,0 +1,160 @@
+"""Applies the numbered SQL files in sql/migrations to an existing database"""
+
+import argparse
+from contextlib import AbstractContextManager
+from pathlib import Path
+
+from db.database_connection import DatabaseConnection
+
+CREATE_MIGRATIONS_TABLE_QUERY: str = "CREATE TABLE IF NOT EXISTS schema_migrations (version TEXT PRIMARY KEY, applied_at TIMESTAMPTZ NOT NULL DEFAULT now());"
+APPLIED_QUERY: str = "SELECT version FROM schema_migrations;"
+RECORD_QUERY: str = "INSERT INTO schema_migrations (version) VALUES (%s);"
+# A line of its own in a migration that must run outside a transaction, e.g.
+# because it uses CREATE INDEX CONCURRENTLY
+NO_TRANSACTION_MARKER: str = "-- migration: no-transaction"
+
+
+def split_statements(sql: str) -> list[str]:
+    """
+    Split a migration file into its statements
+
+    A statement ends with a semicolon at the end of a line, outside any $$
+    quoted function body. Comment lines outside bodies are dropped, so a file
+    can be documented freely.
+
+    Args:
+        sql: the contents of a migration file
+
+    Returns:
+        A list of statements, each ending with a semicolon
+
+    """
+    statements: list[str] = []
+    current: list[str] = []
+    quoted = False
+    for line in sql.splitlines():
+        if not quoted and (not line.strip() or line.lstrip().startswith("--")):
+            continue
+        current.append(line)
+        if line.count("$$") % 2:
+            quoted = not quoted
+        if not quoted and line.rstrip().endswith(";"):
+            statements.append("\n".join(current))
+            current = []
+    if current:
+        statements.append("\n".join(current))
+    return statements
+
+
+def runs_in_transaction(sql: str) -> bool:
+    """Returns False if a migration file opts out of running in a transaction"""
+    return all(line.strip() != NO_TRANSACTION_MARKER for line in sql.splitlines())
+
+
+class MigrationRunner:
+    """Tracks and applies migrations to a database created from an older schema.sql"""
+
+    def __init__(
+        self, db: DatabaseConnection, directory: str = "sql/migrations"
+    ) -> None:
+        """Init with a database connection and the directory holding migrations"""
+        self.db = db
+        self.directory = Path(directory)
+
+    def applied(self) -> set[str]:
+        """Returns the versions already recorded in schema_migrations"""
+        self.db.execute(CREATE_MIGRATIONS_TABLE_QUERY, [])
+        results = self.db.execute(APPLIED_QUERY, [])
+        return {row["version"] for row in results or []}
+
+    def pending(self) -> list[Path]:
+        """Returns the migration files not yet applied, oldest first"""
+        applied = self.applied()
+        return [
+            path
+            for path in sorted(self.directory.glob("*.sql"))
+            if path.stem not in applied
+        ]
+
+    def _hold(self, sql: str) -> AbstractContextManager:
+        """Returns the block a migration's statements run in, on one connection"""
+        return self.db.transaction() if runs_in_transaction(sql) else self.db.checkout()
+
+    def apply(self) -> list[str]:
+        """
+        Apply every pending migration in order
+
+        Each migration runs on one connection. By default its statements and
+        its record in schema_migrations commit as one transaction, so a failed
+        migration changes nothing: fix the cause and run it again. A migration
+        using CREATE INDEX CONCURRENTLY, which cannot run inside a transaction,
+        opts out with a NO_TRANSACTION_MARKER line; its statements then commit
+        one at a time, and it is recorded only once all have succeeded, so write
+        them to be safely re-run (e.g. with IF NOT EXISTS). Statements run once,
+        so they are not prepared.
+
+        Returns:
+            The versions that were applied
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+
+        """
+        versions: list[str] = []
+        for path in self.pending():
+            sql = path.read_text()
+            with self._hold(sql):
+                for statement in split_statements(sql):
+                    self.db.execute(statement, [], prepare=False)
+                self.db.execute(RECORD_QUERY, [path.stem])
+            versions.append(path.stem)
+        return versions
+
+    def stamp(self) -> list[str]:
+        """
+        Record every pending migration as applied, without running it
+
+        For a database created from a schema.sql that already included them but
+        did not record them, such as one created partitioned before schema.sql
+        created schema_migrations. On it, 0001 and 0002 would fail, as
+        CREATE INDEX CONCURRENTLY cannot build an index on a partitioned table,
+        and 0004 would partition tables that are partitioned already.
+
+        Returns:
+            The versions that were recorded
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+
+        """
+        versions: list[str] = [path.stem for path in self.pending()]
+        with self.db.transaction():
+            for version in versions:
+                self.db.execute(RECORD_QUERY, [version])
+        return versions
+
+
+if __name__ == "__main__":
+    from db.instance import db
+
+    parser = argparse.ArgumentParser(prog="python -m db.migrations")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["apply", "stamp"],
+        default="apply",
+        help="apply the pending migrations (default), or record them as applied without running them",
+    )
+    args = parser.parse_args()
+
+    db.connect()
+    try:
+        runner = MigrationRunner(db)
+        if args.command == "stamp":
+            for version in runner.stamp():
+                print(f"Recorded {version}")  # noqa: T201
+        else:
+            for version in runner.apply():
+                print(f"Applied {version}")  # noqa: T201
+    finally:
+        db.close()
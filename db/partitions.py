@@ -0,0 +1,120 @@
+"""Creates and archives the yearly partitions of inspections, observations and actions"""
+
+import argparse
+from datetime import UTC, datetime
+
+from db.database_connection import DatabaseConnection
+
+CREATE_QUERY: str = "SELECT create_inspection_partitions(%s);"
+ARCHIVE_QUERY: str = "SELECT archive_inspection_partitions(%s);"
+YEARS_QUERY: str = "SELECT substring(c.relname FROM '^inspections_y([0-9]+)$')::integer AS year FROM pg_inherits AS i JOIN pg_class AS c ON c.oid = i.inhrelid WHERE i.inhparent = 'inspections'::regclass AND c.relname ~ '^inspections_y[0-9]+$' ORDER BY year;"
+
+
+class PartitionManager:
+    """
+    Manages the partitions of inspections, and of observations and actions with them
+
+    The three tables are partitioned by year of inspection_timestamp, in UTC. A
+    year's partitions are created together and archived together, by the SQL
+    functions create_inspection_partitions and archive_inspection_partitions
+    defined in schema.sql.
+    """
+
+    def __init__(self, db: DatabaseConnection) -> None:
+        """Init with a database connection"""
+        self.db = db
+
+    def years(self) -> list[int]:
+        """Returns the years with partitions attached, oldest first"""
+        results = self.db.execute(YEARS_QUERY, [], prepare=False)
+        return [row["year"] for row in results or []]
+
+    def create(self, year: int) -> None:
+        """Create the partitions for a year, if it does not have them"""
+        self.db.execute(CREATE_QUERY, [year], prepare=False)
+
+    def ensure(self, ahead: int = 1) -> list[int]:
+        """
+        Create the partitions for this year and the next ahead years
+
+        Run it before each year starts, e.g. from cron: a year's partitions
+        cannot be created once the default partition holds rows from that year.
+
+        Returns:
+            The years that were created
+
+        """
+        existing = set(self.years())
+        this_year = datetime.now(UTC).year
+        created: list[int] = []
+        for year in range(this_year, this_year + ahead + 1):
+            if year not in existing:
+                self.create(year)
+                created.append(year)
+        return created
+
+    def archive(self, year: int) -> None:
+        """
+        Detach a year's partitions and move them to the archive schema
+
+        The colonies inspected that year have their colony_states refreshed
+        from the years still attached.
+
+        Raises:
+            ValueError: if the year has no partitions attached.
+
+        """
+        if year not in self.years():
+            error_message = f"No partitions attached for {year}"
+            raise ValueError(error_message)
+        self.db.execute(ARCHIVE_QUERY, [year], prepare=False)
+
+    def archive_before(self, year: int) -> list[int]:
+        """
+        Archive the partitions of every year before year
+
+        Returns:
+            The years that were archived
+
+        """
+        archived = [older for older in self.years() if older < year]
+        for older in archived:
+            self.db.execute(ARCHIVE_QUERY, [older], prepare=False)
+        return archived
+
+
+if __name__ == "__main__":
+    from db.instance import db
+
+    parser = argparse.ArgumentParser(prog="python -m db.partitions")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list the years with partitions attached")
+    ensure = commands.add_parser(
+        "ensure", help="create partitions for this year and the years ahead"
+    )
+    ensure.add_argument("--ahead", type=int, default=1)
+    create = commands.add_parser("create", help="create the partitions for a year")
+    create.add_argument("year", type=int)
+    archive = commands.add_parser(
+        "archive", help="archive the partitions of every year before a year"
+    )
+    archive.add_argument("before", type=int)
+    args = parser.parse_args()
+
+    db.connect()
+    try:
+        manager = PartitionManager(db)
+        if args.command == "list":
+            for year in manager.years():
+                print(year)  # noqa: T201
+        elif args.command == "ensure":
+            for year in manager.ensure(args.ahead):
+                print(f"Created {year}")  # noqa: T201
+        elif args.command == "create":
+            manager.create(args.year)
+            print(f"Created {args.year}")  # noqa: T201
+        else:
+            for year in manager.archive_before(args.before):
+                print(f"Archived {year}")  # noqa: T201
+    finally:
+        db.close()
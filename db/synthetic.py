@@ -0,0 +1,277 @@
+"""Generates a realistic synthetic dataset at a chosen scale and loads it with COPY"""
+
+import argparse
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import bcrypt
+
+from db.database_connection import DatabaseConnection
+from db.partitions import PartitionManager
+from utils.hashing import PasswordHasher
+
+TRUNCATE_QUERY: str = "TRUNCATE users, sessions, apiaries, hives, colonies, queens, inspections, observations, actions, colony_states RESTART IDENTITY CASCADE;"
+COPY_USERS_QUERY: str = "COPY users (username, password) FROM STDIN;"
+COPY_APIARIES_QUERY: str = "COPY apiaries (name, location, user_id) FROM STDIN;"
+COPY_HIVES_QUERY: str = "COPY hives (name, apiary_id) FROM STDIN;"
+COPY_COLONIES_QUERY: str = "COPY colonies (hive_id) FROM STDIN;"
+COPY_QUEENS_QUERY: str = "COPY queens (colour, clipped, colony_id) FROM STDIN;"
+COPY_INSPECTIONS_QUERY: str = (
+    "COPY inspections (inspection_timestamp, colony_id) FROM STDIN;"
+)
+COPY_OBSERVATIONS_QUERY: str = "COPY observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id, inspection_timestamp) FROM STDIN;"
+COPY_ACTIONS_QUERY: str = (
+    "COPY actions (notes, inspection_id, inspection_timestamp) FROM STDIN;"
+)
+# Refreshing colony_states once per colony at the end is cheaper than the
+# triggers refreshing every colony again after each table is copied in
+COLONY_STATE_TRIGGERS: tuple[tuple[str, str], ...] = (
+    ("colonies", "colonies_refresh_colony_state"),
+    ("queens", "queens_insert_refresh_colony_state"),
+    ("inspections", "inspections_insert_refresh_colony_state"),
+    ("observations", "observations_insert_refresh_colony_state"),
+)
+DISABLE_TRIGGER_QUERY: str = "ALTER TABLE {} DISABLE TRIGGER {};"
+ENABLE_TRIGGER_QUERY: str = "ALTER TABLE {} ENABLE TRIGGER {};"
+REFRESH_COLONY_STATES_QUERY: str = (
+    "SELECT count(refresh_colony_state(colony_id)) AS colonies FROM colonies;"
+)
+ANALYZE_QUERY: str = "ANALYZE;"
+
+# Every user signs in with it
+PASSWORD: str = "Synthetic1!"  # noqa: S105
+LOCATIONS: tuple[str, ...] = (
+    "Kent",
+    "Sussex",
+    "Devon",
+    "Cornwall",
+    "Yorkshire",
+    "Norfolk",
+    "Cumbria",
+    "Powys",
+    "Fife",
+    "Antrim",
+)
+COLOURS: tuple[str, ...] = ("White", "Yellow", "Red", "Green", "Blue", "Unmarked")
+OBSERVATION_NOTES: tuple[str, ...] = (
+    "Calm and busy",
+    "Bringing in pollen",
+    "Laying pattern patchy",
+    "Defensive on opening",
+    "Running short of space",
+    "",
+)
+ACTION_NOTES: tuple[str, ...] = (
+    "Added a super",
+    "Fed 1:1 syrup",
+    "Treated for varroa",
+    "Swapped a brood frame",
+    "Removed queen cells",
+    "Took off honey",
+)
+# Inspections fall in the active season, from April into September
+SEASON_START_MONTH: int = 4
+SEASON_DAYS: int = 183
+CLIPPED_RATE: float = 0.3
+QUEENRIGHT_RATE: float = 0.9
+CHALK_BROOD_RATE: float = 0.05
+FOUL_BROOD_RATE: float = 0.005
+MEAN_VARROA_COUNT: int = 20
+SALT_ALPHABET: str = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+
+@dataclass(frozen=True)
+class Scale:
+    """How many rows to generate at each level of the hierarchy"""
+
+    users: int
+    apiaries: int
+    hives: int
+    inspections: int
+    # Every hive holds one colony, and every colony one queen. Each inspection
+    # records one observation, and an action in this share of them
+    action_rate: float = 0.5
+
+
+SCALES: dict[str, Scale] = {
+    "tiny": Scale(users=10, apiaries=20, hives=100, inspections=1_000),
+    "small": Scale(users=1_000, apiaries=10_000, hives=100_000, inspections=1_000_000),
+    "large": Scale(
+        users=10_000, apiaries=100_000, hives=1_000_000, inspections=50_000_000
+    ),
+}
+
+
+class SyntheticDataset:
+    """
+    A synthetic hierarchy of users, apiaries, hives, colonies, queens and inspections
+
+    Every table's rows come from their own random.Random seeded with the dataset
+    seed and the table's name, so the same seed and scale always give the same
+    rows, and each table can be regenerated on its own. Rows hold no ids: loaded
+    into empty tables in order, the nth row of each gets id n, which is how the
+    rows beneath refer to it.
+    """
+
+    def __init__(
+        self, scale: Scale, seed: int = 0, first_year: int = 2015, years: int = 10
+    ) -> None:
+        """Init with a scale, a seed, and the span of years inspections fall in"""
+        self.scale = scale
+        self.seed = seed
+        self.first_year = first_year
+        self.years = years
+
+    def _random(self, table: str) -> random.Random:
+        return random.Random(f"{self.seed}:{table}")  # noqa: S311
+
+    def password_hash(self) -> str:
+        """Returns one bcrypt hash of PASSWORD, salted from the seed, for every user"""
+        rng = self._random("password")
+        salt = "".join(rng.choice(SALT_ALPHABET) for _ in range(21)) + rng.choice(
+            ".Oeu"
+        )
+        prefix = f"$2b${PasswordHasher.DEFAULT_ROUNDS:02d}$"
+        return bcrypt.hashpw(
+            PASSWORD.encode("utf-8"), (prefix + salt).encode("utf-8")
+        ).decode("utf-8")
+
+    def users(self) -> Iterator[list]:
+        password = self.password_hash()
+        for n in range(1, self.scale.users + 1):
+            yield [f"user{n}", password]
+
+    def apiaries(self) -> Iterator[list]:
+        rng = self._random("apiaries")
+        for n in range(1, self.scale.apiaries + 1):
+            yield [
+                f"Apiary {n}",
+                rng.choice(LOCATIONS),
+                rng.randint(1, self.scale.users),
+            ]
+
+    def hives(self) -> Iterator[list]:
+        rng = self._random("hives")
+        for n in range(1, self.scale.hives + 1):
+            yield [f"Hive {n}", rng.randint(1, self.scale.apiaries)]
+
+    def colonies(self) -> Iterator[list]:
+        for hive_id in range(1, self.scale.hives + 1):
+            yield [hive_id]
+
+    def queens(self) -> Iterator[list]:
+        rng = self._random("queens")
+        for colony_id in range(1, self.scale.hives + 1):
+            yield [rng.choice(COLOURS), rng.random() < CLIPPED_RATE, colony_id]
+
+    def inspections(self) -> Iterator[list]:
+        rng = self._random("inspections")
+        for _ in range(self.scale.inspections):
+            year = self.first_year + rng.randrange(self.years)
+            inspection_timestamp = datetime(
+                year, SEASON_START_MONTH, 1, tzinfo=UTC
+            ) + timedelta(
+                days=rng.randrange(SEASON_DAYS),
+                hours=rng.randint(9, 17),
+                minutes=rng.randrange(60),
+            )
+            yield [inspection_timestamp, rng.randint(1, self.scale.hives)]
+
+    def observations(self) -> Iterator[list]:
+        rng = self._random("observations")
+        for inspection_id, (inspection_timestamp, _) in enumerate(
+            self.inspections(), 1
+        ):
+            yield [
+                rng.random() < QUEENRIGHT_RATE,
+                rng.choice((0, 0, 0, 0, 1, 2, 5)),
+                rng.choice((True, False)),
+                rng.randint(0, 10),
+                rng.randint(0, 10),
+                rng.random() < CHALK_BROOD_RATE,
+                rng.random() < FOUL_BROOD_RATE,
+                int(rng.expovariate(1 / MEAN_VARROA_COUNT)),
+                rng.randint(1, 5),
+                rng.choice(OBSERVATION_NOTES),
+                inspection_id,
+                inspection_timestamp,
+            ]
+
+    def actions(self) -> Iterator[list]:
+        rng = self._random("actions")
+        for inspection_id, (inspection_timestamp, _) in enumerate(
+            self.inspections(), 1
+        ):
+            if rng.random() < self.scale.action_rate:
+                yield [rng.choice(ACTION_NOTES), inspection_id, inspection_timestamp]
+
+    def load(self, db: DatabaseConnection) -> dict[str, int]:
+        """
+        Replace everything in the database with this dataset
+
+        Every table is emptied, with its ids restarted, then loaded with COPY in
+        one transaction. The yearly partitions inspections fall in are created
+        first, so no rows land in the default partitions. colony_states is
+        refreshed once at the end rather than by its triggers table by table, and
+        the tables are analyzed, ready to benchmark.
+
+        Returns:
+            The number of rows written to each table
+
+        Raises:
+            ConnectionError: if no connection can be made to the configured database.
+
+        """
+        partitions = PartitionManager(db)
+        counts: dict[str, int] = {}
+        with db.transaction():
+            db.execute(TRUNCATE_QUERY, [], prepare=False)
+            for year in range(self.first_year, self.first_year + self.years):
+                partitions.create(year)
+            for table, trigger in COLONY_STATE_TRIGGERS:
+                db.execute(
+                    DISABLE_TRIGGER_QUERY.format(table, trigger), [], prepare=False
+                )
+            counts["users"] = db.copy(COPY_USERS_QUERY, self.users())
+            counts["apiaries"] = db.copy(COPY_APIARIES_QUERY, self.apiaries())
+            counts["hives"] = db.copy(COPY_HIVES_QUERY, self.hives())
+            counts["colonies"] = db.copy(COPY_COLONIES_QUERY, self.colonies())
+            counts["queens"] = db.copy(COPY_QUEENS_QUERY, self.queens())
+            counts["inspections"] = db.copy(COPY_INSPECTIONS_QUERY, self.inspections())
+            counts["observations"] = db.copy(
+                COPY_OBSERVATIONS_QUERY, self.observations()
+            )
+            counts["actions"] = db.copy(COPY_ACTIONS_QUERY, self.actions())
+            for table, trigger in COLONY_STATE_TRIGGERS:
+                db.execute(
+                    ENABLE_TRIGGER_QUERY.format(table, trigger), [], prepare=False
+                )
+            db.execute(REFRESH_COLONY_STATES_QUERY, [], prepare=False)
+        db.execute(ANALYZE_QUERY, [], prepare=False)
+        return counts
+
+
+if __name__ == "__main__":
+    from db.instance import db
+
+    parser = argparse.ArgumentParser(
+        prog="python -m db.synthetic",
+        description="Replace everything in the configured database with a synthetic dataset",
+    )
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--first-year", type=int, default=2015)
+    parser.add_argument("--years", type=int, default=10)
+    args = parser.parse_args()
+
+    dataset = SyntheticDataset(
+        SCALES[args.scale], seed=args.seed, first_year=args.first_year, years=args.years
+    )
+    db.connect()
+    try:
+        for table, count in dataset.load(db).items():
+            print(f"{table}: {count}")  # noqa: T201
+    finally:
+        db.close()
@@ -1,32 +1,50 @@
 """APIS-API"""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from db.instance import db
+from db.instance import async_db, query_stats
 from routes.action import router as action_router
 from routes.apiary import router as apiary_router
 from routes.colony import router as colony_router
+from routes.colony_health import router as colony_health_router
+from routes.colony_state import router as colony_state_router
+from routes.health import router as health_router
 from routes.hive import router as hive_router
 from routes.inspection import router as inspection_router
+from routes.instrumentation import QueryStatsMiddleware
+from routes.metrics import MetricsMiddleware, instrument
+from routes.metrics import router as metrics_router
 from routes.observation import router as observation_router
 from routes.queen import router as queen_router
+from routes.search import router as search_router
 from routes.user import router as user_router
+from utils.instance import hashing_executor
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
-    db.connect()
+    await async_db.connect()
+    hashing_executor.start()
     yield
-    db.close()
+    # close() waits for running hashes, so it must not block the event loop
+    await asyncio.to_thread(hashing_executor.close)
+    await async_db.close()
 
 
 app = FastAPI()
 
 app.router.lifespan_context = lifespan
 
+app.add_middleware(QueryStatsMiddleware, stats=query_stats)
+app.add_middleware(MetricsMiddleware)
+instrument(async_db)
+
+app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(user_router)
 app.include_router(apiary_router)
 app.include_router(hive_router)
@@ -35,3 +53,6 @@ app.include_router(queen_router)
 app.include_router(inspection_router)
 app.include_router(action_router)
 app.include_router(observation_router)
+app.include_router(colony_health_router)
+app.include_router(colony_state_router)
+app.include_router(search_router)
@@ -0,0 +1,35 @@
+"""ColonyHealth model class"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class ColonyHealth:
+    """
+    Models one point of a colony's health series: an observation, with the
+    rolling means and trend slopes of the colony's window of observations
+    ending at it. Slopes and growth rates are per day.
+    """
+
+    colony_id: int
+    inspection_id: int
+    observation_id: int
+    inspection_timestamp: datetime
+    varroa_count: int
+    brood_frames: int
+    store_frames: int
+    temper: int
+    queen_cells: int
+    chalk_brood: bool
+    foul_brood: bool
+    varroa_mean: float
+    brood_frames_mean: float
+    store_frames_mean: float
+    temper_mean: float
+    varroa_slope: float | None
+    brood_frames_slope: float | None
+    varroa_growth_rate: float | None
+
+    def __str__(self) -> str:
+        return f"ColonyHealth({self.colony_id}, {self.inspection_id}, {self.observation_id}, {self.inspection_timestamp}, {self.varroa_mean}, {self.varroa_slope}, {self.varroa_growth_rate})"
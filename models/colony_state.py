@@ -0,0 +1,27 @@
+"""ColonyState model class"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class ColonyState:
+    """
+    Models the latest state of a colony, as kept in colony_states. Fields are
+    None until the colony has an inspection, an observation or a queen.
+    """
+
+    colony_id: int
+    inspection_id: int | None
+    inspection_timestamp: datetime | None
+    observation_id: int | None
+    queenright: bool | None
+    varroa_count: int | None
+    chalk_brood: bool | None
+    foul_brood: bool | None
+    queen_id: int | None
+    queen_colour: str | None
+    queen_clipped: bool | None
+
+    def __str__(self) -> str:
+        return f"ColonyState({self.colony_id}, {self.inspection_timestamp}, {self.queenright}, {self.varroa_count}, {self.chalk_brood}, {self.foul_brood}, {self.queen_colour}, {self.queen_clipped})"
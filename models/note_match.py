@@ -0,0 +1,25 @@
+"""NoteMatch model class"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class NoteMatch:
+    """
+    Models one note found by a search: the notes of an observation or an
+    action, the inspection and colony they were written for, the notes with
+    the matching terms highlighted, and how well they match
+    """
+
+    kind: str
+    note_id: int
+    inspection_id: int
+    inspection_timestamp: datetime
+    colony_id: int
+    notes: str
+    headline: str
+    rank: float
+
+    def __str__(self) -> str:
+        return f"NoteMatch({self.kind}, {self.note_id}, {self.inspection_id}, {self.colony_id}, {self.rank})"
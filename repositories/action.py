@@ -1,75 +1,211 @@
 """ActionRepository"""
 
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
+
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
 from db.database_connection import DatabaseConnection
 from models.action import Action
 
+# Actions are partitioned like inspections, so each row copies its inspection's
+# timestamp. Nothing is inserted if the inspection does not exist.
+CREATE_QUERY: str = "INSERT INTO actions (notes, inspection_id, inspection_timestamp) SELECT %s, inspection_id, inspection_timestamp FROM inspections WHERE inspection_id = %s RETURNING action_id;"
+COPY_QUERY: str = (
+    "COPY actions (notes, inspection_id, inspection_timestamp) FROM STDIN;"
+)
+FIND_BY_ACTION_ID_QUERY: str = (
+    "SELECT action_id, notes, inspection_id FROM actions WHERE action_id = %s LIMIT 1;"
+)
+FIND_BY_IDS_QUERY: str = "SELECT action_id, notes, inspection_id FROM actions WHERE action_id = ANY(%s) ORDER BY action_id;"
+FIND_BY_INSPECTION_ID_QUERY: str = "SELECT action_id, notes, inspection_id FROM actions WHERE inspection_id = %s ORDER BY action_id;"
+FIND_PAGE_BY_INSPECTION_ID_QUERY: str = "SELECT action_id, notes, inspection_id FROM actions WHERE inspection_id = %s AND action_id > %s ORDER BY action_id LIMIT %s;"
+READ_QUERY: str = "SELECT action_id, notes, inspection_id FROM actions;"
+READ_PAGE_QUERY: str = "SELECT action_id, notes, inspection_id FROM actions WHERE action_id > %s ORDER BY action_id LIMIT %s;"
+# A missing inspection leaves the old timestamp in place, which the foreign key
+# then rejects
+UPDATE_QUERY: str = "UPDATE actions AS a SET notes = %s, inspection_id = target.inspection_id, inspection_timestamp = coalesce(i.inspection_timestamp, a.inspection_timestamp) FROM (SELECT %s::integer AS inspection_id) AS target LEFT JOIN inspections AS i ON i.inspection_id = target.inspection_id WHERE a.action_id = %s RETURNING a.action_id;"
+DELETE_QUERY: str = "DELETE FROM actions WHERE action_id = %s RETURNING action_id;"
+
+
+ROW_FACTORY: RowFactory[Action] = class_row(Action)
+
 
 class ActionRepository:
     def __init__(self, db: DatabaseConnection) -> None:
         self.db: DatabaseConnection = db
 
-    def create(self, notes: str, inspection_id: int) -> Action | None:
-        query: str = "INSERT INTO actions (notes, inspection_id) VALUES (%s, %s) RETURNING action_id;"
+    def create(self, notes: str, inspection_id: int) -> Action:
+        """Raises LookupError if inspection_id does not exist"""
         params: list[str | int] = [notes, inspection_id]
-        results: list[Action] | None = self.db.execute(query, params)
+        results: list[Action] | None = self.db.execute(CREATE_QUERY, params)
         if results:
             return Action(results[0]["action_id"], notes, inspection_id)
-        return None
+        error_message = f"No inspection with inspection_id {inspection_id}"
+        raise LookupError(error_message)
+
+    def create_many(self, actions: list[tuple[str, int, datetime]]) -> int:
+        """Loads rows of (notes, inspection_id, inspection_timestamp) with COPY. Returns the number of rows written"""
+        rows: list[list] = [list(row) for row in actions]
+        return self.db.copy(COPY_QUERY, rows)
 
     def find_by_action_id(self, action_id: int) -> Action | None:
-        query: str = "SELECT * FROM actions WHERE action_id = %s LIMIT 1;"
         params: list[int] = [action_id]
-        results: list[Action] | None = self.db.execute(query, params)
+        results: list[Action] | None = self.db.execute(
+            FIND_BY_ACTION_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return Action(
-                results[0]["action_id"],
-                results[0]["notes"],
-                results[0]["inspection_id"],
-            )
+            return results[0]
         return None
 
-    def find_by_inspection_id(self, inspection_id: int) -> list[Action] | None:
-        query: str = "SELECT * FROM actions WHERE inspection_id = %s;"
+    def find_by_ids(self, action_ids: list[int]) -> list[Action]:
+        """Returns the actions in action_ids that exist, ordered by action_id, in a single query"""
+        params: list = [list(action_ids)]
+        results: list[Action] | None = self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def find_by_inspection_id(
+        self, inspection_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Action] | None:
+        """Returns every match, or with a limit, the page of matches ordered by action_id after the one given"""
+        query: str = FIND_BY_INSPECTION_ID_QUERY
         params: list[int] = [inspection_id]
-        results: list[Action] | None = self.db.execute(query, params)
+        if limit is not None:
+            query = FIND_PAGE_BY_INSPECTION_ID_QUERY
+            params = [inspection_id, after or 0, limit]
+        results: list[Action] | None = self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return [
-                Action(
-                    row["action_id"],
-                    row["notes"],
-                    row["inspection_id"],
-                )
-                for row in results
-            ]
+            return results
         return None
 
-    def read(self) -> list[Action] | None:
-        query: str = "SELECT * FROM actions;"
+    def stream_by_inspection_id(self, inspection_id: int) -> Iterator[Action]:
+        params: list[int] = [inspection_id]
+        yield from self.db.stream(
+            FIND_BY_INSPECTION_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+
+    def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Action] | None:
+        """Returns every row, or with a limit, the page of rows ordered by action_id after the one given"""
+        query: str = READ_QUERY
         params: list = []
-        results: list[Action] | None = self.db.execute(query, params)
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results: list[Action] | None = self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return [
-                Action(
-                    row["action_id"],
-                    row["notes"],
-                    row["inspection_id"],
-                )
-                for row in results
-            ]
+            return results
         return None
 
     def update(self, action_id: int, notes: str, inspection_id: int) -> Action | None:
-        query: str = (
-            "UPDATE actions SET notes = %s, inspection_id = %s RETURNING action_id;"
-        )
         params: list[int | str] = [notes, inspection_id, action_id]
-        results: list[Action] | None = self.db.execute(query, params)
+        results: list[Action] | None = self.db.execute(UPDATE_QUERY, params)
         if results:
             return Action(results[0]["action_id"], notes, inspection_id)
         return None
 
     def delete(self, action_id: int) -> Action | None:
-        query: str = "DELETE FROM actions WHERE action_id = %s RETURNING action_id;"
         params: list[int] = [action_id]
-        results: list[Action] | None = self.db.execute(query, params)
+        results: list[Action] | None = self.db.execute(DELETE_QUERY, params)
+        return bool(results)
+
+
+class AsyncActionRepository:
+    """Asyncio counterpart of ActionRepository"""
+
+    def __init__(self, db: AsyncDatabaseConnection) -> None:
+        self.db: AsyncDatabaseConnection = db
+
+    async def create(self, notes: str, inspection_id: int) -> Action:
+        """Raises LookupError if inspection_id does not exist"""
+        params: list[str | int] = [notes, inspection_id]
+        results: list[Action] | None = await self.db.execute(CREATE_QUERY, params)
+        if results:
+            return Action(results[0]["action_id"], notes, inspection_id)
+        error_message = f"No inspection with inspection_id {inspection_id}"
+        raise LookupError(error_message)
+
+    async def create_many(self, actions: list[tuple[str, int, datetime]]) -> int:
+        """Loads rows of (notes, inspection_id, inspection_timestamp) with COPY. Returns the number of rows written"""
+        rows: list[list] = [list(row) for row in actions]
+        return await self.db.copy(COPY_QUERY, rows)
+
+    async def find_by_action_id(self, action_id: int) -> Action | None:
+        params: list[int] = [action_id]
+        results: list[Action] | None = await self.db.execute(
+            FIND_BY_ACTION_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    async def find_by_ids(self, action_ids: list[int]) -> list[Action]:
+        """Returns the actions in action_ids that exist, ordered by action_id, in a single query"""
+        params: list = [list(action_ids)]
+        results: list[Action] | None = await self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def find_by_inspection_id(
+        self, inspection_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Action] | None:
+        """Returns every match, or with a limit, the page of matches ordered by action_id after the one given"""
+        query: str = FIND_BY_INSPECTION_ID_QUERY
+        params: list[int] = [inspection_id]
+        if limit is not None:
+            query = FIND_PAGE_BY_INSPECTION_ID_QUERY
+            params = [inspection_id, after or 0, limit]
+        results: list[Action] | None = await self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    async def stream_by_inspection_id(
+        self, inspection_id: int
+    ) -> AsyncIterator[Action]:
+        params: list[int] = [inspection_id]
+        async for row in self.db.stream(
+            FIND_BY_INSPECTION_ID_QUERY, params, row_factory=ROW_FACTORY
+        ):
+            yield row
+
+    async def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Action] | None:
+        """Returns every row, or with a limit, the page of rows ordered by action_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results: list[Action] | None = await self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    async def update(
+        self, action_id: int, notes: str, inspection_id: int
+    ) -> Action | None:
+        params: list[int | str] = [notes, inspection_id, action_id]
+        results: list[Action] | None = await self.db.execute(UPDATE_QUERY, params)
+        if results:
+            return Action(results[0]["action_id"], notes, inspection_id)
+        return None
+
+    async def delete(self, action_id: int) -> Action | None:
+        params: list[int] = [action_id]
+        results: list[Action] | None = await self.db.execute(DELETE_QUERY, params)
         return bool(results)
@@ -1,8 +1,26 @@
 """ApiaryRepository"""
 
+from collections.abc import AsyncIterator, Iterator
+
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
 from db.database_connection import DatabaseConnection
 from models.apiary import Apiary
 
+CREATE_QUERY: str = "INSERT INTO apiaries (name, location, user_id) VALUES (%s, %s, %s) RETURNING apiary_id;"
+FIND_BY_APIARY_ID_QUERY: str = "SELECT apiary_id, name, location, user_id FROM apiaries WHERE apiary_id = %s LIMIT 1;"
+FIND_BY_IDS_QUERY: str = "SELECT apiary_id, name, location, user_id FROM apiaries WHERE apiary_id = ANY(%s) ORDER BY apiary_id;"
+FIND_BY_USER_ID_QUERY: str = "SELECT apiary_id, name, location, user_id FROM apiaries WHERE user_id = %s ORDER BY apiary_id;"
+FIND_PAGE_BY_USER_ID_QUERY: str = "SELECT apiary_id, name, location, user_id FROM apiaries WHERE user_id = %s AND apiary_id > %s ORDER BY apiary_id LIMIT %s;"
+READ_QUERY: str = "SELECT apiary_id, name, location, user_id FROM apiaries;"
+READ_PAGE_QUERY: str = "SELECT apiary_id, name, location, user_id FROM apiaries WHERE apiary_id > %s ORDER BY apiary_id LIMIT %s;"
+UPDATE_QUERY: str = "UPDATE apiaries SET name = %s, location = %s, user_id = %s WHERE apiary_id = %s RETURNING apiary_id;"
+DELETE_QUERY: str = "DELETE FROM apiaries WHERE apiary_id = %s RETURNING apiary_id;"
+
+
+ROW_FACTORY: RowFactory[Apiary] = class_row(Apiary)
+
 
 class ApiaryRepository:
     def __init__(self, db: DatabaseConnection) -> None:
@@ -10,75 +28,158 @@ class ApiaryRepository:
 
     def create(self, name: str, location: str, user_id: int) -> Apiary | None:
         if len(name) and len(location) and isinstance(user_id, int):
-            query: str = "INSERT INTO apiaries (name, location, user_id) VALUES (%s, %s, %s) RETURNING apiary_id;"
             params: list = [name, location, user_id]
-            results: list[dict] | None = self.db.execute(query, params)
+            results: list[dict] | None = self.db.execute(CREATE_QUERY, params)
             if results:
                 return Apiary(results[0]["apiary_id"], name, location, user_id)
         return None
 
     def find_by_apiary_id(self, apiary_id: int) -> Apiary | None:
-        query: str = "SELECT * FROM apiaries WHERE apiary_id = %s LIMIT 1;"
         params: list[int] = [apiary_id]
-        results: list[dict] | None = self.db.execute(query, params)
+        results: list[Apiary] | None = self.db.execute(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return Apiary(
-                results[0]["apiary_id"],
-                results[0]["name"],
-                results[0]["location"],
-                results[0]["user_id"],
-            )
+            return results[0]
         return None
 
-    def find_by_user_id(self, user_id: int) -> list[Apiary] | None:
-        query: str = "SELECT * FROM apiaries WHERE user_id = %s;"
+    def find_by_ids(self, apiary_ids: list[int]) -> list[Apiary]:
+        """Returns the apiarys in apiary_ids that exist, ordered by apiary_id, in a single query"""
+        params: list = [list(apiary_ids)]
+        results: list[Apiary] | None = self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def find_by_user_id(
+        self, user_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Apiary] | None:
+        """Returns every match, or with a limit, the page of matches ordered by apiary_id after the one given"""
+        query: str = FIND_BY_USER_ID_QUERY
         params: list[int] = [user_id]
-        results: list[dict] | None = self.db.execute(query, params)
+        if limit is not None:
+            query = FIND_PAGE_BY_USER_ID_QUERY
+            params = [user_id, after or 0, limit]
+        results: list[Apiary] | None = self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return [
-                Apiary(
-                    row["apiary_id"],
-                    row["name"],
-                    row["location"],
-                    row["user_id"],
-                )
-                for row in results
-            ]
+            return results
         return None
 
-    def read(self) -> list[Apiary] | None:
-        query: str = "SELECT * FROM apiaries;"
-        params = []
-        results = self.db.execute(query, params)
+    def stream_by_user_id(self, user_id: int) -> Iterator[Apiary]:
+        params: list[int] = [user_id]
+        yield from self.db.stream(
+            FIND_BY_USER_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+
+    def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Apiary] | None:
+        """Returns every row, or with a limit, the page of rows ordered by apiary_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results = self.db.execute(query, params, row_factory=ROW_FACTORY)
         if results:
-            return [
-                Apiary(
-                    row["apiary_id"],
-                    row["name"],
-                    row["location"],
-                    row["user_id"],
-                )
-                for row in results
-            ]
+            return results
         return None
 
     def update(
         self, apiary_id: int, name: str, location: str, user_id: int
     ) -> Apiary | None:
-        query: str = "UPDATE apiaries SET name = %s, location = %s, user_id = %s WHERE apiary_id = %s RETURNING apiary_id;"
         params = [name, location, user_id, apiary_id]
-        results = self.db.execute(query, params)
+        results = self.db.execute(UPDATE_QUERY, params)
         if results:
-            return Apiary(
-                results[0]["apiary_id"],
-                results[0]["name"],
-                results[0]["location"],
-                results[0]["user_id"],
-            )
+            return Apiary(results[0]["apiary_id"], name, location, user_id)
         return None
 
     def delete(self, apiary_id: int) -> bool:
-        query: str = "DELETE FROM apiaries WHERE apiary_id = %s RETURNING apiary_id;"
         params: list[int] = [apiary_id]
-        results = self.db.execute(query, params)
+        results = self.db.execute(DELETE_QUERY, params)
+        return bool(results)
+
+
+class AsyncApiaryRepository:
+    """Asyncio counterpart of ApiaryRepository"""
+
+    def __init__(self, db: AsyncDatabaseConnection) -> None:
+        self.db = db
+
+    async def create(self, name: str, location: str, user_id: int) -> Apiary | None:
+        if len(name) and len(location) and isinstance(user_id, int):
+            params: list = [name, location, user_id]
+            results: list[dict] | None = await self.db.execute(CREATE_QUERY, params)
+            if results:
+                return Apiary(results[0]["apiary_id"], name, location, user_id)
+        return None
+
+    async def find_by_apiary_id(self, apiary_id: int) -> Apiary | None:
+        params: list[int] = [apiary_id]
+        results: list[Apiary] | None = await self.db.execute(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    async def find_by_ids(self, apiary_ids: list[int]) -> list[Apiary]:
+        """Returns the apiarys in apiary_ids that exist, ordered by apiary_id, in a single query"""
+        params: list = [list(apiary_ids)]
+        results: list[Apiary] | None = await self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def find_by_user_id(
+        self, user_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Apiary] | None:
+        """Returns every match, or with a limit, the page of matches ordered by apiary_id after the one given"""
+        query: str = FIND_BY_USER_ID_QUERY
+        params: list[int] = [user_id]
+        if limit is not None:
+            query = FIND_PAGE_BY_USER_ID_QUERY
+            params = [user_id, after or 0, limit]
+        results: list[Apiary] | None = await self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    async def stream_by_user_id(self, user_id: int) -> AsyncIterator[Apiary]:
+        params: list[int] = [user_id]
+        async for row in self.db.stream(
+            FIND_BY_USER_ID_QUERY, params, row_factory=ROW_FACTORY
+        ):
+            yield row
+
+    async def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Apiary] | None:
+        """Returns every row, or with a limit, the page of rows ordered by apiary_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results = await self.db.execute(query, params, row_factory=ROW_FACTORY)
+        if results:
+            return results
+        return None
+
+    async def update(
+        self, apiary_id: int, name: str, location: str, user_id: int
+    ) -> Apiary | None:
+        params = [name, location, user_id, apiary_id]
+        results = await self.db.execute(UPDATE_QUERY, params)
+        if results:
+            return Apiary(results[0]["apiary_id"], name, location, user_id)
+        return None
+
+    async def delete(self, apiary_id: int) -> bool:
+        params: list[int] = [apiary_id]
+        results = await self.db.execute(DELETE_QUERY, params)
         return bool(results)
@@ -1,56 +1,212 @@
 """ColonyRepository"""
 
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
 from db.database_connection import DatabaseConnection
 from models.colony import Colony
 
+CREATE_QUERY: str = "INSERT INTO colonies (hive_id) VALUES (%s) RETURNING colony_id;"
+FIND_BY_COLONY_ID_QUERY: str = (
+    "SELECT colony_id, hive_id FROM colonies WHERE colony_id = %s LIMIT 1;"
+)
+FIND_BY_IDS_QUERY: str = "SELECT colony_id, hive_id FROM colonies WHERE colony_id = ANY(%s) ORDER BY colony_id;"
+FIND_EXISTING_COLONY_IDS_QUERY: str = (
+    "SELECT colony_id FROM colonies WHERE colony_id = ANY(%s);"
+)
+FIND_BY_HIVE_ID_QUERY: str = (
+    "SELECT colony_id, hive_id FROM colonies WHERE hive_id = %s ORDER BY colony_id;"
+)
+FIND_PAGE_BY_HIVE_ID_QUERY: str = "SELECT colony_id, hive_id FROM colonies WHERE hive_id = %s AND colony_id > %s ORDER BY colony_id LIMIT %s;"
+FIND_BY_HIVE_IDS_QUERY: str = "SELECT colony_id, hive_id FROM colonies WHERE hive_id = ANY(%s) ORDER BY colony_id;"
+READ_QUERY: str = "SELECT colony_id, hive_id FROM colonies;"
+READ_PAGE_QUERY: str = "SELECT colony_id, hive_id FROM colonies WHERE colony_id > %s ORDER BY colony_id LIMIT %s;"
+UPDATE_QUERY: str = (
+    "UPDATE colonies SET hive_id = %s WHERE colony_id = %s RETURNING colony_id;"
+)
+DELETE_QUERY: str = "DELETE FROM colonies WHERE colony_id = %s RETURNING colony_id;"
+
+
+ROW_FACTORY: RowFactory[Colony] = class_row(Colony)
+
 
 class ColonyRepository:
     def __init__(self, db: DatabaseConnection) -> None:
         self.db = db
 
     def create(self, hive_id: int) -> Colony | None:
-        query: str = "INSERT INTO colonies (hive_id) VALUES (%s) RETURNING colony_id;"
         params: list = [hive_id]
-        results: list[dict] | None = self.db.execute(query, params)
+        results: list[dict] | None = self.db.execute(CREATE_QUERY, params)
         if results:
             return Colony(results[0]["colony_id"], hive_id)
         return None
 
     def find_by_colony_id(self, colony_id: int) -> Colony | None:
-        query: str = "SELECT * FROM colonies WHERE colony_id = %s LIMIT 1;"
         params: list = [colony_id]
-        results: list[dict] | None = self.db.execute(query, params)
+        results: list[Colony] | None = self.db.execute(
+            FIND_BY_COLONY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return Colony(results[0]["colony_id"], results[0]["hive_id"])
+            return results[0]
         return None
 
-    def find_by_hive_id(self, hive_id: int) -> Colony | None:
-        query: str = "SELECT * FROM colonies WHERE hive_id = %s LIMIT 1;"
+    def find_by_ids(self, colony_ids: list[int]) -> list[Colony]:
+        """Returns the colonies in colony_ids that exist, ordered by colony_id, in a single query"""
+        params: list = [list(colony_ids)]
+        results: list[Colony] | None = self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def find_existing_colony_ids(self, colony_ids: list[int]) -> set[int]:
+        """Returns which of colony_ids exist, checked in a single query"""
+        params: list = [list(colony_ids)]
+        results: list[dict] | None = self.db.execute(
+            FIND_EXISTING_COLONY_IDS_QUERY, params
+        )
+        return {row["colony_id"] for row in results or []}
+
+    def find_by_hive_id(
+        self, hive_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Colony] | None:
+        """Returns every match, or with a limit, the page of matches ordered by colony_id after the one given"""
+        query: str = FIND_BY_HIVE_ID_QUERY
         params: list = [hive_id]
-        results: list[dict] | None = self.db.execute(query, params)
+        if limit is not None:
+            query = FIND_PAGE_BY_HIVE_ID_QUERY
+            params = [hive_id, after or 0, limit]
+        results: list[Colony] | None = self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return Colony(results[0]["colony_id"], results[0]["hive_id"])
+            return results
         return None
 
-    def read(self) -> list[Colony] | None:
-        query: str = "SELECT * FROM colonies;"
+    def find_by_hive_ids(self, hive_ids: list[int]) -> list[Colony]:
+        """Returns the colonies of every hive in hive_ids, in a single query"""
+        params: list = [list(hive_ids)]
+        results: list[Colony] | None = self.db.execute(
+            FIND_BY_HIVE_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Colony] | None:
+        """Returns every row, or with a limit, the page of rows ordered by colony_id after the one given"""
+        query: str = READ_QUERY
         params: list = []
-        results: list[dict] | None = self.db.execute(query, params)
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results: list[Colony] | None = self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return [Colony(row["colony_id"], row["hive_id"]) for row in results]
+            return results
         return None
 
     def update(self, colony_id: int, hive_id: int) -> Colony | None:
         if isinstance(hive_id, int):
-            query: str = "UPDATE colonies SET hive_id = %s WHERE colony_id = %s RETURNING colony_id;"
             params: list[int] = [hive_id, colony_id]
-            results: list[dict] = self.db.execute(query, params)
+            results: list[dict] = self.db.execute(UPDATE_QUERY, params)
             if results:
                 return Colony(results[0]["colony_id"], hive_id)
         return None
 
     def delete(self, colony_id: int) -> bool:
-        query: str = "DELETE FROM colonies WHERE colony_id = %s RETURNING colony_id;"
         params: list[int] = [colony_id]
-        results: list[dict] | None = self.db.execute(query, params)
+        results: list[dict] | None = self.db.execute(DELETE_QUERY, params)
+        return bool(results)
+
+
+class AsyncColonyRepository:
+    """Asyncio counterpart of ColonyRepository"""
+
+    def __init__(self, db: AsyncDatabaseConnection) -> None:
+        self.db = db
+
+    async def create(self, hive_id: int) -> Colony | None:
+        params: list = [hive_id]
+        results: list[dict] | None = await self.db.execute(CREATE_QUERY, params)
+        if results:
+            return Colony(results[0]["colony_id"], hive_id)
+        return None
+
+    async def find_by_colony_id(self, colony_id: int) -> Colony | None:
+        params: list = [colony_id]
+        results: list[Colony] | None = await self.db.execute(
+            FIND_BY_COLONY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    async def find_by_ids(self, colony_ids: list[int]) -> list[Colony]:
+        """Returns the colonies in colony_ids that exist, ordered by colony_id, in a single query"""
+        params: list = [list(colony_ids)]
+        results: list[Colony] | None = await self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def find_existing_colony_ids(self, colony_ids: list[int]) -> set[int]:
+        """Returns which of colony_ids exist, checked in a single query"""
+        params: list = [list(colony_ids)]
+        results: list[dict] | None = await self.db.execute(
+            FIND_EXISTING_COLONY_IDS_QUERY, params
+        )
+        return {row["colony_id"] for row in results or []}
+
+    async def find_by_hive_id(
+        self, hive_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Colony] | None:
+        """Returns every match, or with a limit, the page of matches ordered by colony_id after the one given"""
+        query: str = FIND_BY_HIVE_ID_QUERY
+        params: list = [hive_id]
+        if limit is not None:
+            query = FIND_PAGE_BY_HIVE_ID_QUERY
+            params = [hive_id, after or 0, limit]
+        results: list[Colony] | None = await self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    async def find_by_hive_ids(self, hive_ids: list[int]) -> list[Colony]:
+        """Returns the colonies of every hive in hive_ids, in a single query"""
+        params: list = [list(hive_ids)]
+        results: list[Colony] | None = await self.db.execute(
+            FIND_BY_HIVE_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Colony] | None:
+        """Returns every row, or with a limit, the page of rows ordered by colony_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results: list[Colony] | None = await self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    async def update(self, colony_id: int, hive_id: int) -> Colony | None:
+        if isinstance(hive_id, int):
+            params: list[int] = [hive_id, colony_id]
+            results: list[dict] = await self.db.execute(UPDATE_QUERY, params)
+            if results:
+                return Colony(results[0]["colony_id"], hive_id)
+        return None
+
+    async def delete(self, colony_id: int) -> bool:
+        params: list[int] = [colony_id]
+        results: list[dict] | None = await self.db.execute(DELETE_QUERY, params)
         return bool(results)
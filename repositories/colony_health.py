@@ -0,0 +1,121 @@
+"""ColonyHealthRepository"""
+
+from collections.abc import AsyncIterator, Iterator
+
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
+from db.database_connection import DatabaseConnection
+from models.colony_health import ColonyHealth
+
+# Every observation with the means and least-squares slopes over its colony's last
+# %s + 1 observations, and the change in varroa_count per day since the previous one.
+# Window functions compute the whole series in one pass over the rows, in the order
+# the (colony_id, inspection_timestamp, inspection_id) index already reads them.
+SERIES_SELECT: str = (
+    "SELECT i.colony_id, i.inspection_id, o.observation_id, i.inspection_timestamp, "
+    "o.varroa_count, o.brood_frames, o.store_frames, o.temper, o.queen_cells, o.chalk_brood, o.foul_brood, "
+    "(avg(o.varroa_count) OVER w)::float8 AS varroa_mean, "
+    "(avg(o.brood_frames) OVER w)::float8 AS brood_frames_mean, "
+    "(avg(o.store_frames) OVER w)::float8 AS store_frames_mean, "
+    "(avg(o.temper) OVER w)::float8 AS temper_mean, "
+    "regr_slope(o.varroa_count, extract(epoch FROM i.inspection_timestamp)::float8 / 86400) OVER w AS varroa_slope, "
+    "regr_slope(o.brood_frames, extract(epoch FROM i.inspection_timestamp)::float8 / 86400) OVER w AS brood_frames_slope, "
+    "((o.varroa_count - lag(o.varroa_count) OVER p) / nullif(extract(epoch FROM i.inspection_timestamp - lag(i.inspection_timestamp) OVER p)::float8 / 86400, 0)) AS varroa_growth_rate "
+    "FROM inspections i JOIN observations o ON o.inspection_id = i.inspection_id AND o.inspection_timestamp = i.inspection_timestamp "
+)
+SERIES_WINDOW: str = (
+    "WINDOW p AS (PARTITION BY i.colony_id ORDER BY i.inspection_timestamp, i.inspection_id, o.observation_id), "
+    "w AS (p ROWS BETWEEN %s PRECEDING AND CURRENT ROW) "
+    "ORDER BY i.colony_id, i.inspection_timestamp, i.inspection_id, o.observation_id;"
+)
+FIND_BY_COLONY_ID_QUERY: str = SERIES_SELECT + "WHERE i.colony_id = %s " + SERIES_WINDOW
+FIND_BY_APIARY_ID_QUERY: str = (
+    SERIES_SELECT
+    + "JOIN colonies c ON c.colony_id = i.colony_id JOIN hives h ON h.hive_id = c.hive_id WHERE h.apiary_id = %s "
+    + SERIES_WINDOW
+)
+
+
+ROW_FACTORY: RowFactory[ColonyHealth] = class_row(ColonyHealth)
+
+
+class ColonyHealthRepository:
+    """Reads the health series of colonies from their observations"""
+
+    def __init__(self, db: DatabaseConnection) -> None:
+        """Init with a database connection"""
+        self.db = db
+
+    def find_by_colony_id(
+        self, colony_id: int, window: int
+    ) -> list[ColonyHealth] | None:
+        """Returns the colony's series, each point averaged over the window of observations ending at it"""
+        params: list[int] = [colony_id, window - 1]
+        results = self.db.execute(
+            FIND_BY_COLONY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    def find_by_apiary_id(
+        self, apiary_id: int, window: int
+    ) -> list[ColonyHealth] | None:
+        """Returns the series of every colony in the apiary, ordered by colony_id"""
+        params: list[int] = [apiary_id, window - 1]
+        results = self.db.execute(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    def stream_by_apiary_id(
+        self, apiary_id: int, window: int
+    ) -> Iterator[ColonyHealth]:
+        params: list[int] = [apiary_id, window - 1]
+        yield from self.db.stream(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+
+
+class AsyncColonyHealthRepository:
+    """Asyncio counterpart of ColonyHealthRepository"""
+
+    def __init__(self, db: AsyncDatabaseConnection) -> None:
+        """Init with an async database connection"""
+        self.db = db
+
+    async def find_by_colony_id(
+        self, colony_id: int, window: int
+    ) -> list[ColonyHealth] | None:
+        """Returns the colony's series, each point averaged over the window of observations ending at it"""
+        params: list[int] = [colony_id, window - 1]
+        results = await self.db.execute(
+            FIND_BY_COLONY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    async def find_by_apiary_id(
+        self, apiary_id: int, window: int
+    ) -> list[ColonyHealth] | None:
+        """Returns the series of every colony in the apiary, ordered by colony_id"""
+        params: list[int] = [apiary_id, window - 1]
+        results = await self.db.execute(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    async def stream_by_apiary_id(
+        self, apiary_id: int, window: int
+    ) -> AsyncIterator[ColonyHealth]:
+        params: list[int] = [apiary_id, window - 1]
+        async for row in self.db.stream(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        ):
+            yield row
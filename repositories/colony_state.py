@@ -0,0 +1,83 @@
+"""ColonyStateRepository"""
+
+from collections.abc import AsyncIterator, Iterator
+
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
+from db.database_connection import DatabaseConnection
+from models.colony_state import ColonyState
+
+# colony_states is written by triggers in sql/schema.sql, never from here
+FIND_BY_COLONY_ID_QUERY: str = "SELECT colony_id, inspection_id, inspection_timestamp, observation_id, queenright, varroa_count, chalk_brood, foul_brood, queen_id, queen_colour, queen_clipped FROM colony_states WHERE colony_id = %s LIMIT 1;"
+FIND_BY_APIARY_ID_QUERY: str = "SELECT s.colony_id, s.inspection_id, s.inspection_timestamp, s.observation_id, s.queenright, s.varroa_count, s.chalk_brood, s.foul_brood, s.queen_id, s.queen_colour, s.queen_clipped FROM hives h JOIN colonies c ON c.hive_id = h.hive_id JOIN colony_states s ON s.colony_id = c.colony_id WHERE h.apiary_id = %s ORDER BY s.colony_id;"
+
+
+ROW_FACTORY: RowFactory[ColonyState] = class_row(ColonyState)
+
+
+class ColonyStateRepository:
+    """Reads the latest state of colonies from colony_states"""
+
+    def __init__(self, db: DatabaseConnection) -> None:
+        """Init with a database connection"""
+        self.db = db
+
+    def find_by_colony_id(self, colony_id: int) -> ColonyState | None:
+        params = [colony_id]
+        results = self.db.execute(
+            FIND_BY_COLONY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    def find_by_apiary_id(self, apiary_id: int) -> list[ColonyState] | None:
+        """Returns the state of every colony in the apiary, ordered by colony_id"""
+        params = [apiary_id]
+        results = self.db.execute(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    def stream_by_apiary_id(self, apiary_id: int) -> Iterator[ColonyState]:
+        params: list[int] = [apiary_id]
+        yield from self.db.stream(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+
+
+class AsyncColonyStateRepository:
+    """Asyncio counterpart of ColonyStateRepository"""
+
+    def __init__(self, db: AsyncDatabaseConnection) -> None:
+        """Init with an async database connection"""
+        self.db = db
+
+    async def find_by_colony_id(self, colony_id: int) -> ColonyState | None:
+        params = [colony_id]
+        results = await self.db.execute(
+            FIND_BY_COLONY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    async def find_by_apiary_id(self, apiary_id: int) -> list[ColonyState] | None:
+        """Returns the state of every colony in the apiary, ordered by colony_id"""
+        params = [apiary_id]
+        results = await self.db.execute(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    async def stream_by_apiary_id(self, apiary_id: int) -> AsyncIterator[ColonyState]:
+        params: list[int] = [apiary_id]
+        async for row in self.db.stream(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        ):
+            yield row
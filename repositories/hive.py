@@ -1,8 +1,34 @@
 """HiveRepository"""
 
+from collections.abc import AsyncIterator, Iterator
+
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
 from db.database_connection import DatabaseConnection
 from models.hive import Hive
 
+CREATE_QUERY: str = (
+    "INSERT INTO hives (name, apiary_id) VALUES (%s, %s) RETURNING hive_id;"
+)
+FIND_BY_HIVE_ID_QUERY: str = (
+    "SELECT hive_id, name, apiary_id FROM hives WHERE hive_id = %s LIMIT 1;"
+)
+FIND_BY_IDS_QUERY: str = "SELECT hive_id, name, apiary_id FROM hives WHERE hive_id = ANY(%s) ORDER BY hive_id;"
+FIND_BY_APIARY_ID_QUERY: str = (
+    "SELECT hive_id, name, apiary_id FROM hives WHERE apiary_id = %s ORDER BY hive_id;"
+)
+FIND_PAGE_BY_APIARY_ID_QUERY: str = "SELECT hive_id, name, apiary_id FROM hives WHERE apiary_id = %s AND hive_id > %s ORDER BY hive_id LIMIT %s;"
+READ_QUERY: str = "SELECT hive_id, name, apiary_id FROM hives;"
+READ_PAGE_QUERY: str = "SELECT hive_id, name, apiary_id FROM hives WHERE hive_id > %s ORDER BY hive_id LIMIT %s;"
+UPDATE_QUERY: str = (
+    "UPDATE hives SET name = %s, apiary_id = %s WHERE hive_id = %s RETURNING hive_id;"
+)
+DELETE_QUERY: str = "DELETE FROM hives WHERE hive_id = %s RETURNING hive_id;"
+
+
+ROW_FACTORY: RowFactory[Hive] = class_row(Hive)
+
 
 class HiveRepository:
     def __init__(self, db: DatabaseConnection) -> None:
@@ -10,60 +36,154 @@ class HiveRepository:
 
     def create(self, name: str, apiary_id: int) -> Hive | None:
         if len(name) and isinstance(apiary_id, int):
-            query: str = (
-                "INSERT INTO hives (name, apiary_id) VALUES (%s, %s) RETURNING hive_id;"
-            )
             params: list = [name, apiary_id]
-            results: list[dict] | None = self.db.execute(query, params)
+            results: list[dict] | None = self.db.execute(CREATE_QUERY, params)
             if results:
                 return Hive(results[0]["hive_id"], name, apiary_id)
         return None
 
     def find_by_hive_id(self, hive_id: int) -> Hive | None:
         if isinstance(hive_id, int):
-            query = "SELECT * FROM hives WHERE hive_id = %s LIMIT 1;"
             params = [hive_id]
-            results = self.db.execute(query, params)
+            results = self.db.execute(
+                FIND_BY_HIVE_ID_QUERY, params, row_factory=ROW_FACTORY
+            )
             if results:
-                return Hive(
-                    results[0]["hive_id"], results[0]["name"], results[0]["apiary_id"]
-                )
+                return results[0]
         return None
 
-    def find_by_apiary_id(self, apiary_id: int) -> list[Hive] | None:
+    def find_by_ids(self, hive_ids: list[int]) -> list[Hive]:
+        """Returns the hives in hive_ids that exist, ordered by hive_id, in a single query"""
+        params: list = [list(hive_ids)]
+        results: list[Hive] | None = self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def find_by_apiary_id(
+        self, apiary_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Hive] | None:
+        """Returns every match, or with a limit, the page of matches ordered by hive_id after the one given"""
         if isinstance(apiary_id, int):
-            query = "SELECT * FROM hives WHERE apiary_id = %s;"
-            params = [apiary_id]
-            results = self.db.execute(query, params)
+            query: str = FIND_BY_APIARY_ID_QUERY
+            params: list[int] = [apiary_id]
+            if limit is not None:
+                query = FIND_PAGE_BY_APIARY_ID_QUERY
+                params = [apiary_id, after or 0, limit]
+            results = self.db.execute(query, params, row_factory=ROW_FACTORY)
             if results:
-                return [
-                    Hive(row["hive_id"], row["name"], row["apiary_id"])
-                    for row in results
-                ]
+                return results
         return None
 
-    def read(self) -> list[Hive] | None:
-        query = "SELECT * FROM hives;"
-        params = []
-        results = self.db.execute(query, params)
+    def stream_by_apiary_id(self, apiary_id: int) -> Iterator[Hive]:
+        params: list[int] = [apiary_id]
+        yield from self.db.stream(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+
+    def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Hive] | None:
+        """Returns every row, or with a limit, the page of rows ordered by hive_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results = self.db.execute(query, params, row_factory=ROW_FACTORY)
         if results:
-            return [
-                Hive(row["hive_id"], row["name"], row["apiary_id"]) for row in results
-            ]
+            return results
         return None
 
     def update(self, hive_id: int, name: str, apiary_id: int) -> Hive | None:
-        query = "UPDATE hives SET name = %s, apiary_id = %s WHERE hive_id = %s RETURNING hive_id;"
         params = [name, apiary_id, hive_id]
-        results = self.db.execute(query, params)
+        results = self.db.execute(UPDATE_QUERY, params)
         if results:
-            return Hive(
-                results[0]["hive_id"], results[0]["name"], results[0]["apiary_id"]
-            )
+            return Hive(results[0]["hive_id"], name, apiary_id)
         return None
 
     def delete(self, hive_id: int) -> bool:
-        query = "DELETE FROM hives WHERE hive_id = %s RETURNING hive_id;"
         params = [hive_id]
-        results = self.db.execute(query, params)
+        results = self.db.execute(DELETE_QUERY, params)
+        return bool(results)
+
+
+class AsyncHiveRepository:
+    """Asyncio counterpart of HiveRepository"""
+
+    def __init__(self, db: AsyncDatabaseConnection) -> None:
+        self.db = db
+
+    async def create(self, name: str, apiary_id: int) -> Hive | None:
+        if len(name) and isinstance(apiary_id, int):
+            params: list = [name, apiary_id]
+            results: list[dict] | None = await self.db.execute(CREATE_QUERY, params)
+            if results:
+                return Hive(results[0]["hive_id"], name, apiary_id)
+        return None
+
+    async def find_by_hive_id(self, hive_id: int) -> Hive | None:
+        if isinstance(hive_id, int):
+            params = [hive_id]
+            results = await self.db.execute(
+                FIND_BY_HIVE_ID_QUERY, params, row_factory=ROW_FACTORY
+            )
+            if results:
+                return results[0]
+        return None
+
+    async def find_by_ids(self, hive_ids: list[int]) -> list[Hive]:
+        """Returns the hives in hive_ids that exist, ordered by hive_id, in a single query"""
+        params: list = [list(hive_ids)]
+        results: list[Hive] | None = await self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def find_by_apiary_id(
+        self, apiary_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Hive] | None:
+        """Returns every match, or with a limit, the page of matches ordered by hive_id after the one given"""
+        if isinstance(apiary_id, int):
+            query: str = FIND_BY_APIARY_ID_QUERY
+            params: list[int] = [apiary_id]
+            if limit is not None:
+                query = FIND_PAGE_BY_APIARY_ID_QUERY
+                params = [apiary_id, after or 0, limit]
+            results = await self.db.execute(query, params, row_factory=ROW_FACTORY)
+            if results:
+                return results
+        return None
+
+    async def stream_by_apiary_id(self, apiary_id: int) -> AsyncIterator[Hive]:
+        params: list[int] = [apiary_id]
+        async for row in self.db.stream(
+            FIND_BY_APIARY_ID_QUERY, params, row_factory=ROW_FACTORY
+        ):
+            yield row
+
+    async def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Hive] | None:
+        """Returns every row, or with a limit, the page of rows ordered by hive_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results = await self.db.execute(query, params, row_factory=ROW_FACTORY)
+        if results:
+            return results
+        return None
+
+    async def update(self, hive_id: int, name: str, apiary_id: int) -> Hive | None:
+        params = [name, apiary_id, hive_id]
+        results = await self.db.execute(UPDATE_QUERY, params)
+        if results:
+            return Hive(results[0]["hive_id"], name, apiary_id)
+        return None
+
+    async def delete(self, hive_id: int) -> bool:
+        params = [hive_id]
+        results = await self.db.execute(DELETE_QUERY, params)
         return bool(results)
@@ -1,10 +1,53 @@
 """InspectionRepository"""
 
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
 
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
 from db.database_connection import DatabaseConnection
 from models.inspection import Inspection
 
+CREATE_QUERY: str = "INSERT INTO inspections (inspection_timestamp, colony_id) VALUES (%s, %s) RETURNING inspection_id;"
+# One statement for the whole batch, so the colony_states triggers refresh each
+# colony once. Rows go in ordered by position, so their ids ascend in input order
+CREATE_MANY_QUERY: str = "INSERT INTO inspections (inspection_timestamp, colony_id) SELECT inspection_timestamp, colony_id FROM unnest(%s::timestamptz[], %s::integer[]) WITH ORDINALITY AS batch (inspection_timestamp, colony_id, position) ORDER BY position RETURNING inspection_id;"
+FIND_BY_INSPECTION_ID_QUERY: str = "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE inspection_id = %s LIMIT 1;"
+FIND_BY_IDS_QUERY: str = "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE inspection_id = ANY(%s) ORDER BY inspection_id;"
+FIND_BY_COLONY_ID_QUERY: str = "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = %s ORDER BY inspection_timestamp, inspection_id;"
+FIND_PAGE_BY_COLONY_ID_QUERY: str = "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = %s ORDER BY inspection_timestamp, inspection_id LIMIT %s;"
+FIND_PAGE_BY_COLONY_ID_AFTER_QUERY: str = "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = %s AND (inspection_timestamp, inspection_id) > (%s, %s) ORDER BY inspection_timestamp, inspection_id LIMIT %s;"
+# DISTINCT ON keeps the first row per colony, read backwards off the (colony_id, inspection_timestamp, inspection_id) index
+FIND_LATEST_BY_COLONY_IDS_QUERY: str = "SELECT DISTINCT ON (colony_id) inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = ANY(%s) ORDER BY colony_id, inspection_timestamp DESC, inspection_id DESC;"
+READ_QUERY: str = (
+    "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections;"
+)
+READ_PAGE_QUERY: str = "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE inspection_id > %s ORDER BY inspection_id LIMIT %s;"
+UPDATE_QUERY: str = "UPDATE inspections SET inspection_timestamp = %s, colony_id = %s WHERE inspection_id = %s RETURNING inspection_id;"
+DELETE_QUERY: str = (
+    "DELETE FROM inspections WHERE inspection_id = %s RETURNING inspection_id;"
+)
+
+
+ROW_FACTORY: RowFactory[Inspection] = class_row(Inspection)
+
+
+def _columns(inspections: list[tuple[datetime, int]]) -> list[list]:
+    return [[row[0] for row in inspections], [row[1] for row in inspections]]
+
+
+def _created(
+    results: list[dict] | None, inspections: list[tuple[datetime, int]]
+) -> list[Inspection]:
+    inspection_ids = sorted(row["inspection_id"] for row in results or [])
+    return [
+        Inspection(inspection_id, inspection_timestamp, colony_id)
+        for inspection_id, (inspection_timestamp, colony_id) in zip(
+            inspection_ids, inspections, strict=True
+        )
+    ]
+
 
 class InspectionRepository:
     """Controls the interaction between models.inspection and the database"""
@@ -16,59 +59,90 @@ class InspectionRepository:
     def create(
         self, inspection_timestamp: datetime, colony_id: int
     ) -> Inspection | None:
-        query: str = "INSERT INTO inspections (inspection_timestamp, colony_id) VALUES (%s, %s) RETURNING inspection_id;"
         params: list[datetime | int] = [inspection_timestamp, colony_id]
-        result: list[int] | None = self.db.execute(query, params)
+        result: list[int] | None = self.db.execute(CREATE_QUERY, params)
         if result:
             return Inspection(
                 result[0]["inspection_id"], inspection_timestamp, colony_id
             )
         return None
 
+    def create_many(self, inspections: list[tuple[datetime, int]]) -> list[Inspection]:
+        """Inserts (inspection_timestamp, colony_id) pairs with one multi-row insert. Returns them in the same order"""
+        results: list[dict] = self.db.execute(CREATE_MANY_QUERY, _columns(inspections))
+        return _created(results, inspections)
+
     def find_by_inspection_id(self, inspection_id: int) -> Inspection | None:
-        query = "SELECT * FROM inspections WHERE inspection_id = %s LIMIT 1;"
         params = [inspection_id]
-        results = self.db.execute(query, params)
+        results = self.db.execute(
+            FIND_BY_INSPECTION_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return Inspection(
-                results[0]["inspection_id"],
-                results[0]["inspection_timestamp"],
-                results[0]["colony_id"],
-            )
+            return results[0]
         return None
 
-    def find_by_colony_id(self, colony_id: int) -> list[Inspection] | None:
-        query = "SELECT * FROM inspections WHERE colony_id = %s;"
-        params = [colony_id]
-        results = self.db.execute(query, params)
+    def find_by_ids(self, inspection_ids: list[int]) -> list[Inspection]:
+        """Returns the inspections in inspection_ids that exist, ordered by inspection_id, in a single query"""
+        params: list = [list(inspection_ids)]
+        results: list[Inspection] | None = self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def find_latest_by_colony_ids(self, colony_ids: list[int]) -> list[Inspection]:
+        """Returns the most recent inspection of every colony in colony_ids, in a single query"""
+        params: list = [list(colony_ids)]
+        results: list[Inspection] | None = self.db.execute(
+            FIND_LATEST_BY_COLONY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def find_by_colony_id(
+        self,
+        colony_id: int,
+        *,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[Inspection] | None:
+        """Returns every match, or with a limit, the page of matches ordered by (inspection_timestamp, inspection_id) after the key given"""
+        query: str = FIND_BY_COLONY_ID_QUERY
+        params: list = [colony_id]
+        if limit is not None and after is None:
+            query = FIND_PAGE_BY_COLONY_ID_QUERY
+            params = [colony_id, limit]
+        elif limit is not None:
+            query = FIND_PAGE_BY_COLONY_ID_AFTER_QUERY
+            params = [colony_id, *after, limit]
+        results = self.db.execute(query, params, row_factory=ROW_FACTORY)
         if results:
-            return [
-                Inspection(
-                    row["inspection_id"], row["inspection_timestamp"], row["colony_id"]
-                )
-                for row in results
-            ]
+            return results
         return None
 
-    def read(self) -> list[Inspection] | None:
-        query = "SELECT * FROM inspections;"
-        params = []
-        results = self.db.execute(query, params)
+    def stream_by_colony_id(self, colony_id: int) -> Iterator[Inspection]:
+        params: list[int] = [colony_id]
+        yield from self.db.stream(
+            FIND_BY_COLONY_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+
+    def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Inspection] | None:
+        """Returns every row, or with a limit, the page of rows ordered by inspection_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results = self.db.execute(query, params, row_factory=ROW_FACTORY)
         if results:
-            return [
-                Inspection(
-                    row["inspection_id"], row["inspection_timestamp"], row["colony_id"]
-                )
-                for row in results
-            ]
+            return results
         return None
 
     def update(
         self, inspection_id: int, inspection_timestamp: datetime, colony_id: int
     ) -> Inspection | None:
-        query = "UPDATE inspections SET inspection_timestamp = %s, colony_id = %s RETURNING inspection_id;"
         params = [inspection_timestamp, colony_id, inspection_id]
-        results = self.db.execute(query, params)
+        results = self.db.execute(UPDATE_QUERY, params)
         if results:
             return Inspection(
                 results[0]["inspection_id"], inspection_timestamp, colony_id
@@ -77,9 +151,120 @@ class InspectionRepository:
 
     def delete(self, inspection_id: int) -> bool:
         """Deletes a inspection by inspection_id. Returns True if the inspection was deleted, False otherwise"""
-        query = (
-            "DELETE FROM inspections WHERE inspection_id = %s RETURNING inspection_id;"
+        params = [inspection_id]
+        result = self.db.execute(DELETE_QUERY, params)
+        return bool(result)
+
+
+class AsyncInspectionRepository:
+    """Asyncio counterpart of InspectionRepository"""
+
+    def __init__(self, db: AsyncDatabaseConnection) -> None:
+        """Init with an async database connection"""
+        self.db = db
+
+    async def create(
+        self, inspection_timestamp: datetime, colony_id: int
+    ) -> Inspection | None:
+        params: list[datetime | int] = [inspection_timestamp, colony_id]
+        result: list[int] | None = await self.db.execute(CREATE_QUERY, params)
+        if result:
+            return Inspection(
+                result[0]["inspection_id"], inspection_timestamp, colony_id
+            )
+        return None
+
+    async def create_many(
+        self, inspections: list[tuple[datetime, int]]
+    ) -> list[Inspection]:
+        """Inserts (inspection_timestamp, colony_id) pairs with one multi-row insert. Returns them in the same order"""
+        results: list[dict] = await self.db.execute(
+            CREATE_MANY_QUERY, _columns(inspections)
+        )
+        return _created(results, inspections)
+
+    async def find_by_inspection_id(self, inspection_id: int) -> Inspection | None:
+        params = [inspection_id]
+        results = await self.db.execute(
+            FIND_BY_INSPECTION_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    async def find_by_ids(self, inspection_ids: list[int]) -> list[Inspection]:
+        """Returns the inspections in inspection_ids that exist, ordered by inspection_id, in a single query"""
+        params: list = [list(inspection_ids)]
+        results: list[Inspection] | None = await self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def find_latest_by_colony_ids(
+        self, colony_ids: list[int]
+    ) -> list[Inspection]:
+        """Returns the most recent inspection of every colony in colony_ids, in a single query"""
+        params: list = [list(colony_ids)]
+        results: list[Inspection] | None = await self.db.execute(
+            FIND_LATEST_BY_COLONY_IDS_QUERY, params, row_factory=ROW_FACTORY
         )
+        return results or []
+
+    async def find_by_colony_id(
+        self,
+        colony_id: int,
+        *,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[Inspection] | None:
+        """Returns every match, or with a limit, the page of matches ordered by (inspection_timestamp, inspection_id) after the key given"""
+        query: str = FIND_BY_COLONY_ID_QUERY
+        params: list = [colony_id]
+        if limit is not None and after is None:
+            query = FIND_PAGE_BY_COLONY_ID_QUERY
+            params = [colony_id, limit]
+        elif limit is not None:
+            query = FIND_PAGE_BY_COLONY_ID_AFTER_QUERY
+            params = [colony_id, *after, limit]
+        results = await self.db.execute(query, params, row_factory=ROW_FACTORY)
+        if results:
+            return results
+        return None
+
+    async def stream_by_colony_id(self, colony_id: int) -> AsyncIterator[Inspection]:
+        params: list[int] = [colony_id]
+        async for row in self.db.stream(
+            FIND_BY_COLONY_ID_QUERY, params, row_factory=ROW_FACTORY
+        ):
+            yield row
+
+    async def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Inspection] | None:
+        """Returns every row, or with a limit, the page of rows ordered by inspection_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results = await self.db.execute(query, params, row_factory=ROW_FACTORY)
+        if results:
+            return results
+        return None
+
+    async def update(
+        self, inspection_id: int, inspection_timestamp: datetime, colony_id: int
+    ) -> Inspection | None:
+        params = [inspection_timestamp, colony_id, inspection_id]
+        results = await self.db.execute(UPDATE_QUERY, params)
+        if results:
+            return Inspection(
+                results[0]["inspection_id"], inspection_timestamp, colony_id
+            )
+        return None
+
+    async def delete(self, inspection_id: int) -> bool:
+        """Deletes a inspection by inspection_id. Returns True if the inspection was deleted, False otherwise"""
         params = [inspection_id]
-        result = self.db.execute(query, params)
+        result = await self.db.execute(DELETE_QUERY, params)
         return bool(result)
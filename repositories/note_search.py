@@ -0,0 +1,143 @@
+"""NoteSearchRepository"""
+
+from datetime import datetime
+
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
+from db.database_connection import DatabaseConnection
+from models.note_match import NoteMatch
+
+# The notes of each table matching the search text. The GIN index on notes_tsv
+# finds the matches, or the scope's inspections are read first when there are
+# fewer of them, whichever the planner expects to be cheaper
+OBSERVATION_MATCHES: str = (
+    "SELECT 'observation' AS kind, n.observation_id AS note_id, n.inspection_id, n.inspection_timestamp, i.colony_id, n.notes, ts_rank(n.notes_tsv, q) AS rank "
+    "FROM websearch_to_tsquery('english', %s) AS q, observations n "
+    "JOIN inspections i ON i.inspection_id = n.inspection_id AND i.inspection_timestamp = n.inspection_timestamp "
+)
+ACTION_MATCHES: str = (
+    "SELECT 'action' AS kind, n.action_id AS note_id, n.inspection_id, n.inspection_timestamp, i.colony_id, n.notes, ts_rank(n.notes_tsv, q) AS rank "
+    "FROM websearch_to_tsquery('english', %s) AS q, actions n "
+    "JOIN inspections i ON i.inspection_id = n.inspection_id AND i.inspection_timestamp = n.inspection_timestamp "
+)
+# How each scope reaches the inspections its notes were written for
+SCOPES: dict[str, str] = {
+    "colony_id": "WHERE n.notes_tsv @@ q AND i.colony_id = %s ",
+    "apiary_id": "JOIN colonies c ON c.colony_id = i.colony_id JOIN hives h ON h.hive_id = c.hive_id WHERE n.notes_tsv @@ q AND h.apiary_id = %s ",
+    "user_id": "JOIN colonies c ON c.colony_id = i.colony_id JOIN hives h ON h.hive_id = c.hive_id JOIN apiaries a ON a.apiary_id = h.apiary_id WHERE n.notes_tsv @@ q AND a.user_id = %s ",
+}
+# Bounds on the partition key, so other years' partitions are skipped
+DATE_RANGE: str = (
+    "AND n.inspection_timestamp >= coalesce(%s::timestamptz, '-infinity') "
+    "AND n.inspection_timestamp < coalesce(%s::timestamptz, 'infinity') "
+)
+# Both tables' matches are ranked, then only the page's notes are given a
+# headline, as ts_headline parses the notes again
+SEARCH_SELECT: str = (
+    "SELECT kind, note_id, inspection_id, inspection_timestamp, colony_id, notes, "
+    "ts_headline('english', notes, websearch_to_tsquery('english', %s)) AS headline, rank "
+    "FROM (SELECT * FROM ("
+)
+SEARCH_AFTER: str = "WHERE (m.rank, m.inspection_timestamp, m.kind, m.note_id) < (%s::real, %s, %s, %s) "
+SEARCH_PAGE: str = (
+    "ORDER BY rank DESC, inspection_timestamp DESC, kind DESC, note_id DESC LIMIT %s) AS page "
+    "ORDER BY rank DESC, inspection_timestamp DESC, kind DESC, note_id DESC;"
+)
+
+
+def _search_query(scope: str, after: str) -> str:
+    return (
+        SEARCH_SELECT
+        + OBSERVATION_MATCHES
+        + SCOPES[scope]
+        + DATE_RANGE
+        + "UNION ALL "
+        + ACTION_MATCHES
+        + SCOPES[scope]
+        + DATE_RANGE
+        + ") AS m "
+        + after
+        + SEARCH_PAGE
+    )
+
+
+SEARCH_QUERIES: dict[str, str] = {scope: _search_query(scope, "") for scope in SCOPES}
+SEARCH_AFTER_QUERIES: dict[str, str] = {
+    scope: _search_query(scope, SEARCH_AFTER) for scope in SCOPES
+}
+
+
+ROW_FACTORY: RowFactory[NoteMatch] = class_row(NoteMatch)
+
+
+def _params(
+    text: str,
+    scope_id: int,
+    since: datetime | None,
+    until: datetime | None,
+    limit: int,
+    after: tuple[float, datetime, str, int] | None,
+) -> list:
+    matches = [text, scope_id, since, until]
+    return [text, *matches, *matches, *(after or ()), limit]
+
+
+class NoteSearchRepository:
+    """Searches the notes of observations and actions"""
+
+    def __init__(self, db: DatabaseConnection) -> None:
+        """Init with a database connection"""
+        self.db = db
+
+    def search(
+        self,
+        text: str,
+        scope: str,
+        scope_id: int,
+        *,
+        limit: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: tuple[float, datetime, str, int] | None = None,
+    ) -> list[NoteMatch]:
+        """
+        Returns the page of notes matching text in the scope, ordered by (rank, inspection_timestamp, kind, note_id) descending, after the key given
+
+        Args:
+            text: the search, in websearch_to_tsquery syntax: words, "quoted phrases", OR and -excluded words
+            scope: whose notes to search, one of SCOPES
+            scope_id: the id of the user, apiary or colony
+            limit: the most notes to return
+            since: only notes from inspections at or after this
+            until: only notes from inspections before this
+            after: the key of the last note of the previous page
+
+        """
+        query = SEARCH_AFTER_QUERIES[scope] if after else SEARCH_QUERIES[scope]
+        params = _params(text, scope_id, since, until, limit, after)
+        return self.db.execute(query, params, row_factory=ROW_FACTORY) or []
+
+
+class AsyncNoteSearchRepository:
+    """Asyncio counterpart of NoteSearchRepository"""
+
+    def __init__(self, db: AsyncDatabaseConnection) -> None:
+        """Init with an async database connection"""
+        self.db = db
+
+    async def search(
+        self,
+        text: str,
+        scope: str,
+        scope_id: int,
+        *,
+        limit: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: tuple[float, datetime, str, int] | None = None,
+    ) -> list[NoteMatch]:
+        """Returns the page of notes matching text in the scope, ordered by (rank, inspection_timestamp, kind, note_id) descending, after the key given"""
+        query = SEARCH_AFTER_QUERIES[scope] if after else SEARCH_QUERIES[scope]
+        params = _params(text, scope_id, since, until, limit, after)
+        return await self.db.execute(query, params, row_factory=ROW_FACTORY) or []
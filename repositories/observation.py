@@ -1,8 +1,31 @@
 """ObservationRepository"""
 
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
 from db.database_connection import DatabaseConnection
 from models.observation import Observation
 
+# Observations are partitioned like inspections, so each row copies its
+# inspection's timestamp. Nothing is inserted if the inspection does not exist.
+CREATE_QUERY: str = "INSERT INTO observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id, inspection_timestamp) SELECT %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, inspection_id, inspection_timestamp FROM inspections WHERE inspection_id = %s RETURNING observation_id;"
+COPY_QUERY: str = "COPY observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id, inspection_timestamp) FROM STDIN;"
+FIND_BY_OBSERVATION_ID_QUERY: str = "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE observation_id = %s LIMIT 1;"
+FIND_BY_IDS_QUERY: str = "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE observation_id = ANY(%s) ORDER BY observation_id;"
+FIND_BY_INSPECTION_ID_QUERY: str = "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE inspection_id = %s LIMIT 1;"
+FIND_BY_INSPECTION_IDS_QUERY: str = "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE inspection_id = ANY(%s) ORDER BY observation_id;"
+READ_QUERY: str = "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations;"
+READ_PAGE_QUERY: str = "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE observation_id > %s ORDER BY observation_id LIMIT %s;"
+# A missing inspection leaves the old timestamp in place, which the foreign key
+# then rejects
+UPDATE_QUERY: str = "UPDATE observations AS o SET queenright = %s, queen_cells = %s, bias = %s, brood_frames = %s, store_frames = %s, chalk_brood = %s, foul_brood = %s, varroa_count = %s, temper = %s, notes = %s, inspection_id = target.inspection_id, inspection_timestamp = coalesce(i.inspection_timestamp, o.inspection_timestamp) FROM (SELECT %s::integer AS inspection_id) AS target LEFT JOIN inspections AS i ON i.inspection_id = target.inspection_id WHERE o.observation_id = %s RETURNING o.observation_id;"
+DELETE_QUERY: str = (
+    "DELETE FROM observations WHERE observation_id = %s RETURNING observation_id;"
+)
+
+
+ROW_FACTORY: RowFactory[Observation] = class_row(Observation)
+
 
 class ObservationRepository:
     def __init__(self, db: DatabaseConnection) -> None:
@@ -22,8 +45,8 @@ class ObservationRepository:
         temper: int,
         notes: str,
         inspection_id: int,
-    ) -> Observation | None:
-        query: str = "INSERT INTO observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)  RETURNING observation_id;"
+    ) -> Observation:
+        """Raises LookupError if inspection_id does not exist"""
         params: list[str | int | bool] = [
             queenright,
             queen_cells,
@@ -37,7 +60,7 @@ class ObservationRepository:
             notes,
             inspection_id,
         ]
-        results: list[Observation] | None = self.db.execute(query, params)
+        results: list[Observation] | None = self.db.execute(CREATE_QUERY, params)
         if results:
             return Observation(
                 results[0]["observation_id"],
@@ -53,75 +76,230 @@ class ObservationRepository:
                 notes,
                 inspection_id,
             )
-        return None
+        error_message = f"No inspection with inspection_id {inspection_id}"
+        raise LookupError(error_message)
+
+    def create_many(self, observations: list[tuple]) -> int:
+        """Loads rows of (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id, inspection_timestamp) with COPY. Returns the number of rows written"""
+        rows: list[list] = [list(row) for row in observations]
+        return self.db.copy(COPY_QUERY, rows)
 
     def find_by_observation_id(self, observation_id: int) -> Observation | None:
-        query: str = "SELECT * FROM observations WHERE observation_id = %s LIMIT 1;"
         params: list[int] = [observation_id]
-        results: list[Observation] | None = self.db.execute(query, params)
+        results: list[Observation] | None = self.db.execute(
+            FIND_BY_OBSERVATION_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    def find_by_ids(self, observation_ids: list[int]) -> list[Observation]:
+        """Returns the observations in observation_ids that exist, ordered by observation_id, in a single query"""
+        params: list = [list(observation_ids)]
+        results: list[Observation] | None = self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def find_by_inspection_id(self, inspection_id: int) -> Observation | None:
+        params: list[int] = [inspection_id]
+        results: list[Observation] | None = self.db.execute(
+            FIND_BY_INSPECTION_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    def find_by_inspection_ids(self, inspection_ids: list[int]) -> list[Observation]:
+        """Returns the observations of every inspection in inspection_ids, in a single query"""
+        params: list = [list(inspection_ids)]
+        results: list[Observation] | None = self.db.execute(
+            FIND_BY_INSPECTION_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Observation] | None:
+        """Returns every row, or with a limit, the page of rows ordered by observation_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results: list[Observation] | None = self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    def update(
+        self,
+        *,
+        observation_id: int,
+        queenright: bool,
+        queen_cells: int,
+        bias: bool,
+        brood_frames: int,
+        store_frames: int,
+        chalk_brood: bool,
+        foul_brood: bool,
+        varroa_count: int,
+        temper: int,
+        notes: str,
+        inspection_id: int,
+    ) -> Observation | None:
+        params: list[int | str | bool] = [
+            queenright,
+            queen_cells,
+            bias,
+            brood_frames,
+            store_frames,
+            chalk_brood,
+            foul_brood,
+            varroa_count,
+            temper,
+            notes,
+            inspection_id,
+            observation_id,
+        ]
+        results: list[Observation] | None = self.db.execute(UPDATE_QUERY, params)
         if results:
             return Observation(
                 results[0]["observation_id"],
-                results[0]["queenright"],
-                results[0]["queen_cells"],
-                results[0]["bias"],
-                results[0]["brood_frames"],
-                results[0]["store_frames"],
-                results[0]["chalk_brood"],
-                results[0]["foul_brood"],
-                results[0]["varroa_count"],
-                results[0]["temper"],
-                results[0]["notes"],
-                results[0]["inspection_id"],
+                queenright,
+                queen_cells,
+                bias,
+                brood_frames,
+                store_frames,
+                chalk_brood,
+                foul_brood,
+                varroa_count,
+                temper,
+                notes,
+                inspection_id,
             )
         return None
 
-    def find_by_inspection_id(self, inspection_id: int) -> Observation | None:
-        query: str = "SELECT * FROM observations WHERE inspection_id = %s LIMIT 1;"
-        params: list[int] = [inspection_id]
-        results: list[Observation] | None = self.db.execute(query, params)
+    def delete(self, observation_id: int) -> Observation | None:
+        params: list[int] = [observation_id]
+        results: list[Observation] | None = self.db.execute(DELETE_QUERY, params)
+        return bool(results)
+
+
+class AsyncObservationRepository:
+    """Asyncio counterpart of ObservationRepository"""
+
+    def __init__(self, db: AsyncDatabaseConnection) -> None:
+        self.db: AsyncDatabaseConnection = db
+
+    async def create(
+        self,
+        *,
+        queenright: bool,
+        queen_cells: int,
+        bias: bool,
+        brood_frames: int,
+        store_frames: int,
+        chalk_brood: bool,
+        foul_brood: bool,
+        varroa_count: int,
+        temper: int,
+        notes: str,
+        inspection_id: int,
+    ) -> Observation:
+        """Raises LookupError if inspection_id does not exist"""
+        params: list[str | int | bool] = [
+            queenright,
+            queen_cells,
+            bias,
+            brood_frames,
+            store_frames,
+            chalk_brood,
+            foul_brood,
+            varroa_count,
+            temper,
+            notes,
+            inspection_id,
+        ]
+        results: list[Observation] | None = await self.db.execute(CREATE_QUERY, params)
         if results:
             return Observation(
                 results[0]["observation_id"],
-                results[0]["queenright"],
-                results[0]["queen_cells"],
-                results[0]["bias"],
-                results[0]["brood_frames"],
-                results[0]["store_frames"],
-                results[0]["chalk_brood"],
-                results[0]["foul_brood"],
-                results[0]["varroa_count"],
-                results[0]["temper"],
-                results[0]["notes"],
-                results[0]["inspection_id"],
+                queenright,
+                queen_cells,
+                bias,
+                brood_frames,
+                store_frames,
+                chalk_brood,
+                foul_brood,
+                varroa_count,
+                temper,
+                notes,
+                inspection_id,
             )
+        error_message = f"No inspection with inspection_id {inspection_id}"
+        raise LookupError(error_message)
+
+    async def create_many(self, observations: list[tuple]) -> int:
+        """Loads rows of (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id, inspection_timestamp) with COPY. Returns the number of rows written"""
+        rows: list[list] = [list(row) for row in observations]
+        return await self.db.copy(COPY_QUERY, rows)
+
+    async def find_by_observation_id(self, observation_id: int) -> Observation | None:
+        params: list[int] = [observation_id]
+        results: list[Observation] | None = await self.db.execute(
+            FIND_BY_OBSERVATION_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
         return None
 
-    def read(self) -> list[Observation] | None:
-        query: str = "SELECT * FROM observations;"
+    async def find_by_ids(self, observation_ids: list[int]) -> list[Observation]:
+        """Returns the observations in observation_ids that exist, ordered by observation_id, in a single query"""
+        params: list = [list(observation_ids)]
+        results: list[Observation] | None = await self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def find_by_inspection_id(self, inspection_id: int) -> Observation | None:
+        params: list[int] = [inspection_id]
+        results: list[Observation] | None = await self.db.execute(
+            FIND_BY_INSPECTION_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    async def find_by_inspection_ids(
+        self, inspection_ids: list[int]
+    ) -> list[Observation]:
+        """Returns the observations of every inspection in inspection_ids, in a single query"""
+        params: list = [list(inspection_ids)]
+        results: list[Observation] | None = await self.db.execute(
+            FIND_BY_INSPECTION_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Observation] | None:
+        """Returns every row, or with a limit, the page of rows ordered by observation_id after the one given"""
+        query: str = READ_QUERY
         params: list = []
-        results: list[Observation] | None = self.db.execute(query, params)
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results: list[Observation] | None = await self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return [
-                Observation(
-                    row["observation_id"],
-                    row["queenright"],
-                    row["queen_cells"],
-                    row["bias"],
-                    row["brood_frames"],
-                    row["store_frames"],
-                    row["chalk_brood"],
-                    row["foul_brood"],
-                    row["varroa_count"],
-                    row["temper"],
-                    row["notes"],
-                    row["inspection_id"],
-                )
-                for row in results
-            ]
+            return results
         return None
 
-    def update(
+    async def update(
         self,
         *,
         observation_id: int,
@@ -137,7 +315,6 @@ class ObservationRepository:
         notes: str,
         inspection_id: int,
     ) -> Observation | None:
-        query: str = "UPDATE observations SET queenright = %s, queen-cells = %s, bias = %s, brood_frames = %s, store_frames = %s, chalk_brood = %s, foul_brood = %s, varroa_count = %s, temper = %s, notes = %s, inspection_id = %s RETURNING observation_id;"
         params: list[int | str | bool] = [
             queenright,
             queen_cells,
@@ -152,7 +329,7 @@ class ObservationRepository:
             inspection_id,
             observation_id,
         ]
-        results: list[Observation] | None = self.db.execute(query, params)
+        results: list[Observation] | None = await self.db.execute(UPDATE_QUERY, params)
         if results:
             return Observation(
                 results[0]["observation_id"],
@@ -170,8 +347,7 @@ class ObservationRepository:
             )
         return None
 
-    def delete(self, observation_id: int) -> Observation | None:
-        query: str = "DELETE FROM observations WHERE observation_id = %s RETURNING observation_id;"
+    async def delete(self, observation_id: int) -> Observation | None:
         params: list[int] = [observation_id]
-        results: list[Observation] | None = self.db.execute(query, params)
+        results: list[Observation] | None = await self.db.execute(DELETE_QUERY, params)
         return bool(results)
@@ -1,75 +1,191 @@
 """QueenRepository"""
 
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
 from db.database_connection import DatabaseConnection
 from models.queen import Queen
 
+CREATE_QUERY: str = "INSERT INTO queens (colour, clipped, colony_id) VALUES (%s, %s, %s) RETURNING queen_id;"
+FIND_BY_QUEEN_ID_QUERY: str = "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE queen_id = %s LIMIT 1;"
+FIND_BY_IDS_QUERY: str = "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE queen_id = ANY(%s) ORDER BY queen_id;"
+FIND_BY_COLONY_ID_QUERY: str = "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE colony_id = %s ORDER BY queen_id;"
+FIND_PAGE_BY_COLONY_ID_QUERY: str = "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE colony_id = %s AND queen_id > %s ORDER BY queen_id LIMIT %s;"
+FIND_BY_COLONY_IDS_QUERY: str = "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE colony_id = ANY(%s) ORDER BY queen_id;"
+READ_QUERY: str = "SELECT queen_id, colour, clipped, colony_id FROM queens;"
+READ_PAGE_QUERY: str = "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE queen_id > %s ORDER BY queen_id LIMIT %s;"
+UPDATE_QUERY: str = "UPDATE queens SET colony_id = %s, colour = %s, clipped = %s WHERE queen_id = %s RETURNING queen_id;"
+DELETE_QUERY: str = "DELETE FROM queens WHERE queen_id = %s RETURNING queen_id;"
+
+
+ROW_FACTORY: RowFactory[Queen] = class_row(Queen)
+
 
 class QueenRepository:
     def __init__(self, db: DatabaseConnection) -> None:
         self.db: DatabaseConnection = db
 
     def create(self, *, colour: str, clipped: bool, colony_id: int) -> Queen | None:
-        query: str = "INSERT INTO queens (colour, clipped, colony_id) VALUES (%s, %s, %s) RETURNING queen_id;"
         params: list[str | bool | int] = [colour, clipped, colony_id]
-        results: list[dict] | None = self.db.execute(query, params)
+        results: list[dict] | None = self.db.execute(CREATE_QUERY, params)
         if results:
             return Queen(results[0]["queen_id"], colour, clipped, colony_id)
         return None
 
     def find_by_queen_id(self, queen_id: int) -> Queen | None:
-        query = "SELECT * FROM queens WHERE queen_id = %s LIMIT 1;"
         params: list[int] = [queen_id]
-        results: list[dict] | None = self.db.execute(query, params)
+        results: list[Queen] | None = self.db.execute(
+            FIND_BY_QUEEN_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return Queen(
-                results[0]["queen_id"],
-                results[0]["colour"],
-                results[0]["clipped"],
-                results[0]["colony_id"],
-            )
+            return results[0]
         return None
 
-    def find_by_colony_id(self, queen_id: int) -> Queen | None:
-        query = "SELECT * FROM queens WHERE colony_id = %s LIMIT 1;"
-        params: list[int] = [queen_id]
-        results: list[dict] | None = self.db.execute(query, params)
+    def find_by_ids(self, queen_ids: list[int]) -> list[Queen]:
+        """Returns the queens in queen_ids that exist, ordered by queen_id, in a single query"""
+        params: list = [list(queen_ids)]
+        results: list[Queen] | None = self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def find_by_colony_id(
+        self, colony_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Queen] | None:
+        """Returns every match, or with a limit, the page of matches ordered by queen_id after the one given"""
+        query: str = FIND_BY_COLONY_ID_QUERY
+        params: list[int] = [colony_id]
+        if limit is not None:
+            query = FIND_PAGE_BY_COLONY_ID_QUERY
+            params = [colony_id, after or 0, limit]
+        results: list[Queen] | None = self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return Queen(
-                results[0]["queen_id"],
-                results[0]["colour"],
-                results[0]["clipped"],
-                results[0]["colony_id"],
-            )
+            return results
         return None
 
-    def read(self) -> list[Queen] | None:
-        query = "SELECT * FROM queens;"
+    def find_by_colony_ids(self, colony_ids: list[int]) -> list[Queen]:
+        """Returns the queens of every colony in colony_ids, in a single query"""
+        params: list = [list(colony_ids)]
+        results: list[Queen] | None = self.db.execute(
+            FIND_BY_COLONY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Queen] | None:
+        """Returns every row, or with a limit, the page of rows ordered by queen_id after the one given"""
+        query: str = READ_QUERY
         params: list = []
-        results: list[dict] | None = self.db.execute(query, params)
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results: list[Queen] | None = self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return [
-                Queen(
-                    row["queen_id"],
-                    row["colour"],
-                    row["clipped"],
-                    row["colony_id"],
-                )
-                for row in results
-            ]
+            return results
         return None
 
     def update(
         self, *, queen_id: int, colour: str, clipped: bool, colony_id: int
     ) -> Queen | None:
-        query = "UPDATE queens SET colony_id = %s, colour = %s, clipped = %s WHERE queen_id = %s RETURNING queen_id;"
         params: list[str | int | bool] = [colony_id, colour, clipped, queen_id]
-        results: list[dict] | None = self.db.execute(query, params)
+        results: list[dict] | None = self.db.execute(UPDATE_QUERY, params)
         if results:
             return Queen(results[0]["queen_id"], colour, clipped, colony_id)
         return None
 
     def delete(self, queen_id: int) -> bool:
-        query = "DELETE FROM queens WHERE queen_id = %s RETURNING queen_id;"
         params: list[int] = [queen_id]
-        results: list[dict] | None = self.db.execute(query, params)
+        results: list[dict] | None = self.db.execute(DELETE_QUERY, params)
+        return bool(results)
+
+
+class AsyncQueenRepository:
+    """Asyncio counterpart of QueenRepository"""
+
+    def __init__(self, db: AsyncDatabaseConnection) -> None:
+        self.db: AsyncDatabaseConnection = db
+
+    async def create(
+        self, *, colour: str, clipped: bool, colony_id: int
+    ) -> Queen | None:
+        params: list[str | bool | int] = [colour, clipped, colony_id]
+        results: list[dict] | None = await self.db.execute(CREATE_QUERY, params)
+        if results:
+            return Queen(results[0]["queen_id"], colour, clipped, colony_id)
+        return None
+
+    async def find_by_queen_id(self, queen_id: int) -> Queen | None:
+        params: list[int] = [queen_id]
+        results: list[Queen] | None = await self.db.execute(
+            FIND_BY_QUEEN_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    async def find_by_ids(self, queen_ids: list[int]) -> list[Queen]:
+        """Returns the queens in queen_ids that exist, ordered by queen_id, in a single query"""
+        params: list = [list(queen_ids)]
+        results: list[Queen] | None = await self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def find_by_colony_id(
+        self, colony_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Queen] | None:
+        """Returns every match, or with a limit, the page of matches ordered by queen_id after the one given"""
+        query: str = FIND_BY_COLONY_ID_QUERY
+        params: list[int] = [colony_id]
+        if limit is not None:
+            query = FIND_PAGE_BY_COLONY_ID_QUERY
+            params = [colony_id, after or 0, limit]
+        results: list[Queen] | None = await self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    async def find_by_colony_ids(self, colony_ids: list[int]) -> list[Queen]:
+        """Returns the queens of every colony in colony_ids, in a single query"""
+        params: list = [list(colony_ids)]
+        results: list[Queen] | None = await self.db.execute(
+            FIND_BY_COLONY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Queen] | None:
+        """Returns every row, or with a limit, the page of rows ordered by queen_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results: list[Queen] | None = await self.db.execute(
+            query, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results
+        return None
+
+    async def update(
+        self, *, queen_id: int, colour: str, clipped: bool, colony_id: int
+    ) -> Queen | None:
+        params: list[str | int | bool] = [colony_id, colour, clipped, queen_id]
+        results: list[dict] | None = await self.db.execute(UPDATE_QUERY, params)
+        if results:
+            return Queen(results[0]["queen_id"], colour, clipped, colony_id)
+        return None
+
+    async def delete(self, queen_id: int) -> bool:
+        params: list[int] = [queen_id]
+        results: list[dict] | None = await self.db.execute(DELETE_QUERY, params)
         return bool(results)
@@ -2,9 +2,31 @@
 
 from datetime import datetime
 
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
 from db.database_connection import DatabaseConnection
 from models.session import Session
 
+CREATE_QUERY: str = "INSERT INTO sessions (session_start, user_id) VALUES (%s, %s) RETURNING session_id;"
+FIND_BY_SESSION_ID_QUERY: str = "SELECT session_id, session_start, user_id FROM sessions WHERE session_id = %s LIMIT 1;"
+FIND_BY_IDS_QUERY: str = "SELECT session_id, session_start, user_id FROM sessions WHERE session_id = ANY(%s) ORDER BY session_id;"
+FIND_BY_USER_ID_QUERY: str = (
+    "SELECT session_id, session_start, user_id FROM sessions WHERE user_id = %s;"
+)
+FIND_PAGE_BY_USER_ID_QUERY: str = "SELECT session_id, session_start, user_id FROM sessions WHERE user_id = %s AND session_id > %s ORDER BY session_id LIMIT %s;"
+READ_QUERY: str = "SELECT session_id, session_start, user_id FROM sessions;"
+READ_PAGE_QUERY: str = "SELECT session_id, session_start, user_id FROM sessions WHERE session_id > %s ORDER BY session_id LIMIT %s;"
+DELETE_BY_SESSION_ID_QUERY: str = (
+    "DELETE FROM sessions WHERE session_id = %s RETURNING session_id;"
+)
+DELETE_BY_USER_ID_QUERY: str = (
+    "DELETE FROM sessions WHERE user_id = %s RETURNING user_id;"
+)
+
+
+ROW_FACTORY: RowFactory[Session] = class_row(Session)
+
 
 class SessionRepository:
     """Controls the interaction between models.session and the database"""
@@ -14,57 +36,137 @@ class SessionRepository:
         self.db = database_connection
 
     def create(self, session_start: datetime, user_id: int) -> Session | None:
-        query: str = "INSERT INTO sessions (session_start, user_id) VALUES (%s, %s) RETURNING session_id;"
         params: list[datetime | int] = [session_start, user_id]
-        result: list[int] | None = self.db.execute(query, params)
+        result: list[int] | None = self.db.execute(CREATE_QUERY, params)
         if result:
             return Session(result[0]["session_id"], session_start, user_id)
         return None
 
     def find_by_session_id(self, session_id: int) -> Session | None:
-        query = "SELECT * FROM sessions WHERE session_id = %s LIMIT 1;"
         params = [session_id]
-        results = self.db.execute(query, params)
+        results = self.db.execute(
+            FIND_BY_SESSION_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return Session(
-                results[0]["session_id"],
-                results[0]["session_start"],
-                results[0]["user_id"],
-            )
+            return results[0]
         return None
 
-    def find_by_user_id(self, user_id: int) -> list[Session] | None:
-        query = "SELECT * FROM sessions WHERE user_id = %s;"
-        params = [user_id]
-        results = self.db.execute(query, params)
+    def find_by_ids(self, session_ids: list[int]) -> list[Session]:
+        """Returns the sessions in session_ids that exist, ordered by session_id, in a single query"""
+        params: list = [list(session_ids)]
+        results: list[Session] | None = self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    def find_by_user_id(
+        self, user_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Session] | None:
+        """Returns every match, or with a limit, the page of matches ordered by session_id after the one given"""
+        query: str = FIND_BY_USER_ID_QUERY
+        params: list[int] = [user_id]
+        if limit is not None:
+            query = FIND_PAGE_BY_USER_ID_QUERY
+            params = [user_id, after or 0, limit]
+        results = self.db.execute(query, params, row_factory=ROW_FACTORY)
         if results:
-            return [
-                Session(row["session_id"], row["session_start"], row["user_id"])
-                for row in results
-            ]
+            return results
         return None
 
-    def read(self) -> list[Session] | None:
-        query = "SELECT * FROM sessions;"
-        params = []
-        results = self.db.execute(query, params)
+    def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Session] | None:
+        """Returns every row, or with a limit, the page of rows ordered by session_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results = self.db.execute(query, params, row_factory=ROW_FACTORY)
         if results:
-            return [
-                Session(row["session_id"], row["session_start"], row["user_id"])
-                for row in results
-            ]
+            return results
         return None
 
     def delete_by_session_id(self, session_id: int) -> bool:
         """Deletes a session by session_id. Returns True if the session was deleted, False otherwise"""
-        query = "DELETE FROM sessions WHERE session_id = %s RETURNING session_id;"
         params = [session_id]
-        result = self.db.execute(query, params)
+        result = self.db.execute(DELETE_BY_SESSION_ID_QUERY, params)
         return bool(result)
 
     def delete_by_user_id(self, session_id: int) -> bool:
         """Deletes a session by user_id. Returns True if the user_id exists, false otherwise."""
-        query = "DELETE FROM sessions WHERE user_id = %s RETURNING user_id;"
         params = [session_id]
-        result = self.db.execute(query, params)
+        result = self.db.execute(DELETE_BY_USER_ID_QUERY, params)
+        return bool(result)
+
+
+class AsyncSessionRepository:
+    """Asyncio counterpart of SessionRepository"""
+
+    def __init__(self, database_connection: AsyncDatabaseConnection) -> None:
+        """Init with an async database connection"""
+        self.db = database_connection
+
+    async def create(self, session_start: datetime, user_id: int) -> Session | None:
+        params: list[datetime | int] = [session_start, user_id]
+        result: list[int] | None = await self.db.execute(CREATE_QUERY, params)
+        if result:
+            return Session(result[0]["session_id"], session_start, user_id)
+        return None
+
+    async def find_by_session_id(self, session_id: int) -> Session | None:
+        params = [session_id]
+        results = await self.db.execute(
+            FIND_BY_SESSION_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    async def find_by_ids(self, session_ids: list[int]) -> list[Session]:
+        """Returns the sessions in session_ids that exist, ordered by session_id, in a single query"""
+        params: list = [list(session_ids)]
+        results: list[Session] | None = await self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def find_by_user_id(
+        self, user_id: int, *, limit: int | None = None, after: int | None = None
+    ) -> list[Session] | None:
+        """Returns every match, or with a limit, the page of matches ordered by session_id after the one given"""
+        query: str = FIND_BY_USER_ID_QUERY
+        params: list[int] = [user_id]
+        if limit is not None:
+            query = FIND_PAGE_BY_USER_ID_QUERY
+            params = [user_id, after or 0, limit]
+        results = await self.db.execute(query, params, row_factory=ROW_FACTORY)
+        if results:
+            return results
+        return None
+
+    async def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[Session] | None:
+        """Returns every row, or with a limit, the page of rows ordered by session_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results = await self.db.execute(query, params, row_factory=ROW_FACTORY)
+        if results:
+            return results
+        return None
+
+    async def delete_by_session_id(self, session_id: int) -> bool:
+        """Deletes a session by session_id. Returns True if the session was deleted, False otherwise"""
+        params = [session_id]
+        result = await self.db.execute(DELETE_BY_SESSION_ID_QUERY, params)
+        return bool(result)
+
+    async def delete_by_user_id(self, session_id: int) -> bool:
+        """Deletes a session by user_id. Returns True if the user_id exists, false otherwise."""
+        params = [session_id]
+        result = await self.db.execute(DELETE_BY_USER_ID_QUERY, params)
         return bool(result)
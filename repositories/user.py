@@ -1,9 +1,31 @@
 """User repository"""
 
+from psycopg.errors import UniqueViolation
+from psycopg.rows import RowFactory, class_row
+
+from db.async_database_connection import AsyncDatabaseConnection
 from db.database_connection import DatabaseConnection
 from db.instance import db
 from models.user import User
 
+CREATE_QUERY: str = (
+    "INSERT INTO users (username, password) VALUES (%s, %s) RETURNING user_id;"
+)
+FIND_BY_USER_ID_QUERY: str = (
+    "SELECT user_id, username, password FROM users WHERE user_id = %s LIMIT 1;"
+)
+FIND_BY_IDS_QUERY: str = "SELECT user_id, username, password FROM users WHERE user_id = ANY(%s) ORDER BY user_id;"
+FIND_BY_USERNAME_QUERY: str = (
+    "SELECT user_id, username, password FROM users WHERE username = %s LIMIT 1;"
+)
+READ_QUERY: str = "SELECT user_id, username, password FROM users;"
+READ_PAGE_QUERY: str = "SELECT user_id, username, password FROM users WHERE user_id > %s ORDER BY user_id LIMIT %s;"
+UPDATE_QUERY: str = "UPDATE users SET username = %s, password = %s WHERE user_id = %s RETURNING user_id;"
+DELETE_QUERY: str = "DELETE FROM users WHERE user_id = %s RETURNING user_id;"
+
+
+ROW_FACTORY: RowFactory[User] = class_row(User)
+
 
 class UserRepository:
     """Controls the interaction between models.User and the database"""
@@ -14,9 +36,8 @@ class UserRepository:
 
     def create(self, username: str, password: str) -> User | None:
         if len(username) > 0 and len(password) > 0:
-            query: str = "INSERT INTO users (username, password) VALUES (%s, %s) RETURNING user_id;"
             params: list[str] = [username, password]
-            results = self.db.execute(query, params)
+            results = self.db.execute(CREATE_QUERY, params)
             if results:
                 return User(
                     user_id=results[0]["user_id"], username=username, password=password
@@ -24,48 +45,145 @@ class UserRepository:
         return None
 
     def find_by_user_id(self, user_id: int) -> User | None:
-        query = "SELECT * FROM users WHERE user_id = %s LIMIT 1;"
         params = [user_id]
-        results = self.db.execute(query, params)
+        results = self.db.execute(
+            FIND_BY_USER_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
         if results:
-            return User(
-                user_id=results[0]["user_id"],
-                username=results[0]["username"],
-                password=results[0]["password"],
-            )
+            return results[0]
         return None
 
+    def find_by_ids(self, user_ids: list[int]) -> list[User]:
+        """Returns the users in user_ids that exist, ordered by user_id, in a single query"""
+        params: list = [list(user_ids)]
+        results: list[User] | None = self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
     def find_by_username(self, username: str) -> User | None:
-        query = "SELECT * FROM users WHERE username = %s LIMIT 1;"
         params = [username]
-        results = self.db.execute(query, params)
+        results = self.db.execute(
+            FIND_BY_USERNAME_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[User] | None:
+        """Returns every row, or with a limit, the page of rows ordered by user_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results = self.db.execute(query, params, row_factory=ROW_FACTORY)
+        if results:
+            return results
+        return None
+
+    def update(self, user_id: int, username: str, password: str) -> User | None:
+        """
+        Updates a user in one statement, returning None if no user has user_id
+
+        Raises:
+            ValueError: if another user already has username.
+
+        """
+        params = [username, password, user_id]
+        try:
+            results = self.db.execute(UPDATE_QUERY, params)
+        except UniqueViolation as e:
+            error_message = f"Row already exists for {e.diag.constraint_name}"
+            raise ValueError(error_message) from e
         if results:
             return User(
                 user_id=results[0]["user_id"],
-                username=results[0]["username"],
-                password=results[0]["password"],
+                username=username,
+                password=password,
             )
         return None
 
-    def read(self) -> list[User] | None:
-        query = "SELECT * FROM users;"
-        params = []
-        results = self.db.execute(query, params)
-        if results:
-            return [
-                User(
-                    user_id=row["user_id"],
-                    username=row["username"],
-                    password=row["password"],
+    def delete(self, user_id: int) -> bool:
+        """Deletes a user by user_id. Returns True if the user was deleted, False otherwise"""
+        params = [user_id]
+        result = self.db.execute(DELETE_QUERY, params)
+        return bool(result)
+
+
+class AsyncUserRepository:
+    """Asyncio counterpart of UserRepository"""
+
+    def __init__(self, db: AsyncDatabaseConnection) -> None:
+        """Init with an async database connection"""
+        self.db = db
+
+    async def create(self, username: str, password: str) -> User | None:
+        if len(username) > 0 and len(password) > 0:
+            params: list[str] = [username, password]
+            results = await self.db.execute(CREATE_QUERY, params)
+            if results:
+                return User(
+                    user_id=results[0]["user_id"], username=username, password=password
                 )
-                for row in results
-            ]
         return None
 
-    def update(self, user_id: int, username: str, password: str) -> User | None:
-        query = "UPDATE users SET username = %s, password = %s WHERE user_id = %s RETURNING user_id;"
+    async def find_by_user_id(self, user_id: int) -> User | None:
+        params = [user_id]
+        results = await self.db.execute(
+            FIND_BY_USER_ID_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    async def find_by_ids(self, user_ids: list[int]) -> list[User]:
+        """Returns the users in user_ids that exist, ordered by user_id, in a single query"""
+        params: list = [list(user_ids)]
+        results: list[User] | None = await self.db.execute(
+            FIND_BY_IDS_QUERY, params, row_factory=ROW_FACTORY
+        )
+        return results or []
+
+    async def find_by_username(self, username: str) -> User | None:
+        params = [username]
+        results = await self.db.execute(
+            FIND_BY_USERNAME_QUERY, params, row_factory=ROW_FACTORY
+        )
+        if results:
+            return results[0]
+        return None
+
+    async def read(
+        self, *, limit: int | None = None, after: int | None = None
+    ) -> list[User] | None:
+        """Returns every row, or with a limit, the page of rows ordered by user_id after the one given"""
+        query: str = READ_QUERY
+        params: list = []
+        if limit is not None:
+            query = READ_PAGE_QUERY
+            params = [after or 0, limit]
+        results = await self.db.execute(query, params, row_factory=ROW_FACTORY)
+        if results:
+            return results
+        return None
+
+    async def update(self, user_id: int, username: str, password: str) -> User | None:
+        """
+        Updates a user in one statement, returning None if no user has user_id
+
+        Raises:
+            ValueError: if another user already has username.
+
+        """
         params = [username, password, user_id]
-        results = self.db.execute(query, params)
+        try:
+            results = await self.db.execute(UPDATE_QUERY, params)
+        except UniqueViolation as e:
+            error_message = f"Row already exists for {e.diag.constraint_name}"
+            raise ValueError(error_message) from e
         if results:
             return User(
                 user_id=results[0]["user_id"],
@@ -74,9 +192,8 @@ class UserRepository:
             )
         return None
 
-    def delete(self, user_id: int) -> bool:
+    async def delete(self, user_id: int) -> bool:
         """Deletes a user by user_id. Returns True if the user was deleted, False otherwise"""
-        query = "DELETE FROM users WHERE user_id = %s RETURNING user_id;"
         params = [user_id]
-        result = self.db.execute(query, params)
+        result = await self.db.execute(DELETE_QUERY, params)
         return bool(result)
@@ -2,22 +2,28 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
+from routes.batch import Ids
+from routes.instrumentation import query_budget
+from routes.ndjson import NDJSON_RESPONSES, accepts_ndjson, stream_response
+from routes.pagination import PageLimit, decode_after, paginate
 from schemas.action import ActionCreate, ActionRead, ActionUpdate
-from services.action import ActionService
+from services.action import AsyncActionService
 from services.dependencies import get_action_service
+from utils.page_cursor import PageCursor
 
-router = APIRouter()
+router = APIRouter(tags=["actions"])
 
 
 @router.post("/actions")
-def create_action(
+@query_budget(1)
+async def create_action(
     payload: ActionCreate,
-    service: Annotated[ActionService, Depends(get_action_service)],
+    service: Annotated[AsyncActionService, Depends(get_action_service)],
 ) -> ActionRead:
     try:
-        return service.create_action(
+        return await service.create_action(
             notes=payload.notes,
             inspection_id=payload.inspection_id,
         )
@@ -25,27 +31,57 @@ def create_action(
         raise HTTPException(status_code=422, detail=str(e)) from e
 
 
-@router.get("/inspections/{inspection_id}/actions")
-def get_actions_by_inspection_id(
+@router.get("/inspections/{inspection_id}/actions", responses=NDJSON_RESPONSES)
+@query_budget(1)
+async def get_actions_by_inspection_id(
     inspection_id: int,
-    service: Annotated[ActionService, Depends(get_action_service)],
+    request: Request,
+    response: Response,
+    service: Annotated[AsyncActionService, Depends(get_action_service)],
+    limit: PageLimit = PageCursor.DEFAULT_LIMIT,
+    after: str | None = None,
 ) -> list[ActionRead]:
-    actions: list[ActionRead] | None = service.find_actions_by_inspection_id(
-        inspection_id=inspection_id
+    if accepts_ndjson(request):
+        return await stream_response(
+            service.stream_actions_by_inspection_id(inspection_id=inspection_id),
+            ActionRead,
+            "No actions found for this inspection",
+        )
+    actions: list[ActionRead] | None = await service.find_actions_by_inspection_id(
+        inspection_id=inspection_id, limit=limit + 1, after=decode_after(after, int)
     )
     if not actions:
         raise HTTPException(
             status_code=404, detail="No actions found for this inspection"
         )
+    return paginate(
+        actions, limit, request, response, lambda action: (action.action_id,)
+    )
+
+
+@router.get("/actions")
+@query_budget(1)
+async def get_actions_by_ids(
+    ids: Ids,
+    service: Annotated[AsyncActionService, Depends(get_action_service)],
+) -> list[ActionRead]:
+    """The actions among ids that exist, ordered by action_id, read in a single query"""
+    try:
+        actions = await service.find_actions_by_action_ids(action_ids=ids)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not actions:
+        raise HTTPException(status_code=404, detail="No actions found")
     return actions
 
 
 @router.get("/actions/{action_id}")
-def get_action_by_action_id(
+@query_budget(1)
+async def get_action_by_action_id(
     action_id: int,
-    service: Annotated[ActionService, Depends(get_action_service)],
+    service: Annotated[AsyncActionService, Depends(get_action_service)],
 ) -> ActionRead:
-    action = service.find_action_by_action_id(action_id=action_id)
+    action = await service.find_action_by_action_id(action_id=action_id)
     if not action:
         raise HTTPException(
             status_code=404, detail="No actions found for this inspection"
@@ -54,13 +90,14 @@ def get_action_by_action_id(
 
 
 @router.post("/actions/{action_id}")
-def update_action(
+@query_budget(1)
+async def update_action(
     action_id: int,
     payload: ActionUpdate,
-    service: Annotated[ActionService, Depends(get_action_service)],
+    service: Annotated[AsyncActionService, Depends(get_action_service)],
 ) -> ActionRead:
     try:
-        return service.update_action(
+        return await service.update_action(
             action_id=action_id,
             notes=payload.notes,
             inspection_id=payload.inspection_id,
@@ -70,11 +107,12 @@ def update_action(
 
 
 @router.delete("/actions/{action_id}")
-def delete_action(
+@query_budget(1)
+async def delete_action(
     action_id: int,
-    service: Annotated[ActionService, Depends(get_action_service)],
+    service: Annotated[AsyncActionService, Depends(get_action_service)],
 ) -> bool:
     try:
-        return service.delete_action(action_id=action_id)
+        return await service.delete_action(action_id=action_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -2,58 +2,127 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from routes.batch import Ids
+from routes.instrumentation import query_budget
+from routes.ndjson import NDJSON_RESPONSES, accepts_ndjson, stream_response
+from routes.pagination import PageLimit, decode_after, paginate
 from schemas.apiary import ApiaryCreate, ApiaryRead, ApiaryUpdate
-from services.apiary import ApiaryService
-from services.dependencies import get_apiary_service
+from schemas.hierarchy import ApiaryTree
+from services.apiary import AsyncApiaryService
+from services.dependencies import get_apiary_service, get_hierarchy_service
+from services.hierarchy import BRANCHES, MAX_DEPTH, AsyncHierarchyService, Branch
+from utils.page_cursor import PageCursor
 
-router = APIRouter()
+router = APIRouter(tags=["apiaries"])
 
 
 @router.post("/apiaries")
-def create_apiary(
+@query_budget(1)
+async def create_apiary(
     payload: ApiaryCreate,
-    service: Annotated[ApiaryService, Depends(get_apiary_service)],
+    service: Annotated[AsyncApiaryService, Depends(get_apiary_service)],
 ) -> ApiaryRead:
     try:
-        return service.create_apiary(
+        return await service.create_apiary(
             name=payload.name, location=payload.location, user_id=payload.user_id
         )
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
 
 
-@router.get("/users/{user_id}/apiaries")
-def list_user_apiaries(
+@router.get("/users/{user_id}/apiaries", responses=NDJSON_RESPONSES)
+@query_budget(1)
+async def list_user_apiaries(
     user_id: int,
-    service: Annotated[ApiaryService, Depends(get_apiary_service)],
+    request: Request,
+    response: Response,
+    service: Annotated[AsyncApiaryService, Depends(get_apiary_service)],
+    limit: PageLimit = PageCursor.DEFAULT_LIMIT,
+    after: str | None = None,
 ) -> list[ApiaryRead]:
-    apiaries = service.find_apiaries_by_user_id(user_id=user_id)
+    if accepts_ndjson(request):
+        return await stream_response(
+            service.stream_apiaries_by_user_id(user_id=user_id),
+            ApiaryRead,
+            "No apiaries found for this user",
+        )
+    apiaries = await service.find_apiaries_by_user_id(
+        user_id=user_id, limit=limit + 1, after=decode_after(after, int)
+    )
     if not apiaries:
         raise HTTPException(status_code=404, detail="No apiaries found for this user")
+    return paginate(
+        apiaries, limit, request, response, lambda apiary: (apiary.apiary_id,)
+    )
+
+
+@router.get("/apiaries")
+@query_budget(1)
+async def get_apiaries_by_ids(
+    ids: Ids,
+    service: Annotated[AsyncApiaryService, Depends(get_apiary_service)],
+) -> list[ApiaryRead]:
+    """The apiaries among ids that exist, ordered by apiary_id, read in a single query"""
+    try:
+        apiaries = await service.find_apiaries_by_apiary_ids(apiary_ids=ids)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not apiaries:
+        raise HTTPException(status_code=404, detail="No apiaries found")
     return apiaries
 
 
 @router.get("/apiaries/{apiary_id}")
-def get_apiary(
+@query_budget(1)
+async def get_apiary(
     apiary_id: int,
-    service: Annotated[ApiaryService, Depends(get_apiary_service)],
+    service: Annotated[AsyncApiaryService, Depends(get_apiary_service)],
 ) -> ApiaryRead:
-    apiaries = service.find_apiary_by_apiary_id(apiary_id=apiary_id)
+    apiaries = await service.find_apiary_by_apiary_id(apiary_id=apiary_id)
     if not apiaries:
         raise HTTPException(status_code=404, detail="Apiary not found")
     return apiaries
 
 
+# The apiary, then one query per level: hives, colonies, queens, the latest
+# inspections and their observations
+@router.get("/apiaries/{apiary_id}/tree", response_model_exclude_unset=True)
+@query_budget(6)
+async def get_apiary_tree(
+    apiary_id: int,
+    service: Annotated[AsyncHierarchyService, Depends(get_hierarchy_service)],
+    depth: Annotated[int, Query(ge=0, le=MAX_DEPTH)] = MAX_DEPTH,
+    include: Annotated[list[Branch] | None, Query()] = None,
+) -> ApiaryTree:
+    """
+    The apiary with its hives, their colonies, and each colony's queens and
+    latest inspection with its observations, in one response
+
+    depth limits how many levels are read beneath the apiary, and include
+    picks which branches are read beneath each colony; both default to all.
+    Every level is a single query, however many hives the apiary has.
+    """
+    tree = await service.find_apiary_tree(
+        apiary_id=apiary_id,
+        depth=depth,
+        include=frozenset(include) if include else BRANCHES,
+    )
+    if not tree:
+        raise HTTPException(status_code=404, detail="Apiary not found")
+    return tree
+
+
 @router.post("/apiaries/{apiary_id}")
-def update_apiary(
+@query_budget(1)
+async def update_apiary(
     apiary_id: int,
     payload: ApiaryUpdate,
-    service: Annotated[ApiaryService, Depends(get_apiary_service)],
+    service: Annotated[AsyncApiaryService, Depends(get_apiary_service)],
 ) -> ApiaryRead:
     try:
-        return service.update_apiary(
+        return await service.update_apiary(
             apiary_id=apiary_id,
             name=payload.name,
             location=payload.location,
@@ -64,11 +133,12 @@ def update_apiary(
 
 
 @router.delete("/apiaries/{apiary_id}")
-def delete_apiary(
+@query_budget(1)
+async def delete_apiary(
     apiary_id: int,
-    service: Annotated[ApiaryService, Depends(get_apiary_service)],
+    service: Annotated[AsyncApiaryService, Depends(get_apiary_service)],
 ) -> bool:
     try:
-        return service.delete_apiary(apiary_id=apiary_id)
+        return await service.delete_apiary(apiary_id=apiary_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
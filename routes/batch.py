@@ -0,0 +1,40 @@
+"""Batch lookup helpers shared by the routes that resolve many ids at once"""
+
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Query
+
+from utils.page_cursor import PageCursor
+
+# As many ids as one page of any list route can hold
+MAX_IDS: int = PageCursor.MAX_LIMIT
+
+
+def parse_ids(
+    ids: Annotated[str, Query(description="Comma-separated ids, e.g. 1,2,3")],
+) -> list[int]:
+    """
+    Parse the ids query parameter into a list of distinct ids, in the order given
+
+    Raises:
+        HTTPException: 422 if ids is empty, not comma-separated integers, or
+            holds more than MAX_IDS ids.
+
+    """
+    try:
+        values = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=422, detail="ids must be comma-separated integers"
+        ) from e
+    unique = list(dict.fromkeys(values))
+    if not unique:
+        raise HTTPException(status_code=422, detail="ids is required")
+    if len(unique) > MAX_IDS:
+        raise HTTPException(
+            status_code=422, detail=f"ids must hold at most {MAX_IDS} ids"
+        )
+    return unique
+
+
+Ids = Annotated[list[int], Depends(parse_ids)]
@@ -2,56 +2,88 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
+from routes.batch import Ids
+from routes.instrumentation import query_budget
+from routes.pagination import PageLimit, decode_after, paginate
 from schemas.colony import ColonyCreate, ColonyRead, ColonyUpdate
-from services.colony import ColonyService
+from services.colony import AsyncColonyService
 from services.dependencies import get_colony_service
+from utils.page_cursor import PageCursor
 
-router = APIRouter()
+router = APIRouter(tags=["colonies"])
 
 
 @router.post("/colony")
-def create_colony(
+@query_budget(1)
+async def create_colony(
     payload: ColonyCreate,
-    service: Annotated[ColonyService, Depends(get_colony_service)],
+    service: Annotated[AsyncColonyService, Depends(get_colony_service)],
 ) -> ColonyRead:
     try:
-        return service.create_colony(hive_id=payload.hive_id)
+        return await service.create_colony(hive_id=payload.hive_id)
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
 
 
 @router.get("/hives/{hive_id}/colony")
-def get_colony_by_hive_id(
+@query_budget(1)
+async def get_colony_by_hive_id(
     hive_id: int,
-    service: Annotated[ColonyService, Depends(get_colony_service)],
+    request: Request,
+    response: Response,
+    service: Annotated[AsyncColonyService, Depends(get_colony_service)],
+    limit: PageLimit = PageCursor.DEFAULT_LIMIT,
+    after: str | None = None,
 ) -> list[ColonyRead]:
-    colony = service.find_colony_by_hive_id(hive_id=hive_id)
-    if not colony:
+    colonies = await service.find_colony_by_hive_id(
+        hive_id=hive_id, limit=limit + 1, after=decode_after(after, int)
+    )
+    if not colonies:
         raise HTTPException(status_code=404, detail="No colonies found for this hive")
-    return colony
+    return paginate(
+        colonies, limit, request, response, lambda colony: (colony.colony_id,)
+    )
+
+
+@router.get("/colony")
+@query_budget(1)
+async def get_colonies_by_ids(
+    ids: Ids,
+    service: Annotated[AsyncColonyService, Depends(get_colony_service)],
+) -> list[ColonyRead]:
+    """The colonies among ids that exist, ordered by colony_id, read in a single query"""
+    try:
+        colonies = await service.find_colonies_by_colony_ids(colony_ids=ids)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not colonies:
+        raise HTTPException(status_code=404, detail="No colonies found")
+    return colonies
 
 
 @router.get("/colony/{colony_id}")
-def get_colony_by_colony_id(
+@query_budget(1)
+async def get_colony_by_colony_id(
     colony_id: int,
-    service: Annotated[ColonyService, Depends(get_colony_service)],
+    service: Annotated[AsyncColonyService, Depends(get_colony_service)],
 ) -> ColonyRead:
-    colony = service.find_colony_by_colony_id(colony_id=colony_id)
+    colony = await service.find_colony_by_colony_id(colony_id=colony_id)
     if not colony:
         raise HTTPException(status_code=404, detail="No colonies found for this hive")
     return colony
 
 
 @router.post("/colony/{colony_id}")
-def update_colony(
+@query_budget(1)
+async def update_colony(
     colony_id: int,
     payload: ColonyUpdate,
-    service: Annotated[ColonyService, Depends(get_colony_service)],
+    service: Annotated[AsyncColonyService, Depends(get_colony_service)],
 ) -> ColonyRead:
     try:
-        return service.update_colony(
+        return await service.update_colony(
             colony_id=colony_id,
             hive_id=payload.hive_id,
         )
@@ -60,11 +92,12 @@ def update_colony(
 
 
 @router.delete("/colony/{colony_id}")
-def delete_colony(
+@query_budget(1)
+async def delete_colony(
     colony_id: int,
-    service: Annotated[ColonyService, Depends(get_colony_service)],
+    service: Annotated[AsyncColonyService, Depends(get_colony_service)],
 ) -> bool:
     try:
-        return service.delete_colony(colony_id=colony_id)
+        return await service.delete_colony(colony_id=colony_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
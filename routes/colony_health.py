@@ -0,0 +1,71 @@
+"""Routes for the health series of colonies"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from routes.instrumentation import query_budget
+from routes.ndjson import NDJSON_RESPONSES, accepts_ndjson, stream_response
+from schemas.colony_health import ColonyHealthRead
+from services.colony_health import DEFAULT_WINDOW, MAX_WINDOW, AsyncColonyHealthService
+from services.dependencies import get_colony_health_service
+
+router = APIRouter(tags=["colony_health"])
+
+Window = Annotated[int, Query(ge=1, le=MAX_WINDOW)]
+
+
+@router.get("/colonies/{colony_id}/health")
+@query_budget(1)
+async def get_colony_health(
+    colony_id: int,
+    service: Annotated[AsyncColonyHealthService, Depends(get_colony_health_service)],
+    window: Window = DEFAULT_WINDOW,
+) -> list[ColonyHealthRead]:
+    """
+    The colony's observations in time order, each with the rolling means and
+    trend slopes of the last window observations, and its varroa growth rate
+    since the one before. Slopes and growth rates are per day.
+    """
+    try:
+        series = await service.find_health_by_colony_id(
+            colony_id=colony_id, window=window
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not series:
+        raise HTTPException(
+            status_code=404, detail="No observations found for this colony"
+        )
+    return series
+
+
+@router.get("/apiaries/{apiary_id}/health", responses=NDJSON_RESPONSES)
+@query_budget(1)
+async def get_apiary_health(
+    apiary_id: int,
+    request: Request,
+    service: Annotated[AsyncColonyHealthService, Depends(get_colony_health_service)],
+    window: Window = DEFAULT_WINDOW,
+) -> list[ColonyHealthRead]:
+    """
+    The health series of every colony in the apiary, as for a single colony,
+    ordered by colony_id. Ask for application/x-ndjson to stream large apiaries.
+    """
+    try:
+        if accepts_ndjson(request):
+            return await stream_response(
+                service.stream_health_by_apiary_id(apiary_id=apiary_id, window=window),
+                ColonyHealthRead,
+                "No observations found for this apiary",
+            )
+        series = await service.find_health_by_apiary_id(
+            apiary_id=apiary_id, window=window
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not series:
+        raise HTTPException(
+            status_code=404, detail="No observations found for this apiary"
+        )
+    return series
@@ -0,0 +1,55 @@
+"""Routes for the latest state of colonies"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from routes.instrumentation import query_budget
+from routes.ndjson import NDJSON_RESPONSES, accepts_ndjson, stream_response
+from schemas.colony_state import ColonyStateRead
+from services.colony_state import AsyncColonyStateService
+from services.dependencies import get_colony_state_service
+
+router = APIRouter(tags=["colony_states"])
+
+
+@router.get("/colonies/{colony_id}/state")
+@query_budget(1)
+async def get_colony_state(
+    colony_id: int,
+    service: Annotated[AsyncColonyStateService, Depends(get_colony_state_service)],
+) -> ColonyStateRead:
+    """
+    The colony's latest inspection, what was last observed in it, and its
+    current queen, read from a summary kept current on every write
+    """
+    try:
+        state = await service.find_state_by_colony_id(colony_id=colony_id)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not state:
+        raise HTTPException(status_code=404, detail="Colony not found")
+    return state
+
+
+@router.get("/apiaries/{apiary_id}/states", responses=NDJSON_RESPONSES)
+@query_budget(1)
+async def get_apiary_colony_states(
+    apiary_id: int,
+    request: Request,
+    service: Annotated[AsyncColonyStateService, Depends(get_colony_state_service)],
+) -> list[ColonyStateRead]:
+    """The latest state of every colony in the apiary, ordered by colony_id"""
+    try:
+        if accepts_ndjson(request):
+            return await stream_response(
+                service.stream_states_by_apiary_id(apiary_id=apiary_id),
+                ColonyStateRead,
+                "No colonies found for this apiary",
+            )
+        states = await service.find_states_by_apiary_id(apiary_id=apiary_id)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not states:
+        raise HTTPException(status_code=404, detail="No colonies found for this apiary")
+    return states
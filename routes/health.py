@@ -0,0 +1,27 @@
+"""Routes for /health"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from db.async_database_connection import AsyncDatabaseConnection
+from routes.instrumentation import query_budget
+from services.dependencies import get_async_db
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/live")
+@query_budget(0)
+async def live() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+@query_budget(1)
+async def ready(
+    db: Annotated[AsyncDatabaseConnection, Depends(get_async_db)],
+) -> dict[str, str]:
+    if not await db.ping():
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    return {"status": "ok"}
@@ -2,56 +2,93 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
+from routes.batch import Ids
+from routes.instrumentation import query_budget
+from routes.ndjson import NDJSON_RESPONSES, accepts_ndjson, stream_response
+from routes.pagination import PageLimit, decode_after, paginate
 from schemas.hive import HiveCreate, HiveRead, HiveUpdate
 from services.dependencies import get_hive_service
-from services.hive import HiveService
+from services.hive import AsyncHiveService
+from utils.page_cursor import PageCursor
 
-router = APIRouter()
+router = APIRouter(tags=["hives"])
 
 
 @router.post("/hives")
-def create_hive(
+@query_budget(1)
+async def create_hive(
     payload: HiveCreate,
-    service: Annotated[HiveService, Depends(get_hive_service)],
+    service: Annotated[AsyncHiveService, Depends(get_hive_service)],
 ) -> HiveRead:
     try:
-        return service.create_hive(name=payload.name, apiary_id=payload.apiary_id)
+        return await service.create_hive(name=payload.name, apiary_id=payload.apiary_id)
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
 
 
-@router.get("/apiaries/{apiary_id}/hives")
-def list_apiary_hives(
+@router.get("/apiaries/{apiary_id}/hives", responses=NDJSON_RESPONSES)
+@query_budget(1)
+async def list_apiary_hives(
     apiary_id: int,
-    service: Annotated[HiveService, Depends(get_hive_service)],
+    request: Request,
+    response: Response,
+    service: Annotated[AsyncHiveService, Depends(get_hive_service)],
+    limit: PageLimit = PageCursor.DEFAULT_LIMIT,
+    after: str | None = None,
 ) -> list[HiveRead]:
-    hives = service.find_hives_by_apiary_id(apiary_id=apiary_id)
+    if accepts_ndjson(request):
+        return await stream_response(
+            service.stream_hives_by_apiary_id(apiary_id=apiary_id),
+            HiveRead,
+            "No hives found for this apiary",
+        )
+    hives = await service.find_hives_by_apiary_id(
+        apiary_id=apiary_id, limit=limit + 1, after=decode_after(after, int)
+    )
     if not hives:
         raise HTTPException(status_code=404, detail="No hives found for this apiary")
+    return paginate(hives, limit, request, response, lambda hive: (hive.hive_id,))
+
+
+@router.get("/hives")
+@query_budget(1)
+async def get_hives_by_ids(
+    ids: Ids,
+    service: Annotated[AsyncHiveService, Depends(get_hive_service)],
+) -> list[HiveRead]:
+    """The hives among ids that exist, ordered by hive_id, read in a single query"""
+    try:
+        hives = await service.find_hives_by_hive_ids(hive_ids=ids)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not hives:
+        raise HTTPException(status_code=404, detail="No hives found")
     return hives
 
 
 @router.get("/hives/{hive_id}")
-def get_hive(
+@query_budget(1)
+async def get_hive(
     hive_id: int,
-    service: Annotated[HiveService, Depends(get_hive_service)],
+    service: Annotated[AsyncHiveService, Depends(get_hive_service)],
 ) -> HiveRead:
-    hives = service.find_hive_by_hive_id(hive_id=hive_id)
+    hives = await service.find_hive_by_hive_id(hive_id=hive_id)
     if not hives:
         raise HTTPException(status_code=404, detail="Hive not found")
     return hives
 
 
 @router.post("/hives/{hive_id}")
-def update_hive(
+@query_budget(1)
+async def update_hive(
     hive_id: int,
     payload: HiveUpdate,
-    service: Annotated[HiveService, Depends(get_hive_service)],
+    service: Annotated[AsyncHiveService, Depends(get_hive_service)],
 ) -> HiveRead:
     try:
-        return service.update_hive(
+        return await service.update_hive(
             hive_id=hive_id,
             name=payload.name,
             apiary_id=payload.apiary_id,
@@ -61,11 +98,12 @@ def update_hive(
 
 
 @router.delete("/hives/{hive_id}")
-def delete_hive(
+@query_budget(1)
+async def delete_hive(
     hive_id: int,
-    service: Annotated[HiveService, Depends(get_hive_service)],
+    service: Annotated[AsyncHiveService, Depends(get_hive_service)],
 ) -> bool:
     try:
-        return service.delete_hive(hive_id=hive_id)
+        return await service.delete_hive(hive_id=hive_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
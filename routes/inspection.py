@@ -1,23 +1,61 @@
 """Routes for /inspections"""
 
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from schemas.inspection import InspectionCreate, InspectionRead, InspectionUpdate
-from services.dependencies import get_inspection_service
-from services.inspection import InspectionService
+from routes.batch import Ids
+from routes.instrumentation import query_budget
+from routes.ndjson import (
+    NDJSON_RESPONSES,
+    accepts_ndjson,
+    read_lines,
+    sends_ndjson,
+    stream_response,
+)
+from routes.pagination import PageLimit, decode_after, paginate
+from schemas.inspection import (
+    InspectionCreate,
+    InspectionIngest,
+    InspectionIngestRead,
+    InspectionRead,
+    InspectionUpdate,
+)
+from services.dependencies import get_ingest_service, get_inspection_service
+from services.ingest import AsyncIngestService
+from services.inspection import AsyncInspectionService
+from utils.page_cursor import PageCursor
 
-router = APIRouter()
+router = APIRouter(tags=["inspections"])
+
+ingest_adapter: TypeAdapter[list[InspectionIngest]] = TypeAdapter(
+    list[InspectionIngest]
+)
+
+
+async def _read_ingest_records(request: Request) -> list[InspectionIngest]:
+    try:
+        if sends_ndjson(request):
+            return [
+                InspectionIngest.model_validate_json(line)
+                async for line in read_lines(request)
+            ]
+        return ingest_adapter.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False)) from e
 
 
 @router.post("/inspections")
-def create_inspection(
+@query_budget(1)
+async def create_inspection(
     payload: InspectionCreate,
-    service: Annotated[InspectionService, Depends(get_inspection_service)],
+    service: Annotated[AsyncInspectionService, Depends(get_inspection_service)],
 ) -> InspectionRead:
     try:
-        return service.create_inspection(
+        return await service.create_inspection(
             inspection_timestamp=payload.inspection_timestamp,
             colony_id=payload.colony_id,
         )
@@ -25,27 +63,83 @@ def create_inspection(
         raise HTTPException(status_code=422, detail=str(e)) from e
 
 
-@router.get("/colonies/{colony_id}/inspections")
-def get_inspection_by_colony_id(
+# One pipelined insert of the inspections, then a COPY each of observations
+# and actions
+@router.post("/inspections/bulk")
+@query_budget(3)
+async def ingest_inspections(
+    request: Request,
+    service: Annotated[AsyncIngestService, Depends(get_ingest_service)],
+) -> InspectionIngestRead:
+    """Create many inspections, with their observations and actions, from a JSON array or an NDJSON stream"""
+    records = await _read_ingest_records(request)
+    try:
+        return await service.ingest_inspections(records)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+
+@router.get("/colonies/{colony_id}/inspections", responses=NDJSON_RESPONSES)
+@query_budget(1)
+async def get_inspection_by_colony_id(
     colony_id: int,
-    service: Annotated[InspectionService, Depends(get_inspection_service)],
+    request: Request,
+    response: Response,
+    service: Annotated[AsyncInspectionService, Depends(get_inspection_service)],
+    limit: PageLimit = PageCursor.DEFAULT_LIMIT,
+    after: str | None = None,
 ) -> list[InspectionRead]:
-    inspections: list[InspectionRead] | None = service.find_inspections_by_colony_id(
-        colony_id=colony_id
+    if accepts_ndjson(request):
+        return await stream_response(
+            service.stream_inspections_by_colony_id(colony_id=colony_id),
+            InspectionRead,
+            "No inspections found for this colony",
+        )
+    inspections = await service.find_inspections_by_colony_id(
+        colony_id=colony_id,
+        limit=limit + 1,
+        after=decode_after(after, datetime, int),
     )
     if not inspections:
         raise HTTPException(
             status_code=404, detail="No inspections found for this colony"
         )
+    return paginate(
+        inspections,
+        limit,
+        request,
+        response,
+        lambda inspection: (inspection.inspection_timestamp, inspection.inspection_id),
+    )
+
+
+@router.get("/inspections")
+@query_budget(1)
+async def get_inspections_by_ids(
+    ids: Ids,
+    service: Annotated[AsyncInspectionService, Depends(get_inspection_service)],
+) -> list[InspectionRead]:
+    """The inspections among ids that exist, ordered by inspection_id, read in a single query"""
+    try:
+        inspections = await service.find_inspections_by_inspection_ids(
+            inspection_ids=ids
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not inspections:
+        raise HTTPException(status_code=404, detail="No inspections found")
     return inspections
 
 
 @router.get("/inspections/{inspection_id}")
-def get_inspection_by_inspection_id(
+@query_budget(1)
+async def get_inspection_by_inspection_id(
     inspection_id: int,
-    service: Annotated[InspectionService, Depends(get_inspection_service)],
+    service: Annotated[AsyncInspectionService, Depends(get_inspection_service)],
 ) -> InspectionRead:
-    inspection = service.find_inspection_by_inspection_id(inspection_id=inspection_id)
+    inspection = await service.find_inspection_by_inspection_id(
+        inspection_id=inspection_id
+    )
     if not inspection:
         raise HTTPException(
             status_code=404, detail="No inspections found for this colony"
@@ -54,13 +148,14 @@ def get_inspection_by_inspection_id(
 
 
 @router.post("/inspections/{inspection_id}")
-def update_inspection(
+@query_budget(1)
+async def update_inspection(
     inspection_id: int,
     payload: InspectionUpdate,
-    service: Annotated[InspectionService, Depends(get_inspection_service)],
+    service: Annotated[AsyncInspectionService, Depends(get_inspection_service)],
 ) -> InspectionRead:
     try:
-        return service.update_inspection(
+        return await service.update_inspection(
             inspection_id=inspection_id,
             inspection_timestamp=payload.inspection_timestamp,
             colony_id=payload.colony_id,
@@ -70,11 +165,12 @@ def update_inspection(
 
 
 @router.delete("/inspections/{inspection_id}")
-def delete_inspection(
+@query_budget(1)
+async def delete_inspection(
     inspection_id: int,
-    service: Annotated[InspectionService, Depends(get_inspection_service)],
+    service: Annotated[AsyncInspectionService, Depends(get_inspection_service)],
 ) -> bool:
     try:
-        return service.delete_inspection(inspection_id=inspection_id)
+        return await service.delete_inspection(inspection_id=inspection_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -0,0 +1,53 @@
+"""Middleware attributing database queries to the request that made them"""
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from db.instrumentation import BUDGET_ATTRIBUTE, QueryStats, request_queries
+
+Endpoint = TypeVar("Endpoint", bound=Callable)
+
+
+def query_budget(max_queries: int) -> Callable[[Endpoint], Endpoint]:
+    """
+    Declare the most queries a route may make to serve one request
+
+    Goes directly beneath the route's @router decorator. QueryStatsMiddleware
+    checks every request against it, so a query creeping into a service, e.g.
+    an existence check ahead of a write, is caught by the route's tests.
+    """
+
+    def declare(endpoint: Endpoint) -> Endpoint:
+        setattr(endpoint, BUDGET_ATTRIBUTE, max_queries)
+        return endpoint
+
+    return declare
+
+
+class QueryStatsMiddleware:
+    """
+    Counts the queries each HTTP request makes, per matched route
+
+    The route is read from the scope once routing has matched it, so requests
+    are grouped by template (GET /apiaries/{apiary_id}) rather than by URL.
+    Queries made while a streamed response is sent count towards its request,
+    and every request is checked against its route's query_budget.
+    """
+
+    def __init__(self, app: ASGIApp, stats: QueryStats) -> None:
+        self.app: ASGIApp = app
+        self.stats: QueryStats = stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with request_queries(scope) as request:
+            try:
+                await self.app(scope, receive, send)
+            except BaseException:
+                self.stats.request_finished(request, failed=True)
+                raise
+            self.stats.request_finished(request)
@@ -0,0 +1,148 @@
+"""Routes for /metrics, and the middleware and hooks that feed it"""
+
+import time
+
+from fastapi import APIRouter, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from db.async_database_connection import AsyncDatabaseConnection
+from db.instance import async_db
+from db.instrumentation import QueryEvent
+from routes.instrumentation import query_budget
+from utils.instance import hashing_executor
+from utils.metrics import CONTENT_TYPE, Counter, Gauge, Histogram, Registry
+
+# Requests that matched no route, e.g. 404s
+UNMATCHED: str = "unmatched"
+
+registry = Registry()
+
+REQUEST_DURATION = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Time to serve a request, from receipt to the last byte sent",
+        ("router", "method", "status"),
+    )
+)
+REQUESTS_IN_FLIGHT = registry.register(
+    Gauge("http_requests_in_flight", "Requests currently being served")
+)
+QUERY_DURATION = registry.register(
+    Histogram("db_query_duration_seconds", "Time to run a database statement")
+)
+QUERY_ROWS = registry.register(
+    Counter("db_query_rows_total", "Rows returned or written by database statements")
+)
+CHECKOUT_WAIT = registry.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time spent waiting for a connection from the pool",
+    )
+)
+
+
+def _pool_stat(db: AsyncDatabaseConnection, name: str) -> float:
+    if db.pool is None or db.pool.closed:
+        return 0
+    return db.pool.get_stats().get(name, 0)
+
+
+registry.register(
+    Gauge(
+        "db_pool_size",
+        "Connections currently open in the pool",
+        function=lambda: _pool_stat(async_db, "pool_size"),
+    )
+)
+registry.register(
+    Gauge(
+        "db_pool_available",
+        "Idle connections in the pool",
+        function=lambda: _pool_stat(async_db, "pool_available"),
+    )
+)
+registry.register(
+    Gauge(
+        "db_pool_requests_waiting",
+        "Checkouts waiting for a connection",
+        function=lambda: _pool_stat(async_db, "requests_waiting"),
+    )
+)
+registry.register(
+    Gauge(
+        "password_hashing_pending",
+        "Password hashing jobs running or queued",
+        function=lambda: hashing_executor.pending,
+    )
+)
+registry.register(
+    Gauge(
+        "password_hashing_max_pending",
+        "Jobs accepted before hashing answers 503",
+        function=lambda: hashing_executor.config.max_pending,
+    )
+)
+
+
+def observe_query(event: QueryEvent) -> None:
+    QUERY_DURATION.observe(event.duration)
+    if event.rows > 0:
+        QUERY_ROWS.inc(event.rows)
+
+
+def observe_checkout(wait: float) -> None:
+    CHECKOUT_WAIT.observe(wait)
+
+
+def instrument(db: AsyncDatabaseConnection) -> None:
+    """Report the queries and pool checkouts of db to /metrics"""
+    db.hooks.append(observe_query)
+    db.checkout_hooks.append(observe_checkout)
+
+
+def router_name(scope: Scope) -> str:
+    """The tag of the router that served the request, e.g. hives"""
+    tags = getattr(scope.get("route"), "tags", None)
+    return str(tags[0]) if tags else UNMATCHED
+
+
+class MetricsMiddleware:
+    """Times every HTTP request and counts those in flight"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                router=router_name(scope),
+                method=scope["method"],
+                status=str(status),
+            )
+
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("", include_in_schema=False)
+@query_budget(0)
+async def metrics() -> Response:
+    return Response(registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,87 @@
+"""Newline-delimited JSON request and response helpers shared by routes"""
+
+from collections.abc import AsyncIterator
+
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Documents the streaming alternative on list routes that support it
+NDJSON_RESPONSES: dict = {
+    200: {"content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}}}
+}
+
+
+def accepts_ndjson(request: Request) -> bool:
+    """Returns True if the client asked for an NDJSON stream"""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def sends_ndjson(request: Request) -> bool:
+    """Returns True if the request body is an NDJSON stream"""
+    return request.headers.get("content-type", "").startswith(NDJSON_MEDIA_TYPE)
+
+
+async def read_lines(request: Request) -> AsyncIterator[bytes]:
+    """Yields each non-blank line of the request body as it is received"""
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
+async def stream_response(
+    items: AsyncIterator, schema: type[BaseModel], not_found: str
+) -> StreamingResponse:
+    """
+    Stream items to the client as NDJSON, one schema-validated object per line
+
+    The first item is fetched before the response starts, so an empty result can
+    still be answered with a 404. items is closed, returning its server-side
+    cursor and pooled connection, when the body ends, and again by a background
+    task once the response is sent, in case the body was never iterated. If
+    reading the first item fails, it is closed before the error is raised.
+
+    Raises:
+        HTTPException: 404 with not_found as its detail if there are no items.
+
+    """
+    try:
+        first = await anext(items, None)
+    except BaseException:
+        await items.aclose()
+        raise
+    if first is None:
+        await items.aclose()
+        raise HTTPException(status_code=404, detail=not_found)
+
+    def encode(item: object) -> bytes:
+        return (
+            schema.model_validate(item, from_attributes=True).model_dump_json().encode()
+            + b"\n"
+        )
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            yield encode(first)
+            async for item in items:
+                yield encode(item)
+        finally:
+            await items.aclose()
+
+    async def close() -> None:
+        # aclose itself is not a coroutine function, so BackgroundTask would
+        # call it in a thread and drop the awaitable it returns
+        await items.aclose()
+
+    return StreamingResponse(
+        body(), media_type=NDJSON_MEDIA_TYPE, background=BackgroundTask(close)
+    )
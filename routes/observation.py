@@ -4,30 +4,36 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
 
+from routes.batch import Ids
+from routes.instrumentation import query_budget
 from schemas.observation import ObservationCreate, ObservationRead, ObservationUpdate
 from services.dependencies import get_observation_service
-from services.observation import ObservationService
+from services.observation import AsyncObservationService
 
-router = APIRouter(tags=["Observations"])
+router = APIRouter(tags=["observations"])
 
 
 @router.post("/observations")
-def create_observation(
+@query_budget(1)
+async def create_observation(
     payload: ObservationCreate,
-    service: Annotated[ObservationService, Depends(get_observation_service)],
+    service: Annotated[AsyncObservationService, Depends(get_observation_service)],
 ) -> ObservationRead:
     try:
-        return service.create_observation(**payload.model_dump())
+        return await service.create_observation(**payload.model_dump())
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
 
 
 @router.get("/inspections/{inspection_id}/observations")
-def get_observation_by_inspection_id(
+@query_budget(1)
+async def get_observation_by_inspection_id(
     inspection_id: int,
-    service: Annotated[ObservationService, Depends(get_observation_service)],
+    service: Annotated[AsyncObservationService, Depends(get_observation_service)],
 ) -> ObservationRead:
-    observation = service.find_observation_by_inspection_id(inspection_id=inspection_id)
+    observation = await service.find_observation_by_inspection_id(
+        inspection_id=inspection_id
+    )
     if not observation:
         raise HTTPException(
             status_code=404, detail="No observations found for this inspection"
@@ -35,12 +41,31 @@ def get_observation_by_inspection_id(
     return observation
 
 
+@router.get("/observations")
+@query_budget(1)
+async def get_observations_by_ids(
+    ids: Ids,
+    service: Annotated[AsyncObservationService, Depends(get_observation_service)],
+) -> list[ObservationRead]:
+    """The observations among ids that exist, ordered by observation_id, read in a single query"""
+    try:
+        observations = await service.find_observations_by_observation_ids(
+            observation_ids=ids
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not observations:
+        raise HTTPException(status_code=404, detail="No observations found")
+    return observations
+
+
 @router.get("/observations/{observation_id}")
-def get_observation_by_observation_id(
+@query_budget(1)
+async def get_observation_by_observation_id(
     observation_id: int,
-    service: Annotated[ObservationService, Depends(get_observation_service)],
+    service: Annotated[AsyncObservationService, Depends(get_observation_service)],
 ) -> ObservationRead:
-    observation = service.find_observation_by_observation_id(
+    observation = await service.find_observation_by_observation_id(
         observation_id=observation_id
     )
     if not observation:
@@ -51,13 +76,14 @@ def get_observation_by_observation_id(
 
 
 @router.post("/observations/{observation_id}")
-def update_observation(
+@query_budget(1)
+async def update_observation(
     observation_id: int,
     payload: ObservationUpdate,
-    service: Annotated[ObservationService, Depends(get_observation_service)],
+    service: Annotated[AsyncObservationService, Depends(get_observation_service)],
 ) -> ObservationRead:
     try:
-        return service.update_observation(
+        return await service.update_observation(
             observation_id=observation_id, **payload.model_dump()
         )
     except ValueError as e:
@@ -65,11 +91,12 @@ def update_observation(
 
 
 @router.delete("/observations/{observation_id}")
-def delete_observation(
+@query_budget(1)
+async def delete_observation(
     observation_id: int,
-    service: Annotated[ObservationService, Depends(get_observation_service)],
+    service: Annotated[AsyncObservationService, Depends(get_observation_service)],
 ) -> bool:
     try:
-        return service.delete_observation(observation_id=observation_id)
+        return await service.delete_observation(observation_id=observation_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -0,0 +1,56 @@
+"""Keyset pagination helpers shared by the list routes"""
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import Annotated, Any
+
+from fastapi import HTTPException, Query, Request, Response
+
+from utils.page_cursor import PageCursor
+
+PageLimit = Annotated[int, Query(ge=1, le=PageCursor.MAX_LIMIT)]
+
+
+def decode_after(
+    after: str | None, *types: type[int | float | str | datetime]
+) -> int | tuple | None:
+    """
+    Decode the after query parameter into a repository key
+
+    Returns:
+        None without a cursor, the single value of a one-column key, or a tuple
+
+    Raises:
+        HTTPException: 422 if the cursor is malformed.
+
+    """
+    if after is None:
+        return None
+    try:
+        key = PageCursor.decode(after, *types)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return key[0] if len(key) == 1 else key
+
+
+def paginate(
+    items: list,
+    limit: int,
+    request: Request,
+    response: Response,
+    key: Callable[[Any], tuple],
+) -> list:
+    """
+    Trim a page fetched with limit + 1 rows to limit, linking to the next page
+
+    The extra row only shows that another page exists. When it does, a Link
+    header with rel="next" carries the cursor for the last row returned.
+    """
+    if len(items) <= limit:
+        return items
+    page = items[:limit]
+    next_url = request.url.include_query_params(
+        limit=limit, after=PageCursor.encode(*key(page[-1]))
+    )
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return page
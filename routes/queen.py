@@ -2,22 +2,27 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
+from routes.batch import Ids
+from routes.instrumentation import query_budget
+from routes.pagination import PageLimit, decode_after, paginate
 from schemas.queen import QueenCreate, QueenRead, QueenUpdate
 from services.dependencies import get_queen_service
-from services.queen import QueenService
+from services.queen import AsyncQueenService
+from utils.page_cursor import PageCursor
 
-router = APIRouter()
+router = APIRouter(tags=["queens"])
 
 
 @router.post("/queens")
-def create_queen(
+@query_budget(1)
+async def create_queen(
     payload: QueenCreate,
-    service: Annotated[QueenService, Depends(get_queen_service)],
+    service: Annotated[AsyncQueenService, Depends(get_queen_service)],
 ) -> QueenRead:
     try:
-        return service.create_queen(
+        return await service.create_queen(
             colour=payload.colour, clipped=payload.clipped, colony_id=payload.colony_id
         )
     except ValueError as e:
@@ -25,35 +30,60 @@ def create_queen(
 
 
 @router.get("/colonies/{colony_id}/queens")
-def get_queen_by_colony_id(
+@query_budget(1)
+async def get_queen_by_colony_id(
     colony_id: int,
-    service: Annotated[QueenService, Depends(get_queen_service)],
+    request: Request,
+    response: Response,
+    service: Annotated[AsyncQueenService, Depends(get_queen_service)],
+    limit: PageLimit = PageCursor.DEFAULT_LIMIT,
+    after: str | None = None,
 ) -> list[QueenRead]:
-    queen = service.find_queen_by_colony_id(colony_id=colony_id)
-    if not queen:
+    queens = await service.find_queen_by_colony_id(
+        colony_id=colony_id, limit=limit + 1, after=decode_after(after, int)
+    )
+    if not queens:
         raise HTTPException(status_code=404, detail="No queens found for this colony")
-    return queen
+    return paginate(queens, limit, request, response, lambda queen: (queen.queen_id,))
+
+
+@router.get("/queens")
+@query_budget(1)
+async def get_queens_by_ids(
+    ids: Ids,
+    service: Annotated[AsyncQueenService, Depends(get_queen_service)],
+) -> list[QueenRead]:
+    """The queens among ids that exist, ordered by queen_id, read in a single query"""
+    try:
+        queens = await service.find_queens_by_queen_ids(queen_ids=ids)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not queens:
+        raise HTTPException(status_code=404, detail="No queens found")
+    return queens
 
 
 @router.get("/queens/{queen_id}")
-def get_queen_by_queen_id(
+@query_budget(1)
+async def get_queen_by_queen_id(
     queen_id: int,
-    service: Annotated[QueenService, Depends(get_queen_service)],
+    service: Annotated[AsyncQueenService, Depends(get_queen_service)],
 ) -> QueenRead:
-    queen = service.find_queen_by_queen_id(queen_id=queen_id)
+    queen = await service.find_queen_by_queen_id(queen_id=queen_id)
     if not queen:
         raise HTTPException(status_code=404, detail="No queens found for this colony")
     return queen
 
 
 @router.post("/queens/{queen_id}")
-def update_queen(
+@query_budget(1)
+async def update_queen(
     queen_id: int,
     payload: QueenUpdate,
-    service: Annotated[QueenService, Depends(get_queen_service)],
+    service: Annotated[AsyncQueenService, Depends(get_queen_service)],
 ) -> QueenRead:
     try:
-        return service.update_queen(
+        return await service.update_queen(
             queen_id=queen_id,
             colour=payload.colour,
             clipped=payload.clipped,
@@ -64,11 +94,12 @@ def update_queen(
 
 
 @router.delete("/queens/{queen_id}")
-def delete_queen(
+@query_budget(1)
+async def delete_queen(
     queen_id: int,
-    service: Annotated[QueenService, Depends(get_queen_service)],
+    service: Annotated[AsyncQueenService, Depends(get_queen_service)],
 ) -> bool:
     try:
-        return service.delete_queen(queen_id=queen_id)
+        return await service.delete_queen(queen_id=queen_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
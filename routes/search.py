@@ -0,0 +1,74 @@
+"""Routes for searching notes"""
+
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import AwareDatetime
+
+from routes.instrumentation import query_budget
+from routes.pagination import PageLimit, decode_after, paginate
+from schemas.note_match import NoteMatchRead
+from services.dependencies import get_note_search_service
+from services.note_search import MAX_SEARCH_LENGTH, AsyncNoteSearchService
+from utils.page_cursor import PageCursor
+
+router = APIRouter(tags=["search"])
+
+SearchText = Annotated[
+    str,
+    Query(
+        min_length=1,
+        max_length=MAX_SEARCH_LENGTH,
+        description='Words to find, "quoted phrases", OR between alternatives, -word to exclude',
+    ),
+]
+
+
+@router.get("/search/notes")
+@query_budget(1)
+async def search_notes(
+    q: SearchText,
+    request: Request,
+    response: Response,
+    service: Annotated[AsyncNoteSearchService, Depends(get_note_search_service)],
+    user_id: int | None = None,
+    apiary_id: int | None = None,
+    colony_id: int | None = None,
+    since: AwareDatetime | None = None,
+    until: AwareDatetime | None = None,
+    limit: PageLimit = PageCursor.DEFAULT_LIMIT,
+    after: str | None = None,
+) -> list[NoteMatchRead]:
+    """
+    The observation and action notes matching q, best match first, each with
+    its matching words highlighted. Give exactly one of user_id, apiary_id or
+    colony_id to search in, and optionally since and until to search only the
+    inspections between them. Words match in any form, so "swarm" also finds
+    "swarming" and "swarmed".
+    """
+    try:
+        matches = await service.search_notes(
+            q,
+            user_id=user_id,
+            apiary_id=apiary_id,
+            colony_id=colony_id,
+            since=since,
+            until=until,
+            limit=limit + 1,
+            after=decode_after(after, float, datetime, str, int),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return paginate(
+        matches,
+        limit,
+        request,
+        response,
+        lambda match: (
+            match.rank,
+            match.inspection_timestamp,
+            match.kind,
+            match.note_id,
+        ),
+    )
@@ -14,6 +14,10 @@ class ActionRead(BaseModel):
     inspection_id: int
 
 
+class ActionIngest(BaseModel):
+    notes: str
+
+
 class ActionUpdate(BaseModel):
     notes: str
     inspection_id: int
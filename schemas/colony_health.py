@@ -0,0 +1,26 @@
+"""ColonyHealth schema"""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ColonyHealthRead(BaseModel):
+    colony_id: int
+    inspection_id: int
+    observation_id: int
+    inspection_timestamp: datetime
+    varroa_count: int
+    brood_frames: int
+    store_frames: int
+    temper: int
+    queen_cells: int
+    chalk_brood: bool
+    foul_brood: bool
+    varroa_mean: float
+    brood_frames_mean: float
+    store_frames_mean: float
+    temper_mean: float
+    varroa_slope: float | None
+    brood_frames_slope: float | None
+    varroa_growth_rate: float | None
@@ -0,0 +1,19 @@
+"""ColonyState schema"""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ColonyStateRead(BaseModel):
+    colony_id: int
+    inspection_id: int | None
+    inspection_timestamp: datetime | None
+    observation_id: int | None
+    queenright: bool | None
+    varroa_count: int | None
+    chalk_brood: bool | None
+    foul_brood: bool | None
+    queen_id: int | None
+    queen_colour: str | None
+    queen_clipped: bool | None
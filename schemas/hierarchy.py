@@ -0,0 +1,27 @@
+"""Hierarchy schema"""
+
+from schemas.apiary import ApiaryRead
+from schemas.colony import ColonyRead
+from schemas.hive import HiveRead
+from schemas.inspection import InspectionRead
+from schemas.observation import ObservationRead
+from schemas.queen import QueenRead
+
+
+class InspectionTree(InspectionRead):
+    observations: list[ObservationRead] | None = None
+
+
+class ColonyTree(ColonyRead):
+    queens: list[QueenRead] | None = None
+    latest_inspection: InspectionTree | None = None
+
+
+class HiveTree(HiveRead):
+    colonies: list[ColonyTree] | None = None
+
+
+class ApiaryTree(ApiaryRead):
+    """An apiary with everything beneath it, down to the depth requested"""
+
+    hives: list[HiveTree] | None = None
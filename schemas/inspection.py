@@ -2,6 +2,9 @@
 
 from pydantic import AwareDatetime, BaseModel
 
+from schemas.action import ActionIngest
+from schemas.observation import ObservationIngest
+
 
 class InspectionCreate(BaseModel):
     inspection_timestamp: AwareDatetime
@@ -17,3 +20,18 @@ class InspectionRead(BaseModel):
     inspection_id: int
     inspection_timestamp: AwareDatetime
     colony_id: int
+
+
+class InspectionIngest(BaseModel):
+    """An inspection with the observations and actions recorded during it"""
+
+    inspection_timestamp: AwareDatetime
+    colony_id: int
+    observations: list[ObservationIngest] = []
+    actions: list[ActionIngest] = []
+
+
+class InspectionIngestRead(BaseModel):
+    inspection_ids: list[int]
+    observations: int
+    actions: int
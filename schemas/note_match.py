@@ -0,0 +1,17 @@
+"""NoteMatch schema"""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class NoteMatchRead(BaseModel):
+    kind: Literal["observation", "action"]
+    note_id: int
+    inspection_id: int
+    inspection_timestamp: datetime
+    colony_id: int
+    notes: str
+    headline: str
+    rank: float
@@ -31,6 +31,19 @@ class ObservationUpdate(BaseModel):
     inspection_id: int
 
 
+class ObservationIngest(BaseModel):
+    queenright: bool
+    queen_cells: int
+    bias: bool
+    brood_frames: int
+    store_frames: int
+    chalk_brood: bool
+    foul_brood: bool
+    varroa_count: int
+    temper: int
+    notes: str
+
+
 class ObservationRead(BaseModel):
     observation_id: int
     queenright: bool
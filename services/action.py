@@ -1,8 +1,11 @@
 """ActionService"""
 
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+
 from models.action import Action
-from repositories.action import ActionRepository
-from repositories.inspection import InspectionRepository
+from repositories.action import ActionRepository, AsyncActionRepository
+from repositories.inspection import AsyncInspectionRepository, InspectionRepository
 
 
 class ActionService:
@@ -27,27 +30,44 @@ class ActionService:
         if isinstance(inspection_id, int) is False or inspection_id <= 0:
             raise ValueError(self.invalid_inspection_id)
 
-    def _validate_inspection_exists(self, inspection_id: int) -> None:
-        if self.inspection_repo.find_by_inspection_id(inspection_id) is None:
-            raise ValueError(self.invalid_inspection_id)
-
-    def _validate_action_exists(self, action_id: int) -> None:
-        if self.action_repo.find_by_action_id(action_id) is None:
-            raise ValueError(self.invalid_action_id)
+    @contextmanager
+    def _inspection_must_exist(self) -> Iterator[None]:
+        """Reports a write rejected by the inspection_id foreign key as an invalid inspection_id"""
+        try:
+            yield
+        except LookupError as e:
+            raise ValueError(self.invalid_inspection_id) from e
 
     def create_action(self, notes: str, inspection_id: int) -> Action | None:
         self._validate_inspection_id(inspection_id)
         self._validate_notes(notes=notes)
-        self._validate_inspection_exists(inspection_id)
-        return self.action_repo.create(notes=notes, inspection_id=inspection_id)
+        with self._inspection_must_exist():
+            return self.action_repo.create(notes=notes, inspection_id=inspection_id)
 
     def find_action_by_action_id(self, action_id: int) -> Action | None:
         self._validate_action_id(action_id)
         return self.action_repo.find_by_action_id(action_id)
 
-    def find_actions_by_inspection_id(self, inspection_id: int) -> list[Action] | None:
+    def find_actions_by_action_ids(self, action_ids: list[int]) -> list[Action]:
+        for action_id in action_ids:
+            self._validate_action_id(action_id)
+        return self.action_repo.find_by_ids(action_ids)
+
+    def find_actions_by_inspection_id(
+        self,
+        inspection_id: int,
+        *,
+        limit: int | None = None,
+        after: int | None = None,
+    ) -> list[Action] | None:
         self._validate_inspection_id(inspection_id)
-        return self.action_repo.find_by_inspection_id(inspection_id)
+        return self.action_repo.find_by_inspection_id(
+            inspection_id, limit=limit, after=after
+        )
+
+    def stream_actions_by_inspection_id(self, inspection_id: int) -> Iterator[Action]:
+        self._validate_inspection_id(inspection_id)
+        return self.action_repo.stream_by_inspection_id(inspection_id)
 
     def update_action(
         self, action_id: int, notes: str, inspection_id: int
@@ -55,14 +75,82 @@ class ActionService:
         self._validate_action_id(action_id)
         self._validate_notes(notes=notes)
         self._validate_inspection_id(inspection_id)
-        self._validate_action_exists(action_id)
-        self._validate_inspection_exists(inspection_id)
-        return self.action_repo.update(
-            action_id=action_id,
-            notes=notes,
-            inspection_id=inspection_id,
-        )
+        with self._inspection_must_exist():
+            action = self.action_repo.update(
+                action_id=action_id,
+                notes=notes,
+                inspection_id=inspection_id,
+            )
+        if action is None:
+            raise ValueError(self.invalid_action_id)
+        return action
 
     def delete_action(self, action_id: int) -> bool:
         self._validate_action_id(action_id)
         return bool(self.action_repo.delete(action_id))
+
+
+class AsyncActionService(ActionService):
+    """Asyncio counterpart of ActionService"""
+
+    def __init__(
+        self,
+        action_repo: AsyncActionRepository,
+        inspection_repo: AsyncInspectionRepository,
+    ) -> None:
+        super().__init__(action_repo=action_repo, inspection_repo=inspection_repo)
+
+    async def create_action(self, notes: str, inspection_id: int) -> Action | None:
+        self._validate_inspection_id(inspection_id)
+        self._validate_notes(notes=notes)
+        with self._inspection_must_exist():
+            return await self.action_repo.create(
+                notes=notes, inspection_id=inspection_id
+            )
+
+    async def find_action_by_action_id(self, action_id: int) -> Action | None:
+        self._validate_action_id(action_id)
+        return await self.action_repo.find_by_action_id(action_id)
+
+    async def find_actions_by_action_ids(self, action_ids: list[int]) -> list[Action]:
+        for action_id in action_ids:
+            self._validate_action_id(action_id)
+        return await self.action_repo.find_by_ids(action_ids)
+
+    async def find_actions_by_inspection_id(
+        self,
+        inspection_id: int,
+        *,
+        limit: int | None = None,
+        after: int | None = None,
+    ) -> list[Action] | None:
+        self._validate_inspection_id(inspection_id)
+        return await self.action_repo.find_by_inspection_id(
+            inspection_id, limit=limit, after=after
+        )
+
+    def stream_actions_by_inspection_id(
+        self, inspection_id: int
+    ) -> AsyncIterator[Action]:
+        self._validate_inspection_id(inspection_id)
+        return self.action_repo.stream_by_inspection_id(inspection_id)
+
+    async def update_action(
+        self, action_id: int, notes: str, inspection_id: int
+    ) -> Action | None:
+        self._validate_action_id(action_id)
+        self._validate_notes(notes=notes)
+        self._validate_inspection_id(inspection_id)
+        with self._inspection_must_exist():
+            action = await self.action_repo.update(
+                action_id=action_id,
+                notes=notes,
+                inspection_id=inspection_id,
+            )
+        if action is None:
+            raise ValueError(self.invalid_action_id)
+        return action
+
+    async def delete_action(self, action_id: int) -> bool:
+        self._validate_action_id(action_id)
+        return bool(await self.action_repo.delete(action_id))
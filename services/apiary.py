@@ -1,8 +1,11 @@
 """Service class for handling Apiary operations"""
 
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+
 from models.apiary import Apiary
-from repositories.apiary import ApiaryRepository
-from repositories.user import UserRepository
+from repositories.apiary import ApiaryRepository, AsyncApiaryRepository
+from repositories.user import AsyncUserRepository, UserRepository
 
 
 class ApiaryService:
@@ -24,19 +27,42 @@ class ApiaryService:
         if not isinstance(user_id, int) or user_id <= 0:
             raise ValueError(self.invalid_user_id)
 
+    @contextmanager
+    def _user_must_exist(self) -> Iterator[None]:
+        """Reports a write rejected by the user_id foreign key as an invalid user_id"""
+        try:
+            yield
+        except LookupError as e:
+            raise ValueError(self.invalid_user_id) from e
+
     def create_apiary(self, name: str, location: str, user_id: int) -> Apiary | None:
         name = name.strip()
         location = location.strip()
         self._validate_data(name, location, user_id)
-        if not self.user_repo.find_by_user_id(user_id):
-            raise ValueError(self.invalid_user_id)
-        return self.apiary_repo.create(name=name, location=location, user_id=user_id)
+        with self._user_must_exist():
+            return self.apiary_repo.create(
+                name=name, location=location, user_id=user_id
+            )
 
     def find_apiary_by_apiary_id(self, apiary_id: int) -> Apiary | None:
         return self.apiary_repo.find_by_apiary_id(apiary_id=apiary_id)
 
-    def find_apiaries_by_user_id(self, user_id: int) -> list[Apiary] | None:
-        return self.apiary_repo.find_by_user_id(user_id=user_id)
+    def find_apiaries_by_apiary_ids(self, apiary_ids: list[int]) -> list[Apiary]:
+        return self.apiary_repo.find_by_ids(apiary_ids)
+
+    def find_apiaries_by_user_id(
+        self,
+        user_id: int,
+        *,
+        limit: int | None = None,
+        after: int | None = None,
+    ) -> list[Apiary] | None:
+        return self.apiary_repo.find_by_user_id(
+            user_id=user_id, limit=limit, after=after
+        )
+
+    def stream_apiaries_by_user_id(self, user_id: int) -> Iterator[Apiary]:
+        return self.apiary_repo.stream_by_user_id(user_id=user_id)
 
     def update_apiary(
         self, apiary_id: int, name: str, location: str, user_id: int
@@ -46,15 +72,76 @@ class ApiaryService:
         self._validate_data(name, location, user_id)
         if not isinstance(apiary_id, int) or apiary_id <= 0:
             raise ValueError(self.invalid_apiary)
-        if not self.user_repo.find_by_user_id(user_id):
-            raise ValueError(self.invalid_user_id)
-        if not self.apiary_repo.find_by_apiary_id(apiary_id):
+        with self._user_must_exist():
+            apiary = self.apiary_repo.update(
+                apiary_id=apiary_id, name=name, location=location, user_id=user_id
+            )
+        if apiary is None:
             raise ValueError(self.invalid_apiary)
-        return self.apiary_repo.update(
-            apiary_id=apiary_id, name=name, location=location, user_id=user_id
-        )
+        return apiary
 
     def delete_apiary(self, apiary_id: int) -> bool:
-        if not self.apiary_repo.find_by_apiary_id(apiary_id):
+        if not self.apiary_repo.delete(apiary_id=apiary_id):
+            raise ValueError(self.invalid_apiary)
+        return True
+
+
+class AsyncApiaryService(ApiaryService):
+    """Asyncio counterpart of ApiaryService"""
+
+    def __init__(
+        self, apiary_repo: AsyncApiaryRepository, user_repo: AsyncUserRepository
+    ) -> None:
+        super().__init__(apiary_repo=apiary_repo, user_repo=user_repo)
+
+    async def create_apiary(
+        self, name: str, location: str, user_id: int
+    ) -> Apiary | None:
+        name = name.strip()
+        location = location.strip()
+        self._validate_data(name, location, user_id)
+        with self._user_must_exist():
+            return await self.apiary_repo.create(
+                name=name, location=location, user_id=user_id
+            )
+
+    async def find_apiary_by_apiary_id(self, apiary_id: int) -> Apiary | None:
+        return await self.apiary_repo.find_by_apiary_id(apiary_id=apiary_id)
+
+    async def find_apiaries_by_apiary_ids(self, apiary_ids: list[int]) -> list[Apiary]:
+        return await self.apiary_repo.find_by_ids(apiary_ids)
+
+    async def find_apiaries_by_user_id(
+        self,
+        user_id: int,
+        *,
+        limit: int | None = None,
+        after: int | None = None,
+    ) -> list[Apiary] | None:
+        return await self.apiary_repo.find_by_user_id(
+            user_id=user_id, limit=limit, after=after
+        )
+
+    def stream_apiaries_by_user_id(self, user_id: int) -> AsyncIterator[Apiary]:
+        return self.apiary_repo.stream_by_user_id(user_id=user_id)
+
+    async def update_apiary(
+        self, apiary_id: int, name: str, location: str, user_id: int
+    ) -> Apiary | None:
+        name = name.strip()
+        location = location.strip()
+        self._validate_data(name, location, user_id)
+        if not isinstance(apiary_id, int) or apiary_id <= 0:
+            raise ValueError(self.invalid_apiary)
+        with self._user_must_exist():
+            apiary = await self.apiary_repo.update(
+                apiary_id=apiary_id, name=name, location=location, user_id=user_id
+            )
+        if apiary is None:
+            raise ValueError(self.invalid_apiary)
+        return apiary
+
+    async def delete_apiary(self, apiary_id: int) -> bool:
+        if not await self.apiary_repo.delete(apiary_id=apiary_id):
             raise ValueError(self.invalid_apiary)
-        return self.apiary_repo.delete(apiary_id=apiary_id)
+        return True
@@ -1,8 +1,11 @@
 """ColonyService"""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from models.colony import Colony
-from repositories.colony import ColonyRepository
-from repositories.hive import HiveRepository
+from repositories.colony import AsyncColonyRepository, ColonyRepository
+from repositories.hive import AsyncHiveRepository, HiveRepository
 
 
 class ColonyService:
@@ -22,29 +25,93 @@ class ColonyService:
         if not isinstance(colony_id, int) or colony_id <= 0:
             raise ValueError(self.invalid_colony_id)
 
+    @contextmanager
+    def _hive_must_exist(self) -> Iterator[None]:
+        """Reports a write rejected by the hive_id foreign key as an invalid hive_id"""
+        try:
+            yield
+        except LookupError as e:
+            raise ValueError(self.invalid_hive_id) from e
+
     def create_colony(self, hive_id: int) -> Colony | None:
         self._validate_hive_id(hive_id)
-        if not bool(self.hive_repo.find_by_hive_id(hive_id)):
-            raise ValueError(self.invalid_hive_id)
-        return self.colony_repo.create(hive_id)
+        with self._hive_must_exist():
+            return self.colony_repo.create(hive_id)
 
     def find_colony_by_colony_id(self, colony_id: int) -> Colony | None:
         self._validate_colony_id(colony_id)
         return self.colony_repo.find_by_colony_id(colony_id)
 
-    def find_colony_by_hive_id(self, hive_id: int) -> Colony | None:
+    def find_colonies_by_colony_ids(self, colony_ids: list[int]) -> list[Colony]:
+        for colony_id in colony_ids:
+            self._validate_colony_id(colony_id)
+        return self.colony_repo.find_by_ids(colony_ids)
+
+    def find_colony_by_hive_id(
+        self,
+        hive_id: int,
+        *,
+        limit: int | None = None,
+        after: int | None = None,
+    ) -> list[Colony] | None:
         self._validate_hive_id(hive_id)
-        return self.colony_repo.find_by_hive_id(hive_id)
+        return self.colony_repo.find_by_hive_id(hive_id, limit=limit, after=after)
 
     def update_colony(self, colony_id: int, hive_id: int) -> Colony | None:
         self._validate_colony_id(colony_id)
         self._validate_hive_id(hive_id)
-        if not bool(self.colony_repo.find_by_colony_id(colony_id)):
+        with self._hive_must_exist():
+            colony = self.colony_repo.update(colony_id=colony_id, hive_id=hive_id)
+        if colony is None:
             raise ValueError(self.invalid_colony_id)
-        if not bool(self.hive_repo.find_by_hive_id(hive_id)):
-            raise ValueError(self.invalid_hive_id)
-        return self.colony_repo.update(colony_id=colony_id, hive_id=hive_id)
+        return colony
 
     def delete_colony(self, colony_id: int) -> bool:
         self._validate_colony_id(colony_id)
         return bool(self.colony_repo.delete(colony_id))
+
+
+class AsyncColonyService(ColonyService):
+    """Asyncio counterpart of ColonyService"""
+
+    def __init__(
+        self, colony_repo: AsyncColonyRepository, hive_repo: AsyncHiveRepository
+    ) -> None:
+        super().__init__(colony_repo=colony_repo, hive_repo=hive_repo)
+
+    async def create_colony(self, hive_id: int) -> Colony | None:
+        self._validate_hive_id(hive_id)
+        with self._hive_must_exist():
+            return await self.colony_repo.create(hive_id)
+
+    async def find_colony_by_colony_id(self, colony_id: int) -> Colony | None:
+        self._validate_colony_id(colony_id)
+        return await self.colony_repo.find_by_colony_id(colony_id)
+
+    async def find_colonies_by_colony_ids(self, colony_ids: list[int]) -> list[Colony]:
+        for colony_id in colony_ids:
+            self._validate_colony_id(colony_id)
+        return await self.colony_repo.find_by_ids(colony_ids)
+
+    async def find_colony_by_hive_id(
+        self,
+        hive_id: int,
+        *,
+        limit: int | None = None,
+        after: int | None = None,
+    ) -> list[Colony] | None:
+        self._validate_hive_id(hive_id)
+        return await self.colony_repo.find_by_hive_id(hive_id, limit=limit, after=after)
+
+    async def update_colony(self, colony_id: int, hive_id: int) -> Colony | None:
+        self._validate_colony_id(colony_id)
+        self._validate_hive_id(hive_id)
+        with self._hive_must_exist():
+            colony = await self.colony_repo.update(colony_id=colony_id, hive_id=hive_id)
+        if colony is None:
+            raise ValueError(self.invalid_colony_id)
+        return colony
+
+    async def delete_colony(self, colony_id: int) -> bool:
+        self._validate_colony_id(colony_id)
+        return bool(await self.colony_repo.delete(colony_id))
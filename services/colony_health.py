@@ -0,0 +1,82 @@
+"""ColonyHealthService"""
+
+from collections.abc import AsyncIterator, Iterator
+
+from models.colony_health import ColonyHealth
+from repositories.colony_health import (
+    AsyncColonyHealthRepository,
+    ColonyHealthRepository,
+)
+
+# How many observations, ending at each point, its means and slopes are taken over
+DEFAULT_WINDOW: int = 3
+MAX_WINDOW: int = 52
+
+
+class ColonyHealthService:
+    def __init__(self, health_repo: ColonyHealthRepository) -> None:
+        self.health_repo: ColonyHealthRepository = health_repo
+        self.invalid_colony_id = "Invalid colony_id"
+        self.invalid_apiary_id = "Invalid apiary_id"
+        self.invalid_window = f"window must be between 1 and {MAX_WINDOW}"
+
+    def _validate_colony_id(self, colony_id: int) -> None:
+        if isinstance(colony_id, int) is False or colony_id <= 0:
+            raise ValueError(self.invalid_colony_id)
+
+    def _validate_apiary_id(self, apiary_id: int) -> None:
+        if isinstance(apiary_id, int) is False or apiary_id <= 0:
+            raise ValueError(self.invalid_apiary_id)
+
+    def _validate_window(self, window: int) -> None:
+        if isinstance(window, int) is False or not 1 <= window <= MAX_WINDOW:
+            raise ValueError(self.invalid_window)
+
+    def find_health_by_colony_id(
+        self, colony_id: int, window: int = DEFAULT_WINDOW
+    ) -> list[ColonyHealth] | None:
+        self._validate_colony_id(colony_id)
+        self._validate_window(window)
+        return self.health_repo.find_by_colony_id(colony_id, window)
+
+    def find_health_by_apiary_id(
+        self, apiary_id: int, window: int = DEFAULT_WINDOW
+    ) -> list[ColonyHealth] | None:
+        self._validate_apiary_id(apiary_id)
+        self._validate_window(window)
+        return self.health_repo.find_by_apiary_id(apiary_id, window)
+
+    def stream_health_by_apiary_id(
+        self, apiary_id: int, window: int = DEFAULT_WINDOW
+    ) -> Iterator[ColonyHealth]:
+        self._validate_apiary_id(apiary_id)
+        self._validate_window(window)
+        return self.health_repo.stream_by_apiary_id(apiary_id, window)
+
+
+class AsyncColonyHealthService(ColonyHealthService):
+    """Asyncio counterpart of ColonyHealthService"""
+
+    def __init__(self, health_repo: AsyncColonyHealthRepository) -> None:
+        super().__init__(health_repo=health_repo)
+
+    async def find_health_by_colony_id(
+        self, colony_id: int, window: int = DEFAULT_WINDOW
+    ) -> list[ColonyHealth] | None:
+        self._validate_colony_id(colony_id)
+        self._validate_window(window)
+        return await self.health_repo.find_by_colony_id(colony_id, window)
+
+    async def find_health_by_apiary_id(
+        self, apiary_id: int, window: int = DEFAULT_WINDOW
+    ) -> list[ColonyHealth] | None:
+        self._validate_apiary_id(apiary_id)
+        self._validate_window(window)
+        return await self.health_repo.find_by_apiary_id(apiary_id, window)
+
+    def stream_health_by_apiary_id(
+        self, apiary_id: int, window: int = DEFAULT_WINDOW
+    ) -> AsyncIterator[ColonyHealth]:
+        self._validate_apiary_id(apiary_id)
+        self._validate_window(window)
+        return self.health_repo.stream_by_apiary_id(apiary_id, window)
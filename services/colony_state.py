@@ -0,0 +1,54 @@
+"""ColonyStateService"""
+
+from collections.abc import AsyncIterator, Iterator
+
+from models.colony_state import ColonyState
+from repositories.colony_state import AsyncColonyStateRepository, ColonyStateRepository
+
+
+class ColonyStateService:
+    def __init__(self, state_repo: ColonyStateRepository) -> None:
+        self.state_repo: ColonyStateRepository = state_repo
+        self.invalid_colony_id = "Invalid colony_id"
+        self.invalid_apiary_id = "Invalid apiary_id"
+
+    def _validate_colony_id(self, colony_id: int) -> None:
+        if isinstance(colony_id, int) is False or colony_id <= 0:
+            raise ValueError(self.invalid_colony_id)
+
+    def _validate_apiary_id(self, apiary_id: int) -> None:
+        if isinstance(apiary_id, int) is False or apiary_id <= 0:
+            raise ValueError(self.invalid_apiary_id)
+
+    def find_state_by_colony_id(self, colony_id: int) -> ColonyState | None:
+        self._validate_colony_id(colony_id)
+        return self.state_repo.find_by_colony_id(colony_id)
+
+    def find_states_by_apiary_id(self, apiary_id: int) -> list[ColonyState] | None:
+        self._validate_apiary_id(apiary_id)
+        return self.state_repo.find_by_apiary_id(apiary_id)
+
+    def stream_states_by_apiary_id(self, apiary_id: int) -> Iterator[ColonyState]:
+        self._validate_apiary_id(apiary_id)
+        return self.state_repo.stream_by_apiary_id(apiary_id)
+
+
+class AsyncColonyStateService(ColonyStateService):
+    """Asyncio counterpart of ColonyStateService"""
+
+    def __init__(self, state_repo: AsyncColonyStateRepository) -> None:
+        super().__init__(state_repo=state_repo)
+
+    async def find_state_by_colony_id(self, colony_id: int) -> ColonyState | None:
+        self._validate_colony_id(colony_id)
+        return await self.state_repo.find_by_colony_id(colony_id)
+
+    async def find_states_by_apiary_id(
+        self, apiary_id: int
+    ) -> list[ColonyState] | None:
+        self._validate_apiary_id(apiary_id)
+        return await self.state_repo.find_by_apiary_id(apiary_id)
+
+    def stream_states_by_apiary_id(self, apiary_id: int) -> AsyncIterator[ColonyState]:
+        self._validate_apiary_id(apiary_id)
+        return self.state_repo.stream_by_apiary_id(apiary_id)
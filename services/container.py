@@ -0,0 +1,103 @@
+"""Builds every repository and service once, to be shared by all requests"""
+
+from db.async_database_connection import AsyncDatabaseConnection
+from repositories.action import AsyncActionRepository
+from repositories.apiary import AsyncApiaryRepository
+from repositories.colony import AsyncColonyRepository
+from repositories.colony_health import AsyncColonyHealthRepository
+from repositories.colony_state import AsyncColonyStateRepository
+from repositories.hive import AsyncHiveRepository
+from repositories.inspection import AsyncInspectionRepository
+from repositories.note_search import AsyncNoteSearchRepository
+from repositories.observation import AsyncObservationRepository
+from repositories.queen import AsyncQueenRepository
+from repositories.user import AsyncUserRepository
+from services.action import AsyncActionService
+from services.apiary import AsyncApiaryService
+from services.colony import AsyncColonyService
+from services.colony_health import AsyncColonyHealthService
+from services.colony_state import AsyncColonyStateService
+from services.hierarchy import AsyncHierarchyService
+from services.hive import AsyncHiveService
+from services.ingest import AsyncIngestService
+from services.inspection import AsyncInspectionService
+from services.note_search import AsyncNoteSearchService
+from services.observation import AsyncObservationService
+from services.queen import AsyncQueenService
+from services.user import AsyncUserService
+from utils.hashing_executor import HashingExecutor
+
+
+class Container:
+    """
+    The process-wide graph of repositories and the services built on them
+
+    Repositories and services hold nothing about any one request, only the
+    connection object they query through, so one of each serves every request.
+    The connection a request actually uses is bound per request, by
+    AsyncDatabaseConnection.request_scope() or unit_of_work(), and the
+    repositories pick it up there.
+    """
+
+    def __init__(self, db: AsyncDatabaseConnection, hasher: HashingExecutor) -> None:
+        self.db: AsyncDatabaseConnection = db
+
+        self.user_repo = AsyncUserRepository(db)
+        self.apiary_repo = AsyncApiaryRepository(db)
+        self.hive_repo = AsyncHiveRepository(db)
+        self.colony_repo = AsyncColonyRepository(db)
+        self.queen_repo = AsyncQueenRepository(db)
+        self.inspection_repo = AsyncInspectionRepository(db)
+        self.observation_repo = AsyncObservationRepository(db)
+        self.action_repo = AsyncActionRepository(db)
+        self.colony_health_repo = AsyncColonyHealthRepository(db)
+        self.colony_state_repo = AsyncColonyStateRepository(db)
+        self.note_search_repo = AsyncNoteSearchRepository(db)
+
+        self.user_service = AsyncUserService(repo=self.user_repo, hasher=hasher)
+        self.apiary_service = AsyncApiaryService(
+            apiary_repo=self.apiary_repo, user_repo=self.user_repo
+        )
+        self.hive_service = AsyncHiveService(
+            hive_repo=self.hive_repo, apiary_repo=self.apiary_repo
+        )
+        self.colony_service = AsyncColonyService(
+            colony_repo=self.colony_repo, hive_repo=self.hive_repo
+        )
+        self.queen_service = AsyncQueenService(
+            queen_repo=self.queen_repo, colony_repo=self.colony_repo
+        )
+        self.inspection_service = AsyncInspectionService(
+            inspection_repo=self.inspection_repo, colony_repo=self.colony_repo
+        )
+        self.action_service = AsyncActionService(
+            action_repo=self.action_repo, inspection_repo=self.inspection_repo
+        )
+        self.observation_service = AsyncObservationService(
+            observation_repo=self.observation_repo,
+            inspection_repo=self.inspection_repo,
+        )
+        self.hierarchy_service = AsyncHierarchyService(
+            apiary_repo=self.apiary_repo,
+            hive_repo=self.hive_repo,
+            colony_repo=self.colony_repo,
+            queen_repo=self.queen_repo,
+            inspection_repo=self.inspection_repo,
+            observation_repo=self.observation_repo,
+        )
+        self.colony_health_service = AsyncColonyHealthService(
+            health_repo=self.colony_health_repo
+        )
+        self.colony_state_service = AsyncColonyStateService(
+            state_repo=self.colony_state_repo
+        )
+        self.note_search_service = AsyncNoteSearchService(
+            search_repo=self.note_search_repo
+        )
+        self.ingest_service = AsyncIngestService(
+            db=db,
+            inspection_repo=self.inspection_repo,
+            observation_repo=self.observation_repo,
+            action_repo=self.action_repo,
+            colony_repo=self.colony_repo,
+        )
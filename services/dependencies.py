@@ -1,68 +1,118 @@
 """Dependencies required by routes"""
 
-from db.instance import db
-from repositories.action import ActionRepository
-from repositories.apiary import ApiaryRepository
-from repositories.colony import ColonyRepository
-from repositories.hive import HiveRepository
-from repositories.inspection import InspectionRepository
-from repositories.observation import ObservationRepository
-from repositories.queen import QueenRepository
-from repositories.user import UserRepository
-from services.action import ActionService
-from services.apiary import ApiaryService
-from services.colony import ColonyService
-from services.hive import HiveService
-from services.inspection import InspectionService
-from services.observation import ObservationService
-from services.queen import QueenService
-from services.user import UserService
+from collections.abc import AsyncIterator
+from typing import Annotated
 
+from fastapi import Depends
 
-def get_user_service() -> UserService:
-    user_repo = UserRepository(db)
-    return UserService(repo=user_repo)
+from db.async_database_connection import AsyncDatabaseConnection
+from db.instance import async_db
+from services.action import AsyncActionService
+from services.apiary import AsyncApiaryService
+from services.colony import AsyncColonyService
+from services.colony_health import AsyncColonyHealthService
+from services.colony_state import AsyncColonyStateService
+from services.container import Container
+from services.hierarchy import AsyncHierarchyService
+from services.hive import AsyncHiveService
+from services.ingest import AsyncIngestService
+from services.inspection import AsyncInspectionService
+from services.note_search import AsyncNoteSearchService
+from services.observation import AsyncObservationService
+from services.queen import AsyncQueenService
+from services.user import AsyncUserService
+from utils.instance import hashing_executor
 
+# Built once, at import; nothing in it connects until main.lifespan opens async_db
+container = Container(db=async_db, hasher=hashing_executor)
 
-def get_apiary_service() -> ApiaryService:
-    user_repo = UserRepository(db)
-    apiary_repo = ApiaryRepository(db)
-    return ApiaryService(apiary_repo=apiary_repo, user_repo=user_repo)
 
+async def request_scope() -> AsyncIterator[None]:
+    """
+    Bind one pooled connection to the whole of a request
 
-def get_hive_service() -> HiveService:
-    apiary_repo = ApiaryRepository(db)
-    hive_repo = HiveRepository(db)
-    return HiveService(hive_repo=hive_repo, apiary_repo=apiary_repo)
+    Every query the request's services make reuses it, instead of each taking
+    a connection from the pool and handing it back. It is taken on the first
+    query, so a request rejected by validation never touches the pool, and
+    returned before the response is sent, so a streamed body borrows its own.
+    """
+    async with container.db.request_scope():
+        yield
 
 
-def get_colony_service() -> ColonyService:
-    colony_repo = ColonyRepository(db)
-    hive_repo = HiveRepository(db)
-    return ColonyService(colony_repo=colony_repo, hive_repo=hive_repo)
+async def unit_of_work() -> AsyncIterator[None]:
+    """
+    Run the whole of a request in one transaction, on one pooled connection
 
+    Its writes commit together once the route returns, or roll back if it
+    raises, HTTPException included. The transaction begins with the first
+    query, so a request rejected by validation never opens one. The
+    request_scope() of the route's providers joins it.
+    """
+    async with container.db.unit_of_work():
+        yield
 
-def get_queen_service() -> QueenService:
-    queen_repo = QueenRepository(db)
-    colony_repo = ColonyRepository(db)
-    return QueenService(queen_repo=queen_repo, colony_repo=colony_repo)
 
+# Declared by every provider below, so a route's services share one connection.
+# Overriding a provider, as the route tests do, leaves the pool untouched
+RequestScope = Annotated[None, Depends(request_scope)]
 
-def get_inspection_service() -> InspectionService:
-    inspection_repo = InspectionRepository(db)
-    colony_repo = ColonyRepository(db)
-    return InspectionService(inspection_repo=inspection_repo, colony_repo=colony_repo)
+# For routes whose writes must land together: @router.post(..., dependencies=[UnitOfWork])
+UnitOfWork = Depends(unit_of_work)
 
 
-def get_action_service() -> ActionService:
-    action_repo = ActionRepository(db)
-    inspection_repo = InspectionRepository(db)
-    return ActionService(action_repo=action_repo, inspection_repo=inspection_repo)
+def get_async_db() -> AsyncDatabaseConnection:
+    return container.db
 
 
-def get_observation_service() -> ObservationService:
-    observation_repo = ObservationRepository(db)
-    inspection_repo = InspectionRepository(db)
-    return ObservationService(
-        observation_repo=observation_repo, inspection_repo=inspection_repo
-    )
+def get_user_service() -> AsyncUserService:
+    # No request scope: its connection would sit idle while bcrypt hashes the password
+    return container.user_service
+
+
+def get_apiary_service(_scope: RequestScope = None) -> AsyncApiaryService:
+    return container.apiary_service
+
+
+def get_hive_service(_scope: RequestScope = None) -> AsyncHiveService:
+    return container.hive_service
+
+
+def get_colony_service(_scope: RequestScope = None) -> AsyncColonyService:
+    return container.colony_service
+
+
+def get_queen_service(_scope: RequestScope = None) -> AsyncQueenService:
+    return container.queen_service
+
+
+def get_inspection_service(_scope: RequestScope = None) -> AsyncInspectionService:
+    return container.inspection_service
+
+
+def get_action_service(_scope: RequestScope = None) -> AsyncActionService:
+    return container.action_service
+
+
+def get_observation_service(_scope: RequestScope = None) -> AsyncObservationService:
+    return container.observation_service
+
+
+def get_hierarchy_service(_scope: RequestScope = None) -> AsyncHierarchyService:
+    return container.hierarchy_service
+
+
+def get_colony_health_service(_scope: RequestScope = None) -> AsyncColonyHealthService:
+    return container.colony_health_service
+
+
+def get_colony_state_service(_scope: RequestScope = None) -> AsyncColonyStateService:
+    return container.colony_state_service
+
+
+def get_note_search_service(_scope: RequestScope = None) -> AsyncNoteSearchService:
+    return container.note_search_service
+
+
+def get_ingest_service(_scope: RequestScope = None) -> AsyncIngestService:
+    return container.ingest_service
@@ -0,0 +1,255 @@
+"""HierarchyService"""
+
+from typing import Literal, TypeVar
+
+from pydantic import BaseModel
+
+from repositories.apiary import ApiaryRepository, AsyncApiaryRepository
+from repositories.colony import AsyncColonyRepository, ColonyRepository
+from repositories.hive import AsyncHiveRepository, HiveRepository
+from repositories.inspection import AsyncInspectionRepository, InspectionRepository
+from repositories.observation import AsyncObservationRepository, ObservationRepository
+from repositories.queen import AsyncQueenRepository, QueenRepository
+from schemas.hierarchy import ApiaryTree, ColonyTree, HiveTree, InspectionTree
+from schemas.observation import ObservationRead
+from schemas.queen import QueenRead
+
+# Levels read beneath the apiary, each one query: depth n reads every level up to n
+HIVES: int = 1
+COLONIES: int = 2
+# Each colony's queens and latest inspection
+COLONY_BRANCHES: int = 3
+# The observations made during each latest inspection
+OBSERVATIONS: int = 4
+MAX_DEPTH: int = OBSERVATIONS
+
+Branch = Literal["queens", "latest_inspection"]
+BRANCHES: frozenset[Branch] = frozenset(("queens", "latest_inspection"))
+
+S = TypeVar("S", bound=BaseModel)
+
+
+def _attach(
+    parents: list[BaseModel],
+    key: str,
+    field: str,
+    children: list,
+    schema: type[S],
+    *,
+    many: bool = True,
+) -> list[S]:
+    """
+    Set field on each parent to its children, matched on the key they share
+
+    Returns:
+        Every child, converted to schema, so the next level can attach to them
+
+    """
+    grouped: dict[int, list[S]] = {}
+    for child in children:
+        grouped.setdefault(getattr(child, key), []).append(
+            schema.model_validate(child, from_attributes=True)
+        )
+    for parent in parents:
+        group = grouped.get(getattr(parent, key), [])
+        setattr(parent, field, group if many else next(iter(group), None))
+    return [child for group in grouped.values() for child in group]
+
+
+class HierarchyService:
+    """Reads an apiary and everything beneath it with one query per level"""
+
+    def __init__(
+        self,
+        apiary_repo: ApiaryRepository,
+        hive_repo: HiveRepository,
+        colony_repo: ColonyRepository,
+        queen_repo: QueenRepository,
+        inspection_repo: InspectionRepository,
+        observation_repo: ObservationRepository,
+    ) -> None:
+        self.apiary_repo = apiary_repo
+        self.hive_repo = hive_repo
+        self.colony_repo = colony_repo
+        self.queen_repo = queen_repo
+        self.inspection_repo = inspection_repo
+        self.observation_repo = observation_repo
+        self.invalid_depth = f"depth must be between 0 and {MAX_DEPTH}"
+        self.invalid_include = f"include must be one of {sorted(BRANCHES)}"
+
+    def _validate(self, depth: int, include: frozenset[str]) -> None:
+        if not isinstance(depth, int) or not 0 <= depth <= MAX_DEPTH:
+            raise ValueError(self.invalid_depth)
+        if not include <= BRANCHES:
+            raise ValueError(self.invalid_include)
+
+    def find_apiary_tree(
+        self,
+        apiary_id: int,
+        *,
+        depth: int = MAX_DEPTH,
+        include: frozenset[str] = BRANCHES,
+    ) -> ApiaryTree | None:
+        """
+        Returns the apiary with its hives, colonies, queens and latest inspections
+
+        Args:
+            apiary_id: the apiary at the root of the tree
+            depth: how many levels to read beneath the apiary, up to MAX_DEPTH
+            include: the branches read beneath each colony. The queries for the
+                others are skipped, and they are left out of the tree
+
+        Raises:
+            ValueError: if depth or include is out of range.
+
+        """
+        self._validate(depth, include)
+        apiary = self.apiary_repo.find_by_apiary_id(apiary_id=apiary_id)
+        if apiary is None:
+            return None
+        tree = ApiaryTree.model_validate(apiary, from_attributes=True)
+        if depth >= HIVES:
+            hives = _attach(
+                [tree],
+                "apiary_id",
+                "hives",
+                self.hive_repo.find_by_apiary_id(apiary_id=apiary_id) or [],
+                HiveTree,
+            )
+            if depth >= COLONIES and hives:
+                self._read_colonies(hives, depth, include)
+        return tree
+
+    def _read_colonies(
+        self, hives: list[HiveTree], depth: int, include: frozenset[str]
+    ) -> None:
+        colonies = _attach(
+            hives,
+            "hive_id",
+            "colonies",
+            self.colony_repo.find_by_hive_ids([hive.hive_id for hive in hives]),
+            ColonyTree,
+        )
+        if depth < COLONY_BRANCHES or not colonies:
+            return
+
+        colony_ids = [colony.colony_id for colony in colonies]
+        if "queens" in include:
+            _attach(
+                colonies,
+                "colony_id",
+                "queens",
+                self.queen_repo.find_by_colony_ids(colony_ids),
+                QueenRead,
+            )
+        if "latest_inspection" not in include:
+            return
+
+        inspections = _attach(
+            colonies,
+            "colony_id",
+            "latest_inspection",
+            self.inspection_repo.find_latest_by_colony_ids(colony_ids),
+            InspectionTree,
+            many=False,
+        )
+        if depth >= OBSERVATIONS and inspections:
+            _attach(
+                inspections,
+                "inspection_id",
+                "observations",
+                self.observation_repo.find_by_inspection_ids(
+                    [inspection.inspection_id for inspection in inspections]
+                ),
+                ObservationRead,
+            )
+
+
+class AsyncHierarchyService(HierarchyService):
+    """Asyncio counterpart of HierarchyService"""
+
+    def __init__(
+        self,
+        apiary_repo: AsyncApiaryRepository,
+        hive_repo: AsyncHiveRepository,
+        colony_repo: AsyncColonyRepository,
+        queen_repo: AsyncQueenRepository,
+        inspection_repo: AsyncInspectionRepository,
+        observation_repo: AsyncObservationRepository,
+    ) -> None:
+        super().__init__(
+            apiary_repo=apiary_repo,
+            hive_repo=hive_repo,
+            colony_repo=colony_repo,
+            queen_repo=queen_repo,
+            inspection_repo=inspection_repo,
+            observation_repo=observation_repo,
+        )
+
+    async def find_apiary_tree(
+        self,
+        apiary_id: int,
+        *,
+        depth: int = MAX_DEPTH,
+        include: frozenset[str] = BRANCHES,
+    ) -> ApiaryTree | None:
+        self._validate(depth, include)
+        apiary = await self.apiary_repo.find_by_apiary_id(apiary_id=apiary_id)
+        if apiary is None:
+            return None
+        tree = ApiaryTree.model_validate(apiary, from_attributes=True)
+        if depth >= HIVES:
+            hives = _attach(
+                [tree],
+                "apiary_id",
+                "hives",
+                await self.hive_repo.find_by_apiary_id(apiary_id=apiary_id) or [],
+                HiveTree,
+            )
+            if depth >= COLONIES and hives:
+                await self._read_colonies(hives, depth, include)
+        return tree
+
+    async def _read_colonies(
+        self, hives: list[HiveTree], depth: int, include: frozenset[str]
+    ) -> None:
+        colonies = _attach(
+            hives,
+            "hive_id",
+            "colonies",
+            await self.colony_repo.find_by_hive_ids([hive.hive_id for hive in hives]),
+            ColonyTree,
+        )
+        if depth < COLONY_BRANCHES or not colonies:
+            return
+
+        colony_ids = [colony.colony_id for colony in colonies]
+        if "queens" in include:
+            _attach(
+                colonies,
+                "colony_id",
+                "queens",
+                await self.queen_repo.find_by_colony_ids(colony_ids),
+                QueenRead,
+            )
+        if "latest_inspection" not in include:
+            return
+
+        inspections = _attach(
+            colonies,
+            "colony_id",
+            "latest_inspection",
+            await self.inspection_repo.find_latest_by_colony_ids(colony_ids),
+            InspectionTree,
+            many=False,
+        )
+        if depth >= OBSERVATIONS and inspections:
+            _attach(
+                inspections,
+                "inspection_id",
+                "observations",
+                await self.observation_repo.find_by_inspection_ids(
+                    [inspection.inspection_id for inspection in inspections]
+                ),
+                ObservationRead,
+            )
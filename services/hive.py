@@ -1,8 +1,11 @@
 """HiveService"""
 
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+
 from models.hive import Hive
-from repositories.apiary import ApiaryRepository
-from repositories.hive import HiveRepository
+from repositories.apiary import ApiaryRepository, AsyncApiaryRepository
+from repositories.hive import AsyncHiveRepository, HiveRepository
 
 
 class HiveService:
@@ -27,34 +30,115 @@ class HiveService:
         if not isinstance(name, str) or len(name.strip()) <= 0:
             raise ValueError(self.hive_name_invalid)
 
+    @contextmanager
+    def _apiary_must_exist(self) -> Iterator[None]:
+        """Reports a write rejected by the apiary_id foreign key as an invalid apiary_id"""
+        try:
+            yield
+        except LookupError as e:
+            raise ValueError(self.apiary_id_invalid) from e
+
     def create_hive(self, name: str, apiary_id: int) -> Hive | None:
         self._validate_apiary_id(apiary_id)
 
         self._validate_name(name)
 
-        if self.apiary_repo.find_by_apiary_id(apiary_id) is None:
-            raise ValueError(self.apiary_id_invalid)
-
-        return self.hive_repo.create(name.strip(), apiary_id)
+        with self._apiary_must_exist():
+            return self.hive_repo.create(name.strip(), apiary_id)
 
     def find_hive_by_hive_id(self, hive_id: int) -> Hive | None:
         self._validate_hive_id(hive_id)
         return self.hive_repo.find_by_hive_id(hive_id)
 
-    def find_hives_by_apiary_id(self, apiary_id: int) -> list[Hive] | None:
+    def find_hives_by_hive_ids(self, hive_ids: list[int]) -> list[Hive]:
+        for hive_id in hive_ids:
+            self._validate_hive_id(hive_id)
+        return self.hive_repo.find_by_ids(hive_ids)
+
+    def find_hives_by_apiary_id(
+        self,
+        apiary_id: int,
+        *,
+        limit: int | None = None,
+        after: int | None = None,
+    ) -> list[Hive] | None:
+        self._validate_apiary_id(apiary_id)
+        return self.hive_repo.find_by_apiary_id(apiary_id, limit=limit, after=after)
+
+    def stream_hives_by_apiary_id(self, apiary_id: int) -> Iterator[Hive]:
         self._validate_apiary_id(apiary_id)
-        return self.hive_repo.find_by_apiary_id(apiary_id)
+        return self.hive_repo.stream_by_apiary_id(apiary_id)
 
     def update_hive(self, hive_id: int, name: str, apiary_id: int) -> Hive | None:
         self._validate_hive_id(hive_id)
         self._validate_apiary_id(apiary_id)
         self._validate_name(name)
-        if not bool(self.hive_repo.find_by_hive_id(hive_id=hive_id)):
+        with self._apiary_must_exist():
+            hive = self.hive_repo.update(
+                hive_id=hive_id, name=name, apiary_id=apiary_id
+            )
+        if hive is None:
             raise ValueError(self.hive_id_invalid)
-        if not bool(self.apiary_repo.find_by_apiary_id(apiary_id=apiary_id)):
-            raise ValueError(self.apiary_id_invalid)
-        return self.hive_repo.update(hive_id=hive_id, name=name, apiary_id=apiary_id)
+        return hive
 
     def delete_hive(self, hive_id: int) -> bool:
         self._validate_hive_id(hive_id)
         return bool(self.hive_repo.delete(hive_id))
+
+
+class AsyncHiveService(HiveService):
+    """Asyncio counterpart of HiveService"""
+
+    def __init__(
+        self, hive_repo: AsyncHiveRepository, apiary_repo: AsyncApiaryRepository
+    ) -> None:
+        super().__init__(hive_repo=hive_repo, apiary_repo=apiary_repo)
+
+    async def create_hive(self, name: str, apiary_id: int) -> Hive | None:
+        self._validate_apiary_id(apiary_id)
+
+        self._validate_name(name)
+
+        with self._apiary_must_exist():
+            return await self.hive_repo.create(name.strip(), apiary_id)
+
+    async def find_hive_by_hive_id(self, hive_id: int) -> Hive | None:
+        self._validate_hive_id(hive_id)
+        return await self.hive_repo.find_by_hive_id(hive_id)
+
+    async def find_hives_by_hive_ids(self, hive_ids: list[int]) -> list[Hive]:
+        for hive_id in hive_ids:
+            self._validate_hive_id(hive_id)
+        return await self.hive_repo.find_by_ids(hive_ids)
+
+    async def find_hives_by_apiary_id(
+        self,
+        apiary_id: int,
+        *,
+        limit: int | None = None,
+        after: int | None = None,
+    ) -> list[Hive] | None:
+        self._validate_apiary_id(apiary_id)
+        return await self.hive_repo.find_by_apiary_id(
+            apiary_id, limit=limit, after=after
+        )
+
+    def stream_hives_by_apiary_id(self, apiary_id: int) -> AsyncIterator[Hive]:
+        self._validate_apiary_id(apiary_id)
+        return self.hive_repo.stream_by_apiary_id(apiary_id)
+
+    async def update_hive(self, hive_id: int, name: str, apiary_id: int) -> Hive | None:
+        self._validate_hive_id(hive_id)
+        self._validate_apiary_id(apiary_id)
+        self._validate_name(name)
+        with self._apiary_must_exist():
+            hive = await self.hive_repo.update(
+                hive_id=hive_id, name=name, apiary_id=apiary_id
+            )
+        if hive is None:
+            raise ValueError(self.hive_id_invalid)
+        return hive
+
+    async def delete_hive(self, hive_id: int) -> bool:
+        self._validate_hive_id(hive_id)
+        return bool(await self.hive_repo.delete(hive_id))
@@ -0,0 +1,205 @@
+"""IngestService"""
+
+from datetime import datetime
+
+from db.async_database_connection import AsyncDatabaseConnection
+from db.database_connection import DatabaseConnection
+from models.inspection import Inspection
+from repositories.action import ActionRepository, AsyncActionRepository
+from repositories.colony import AsyncColonyRepository, ColonyRepository
+from repositories.inspection import AsyncInspectionRepository, InspectionRepository
+from repositories.observation import AsyncObservationRepository, ObservationRepository
+from schemas.inspection import InspectionIngest
+
+
+class IngestService:
+    """Writes inspections with their observations and actions in bulk, in one transaction"""
+
+    def __init__(
+        self,
+        db: DatabaseConnection,
+        inspection_repo: InspectionRepository,
+        observation_repo: ObservationRepository,
+        action_repo: ActionRepository,
+        colony_repo: ColonyRepository,
+    ) -> None:
+        self.db: DatabaseConnection = db
+        self.inspection_repo: InspectionRepository = inspection_repo
+        self.observation_repo: ObservationRepository = observation_repo
+        self.action_repo: ActionRepository = action_repo
+        self.colony_repo: ColonyRepository = colony_repo
+        self.invalid_colony_id = "Invalid colony_id"
+        self.invalid_inspection_timestamp = "Invalid inspection_timestamp"
+        self.invalid_notes = "Invalid notes"
+
+    def _validate_colony_id(self, colony_id: int) -> None:
+        if isinstance(colony_id, int) is False or colony_id <= 0:
+            raise ValueError(self.invalid_colony_id)
+
+    def _validate_inspection_timestamp(self, inspection_timestamp: datetime) -> None:
+        if isinstance(inspection_timestamp, datetime) is False:
+            raise TypeError(self.invalid_inspection_timestamp)
+
+    def _validate_notes(self, notes: str) -> None:
+        if isinstance(notes, str) is False:
+            raise TypeError(self.invalid_notes)
+
+    def _validate_records(self, records: list[InspectionIngest]) -> None:
+        for record in records:
+            self._validate_colony_id(record.colony_id)
+            self._validate_inspection_timestamp(record.inspection_timestamp)
+            for observation in record.observations:
+                self._validate_notes(observation.notes)
+            for action in record.actions:
+                self._validate_notes(action.notes)
+
+    def _check_colonies(self, colony_ids: set[int], existing: set[int]) -> None:
+        missing = sorted(colony_ids - existing)
+        if missing:
+            error_message = f"{self.invalid_colony_id}: {missing}"
+            raise ValueError(error_message)
+
+    def _validate_colonies_exist(self, colony_ids: set[int]) -> None:
+        """Raises ValueError naming every colony_id that does not exist"""
+        existing = self.colony_repo.find_existing_colony_ids(sorted(colony_ids))
+        self._check_colonies(colony_ids, existing)
+
+    @staticmethod
+    def _child_rows(
+        records: list[InspectionIngest], inspections: list[Inspection]
+    ) -> tuple[list[tuple], list[tuple]]:
+        observation_rows: list[tuple] = []
+        action_rows: list[tuple] = []
+        for record, inspection in zip(records, inspections, strict=True):
+            observation_rows.extend(
+                (
+                    observation.queenright,
+                    observation.queen_cells,
+                    observation.bias,
+                    observation.brood_frames,
+                    observation.store_frames,
+                    observation.chalk_brood,
+                    observation.foul_brood,
+                    observation.varroa_count,
+                    observation.temper,
+                    observation.notes,
+                    inspection.inspection_id,
+                    inspection.inspection_timestamp,
+                )
+                for observation in record.observations
+            )
+            action_rows.extend(
+                (
+                    action.notes,
+                    inspection.inspection_id,
+                    inspection.inspection_timestamp,
+                )
+                for action in record.actions
+            )
+        return observation_rows, action_rows
+
+    def ingest_inspections(self, records: list[InspectionIngest]) -> dict:
+        """
+        Validate and write a batch of inspections
+
+        Inspections are inserted with one multi-row insert, then observations
+        and actions are loaded with COPY, all in one unit of work, so a failure
+        writes nothing. Inside a caller's unit of work the batch is a savepoint
+        of it, so an import of many batches pays for one commit. The foreign key
+        checks every colony_id as it is written; only if one is missing are they
+        looked up, to name the missing ones.
+
+        Returns:
+            The new inspection_ids in input order, and how many observations and actions were written
+
+        Raises:
+            ValueError: if a colony_id is invalid or does not exist.
+            TypeError: if a timestamp or notes field has the wrong type.
+
+        """
+        self._validate_records(records)
+        if not records:
+            return {"inspection_ids": [], "observations": 0, "actions": 0}
+        try:
+            with self.db.unit_of_work():
+                inspections = self.inspection_repo.create_many(
+                    [
+                        (record.inspection_timestamp, record.colony_id)
+                        for record in records
+                    ]
+                )
+                observation_rows, action_rows = self._child_rows(records, inspections)
+                observations = (
+                    self.observation_repo.create_many(observation_rows)
+                    if observation_rows
+                    else 0
+                )
+                actions = (
+                    self.action_repo.create_many(action_rows) if action_rows else 0
+                )
+        except LookupError as e:
+            self._validate_colonies_exist({record.colony_id for record in records})
+            raise ValueError(self.invalid_colony_id) from e
+        return {
+            "inspection_ids": [inspection.inspection_id for inspection in inspections],
+            "observations": observations,
+            "actions": actions,
+        }
+
+
+class AsyncIngestService(IngestService):
+    """Asyncio counterpart of IngestService"""
+
+    def __init__(
+        self,
+        db: AsyncDatabaseConnection,
+        inspection_repo: AsyncInspectionRepository,
+        observation_repo: AsyncObservationRepository,
+        action_repo: AsyncActionRepository,
+        colony_repo: AsyncColonyRepository,
+    ) -> None:
+        super().__init__(
+            db=db,
+            inspection_repo=inspection_repo,
+            observation_repo=observation_repo,
+            action_repo=action_repo,
+            colony_repo=colony_repo,
+        )
+
+    async def _validate_colonies_exist(self, colony_ids: set[int]) -> None:
+        existing = await self.colony_repo.find_existing_colony_ids(sorted(colony_ids))
+        self._check_colonies(colony_ids, existing)
+
+    async def ingest_inspections(self, records: list[InspectionIngest]) -> dict:
+        self._validate_records(records)
+        if not records:
+            return {"inspection_ids": [], "observations": 0, "actions": 0}
+        try:
+            async with self.db.unit_of_work():
+                inspections = await self.inspection_repo.create_many(
+                    [
+                        (record.inspection_timestamp, record.colony_id)
+                        for record in records
+                    ]
+                )
+                observation_rows, action_rows = self._child_rows(records, inspections)
+                observations = (
+                    await self.observation_repo.create_many(observation_rows)
+                    if observation_rows
+                    else 0
+                )
+                actions = (
+                    await self.action_repo.create_many(action_rows)
+                    if action_rows
+                    else 0
+                )
+        except LookupError as e:
+            await self._validate_colonies_exist(
+                {record.colony_id for record in records}
+            )
+            raise ValueError(self.invalid_colony_id) from e
+        return {
+            "inspection_ids": [inspection.inspection_id for inspection in inspections],
+            "observations": observations,
+            "actions": actions,
+        }
@@ -1,10 +1,12 @@
 """InspectionService"""
 
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 
 from models.inspection import Inspection
-from repositories.colony import ColonyRepository
-from repositories.inspection import InspectionRepository
+from repositories.colony import AsyncColonyRepository, ColonyRepository
+from repositories.inspection import AsyncInspectionRepository, InspectionRepository
 
 
 class InspectionService:
@@ -29,31 +31,50 @@ class InspectionService:
         if isinstance(colony_id, int) is False or colony_id <= 0:
             raise ValueError(self.invalid_colony_id)
 
-    def _validate_colony_exists(self, colony_id: int) -> None:
-        if self.colony_repo.find_by_colony_id(colony_id) is None:
-            raise ValueError(self.invalid_colony_id)
-
-    def _validate_inspection_exists(self, inspection_id: int) -> None:
-        if self.inspection_repo.find_by_inspection_id(inspection_id) is None:
-            raise ValueError(self.invalid_inspection_id)
+    @contextmanager
+    def _colony_must_exist(self) -> Iterator[None]:
+        """Reports a write rejected by the colony_id foreign key as an invalid colony_id"""
+        try:
+            yield
+        except LookupError as e:
+            raise ValueError(self.invalid_colony_id) from e
 
     def create_inspection(
         self, inspection_timestamp: datetime, colony_id: int
     ) -> Inspection | None:
         self._validate_colony_id(colony_id)
         self._validate_inspection_timestamp(inspection_timestamp=inspection_timestamp)
-        self._validate_colony_exists(colony_id)
-        return self.inspection_repo.create(
-            inspection_timestamp=inspection_timestamp, colony_id=colony_id
-        )
+        with self._colony_must_exist():
+            return self.inspection_repo.create(
+                inspection_timestamp=inspection_timestamp, colony_id=colony_id
+            )
 
     def find_inspection_by_inspection_id(self, inspection_id: int) -> Inspection | None:
         self._validate_inspection_id(inspection_id)
         return self.inspection_repo.find_by_inspection_id(inspection_id)
 
-    def find_inspections_by_colony_id(self, colony_id: int) -> list[Inspection] | None:
+    def find_inspections_by_inspection_ids(
+        self, inspection_ids: list[int]
+    ) -> list[Inspection]:
+        for inspection_id in inspection_ids:
+            self._validate_inspection_id(inspection_id)
+        return self.inspection_repo.find_by_ids(inspection_ids)
+
+    def find_inspections_by_colony_id(
+        self,
+        colony_id: int,
+        *,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[Inspection] | None:
         self._validate_colony_id(colony_id)
-        return self.inspection_repo.find_by_colony_id(colony_id)
+        return self.inspection_repo.find_by_colony_id(
+            colony_id, limit=limit, after=after
+        )
+
+    def stream_inspections_by_colony_id(self, colony_id: int) -> Iterator[Inspection]:
+        self._validate_colony_id(colony_id)
+        return self.inspection_repo.stream_by_colony_id(colony_id)
 
     def update_inspection(
         self, inspection_id: int, inspection_timestamp: datetime, colony_id: int
@@ -61,14 +82,88 @@ class InspectionService:
         self._validate_inspection_id(inspection_id)
         self._validate_inspection_timestamp(inspection_timestamp=inspection_timestamp)
         self._validate_colony_id(colony_id)
-        self._validate_inspection_exists(inspection_id)
-        self._validate_colony_exists(colony_id)
-        return self.inspection_repo.update(
-            inspection_id=inspection_id,
-            inspection_timestamp=inspection_timestamp,
-            colony_id=colony_id,
-        )
+        with self._colony_must_exist():
+            inspection = self.inspection_repo.update(
+                inspection_id=inspection_id,
+                inspection_timestamp=inspection_timestamp,
+                colony_id=colony_id,
+            )
+        if inspection is None:
+            raise ValueError(self.invalid_inspection_id)
+        return inspection
 
     def delete_inspection(self, inspection_id: int) -> bool:
         self._validate_inspection_id(inspection_id)
         return bool(self.inspection_repo.delete(inspection_id))
+
+
+class AsyncInspectionService(InspectionService):
+    """Asyncio counterpart of InspectionService"""
+
+    def __init__(
+        self,
+        inspection_repo: AsyncInspectionRepository,
+        colony_repo: AsyncColonyRepository,
+    ) -> None:
+        super().__init__(inspection_repo=inspection_repo, colony_repo=colony_repo)
+
+    async def create_inspection(
+        self, inspection_timestamp: datetime, colony_id: int
+    ) -> Inspection | None:
+        self._validate_colony_id(colony_id)
+        self._validate_inspection_timestamp(inspection_timestamp=inspection_timestamp)
+        with self._colony_must_exist():
+            return await self.inspection_repo.create(
+                inspection_timestamp=inspection_timestamp, colony_id=colony_id
+            )
+
+    async def find_inspection_by_inspection_id(
+        self, inspection_id: int
+    ) -> Inspection | None:
+        self._validate_inspection_id(inspection_id)
+        return await self.inspection_repo.find_by_inspection_id(inspection_id)
+
+    async def find_inspections_by_inspection_ids(
+        self, inspection_ids: list[int]
+    ) -> list[Inspection]:
+        for inspection_id in inspection_ids:
+            self._validate_inspection_id(inspection_id)
+        return await self.inspection_repo.find_by_ids(inspection_ids)
+
+    async def find_inspections_by_colony_id(
+        self,
+        colony_id: int,
+        *,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[Inspection] | None:
+        self._validate_colony_id(colony_id)
+        return await self.inspection_repo.find_by_colony_id(
+            colony_id, limit=limit, after=after
+        )
+
+    def stream_inspections_by_colony_id(
+        self, colony_id: int
+    ) -> AsyncIterator[Inspection]:
+        self._validate_colony_id(colony_id)
+        return self.inspection_repo.stream_by_colony_id(colony_id)
+
+    async def update_inspection(
+        self, inspection_id: int, inspection_timestamp: datetime, colony_id: int
+    ) -> Inspection | None:
+        self._validate_inspection_id(inspection_id)
+        self._validate_inspection_timestamp(inspection_timestamp=inspection_timestamp)
+        self._validate_colony_id(colony_id)
+        with self._colony_must_exist():
+            inspection = await self.inspection_repo.update(
+                inspection_id=inspection_id,
+                inspection_timestamp=inspection_timestamp,
+                colony_id=colony_id,
+            )
+        if inspection is None:
+            raise ValueError(self.invalid_inspection_id)
+        return inspection
+
+    async def delete_inspection(self, inspection_id: int) -> bool:
+        self._validate_inspection_id(inspection_id)
+        return bool(await self.inspection_repo.delete(inspection_id))
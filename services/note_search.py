@@ -0,0 +1,122 @@
+"""NoteSearchService"""
+
+from datetime import datetime
+
+from models.note_match import NoteMatch
+from repositories.note_search import (
+    SCOPES,
+    AsyncNoteSearchRepository,
+    NoteSearchRepository,
+)
+
+# Longer searches are no more selective, only slower to parse and rank
+MAX_SEARCH_LENGTH: int = 200
+
+
+class NoteSearchService:
+    def __init__(self, search_repo: NoteSearchRepository) -> None:
+        self.search_repo: NoteSearchRepository = search_repo
+        self.invalid_search = (
+            f"q must hold between 1 and {MAX_SEARCH_LENGTH} characters"
+        )
+        self.invalid_scope = "Give exactly one of user_id, apiary_id or colony_id"
+        self.invalid_date_range = "since must be before until"
+
+    def _validate_search(self, text: str) -> None:
+        if (
+            isinstance(text, str) is False
+            or not text.strip()
+            or len(text) > MAX_SEARCH_LENGTH
+        ):
+            raise ValueError(self.invalid_search)
+
+    def _scope(self, **scope_ids: int | None) -> tuple[str, int]:
+        """Returns the one scope given, and its id"""
+        given = [
+            (scope, value) for scope, value in scope_ids.items() if value is not None
+        ]
+        if len(given) != 1:
+            raise ValueError(self.invalid_scope)
+        scope, scope_id = given[0]
+        if scope not in SCOPES or isinstance(scope_id, int) is False or scope_id <= 0:
+            error_message = f"Invalid {scope}"
+            raise ValueError(error_message)
+        return scope, scope_id
+
+    def _validate_date_range(
+        self, since: datetime | None, until: datetime | None
+    ) -> None:
+        if since is not None and until is not None and since >= until:
+            raise ValueError(self.invalid_date_range)
+
+    def search_notes(
+        self,
+        text: str,
+        *,
+        user_id: int | None = None,
+        apiary_id: int | None = None,
+        colony_id: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int,
+        after: tuple[float, datetime, str, int] | None = None,
+    ) -> list[NoteMatch]:
+        """
+        Search the notes of one user's, apiary's or colony's observations and actions
+
+        Returns:
+            The page of matching notes, best match first
+
+        Raises:
+            ValueError: if the search is empty or too long, not exactly one scope
+                is given, its id is invalid, or since is not before until.
+
+        """
+        self._validate_search(text)
+        scope, scope_id = self._scope(
+            user_id=user_id, apiary_id=apiary_id, colony_id=colony_id
+        )
+        self._validate_date_range(since, until)
+        return self.search_repo.search(
+            text,
+            scope,
+            scope_id,
+            limit=limit,
+            since=since,
+            until=until,
+            after=after,
+        )
+
+
+class AsyncNoteSearchService(NoteSearchService):
+    """Asyncio counterpart of NoteSearchService"""
+
+    def __init__(self, search_repo: AsyncNoteSearchRepository) -> None:
+        super().__init__(search_repo=search_repo)
+
+    async def search_notes(
+        self,
+        text: str,
+        *,
+        user_id: int | None = None,
+        apiary_id: int | None = None,
+        colony_id: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int,
+        after: tuple[float, datetime, str, int] | None = None,
+    ) -> list[NoteMatch]:
+        self._validate_search(text)
+        scope, scope_id = self._scope(
+            user_id=user_id, apiary_id=apiary_id, colony_id=colony_id
+        )
+        self._validate_date_range(since, until)
+        return await self.search_repo.search(
+            text,
+            scope,
+            scope_id,
+            limit=limit,
+            since=since,
+            until=until,
+            after=after,
+        )
@@ -1,8 +1,11 @@
 """ObservationService"""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from models.observation import Observation
-from repositories.inspection import InspectionRepository
-from repositories.observation import ObservationRepository
+from repositories.inspection import AsyncInspectionRepository, InspectionRepository
+from repositories.observation import AsyncObservationRepository, ObservationRepository
 
 
 class ObservationService:
@@ -29,13 +32,13 @@ class ObservationService:
         if isinstance(inspection_id, int) is False or inspection_id <= 0:
             raise ValueError(self.invalid_inspection_id)
 
-    def _validate_inspection_exists(self, inspection_id: int) -> None:
-        if self.inspection_repo.find_by_inspection_id(inspection_id) is None:
-            raise ValueError(self.invalid_inspection_id)
-
-    def _validate_observation_exists(self, observation_id: int) -> None:
-        if self.observation_repo.find_by_observation_id(observation_id) is None:
-            raise ValueError(self.invalid_observation_id)
+    @contextmanager
+    def _inspection_must_exist(self) -> Iterator[None]:
+        """Reports a write rejected by the inspection_id foreign key as an invalid inspection_id"""
+        try:
+            yield
+        except LookupError as e:
+            raise ValueError(self.invalid_inspection_id) from e
 
     def create_observation(
         self,
@@ -54,20 +57,20 @@ class ObservationService:
     ) -> Observation | None:
         self._validate_inspection_id(inspection_id)
         self._validate_notes(notes=notes)
-        self._validate_inspection_exists(inspection_id)
-        return self.observation_repo.create(
-            queenright=queenright,
-            queen_cells=queen_cells,
-            bias=bias,
-            brood_frames=brood_frames,
-            store_frames=store_frames,
-            chalk_brood=chalk_brood,
-            foul_brood=foul_brood,
-            varroa_count=varroa_count,
-            temper=temper,
-            notes=notes,
-            inspection_id=inspection_id,
-        )
+        with self._inspection_must_exist():
+            return self.observation_repo.create(
+                queenright=queenright,
+                queen_cells=queen_cells,
+                bias=bias,
+                brood_frames=brood_frames,
+                store_frames=store_frames,
+                chalk_brood=chalk_brood,
+                foul_brood=foul_brood,
+                varroa_count=varroa_count,
+                temper=temper,
+                notes=notes,
+                inspection_id=inspection_id,
+            )
 
     def find_observation_by_observation_id(
         self, observation_id: int
@@ -75,6 +78,13 @@ class ObservationService:
         self._validate_observation_id(observation_id)
         return self.observation_repo.find_by_observation_id(observation_id)
 
+    def find_observations_by_observation_ids(
+        self, observation_ids: list[int]
+    ) -> list[Observation]:
+        for observation_id in observation_ids:
+            self._validate_observation_id(observation_id)
+        return self.observation_repo.find_by_ids(observation_ids)
+
     def find_observation_by_inspection_id(
         self, inspection_id: int
     ) -> Observation | None:
@@ -100,23 +110,131 @@ class ObservationService:
         self._validate_observation_id(observation_id)
         self._validate_notes(notes=notes)
         self._validate_inspection_id(inspection_id)
-        self._validate_observation_exists(observation_id)
-        self._validate_inspection_exists(inspection_id)
-        return self.observation_repo.update(
-            observation_id=observation_id,
-            queenright=queenright,
-            queen_cells=queen_cells,
-            bias=bias,
-            brood_frames=brood_frames,
-            store_frames=store_frames,
-            chalk_brood=chalk_brood,
-            foul_brood=foul_brood,
-            varroa_count=varroa_count,
-            temper=temper,
-            notes=notes,
-            inspection_id=inspection_id,
-        )
+        with self._inspection_must_exist():
+            observation = self.observation_repo.update(
+                observation_id=observation_id,
+                queenright=queenright,
+                queen_cells=queen_cells,
+                bias=bias,
+                brood_frames=brood_frames,
+                store_frames=store_frames,
+                chalk_brood=chalk_brood,
+                foul_brood=foul_brood,
+                varroa_count=varroa_count,
+                temper=temper,
+                notes=notes,
+                inspection_id=inspection_id,
+            )
+        if observation is None:
+            raise ValueError(self.invalid_observation_id)
+        return observation
 
     def delete_observation(self, observation_id: int) -> bool:
         self._validate_observation_id(observation_id)
         return bool(self.observation_repo.delete(observation_id))
+
+
+class AsyncObservationService(ObservationService):
+    """Asyncio counterpart of ObservationService"""
+
+    def __init__(
+        self,
+        observation_repo: AsyncObservationRepository,
+        inspection_repo: AsyncInspectionRepository,
+    ) -> None:
+        super().__init__(
+            observation_repo=observation_repo, inspection_repo=inspection_repo
+        )
+
+    async def create_observation(
+        self,
+        *,
+        queenright: bool,
+        queen_cells: int,
+        bias: bool,
+        brood_frames: int,
+        store_frames: int,
+        chalk_brood: bool,
+        foul_brood: bool,
+        varroa_count: int,
+        temper: int,
+        notes: str,
+        inspection_id: int,
+    ) -> Observation | None:
+        self._validate_inspection_id(inspection_id)
+        self._validate_notes(notes=notes)
+        with self._inspection_must_exist():
+            return await self.observation_repo.create(
+                queenright=queenright,
+                queen_cells=queen_cells,
+                bias=bias,
+                brood_frames=brood_frames,
+                store_frames=store_frames,
+                chalk_brood=chalk_brood,
+                foul_brood=foul_brood,
+                varroa_count=varroa_count,
+                temper=temper,
+                notes=notes,
+                inspection_id=inspection_id,
+            )
+
+    async def find_observation_by_observation_id(
+        self, observation_id: int
+    ) -> Observation | None:
+        self._validate_observation_id(observation_id)
+        return await self.observation_repo.find_by_observation_id(observation_id)
+
+    async def find_observations_by_observation_ids(
+        self, observation_ids: list[int]
+    ) -> list[Observation]:
+        for observation_id in observation_ids:
+            self._validate_observation_id(observation_id)
+        return await self.observation_repo.find_by_ids(observation_ids)
+
+    async def find_observation_by_inspection_id(
+        self, inspection_id: int
+    ) -> Observation | None:
+        self._validate_inspection_id(inspection_id)
+        return await self.observation_repo.find_by_inspection_id(inspection_id)
+
+    async def update_observation(
+        self,
+        *,
+        observation_id: int,
+        queenright: bool,
+        queen_cells: int,
+        bias: bool,
+        brood_frames: int,
+        store_frames: int,
+        chalk_brood: bool,
+        foul_brood: bool,
+        varroa_count: int,
+        temper: int,
+        notes: str,
+        inspection_id: int,
+    ) -> Observation | None:
+        self._validate_observation_id(observation_id)
+        self._validate_notes(notes=notes)
+        self._validate_inspection_id(inspection_id)
+        with self._inspection_must_exist():
+            observation = await self.observation_repo.update(
+                observation_id=observation_id,
+                queenright=queenright,
+                queen_cells=queen_cells,
+                bias=bias,
+                brood_frames=brood_frames,
+                store_frames=store_frames,
+                chalk_brood=chalk_brood,
+                foul_brood=foul_brood,
+                varroa_count=varroa_count,
+                temper=temper,
+                notes=notes,
+                inspection_id=inspection_id,
+            )
+        if observation is None:
+            raise ValueError(self.invalid_observation_id)
+        return observation
+
+    async def delete_observation(self, observation_id: int) -> bool:
+        self._validate_observation_id(observation_id)
+        return bool(await self.observation_repo.delete(observation_id))
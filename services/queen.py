@@ -1,8 +1,11 @@
 """QueenService"""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from models.queen import Queen
-from repositories.colony import ColonyRepository
-from repositories.queen import QueenRepository
+from repositories.colony import AsyncColonyRepository, ColonyRepository
+from repositories.queen import AsyncQueenRepository, QueenRepository
 
 
 class QueenService:
@@ -22,37 +25,111 @@ class QueenService:
         if not isinstance(colony_id, int) or colony_id <= 0:
             raise ValueError(self.invalid_colony_id)
 
+    @contextmanager
+    def _colony_must_exist(self) -> Iterator[None]:
+        """Reports a write rejected by the colony_id foreign key as an invalid colony_id"""
+        try:
+            yield
+        except LookupError as e:
+            raise ValueError(self.invalid_colony_id) from e
+
     def create_queen(
         self, *, colour: str, clipped: bool, colony_id: int
     ) -> Queen | None:
         self._validate_colony_id(colony_id)
-        if not bool(self.colony_repo.find_by_colony_id(colony_id)):
-            raise ValueError(self.invalid_colony_id)
-        return self.queen_repo.create(
-            colour=colour, clipped=clipped, colony_id=colony_id
-        )
+        with self._colony_must_exist():
+            return self.queen_repo.create(
+                colour=colour, clipped=clipped, colony_id=colony_id
+            )
 
     def find_queen_by_queen_id(self, queen_id: int) -> Queen | None:
         self._validate_queen_id(queen_id)
         return self.queen_repo.find_by_queen_id(queen_id)
 
-    def find_queen_by_colony_id(self, colony_id: int) -> Queen | None:
+    def find_queens_by_queen_ids(self, queen_ids: list[int]) -> list[Queen]:
+        for queen_id in queen_ids:
+            self._validate_queen_id(queen_id)
+        return self.queen_repo.find_by_ids(queen_ids)
+
+    def find_queen_by_colony_id(
+        self,
+        colony_id: int,
+        *,
+        limit: int | None = None,
+        after: int | None = None,
+    ) -> list[Queen] | None:
         self._validate_colony_id(colony_id)
-        return self.queen_repo.find_by_colony_id(colony_id)
+        return self.queen_repo.find_by_colony_id(colony_id, limit=limit, after=after)
 
     def update_queen(
         self, *, queen_id: int, colour: str, clipped: bool, colony_id: int
     ) -> Queen | None:
         self._validate_queen_id(queen_id)
         self._validate_colony_id(colony_id)
-        if not bool(self.queen_repo.find_by_queen_id(queen_id)):
+        with self._colony_must_exist():
+            queen = self.queen_repo.update(
+                queen_id=queen_id, colour=colour, clipped=clipped, colony_id=colony_id
+            )
+        if queen is None:
             raise ValueError(self.invalid_queen_id)
-        if not bool(self.colony_repo.find_by_colony_id(colony_id)):
-            raise ValueError(self.invalid_colony_id)
-        return self.queen_repo.update(
-            queen_id=queen_id, colour=colour, clipped=clipped, colony_id=colony_id
-        )
+        return queen
 
     def delete_queen(self, queen_id: int) -> bool:
         self._validate_queen_id(queen_id)
         return bool(self.queen_repo.delete(queen_id))
+
+
+class AsyncQueenService(QueenService):
+    """Asyncio counterpart of QueenService"""
+
+    def __init__(
+        self, queen_repo: AsyncQueenRepository, colony_repo: AsyncColonyRepository
+    ) -> None:
+        super().__init__(queen_repo=queen_repo, colony_repo=colony_repo)
+
+    async def create_queen(
+        self, *, colour: str, clipped: bool, colony_id: int
+    ) -> Queen | None:
+        self._validate_colony_id(colony_id)
+        with self._colony_must_exist():
+            return await self.queen_repo.create(
+                colour=colour, clipped=clipped, colony_id=colony_id
+            )
+
+    async def find_queen_by_queen_id(self, queen_id: int) -> Queen | None:
+        self._validate_queen_id(queen_id)
+        return await self.queen_repo.find_by_queen_id(queen_id)
+
+    async def find_queens_by_queen_ids(self, queen_ids: list[int]) -> list[Queen]:
+        for queen_id in queen_ids:
+            self._validate_queen_id(queen_id)
+        return await self.queen_repo.find_by_ids(queen_ids)
+
+    async def find_queen_by_colony_id(
+        self,
+        colony_id: int,
+        *,
+        limit: int | None = None,
+        after: int | None = None,
+    ) -> list[Queen] | None:
+        self._validate_colony_id(colony_id)
+        return await self.queen_repo.find_by_colony_id(
+            colony_id, limit=limit, after=after
+        )
+
+    async def update_queen(
+        self, *, queen_id: int, colour: str, clipped: bool, colony_id: int
+    ) -> Queen | None:
+        self._validate_queen_id(queen_id)
+        self._validate_colony_id(colony_id)
+        with self._colony_must_exist():
+            queen = await self.queen_repo.update(
+                queen_id=queen_id, colour=colour, clipped=clipped, colony_id=colony_id
+            )
+        if queen is None:
+            raise ValueError(self.invalid_queen_id)
+        return queen
+
+    async def delete_queen(self, queen_id: int) -> bool:
+        self._validate_queen_id(queen_id)
+        return bool(await self.queen_repo.delete(queen_id))
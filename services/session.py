@@ -1,10 +1,12 @@
 """SessionService"""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
 
 from models.session import Session
-from repositories.session import SessionRepository
-from repositories.user import UserRepository
+from repositories.session import AsyncSessionRepository, SessionRepository
+from repositories.user import AsyncUserRepository, UserRepository
 
 
 class SessionService:
@@ -15,11 +17,20 @@ class SessionService:
         self.user_id_invalid = "User does not exist"
         self.user_repo = user_repo
 
+    @contextmanager
+    def _user_must_exist(self) -> Iterator[None]:
+        """Reports a write rejected by the user_id foreign key as a missing user"""
+        try:
+            yield
+        except LookupError as e:
+            raise ValueError(self.user_id_invalid) from e
+
     def create_session(self, user_id: int) -> Session | None:
-        if not self.user_repo.find_by_user_id(user_id):
-            raise ValueError(self.user_id_invalid)
         session_start = datetime.now(tz=UTC)
-        return self.session_repo.create(session_start=session_start, user_id=user_id)
+        with self._user_must_exist():
+            return self.session_repo.create(
+                session_start=session_start, user_id=user_id
+            )
 
     def find_session_by_session_id(self, session_id: int) -> Session | None:
         return self.session_repo.find_by_session_id(session_id)
@@ -32,3 +43,31 @@ class SessionService:
 
     def delete_session_by_user_id(self, user_id: int) -> bool:
         return self.session_repo.delete_by_user_id(user_id)
+
+
+class AsyncSessionService(SessionService):
+    """Asyncio counterpart of SessionService"""
+
+    def __init__(
+        self, session_repo: AsyncSessionRepository, user_repo: AsyncUserRepository
+    ) -> None:
+        super().__init__(session_repo=session_repo, user_repo=user_repo)
+
+    async def create_session(self, user_id: int) -> Session | None:
+        session_start = datetime.now(tz=UTC)
+        with self._user_must_exist():
+            return await self.session_repo.create(
+                session_start=session_start, user_id=user_id
+            )
+
+    async def find_session_by_session_id(self, session_id: int) -> Session | None:
+        return await self.session_repo.find_by_session_id(session_id)
+
+    async def find_session_by_user_id(self, user_id: int) -> list[Session] | None:
+        return await self.session_repo.find_by_user_id(user_id)
+
+    async def delete_session_by_session_id(self, session_id: int) -> bool:
+        return await self.session_repo.delete_by_session_id(session_id)
+
+    async def delete_session_by_user_id(self, user_id: int) -> bool:
+        return await self.session_repo.delete_by_user_id(user_id)
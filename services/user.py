@@ -1,37 +1,50 @@
 """User service"""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from models.user import User
-from repositories.user import UserRepository
+from repositories.user import AsyncUserRepository, UserRepository
 from utils.hashing import PasswordHasher
+from utils.hashing_executor import HashingExecutor
 from utils.password_validator import PasswordValidator
 from utils.username_validator import UsernameValidator
 
 
 class UserService:
-    def __init__(self, repo: UserRepository) -> None:
+    def __init__(
+        self, repo: UserRepository, rounds: int = PasswordHasher.DEFAULT_ROUNDS
+    ) -> None:
         self.repo: UserRepository = repo
+        self.rounds: int = rounds
         self.username_invalid = "Username invalid"
         self.password_invalid = "Password invalid"  # noqa: S105
         self.username_taken = "Username already taken"
-        self.user_does_not_exist = "User does not exist"
 
-    def create_user(self, username: str, password: str) -> User | None:
-        """Creates a new user in the database if the user doesn't already exist"""
-        password_validator = PasswordValidator()
-        username_validator = UsernameValidator()
-        password_hasher = PasswordHasher()
-        normalised_username = username.strip().lower()
-
-        if password_validator.validate(password) is False:
+    def _validate_credentials(self, username: str, password: str) -> None:
+        if PasswordValidator().validate(password) is False:
             raise ValueError(self.password_invalid)
 
-        if username_validator.validate(username) is False:
+        if UsernameValidator().validate(username) is False:
             raise ValueError(self.username_invalid)
 
+    @contextmanager
+    def _username_must_be_free(self) -> Iterator[None]:
+        """Reports a write rejected by the username unique key as a taken username"""
+        try:
+            yield
+        except ValueError as e:
+            raise ValueError(self.username_taken) from e
+
+    def create_user(self, username: str, password: str) -> User | None:
+        """Creates a new user in the database if the user doesn't already exist"""
+        normalised_username = username.strip().lower()
+        self._validate_credentials(username, password)
+
         if self.find_user_by_username(normalised_username):
             raise ValueError(self.username_taken)
 
-        hashed_password = password_hasher.hash(password)
+        hashed_password = PasswordHasher.hash(password, self.rounds)
 
         return self.repo.create(normalised_username, hashed_password)
 
@@ -42,31 +55,109 @@ class UserService:
         return self.repo.find_by_username(username=username)
 
     def update_user(self, user_id: int, username: str, password: str) -> User | None:
-        password_validator = PasswordValidator()
-        username_validator = UsernameValidator()
-        password_hasher = PasswordHasher()
+        """
+        Validates the new credentials, hashes the new password and updates the user
+
+        Returns None if the user does not exist; the username unique key, not a
+        lookup beforehand, decides whether the username is taken.
+        """
         normalised_username = username.strip().lower()
-        hashed_password = password_hasher.hash(password)
+        self._validate_credentials(username, password)
+
+        hashed_password = PasswordHasher.hash(password, self.rounds)
+
+        with self._username_must_be_free():
+            return self.repo.update(
+                user_id=user_id, username=normalised_username, password=hashed_password
+            )
+
+    def authenticate(self, username: str, password: str) -> User | None:
+        """
+        Returns the user if the password matches their stored hash
+
+        A hash made at a cost other than the configured one is replaced with a
+        fresh hash of the now-known password, so a cost change reaches every
+        account as its owner next signs in.
+        """
+        user = self.find_user_by_username(username.strip().lower())
+        if user is None or not PasswordHasher.verify(password, user.password):
+            return None
+        if PasswordHasher.needs_rehash(user.password, self.rounds):
+            user.password = PasswordHasher.hash(password, self.rounds)
+            self.repo.update(
+                user_id=user.user_id, username=user.username, password=user.password
+            )
+        return user
 
-        if username_validator.validate(username) is False:
-            raise ValueError(self.username_invalid)
+    def delete_user(self, user_id: int) -> bool:
+        return bool(self.repo.delete(user_id=user_id))
 
-        if password_validator.validate(password) is False:
-            raise ValueError(self.password_invalid)
 
-        user_exists = self.find_user_by_user_id(user_id)
+class AsyncUserService(UserService):
+    """Asyncio counterpart of UserService, hashing in the worker processes of hasher"""
+
+    def __init__(self, repo: AsyncUserRepository, hasher: HashingExecutor) -> None:
+        super().__init__(repo=repo, rounds=hasher.rounds)
+        self.hasher: HashingExecutor = hasher
 
-        if user_exists is None:
-            raise ValueError(self.user_does_not_exist)
+    async def create_user(self, username: str, password: str) -> User | None:
+        """
+        Creates a new user in the database if the user doesn't already exist
 
-        username_exists = self.find_user_by_username(normalised_username)
+        Raises:
+            ValueError: if the username or password is invalid, or the username is taken.
+            HashingBusyError: if the hashing workers are saturated.
+
+        """
+        normalised_username = username.strip().lower()
+        self._validate_credentials(username, password)
 
-        if username_exists and (username_exists.user_id != user_exists.user_id):
+        if await self.find_user_by_username(normalised_username):
             raise ValueError(self.username_taken)
 
-        return self.repo.update(
-            user_id=user_id, username=normalised_username, password=hashed_password
-        )
+        hashed_password = await self.hasher.hash(password)
 
-    def delete_user(self, user_id: int) -> bool:
-        return bool(self.repo.delete(user_id=user_id))
+        return await self.repo.create(normalised_username, hashed_password)
+
+    async def find_user_by_user_id(self, user_id: int) -> User | None:
+        return await self.repo.find_by_user_id(user_id=user_id)
+
+    async def find_user_by_username(self, username: str) -> User | None:
+        return await self.repo.find_by_username(username=username)
+
+    async def update_user(
+        self, user_id: int, username: str, password: str
+    ) -> User | None:
+        """
+        Validates the new credentials, hashes the new password and updates the user
+
+        Returns None if the user does not exist.
+
+        Raises:
+            ValueError: if the credentials are invalid or the username is taken.
+            HashingBusyError: if the hashing workers are saturated.
+
+        """
+        normalised_username = username.strip().lower()
+        self._validate_credentials(username, password)
+
+        hashed_password = await self.hasher.hash(password)
+
+        with self._username_must_be_free():
+            return await self.repo.update(
+                user_id=user_id, username=normalised_username, password=hashed_password
+            )
+
+    async def authenticate(self, username: str, password: str) -> User | None:
+        user = await self.find_user_by_username(username.strip().lower())
+        if user is None or not await self.hasher.verify(password, user.password):
+            return None
+        if self.hasher.needs_rehash(user.password):
+            user.password = await self.hasher.hash(password)
+            await self.repo.update(
+                user_id=user.user_id, username=user.username, password=user.password
+            )
+        return user
+
+    async def delete_user(self, user_id: int) -> bool:
+        return bool(await self.repo.delete(user_id=user_id))
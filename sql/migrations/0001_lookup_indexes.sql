@@ -0,0 +1,34 @@
+-- migration: no-transaction
+-- Adds the foreign-key and lookup indexes from schema.sql to a database created
+-- before they existed. CONCURRENTLY builds each index without blocking writes,
+-- so every statement runs on its own, outside a transaction.
+--
+-- users_username_key fails if two users share a username; remove the duplicates
+-- first. A failed concurrent build leaves an INVALID index behind: drop it and
+-- re-run this migration.
+--
+-- CONCURRENTLY cannot build an index on a partitioned table, so this runs only
+-- on a database from before 0004_partition_inspections. A database created
+-- partitioned records it as applied: see python -m db.migrations stamp.
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS users_username_key ON users (username);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS sessions_user_id_idx ON sessions (user_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS apiaries_user_id_idx ON apiaries (user_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS hives_apiary_id_idx ON hives (apiary_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS colonies_hive_id_idx ON colonies (hive_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS queens_colony_id_idx ON queens (colony_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS inspections_colony_id_inspection_timestamp_idx ON inspections (
+    colony_id, inspection_timestamp
+);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS observations_inspection_id_idx ON observations (
+    inspection_id
+);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS actions_inspection_id_idx ON actions (inspection_id);
@@ -0,0 +1,43 @@
+-- migration: no-transaction
+-- Widens the parent lookup indexes to end in each list's sort key, so keyset
+-- pages (WHERE parent = %s AND key > %s ORDER BY key LIMIT %s) are read straight
+-- off the index instead of sorting every child of the parent. The new indexes
+-- still serve lookups on the parent column alone, so the old ones are dropped.
+--
+-- CONCURRENTLY builds and drops each index without blocking writes, so every
+-- statement runs on its own, outside a transaction. A failed concurrent build
+-- leaves an INVALID index behind: drop it and re-run this migration.
+--
+-- CONCURRENTLY cannot build an index on a partitioned table, so this runs only
+-- on a database from before 0004_partition_inspections. A database created
+-- partitioned records it as applied: see python -m db.migrations stamp.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS sessions_user_id_session_id_idx ON sessions (
+    user_id, session_id
+);
+
+DROP INDEX CONCURRENTLY IF EXISTS sessions_user_id_idx;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS apiaries_user_id_apiary_id_idx ON apiaries (
+    user_id, apiary_id
+);
+
+DROP INDEX CONCURRENTLY IF EXISTS apiaries_user_id_idx;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS hives_apiary_id_hive_id_idx ON hives (
+    apiary_id, hive_id
+);
+
+DROP INDEX CONCURRENTLY IF EXISTS hives_apiary_id_idx;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS inspections_colony_id_inspection_timestamp_inspection_id_idx ON inspections (
+    colony_id, inspection_timestamp, inspection_id
+);
+
+DROP INDEX CONCURRENTLY IF EXISTS inspections_colony_id_inspection_timestamp_idx;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS actions_inspection_id_action_id_idx ON actions (
+    inspection_id, action_id
+);
+
+DROP INDEX CONCURRENTLY IF EXISTS actions_inspection_id_idx;
@@ -0,0 +1,119 @@
+-- Adds the colony_states summary table, and the triggers that keep it current,
+-- to a database created before they existed, then fills it in for every
+-- existing colony. Re-running it replaces the functions and triggers and
+-- refreshes every row again.
+
+-- Colony states table: the latest state of each colony, kept current by the
+-- triggers below on every write to colonies, queens, inspections and
+-- observations, so it is read with one index lookup per colony
+CREATE TABLE IF NOT EXISTS colony_states (
+    colony_id integer PRIMARY KEY REFERENCES colonies(colony_id) ON DELETE CASCADE,
+    inspection_id integer,
+    inspection_timestamp timestamptz,
+    observation_id integer,
+    queenright boolean,
+    varroa_count integer,
+    chalk_brood boolean,
+    foul_brood boolean,
+    queen_id integer,
+    queen_colour queen_colour,
+    queen_clipped boolean
+);
+
+-- Recomputes one colony's row from its latest inspection, its latest observation
+-- and its newest queen. Each is a backwards read of an index, however long the
+-- colony's history. Locking the colony makes concurrent refreshes of it take
+-- turns, so the later one reads the writes the earlier one committed.
+CREATE OR REPLACE FUNCTION refresh_colony_state(target integer) RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM 1 FROM colonies WHERE colony_id = target FOR NO KEY UPDATE;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+    INSERT INTO colony_states (
+        colony_id, inspection_id, inspection_timestamp, observation_id, queenright,
+        varroa_count, chalk_brood, foul_brood, queen_id, queen_colour, queen_clipped
+    )
+    SELECT
+        target, i.inspection_id, i.inspection_timestamp, o.observation_id, o.queenright,
+        o.varroa_count, o.chalk_brood, o.foul_brood, q.queen_id, q.colour, q.clipped
+    FROM (SELECT 1) AS t
+    LEFT JOIN LATERAL (
+        SELECT inspection_id, inspection_timestamp FROM inspections
+        WHERE colony_id = target
+        ORDER BY inspection_timestamp DESC, inspection_id DESC LIMIT 1
+    ) AS i ON true
+    LEFT JOIN LATERAL (
+        SELECT ob.observation_id, ob.queenright, ob.varroa_count, ob.chalk_brood, ob.foul_brood
+        FROM inspections AS oi JOIN observations AS ob ON ob.inspection_id = oi.inspection_id
+        WHERE oi.colony_id = target
+        ORDER BY oi.inspection_timestamp DESC, oi.inspection_id DESC, ob.observation_id DESC LIMIT 1
+    ) AS o ON true
+    LEFT JOIN LATERAL (
+        SELECT queen_id, colour, clipped FROM queens
+        WHERE colony_id = target
+        ORDER BY queen_id DESC LIMIT 1
+    ) AS q ON true
+    ON CONFLICT (colony_id) DO UPDATE SET
+        inspection_id = EXCLUDED.inspection_id,
+        inspection_timestamp = EXCLUDED.inspection_timestamp,
+        observation_id = EXCLUDED.observation_id,
+        queenright = EXCLUDED.queenright,
+        varroa_count = EXCLUDED.varroa_count,
+        chalk_brood = EXCLUDED.chalk_brood,
+        foul_brood = EXCLUDED.foul_brood,
+        queen_id = EXCLUDED.queen_id,
+        queen_colour = EXCLUDED.queen_colour,
+        queen_clipped = EXCLUDED.queen_clipped;
+END;
+$$;
+
+-- Refreshes the colony a colonies, queens or inspections row belongs to, and the
+-- one it belonged to before an update moved it
+CREATE OR REPLACE FUNCTION refresh_colony_state_of_row() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM refresh_colony_state(OLD.colony_id);
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.colony_id <> OLD.colony_id) THEN
+        PERFORM refresh_colony_state(NEW.colony_id);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- As above, for observations, which reach their colony through their inspection
+CREATE OR REPLACE FUNCTION refresh_colony_state_of_observation() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM refresh_colony_state(colony_id) FROM inspections
+        WHERE inspection_id = OLD.inspection_id;
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.inspection_id <> OLD.inspection_id) THEN
+        PERFORM refresh_colony_state(colony_id) FROM inspections
+        WHERE inspection_id = NEW.inspection_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE TRIGGER colonies_refresh_colony_state
+AFTER INSERT ON colonies
+FOR EACH ROW EXECUTE FUNCTION refresh_colony_state_of_row();
+
+CREATE OR REPLACE TRIGGER queens_refresh_colony_state
+AFTER INSERT OR UPDATE OR DELETE ON queens
+FOR EACH ROW EXECUTE FUNCTION refresh_colony_state_of_row();
+
+CREATE OR REPLACE TRIGGER inspections_refresh_colony_state
+AFTER INSERT OR UPDATE OR DELETE ON inspections
+FOR EACH ROW EXECUTE FUNCTION refresh_colony_state_of_row();
+
+CREATE OR REPLACE TRIGGER observations_refresh_colony_state
+AFTER INSERT OR UPDATE OR DELETE ON observations
+FOR EACH ROW EXECUTE FUNCTION refresh_colony_state_of_observation();
+
+SELECT refresh_colony_state(colony_id) FROM colonies;
@@ -0,0 +1,272 @@
+-- Rebuilds inspections, observations and actions as tables partitioned by year
+-- of inspection_timestamp, for a database created before they were. Observations
+-- and actions gain their inspection's timestamp, which their foreign key now
+-- includes. Every row is copied with its id, so nothing that refers to one
+-- changes, and colony_states stays as it is.
+--
+-- The migration runner applies it as one transaction, holding every table
+-- involved locked, so take the application offline first. If it fails, nothing
+-- changes: fix the cause and re-run it.
+
+ALTER TABLE actions RENAME TO actions_unpartitioned;
+ALTER INDEX IF EXISTS actions_pkey RENAME TO actions_unpartitioned_pkey;
+ALTER INDEX IF EXISTS actions_inspection_id_action_id_idx RENAME TO actions_unpartitioned_inspection_id_action_id_idx;
+ALTER SEQUENCE IF EXISTS actions_action_id_seq RENAME TO actions_unpartitioned_action_id_seq;
+ALTER TABLE observations RENAME TO observations_unpartitioned;
+ALTER INDEX IF EXISTS observations_pkey RENAME TO observations_unpartitioned_pkey;
+ALTER INDEX IF EXISTS observations_inspection_id_idx RENAME TO observations_unpartitioned_inspection_id_idx;
+ALTER SEQUENCE IF EXISTS observations_observation_id_seq RENAME TO observations_unpartitioned_observation_id_seq;
+ALTER TABLE inspections RENAME TO inspections_unpartitioned;
+ALTER INDEX IF EXISTS inspections_pkey RENAME TO inspections_unpartitioned_pkey;
+ALTER INDEX IF EXISTS inspections_colony_id_inspection_timestamp_inspection_id_idx RENAME TO inspections_unpartitioned_colony_id_inspection_timestamp_inspection_id_idx;
+ALTER SEQUENCE IF EXISTS inspections_inspection_id_seq RENAME TO inspections_unpartitioned_inspection_id_seq;
+
+-- Inspections table, partitioned by year of inspection_timestamp. A partitioned
+-- table's keys must include its partition key, so inspections are referenced by
+-- (inspection_id, inspection_timestamp), and inspection_id is unique by way of
+-- its identity rather than an index.
+CREATE TABLE IF NOT EXISTS inspections (
+    inspection_id integer GENERATED ALWAYS AS IDENTITY,
+    inspection_timestamp timestamptz NOT NULL,
+    colony_id integer NOT NULL REFERENCES colonies(colony_id) ON DELETE CASCADE,
+    PRIMARY KEY (inspection_id, inspection_timestamp)
+) PARTITION BY RANGE (inspection_timestamp);
+
+-- Also serves lookups on colony_id alone, and keyset pages in timestamp order
+CREATE INDEX IF NOT EXISTS inspections_colony_id_inspection_timestamp_inspection_id_idx ON inspections (
+    colony_id, inspection_timestamp, inspection_id
+);
+
+-- Observations table, partitioned like inspections: each row carries its
+-- inspection's timestamp, so it lands in the partition for the same year. The
+-- foreign key cascades a change of timestamp, moving the rows along with it.
+CREATE TABLE IF NOT EXISTS observations (
+    observation_id integer GENERATED ALWAYS AS IDENTITY,
+    queenright boolean NOT NULL,
+    queen_cells integer NOT NULL,
+    bias boolean NOT NULL,
+    brood_frames integer NOT NULL,
+    store_frames integer NOT NULL,
+    chalk_brood boolean NOT NULL,
+    foul_brood boolean NOT NULL,
+    varroa_count integer NOT NULL,
+    temper integer NOT NULL,
+    notes text,
+    inspection_id integer NOT NULL,
+    inspection_timestamp timestamptz NOT NULL,
+    PRIMARY KEY (observation_id, inspection_timestamp),
+    CONSTRAINT observations_inspection_fkey FOREIGN KEY (
+        inspection_id, inspection_timestamp
+    ) REFERENCES inspections(
+        inspection_id, inspection_timestamp
+    ) ON DELETE CASCADE ON UPDATE CASCADE
+) PARTITION BY RANGE (inspection_timestamp);
+
+CREATE INDEX IF NOT EXISTS observations_inspection_id_idx ON observations (
+    inspection_id
+);
+
+-- Actions table, partitioned like observations
+CREATE TABLE IF NOT EXISTS actions (
+    action_id integer GENERATED ALWAYS AS IDENTITY,
+    notes text,
+    inspection_id integer NOT NULL,
+    inspection_timestamp timestamptz NOT NULL,
+    PRIMARY KEY (action_id, inspection_timestamp),
+    CONSTRAINT actions_inspection_fkey FOREIGN KEY (
+        inspection_id, inspection_timestamp
+    ) REFERENCES inspections(
+        inspection_id, inspection_timestamp
+    ) ON DELETE CASCADE ON UPDATE CASCADE
+) PARTITION BY RANGE (inspection_timestamp);
+
+CREATE INDEX IF NOT EXISTS actions_inspection_id_action_id_idx ON actions (
+    inspection_id, action_id
+);
+
+-- Rows outside every yearly partition land here. Create a year's partitions
+-- before it starts (python -m db.partitions ensure): a partition cannot be
+-- created while the default partition holds rows in its range.
+CREATE TABLE IF NOT EXISTS inspections_default PARTITION OF inspections DEFAULT;
+CREATE TABLE IF NOT EXISTS observations_default PARTITION OF observations DEFAULT;
+CREATE TABLE IF NOT EXISTS actions_default PARTITION OF actions DEFAULT;
+
+-- Creates the inspections, observations and actions partitions for one calendar
+-- year (UTC), named <table>_y<year>. Does nothing for a year that has them.
+CREATE OR REPLACE FUNCTION create_inspection_partitions(partition_year integer) RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    parent text;
+BEGIN
+    FOREACH parent IN ARRAY ARRAY['inspections', 'observations', 'actions'] LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_y' || partition_year,
+            parent,
+            make_timestamptz(partition_year, 1, 1, 0, 0, 0, 'UTC'),
+            make_timestamptz(partition_year + 1, 1, 1, 0, 0, 0, 'UTC')
+        );
+    END LOOP;
+END;
+$$;
+
+-- Detaches one year's partitions and moves them to the archive schema, where
+-- they are plain tables that can be dumped, moved to cheaper storage or dropped.
+-- Children go first, each losing its foreign key to the live inspections, which
+-- would otherwise stop that year's inspections being detached. DETACH locks the
+-- parents while it runs: CONCURRENTLY is not allowed with a default partition.
+CREATE OR REPLACE FUNCTION archive_inspection_partitions(partition_year integer) RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    parent text;
+    child text;
+    fkey text;
+BEGIN
+    CREATE SCHEMA IF NOT EXISTS archive;
+    FOREACH parent IN ARRAY ARRAY['actions', 'observations', 'inspections'] LOOP
+        child := parent || '_y' || partition_year;
+        EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', parent, child);
+        FOR fkey IN
+            SELECT conname FROM pg_constraint
+            WHERE conrelid = child::regclass AND confrelid = 'inspections'::regclass
+        LOOP
+            EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', child, fkey);
+        END LOOP;
+        EXECUTE format('ALTER TABLE %I SET SCHEMA archive', child);
+    END LOOP;
+END;
+$$;
+
+-- A partition for each year with inspections, so the default partitions start
+-- out empty, and for this year and the next
+SELECT create_inspection_partitions(partition_year)
+FROM (
+    SELECT DISTINCT extract(year FROM inspection_timestamp AT TIME ZONE 'UTC')::integer AS partition_year
+    FROM inspections_unpartitioned
+    UNION
+    SELECT extract(year FROM now() AT TIME ZONE 'UTC')::integer + offset_years
+    FROM generate_series(0, 1) AS offset_years
+) AS years;
+
+INSERT INTO inspections (inspection_id, inspection_timestamp, colony_id)
+OVERRIDING SYSTEM VALUE
+SELECT inspection_id, inspection_timestamp, colony_id FROM inspections_unpartitioned;
+
+INSERT INTO observations (
+    observation_id, queenright, queen_cells, bias, brood_frames, store_frames,
+    chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id, inspection_timestamp
+)
+OVERRIDING SYSTEM VALUE
+SELECT
+    o.observation_id, o.queenright, o.queen_cells, o.bias, o.brood_frames, o.store_frames,
+    o.chalk_brood, o.foul_brood, o.varroa_count, o.temper, o.notes, o.inspection_id, i.inspection_timestamp
+FROM observations_unpartitioned AS o
+JOIN inspections_unpartitioned AS i ON i.inspection_id = o.inspection_id;
+
+INSERT INTO actions (action_id, notes, inspection_id, inspection_timestamp)
+OVERRIDING SYSTEM VALUE
+SELECT a.action_id, a.notes, a.inspection_id, i.inspection_timestamp
+FROM actions_unpartitioned AS a
+JOIN inspections_unpartitioned AS i ON i.inspection_id = a.inspection_id;
+
+-- New ids carry on from the copied ones
+SELECT setval(pg_get_serial_sequence('inspections', 'inspection_id'), coalesce(max(inspection_id), 0) + 1, false) FROM inspections;
+SELECT setval(pg_get_serial_sequence('observations', 'observation_id'), coalesce(max(observation_id), 0) + 1, false) FROM observations;
+SELECT setval(pg_get_serial_sequence('actions', 'action_id'), coalesce(max(action_id), 0) + 1, false) FROM actions;
+
+DROP TABLE actions_unpartitioned;
+DROP TABLE observations_unpartitioned;
+DROP TABLE inspections_unpartitioned;
+
+-- The triggers went with the old tables. They are added back after the copy,
+-- which would otherwise have refreshed every colony once per row.
+-- Recomputes one colony's row from its latest inspection, its latest observation
+-- and its newest queen. Each is a backwards read of an index, however long the
+-- colony's history. Locking the colony makes concurrent refreshes of it take
+-- turns, so the later one reads the writes the earlier one committed.
+CREATE OR REPLACE FUNCTION refresh_colony_state(target integer) RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM 1 FROM colonies WHERE colony_id = target FOR NO KEY UPDATE;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+    INSERT INTO colony_states (
+        colony_id, inspection_id, inspection_timestamp, observation_id, queenright,
+        varroa_count, chalk_brood, foul_brood, queen_id, queen_colour, queen_clipped
+    )
+    SELECT
+        target, i.inspection_id, i.inspection_timestamp, o.observation_id, o.queenright,
+        o.varroa_count, o.chalk_brood, o.foul_brood, q.queen_id, q.colour, q.clipped
+    FROM (SELECT 1) AS t
+    LEFT JOIN LATERAL (
+        SELECT inspection_id, inspection_timestamp FROM inspections
+        WHERE colony_id = target
+        ORDER BY inspection_timestamp DESC, inspection_id DESC LIMIT 1
+    ) AS i ON true
+    LEFT JOIN LATERAL (
+        SELECT ob.observation_id, ob.queenright, ob.varroa_count, ob.chalk_brood, ob.foul_brood
+        FROM inspections AS oi JOIN observations AS ob
+            ON ob.inspection_id = oi.inspection_id AND ob.inspection_timestamp = oi.inspection_timestamp
+        WHERE oi.colony_id = target
+        ORDER BY oi.inspection_timestamp DESC, oi.inspection_id DESC, ob.observation_id DESC LIMIT 1
+    ) AS o ON true
+    LEFT JOIN LATERAL (
+        SELECT queen_id, colour, clipped FROM queens
+        WHERE colony_id = target
+        ORDER BY queen_id DESC LIMIT 1
+    ) AS q ON true
+    ON CONFLICT (colony_id) DO UPDATE SET
+        inspection_id = EXCLUDED.inspection_id,
+        inspection_timestamp = EXCLUDED.inspection_timestamp,
+        observation_id = EXCLUDED.observation_id,
+        queenright = EXCLUDED.queenright,
+        varroa_count = EXCLUDED.varroa_count,
+        chalk_brood = EXCLUDED.chalk_brood,
+        foul_brood = EXCLUDED.foul_brood,
+        queen_id = EXCLUDED.queen_id,
+        queen_colour = EXCLUDED.queen_colour,
+        queen_clipped = EXCLUDED.queen_clipped;
+END;
+$$;
+
+-- Refreshes the colony a colonies, queens or inspections row belongs to, and the
+-- one it belonged to before an update moved it
+CREATE OR REPLACE FUNCTION refresh_colony_state_of_row() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM refresh_colony_state(OLD.colony_id);
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.colony_id <> OLD.colony_id) THEN
+        PERFORM refresh_colony_state(NEW.colony_id);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- As above, for observations, which reach their colony through their inspection
+CREATE OR REPLACE FUNCTION refresh_colony_state_of_observation() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM refresh_colony_state(colony_id) FROM inspections
+        WHERE inspection_id = OLD.inspection_id
+        AND inspection_timestamp = OLD.inspection_timestamp;
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.inspection_id <> OLD.inspection_id) THEN
+        PERFORM refresh_colony_state(colony_id) FROM inspections
+        WHERE inspection_id = NEW.inspection_id
+        AND inspection_timestamp = NEW.inspection_timestamp;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE TRIGGER inspections_refresh_colony_state
+AFTER INSERT OR UPDATE OR DELETE ON inspections
+FOR EACH ROW EXECUTE FUNCTION refresh_colony_state_of_row();
+
+CREATE OR REPLACE TRIGGER observations_refresh_colony_state
+AFTER INSERT OR UPDATE OR DELETE ON observations
+FOR EACH ROW EXECUTE FUNCTION refresh_colony_state_of_observation();
@@ -0,0 +1,16 @@
+-- Adds full-text search over observation and action notes to a database created
+-- before it existed: a stored tsvector of each row's notes, and a GIN index on
+-- it. Adding a stored generated column rewrites every partition under an
+-- exclusive lock, so run this while writes can wait. Indexes on a partitioned
+-- table cannot be built CONCURRENTLY either; each partition's index is built in
+-- turn, blocking writes to it while it builds.
+
+ALTER TABLE observations ADD COLUMN IF NOT EXISTS notes_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', coalesce(notes, ''))) STORED;
+
+ALTER TABLE actions ADD COLUMN IF NOT EXISTS notes_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', coalesce(notes, ''))) STORED;
+
+CREATE INDEX IF NOT EXISTS observations_notes_tsv_idx ON observations USING gin (notes_tsv);
+
+CREATE INDEX IF NOT EXISTS actions_notes_tsv_idx ON actions USING gin (notes_tsv);
@@ -0,0 +1,108 @@
+-- Replaces the row-level triggers keeping colony_states current with
+-- statement-level ones, which refresh each colony a statement touched once,
+-- however many of its rows the statement wrote. A multi-row insert or a COPY
+-- into inspections or observations no longer locks and recomputes a colony
+-- for every row.
+
+DROP TRIGGER IF EXISTS colonies_refresh_colony_state ON colonies;
+DROP TRIGGER IF EXISTS queens_refresh_colony_state ON queens;
+DROP TRIGGER IF EXISTS inspections_refresh_colony_state ON inspections;
+DROP TRIGGER IF EXISTS observations_refresh_colony_state ON observations;
+DROP FUNCTION IF EXISTS refresh_colony_state_of_row();
+DROP FUNCTION IF EXISTS refresh_colony_state_of_observation();
+
+-- Refreshes each colony in targets once, in colony_id order, so statements
+-- refreshing the same colonies at once lock them in the same order
+CREATE OR REPLACE FUNCTION refresh_colony_states(targets integer[]) RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_colony_state(target)
+    FROM (SELECT DISTINCT unnest(targets) AS target) AS changed
+    ORDER BY target;
+END;
+$$;
+
+-- Refreshes, once each, the colonies a statement's colonies, queens or
+-- inspections rows belong to, and those an update moved them from. Runs once
+-- per statement, so a multi-row insert or a COPY refreshes each colony once
+-- rather than once per row.
+CREATE OR REPLACE FUNCTION refresh_colony_states_of_rows() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    changed integer[] := '{}';
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        changed := changed || ARRAY(SELECT colony_id FROM old_rows);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        changed := changed || ARRAY(SELECT colony_id FROM new_rows);
+    END IF;
+    PERFORM refresh_colony_states(changed);
+    RETURN NULL;
+END;
+$$;
+
+-- As above, for observations, which reach their colony through their inspection
+CREATE OR REPLACE FUNCTION refresh_colony_states_of_observations() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    changed integer[] := '{}';
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        changed := changed || ARRAY(
+            SELECT i.colony_id FROM old_rows AS r JOIN inspections AS i
+                ON i.inspection_id = r.inspection_id AND i.inspection_timestamp = r.inspection_timestamp
+        );
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        changed := changed || ARRAY(
+            SELECT i.colony_id FROM new_rows AS r JOIN inspections AS i
+                ON i.inspection_id = r.inspection_id AND i.inspection_timestamp = r.inspection_timestamp
+        );
+    END IF;
+    PERFORM refresh_colony_states(changed);
+    RETURN NULL;
+END;
+$$;
+
+-- A trigger with transition tables handles a single event, so each table has
+-- one per event it refreshes on
+CREATE OR REPLACE TRIGGER colonies_refresh_colony_state
+AFTER INSERT ON colonies REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER queens_insert_refresh_colony_state
+AFTER INSERT ON queens REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER queens_update_refresh_colony_state
+AFTER UPDATE ON queens REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER queens_delete_refresh_colony_state
+AFTER DELETE ON queens REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER inspections_insert_refresh_colony_state
+AFTER INSERT ON inspections REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER inspections_update_refresh_colony_state
+AFTER UPDATE ON inspections REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER inspections_delete_refresh_colony_state
+AFTER DELETE ON inspections REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER observations_insert_refresh_colony_state
+AFTER INSERT ON observations REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_observations();
+
+CREATE OR REPLACE TRIGGER observations_update_refresh_colony_state
+AFTER UPDATE ON observations REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_observations();
+
+CREATE OR REPLACE TRIGGER observations_delete_refresh_colony_state
+AFTER DELETE ON observations REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_observations();
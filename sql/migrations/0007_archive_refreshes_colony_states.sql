@@ -0,0 +1,40 @@
+-- Makes archive_inspection_partitions refresh colony_states for the colonies
+-- inspected in the archived year, which it used to leave pointing at archived
+-- inspections and observations. It needs refresh_colony_states, from
+-- 0006_colony_state_statement_triggers.
+--
+-- A database that has archived a year already can be put right with
+-- SELECT count(refresh_colony_state(colony_id)) FROM colonies;
+
+-- Detaches one year's partitions and moves them to the archive schema, where
+-- they are plain tables that can be dumped, moved to cheaper storage or dropped.
+-- Children go first, each losing its foreign key to the live inspections, which
+-- would otherwise stop that year's inspections being detached. DETACH locks the
+-- parents while it runs: CONCURRENTLY is not allowed with a default partition.
+-- The colonies inspected that year are refreshed last, so no colony_states row
+-- is left pointing at an archived inspection or observation.
+CREATE OR REPLACE FUNCTION archive_inspection_partitions(partition_year integer) RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    parent text;
+    child text;
+    fkey text;
+    archived_colonies integer[];
+BEGIN
+    EXECUTE format('SELECT ARRAY(SELECT DISTINCT colony_id FROM %I)', 'inspections_y' || partition_year)
+    INTO archived_colonies;
+    CREATE SCHEMA IF NOT EXISTS archive;
+    FOREACH parent IN ARRAY ARRAY['actions', 'observations', 'inspections'] LOOP
+        child := parent || '_y' || partition_year;
+        EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', parent, child);
+        FOR fkey IN
+            SELECT conname FROM pg_constraint
+            WHERE conrelid = child::regclass AND confrelid = 'inspections'::regclass
+        LOOP
+            EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', child, fkey);
+        END LOOP;
+        EXECUTE format('ALTER TABLE %I SET SCHEMA archive', child);
+    END LOOP;
+    PERFORM refresh_colony_states(archived_colonies);
+END;
+$$;
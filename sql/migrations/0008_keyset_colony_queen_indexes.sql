@@ -0,0 +1,21 @@
+-- migration: no-transaction
+-- Widens the lookup indexes of a hive's colonies and a colony's queens to end
+-- in the id each list is ordered by, so their keyset pages are read straight off
+-- the index, as 0002 did for the other lists. The new indexes still serve
+-- lookups on the parent column alone, so the old ones are dropped.
+--
+-- CONCURRENTLY builds and drops each index without blocking writes, so every
+-- statement runs on its own, outside a transaction. A failed concurrent build
+-- leaves an INVALID index behind: drop it and re-run this migration.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS colonies_hive_id_colony_id_idx ON colonies (
+    hive_id, colony_id
+);
+
+DROP INDEX CONCURRENTLY IF EXISTS colonies_hive_id_idx;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS queens_colony_id_queen_id_idx ON queens (
+    colony_id, queen_id
+);
+
+DROP INDEX CONCURRENTLY IF EXISTS queens_colony_id_idx;
@@ -8,6 +8,8 @@ DROP TABLE IF EXISTS queens CASCADE;
 DROP TABLE IF EXISTS inspections CASCADE;
 DROP TABLE IF EXISTS observations CASCADE;
 DROP TABLE IF EXISTS actions CASCADE;
+DROP TABLE IF EXISTS colony_states CASCADE;
+DROP TABLE IF EXISTS schema_migrations CASCADE;
 
 -- User table
 CREATE TABLE IF NOT EXISTS users (
@@ -16,6 +18,8 @@ CREATE TABLE IF NOT EXISTS users (
     password text NOT NULL
 );
 
+CREATE UNIQUE INDEX IF NOT EXISTS users_username_key ON users (username);
+
 -- User sessions table
 CREATE TABLE IF NOT EXISTS sessions (
     session_id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
@@ -23,6 +27,8 @@ CREATE TABLE IF NOT EXISTS sessions (
     user_id int NOT NULL REFERENCES users(user_id) ON DELETE CASCADE
 );
 
+CREATE INDEX IF NOT EXISTS sessions_user_id_session_id_idx ON sessions (user_id, session_id);
+
 -- Apiaries table
 CREATE TABLE IF NOT EXISTS apiaries (
     apiary_id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
@@ -31,6 +37,8 @@ CREATE TABLE IF NOT EXISTS apiaries (
     user_id integer NOT NULL REFERENCES users(user_id) ON DELETE CASCADE
 );
 
+CREATE INDEX IF NOT EXISTS apiaries_user_id_apiary_id_idx ON apiaries (user_id, apiary_id);
+
 -- Hives table
 CREATE TABLE IF NOT EXISTS hives (
     hive_id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
@@ -38,12 +46,16 @@ CREATE TABLE IF NOT EXISTS hives (
     apiary_id integer NOT NULL REFERENCES apiaries(apiary_id) ON DELETE CASCADE
 );
 
+CREATE INDEX IF NOT EXISTS hives_apiary_id_hive_id_idx ON hives (apiary_id, hive_id);
+
 -- Colonies table
 CREATE TABLE IF NOT EXISTS colonies (
     colony_id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     hive_id integer NOT NULL REFERENCES hives(hive_id) ON DELETE CASCADE
 );
 
+CREATE INDEX IF NOT EXISTS colonies_hive_id_colony_id_idx ON colonies (hive_id, colony_id);
+
 -- Queen colour enum
 CREATE TYPE queen_colour AS ENUM (
     'White',
@@ -62,16 +74,32 @@ CREATE TABLE IF NOT EXISTS queens (
     colony_id integer NOT NULL REFERENCES colonies(colony_id) ON DELETE CASCADE
 );
 
--- Inspections table
+CREATE INDEX IF NOT EXISTS queens_colony_id_queen_id_idx ON queens (colony_id, queen_id);
+
+-- Inspections table, partitioned by year of inspection_timestamp. A partitioned
+-- table's keys must include its partition key, so inspections are referenced by
+-- (inspection_id, inspection_timestamp), and inspection_id is unique by way of
+-- its identity rather than an index. A lookup by inspection_id alone, as by
+-- GET /inspections/{id} or for an inspection's observations and actions, cannot
+-- be pruned to one partition: it probes an index of every partition, one more
+-- for each year kept live, which is a reason to archive old years.
 CREATE TABLE IF NOT EXISTS inspections (
-    inspection_id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    inspection_id integer GENERATED ALWAYS AS IDENTITY,
     inspection_timestamp timestamptz NOT NULL,
-    colony_id integer NOT NULL REFERENCES colonies(colony_id) ON DELETE CASCADE
+    colony_id integer NOT NULL REFERENCES colonies(colony_id) ON DELETE CASCADE,
+    PRIMARY KEY (inspection_id, inspection_timestamp)
+) PARTITION BY RANGE (inspection_timestamp);
+
+-- Also serves lookups on colony_id alone, and keyset pages in timestamp order
+CREATE INDEX IF NOT EXISTS inspections_colony_id_inspection_timestamp_inspection_id_idx ON inspections (
+    colony_id, inspection_timestamp, inspection_id
 );
 
--- Observations table
+-- Observations table, partitioned like inspections: each row carries its
+-- inspection's timestamp, so it lands in the partition for the same year. The
+-- foreign key cascades a change of timestamp, moving the rows along with it.
 CREATE TABLE IF NOT EXISTS observations (
-    observation_id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    observation_id integer GENERATED ALWAYS AS IDENTITY,
     queenright boolean NOT NULL,
     queen_cells integer NOT NULL,
     bias boolean NOT NULL,
@@ -82,16 +110,288 @@ CREATE TABLE IF NOT EXISTS observations (
     varroa_count integer NOT NULL,
     temper integer NOT NULL,
     notes text,
-    inspection_id integer NOT NULL REFERENCES inspections(
-        inspection_id
-    ) ON DELETE CASCADE
+    notes_tsv tsvector GENERATED ALWAYS AS (to_tsvector('english', coalesce(notes, ''))) STORED,
+    inspection_id integer NOT NULL,
+    inspection_timestamp timestamptz NOT NULL,
+    PRIMARY KEY (observation_id, inspection_timestamp),
+    CONSTRAINT observations_inspection_fkey FOREIGN KEY (
+        inspection_id, inspection_timestamp
+    ) REFERENCES inspections(
+        inspection_id, inspection_timestamp
+    ) ON DELETE CASCADE ON UPDATE CASCADE
+) PARTITION BY RANGE (inspection_timestamp);
+
+CREATE INDEX IF NOT EXISTS observations_inspection_id_idx ON observations (
+    inspection_id
 );
 
--- Actions table
+-- Actions table, partitioned like observations
 CREATE TABLE IF NOT EXISTS actions (
-    action_id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    action_id integer GENERATED ALWAYS AS IDENTITY,
     notes text,
-    inspection_id integer NOT NULL REFERENCES inspections(
-        inspection_id
-    ) ON DELETE CASCADE
+    notes_tsv tsvector GENERATED ALWAYS AS (to_tsvector('english', coalesce(notes, ''))) STORED,
+    inspection_id integer NOT NULL,
+    inspection_timestamp timestamptz NOT NULL,
+    PRIMARY KEY (action_id, inspection_timestamp),
+    CONSTRAINT actions_inspection_fkey FOREIGN KEY (
+        inspection_id, inspection_timestamp
+    ) REFERENCES inspections(
+        inspection_id, inspection_timestamp
+    ) ON DELETE CASCADE ON UPDATE CASCADE
+) PARTITION BY RANGE (inspection_timestamp);
+
+CREATE INDEX IF NOT EXISTS actions_inspection_id_action_id_idx ON actions (
+    inspection_id, action_id
+);
+
+-- Full-text search over notes. notes_tsv is stored, so matches are ranked from
+-- it without parsing the notes again, and each partition gets its own index
+CREATE INDEX IF NOT EXISTS observations_notes_tsv_idx ON observations USING gin (notes_tsv);
+CREATE INDEX IF NOT EXISTS actions_notes_tsv_idx ON actions USING gin (notes_tsv);
+
+-- Rows outside every yearly partition land here. Create a year's partitions
+-- before it starts (python -m db.partitions ensure): a partition cannot be
+-- created while the default partition holds rows in its range.
+CREATE TABLE IF NOT EXISTS inspections_default PARTITION OF inspections DEFAULT;
+CREATE TABLE IF NOT EXISTS observations_default PARTITION OF observations DEFAULT;
+CREATE TABLE IF NOT EXISTS actions_default PARTITION OF actions DEFAULT;
+
+-- Creates the inspections, observations and actions partitions for one calendar
+-- year (UTC), named <table>_y<year>. Does nothing for a year that has them.
+CREATE OR REPLACE FUNCTION create_inspection_partitions(partition_year integer) RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    parent text;
+BEGIN
+    FOREACH parent IN ARRAY ARRAY['inspections', 'observations', 'actions'] LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_y' || partition_year,
+            parent,
+            make_timestamptz(partition_year, 1, 1, 0, 0, 0, 'UTC'),
+            make_timestamptz(partition_year + 1, 1, 1, 0, 0, 0, 'UTC')
+        );
+    END LOOP;
+END;
+$$;
+
+-- Detaches one year's partitions and moves them to the archive schema, where
+-- they are plain tables that can be dumped, moved to cheaper storage or dropped.
+-- Children go first, each losing its foreign key to the live inspections, which
+-- would otherwise stop that year's inspections being detached. DETACH locks the
+-- parents while it runs: CONCURRENTLY is not allowed with a default partition.
+-- The colonies inspected that year are refreshed last, so no colony_states row
+-- is left pointing at an archived inspection or observation.
+CREATE OR REPLACE FUNCTION archive_inspection_partitions(partition_year integer) RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    parent text;
+    child text;
+    fkey text;
+    archived_colonies integer[];
+BEGIN
+    EXECUTE format('SELECT ARRAY(SELECT DISTINCT colony_id FROM %I)', 'inspections_y' || partition_year)
+    INTO archived_colonies;
+    CREATE SCHEMA IF NOT EXISTS archive;
+    FOREACH parent IN ARRAY ARRAY['actions', 'observations', 'inspections'] LOOP
+        child := parent || '_y' || partition_year;
+        EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', parent, child);
+        FOR fkey IN
+            SELECT conname FROM pg_constraint
+            WHERE conrelid = child::regclass AND confrelid = 'inspections'::regclass
+        LOOP
+            EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', child, fkey);
+        END LOOP;
+        EXECUTE format('ALTER TABLE %I SET SCHEMA archive', child);
+    END LOOP;
+    PERFORM refresh_colony_states(archived_colonies);
+END;
+$$;
+
+SELECT create_inspection_partitions(partition_year)
+FROM generate_series(
+    extract(year FROM now() AT TIME ZONE 'UTC')::integer,
+    extract(year FROM now() AT TIME ZONE 'UTC')::integer + 1
+) AS partition_year;
+
+-- Colony states table: the latest state of each colony, kept current by the
+-- triggers below on every write to colonies, queens, inspections and
+-- observations, so it is read with one index lookup per colony
+CREATE TABLE IF NOT EXISTS colony_states (
+    colony_id integer PRIMARY KEY REFERENCES colonies(colony_id) ON DELETE CASCADE,
+    inspection_id integer,
+    inspection_timestamp timestamptz,
+    observation_id integer,
+    queenright boolean,
+    varroa_count integer,
+    chalk_brood boolean,
+    foul_brood boolean,
+    queen_id integer,
+    queen_colour queen_colour,
+    queen_clipped boolean
+);
+
+-- Recomputes one colony's row from its latest inspection, its latest observation
+-- and its newest queen. Each is a backwards read of an index, however long the
+-- colony's history. Locking the colony makes concurrent refreshes of it take
+-- turns, so the later one reads the writes the earlier one committed.
+CREATE OR REPLACE FUNCTION refresh_colony_state(target integer) RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM 1 FROM colonies WHERE colony_id = target FOR NO KEY UPDATE;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+    INSERT INTO colony_states (
+        colony_id, inspection_id, inspection_timestamp, observation_id, queenright,
+        varroa_count, chalk_brood, foul_brood, queen_id, queen_colour, queen_clipped
+    )
+    SELECT
+        target, i.inspection_id, i.inspection_timestamp, o.observation_id, o.queenright,
+        o.varroa_count, o.chalk_brood, o.foul_brood, q.queen_id, q.colour, q.clipped
+    FROM (SELECT 1) AS t
+    LEFT JOIN LATERAL (
+        SELECT inspection_id, inspection_timestamp FROM inspections
+        WHERE colony_id = target
+        ORDER BY inspection_timestamp DESC, inspection_id DESC LIMIT 1
+    ) AS i ON true
+    LEFT JOIN LATERAL (
+        SELECT ob.observation_id, ob.queenright, ob.varroa_count, ob.chalk_brood, ob.foul_brood
+        FROM inspections AS oi JOIN observations AS ob
+            ON ob.inspection_id = oi.inspection_id AND ob.inspection_timestamp = oi.inspection_timestamp
+        WHERE oi.colony_id = target
+        ORDER BY oi.inspection_timestamp DESC, oi.inspection_id DESC, ob.observation_id DESC LIMIT 1
+    ) AS o ON true
+    LEFT JOIN LATERAL (
+        SELECT queen_id, colour, clipped FROM queens
+        WHERE colony_id = target
+        ORDER BY queen_id DESC LIMIT 1
+    ) AS q ON true
+    ON CONFLICT (colony_id) DO UPDATE SET
+        inspection_id = EXCLUDED.inspection_id,
+        inspection_timestamp = EXCLUDED.inspection_timestamp,
+        observation_id = EXCLUDED.observation_id,
+        queenright = EXCLUDED.queenright,
+        varroa_count = EXCLUDED.varroa_count,
+        chalk_brood = EXCLUDED.chalk_brood,
+        foul_brood = EXCLUDED.foul_brood,
+        queen_id = EXCLUDED.queen_id,
+        queen_colour = EXCLUDED.queen_colour,
+        queen_clipped = EXCLUDED.queen_clipped;
+END;
+$$;
+
+-- Refreshes each colony in targets once, in colony_id order, so statements
+-- refreshing the same colonies at once lock them in the same order
+CREATE OR REPLACE FUNCTION refresh_colony_states(targets integer[]) RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_colony_state(target)
+    FROM (SELECT DISTINCT unnest(targets) AS target) AS changed
+    ORDER BY target;
+END;
+$$;
+
+-- Refreshes, once each, the colonies a statement's colonies, queens or
+-- inspections rows belong to, and those an update moved them from. Runs once
+-- per statement, so a multi-row insert or a COPY refreshes each colony once
+-- rather than once per row.
+CREATE OR REPLACE FUNCTION refresh_colony_states_of_rows() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    changed integer[] := '{}';
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        changed := changed || ARRAY(SELECT colony_id FROM old_rows);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        changed := changed || ARRAY(SELECT colony_id FROM new_rows);
+    END IF;
+    PERFORM refresh_colony_states(changed);
+    RETURN NULL;
+END;
+$$;
+
+-- As above, for observations, which reach their colony through their inspection
+CREATE OR REPLACE FUNCTION refresh_colony_states_of_observations() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    changed integer[] := '{}';
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        changed := changed || ARRAY(
+            SELECT i.colony_id FROM old_rows AS r JOIN inspections AS i
+                ON i.inspection_id = r.inspection_id AND i.inspection_timestamp = r.inspection_timestamp
+        );
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        changed := changed || ARRAY(
+            SELECT i.colony_id FROM new_rows AS r JOIN inspections AS i
+                ON i.inspection_id = r.inspection_id AND i.inspection_timestamp = r.inspection_timestamp
+        );
+    END IF;
+    PERFORM refresh_colony_states(changed);
+    RETURN NULL;
+END;
+$$;
+
+-- A trigger with transition tables handles a single event, so each table has
+-- one per event it refreshes on
+CREATE OR REPLACE TRIGGER colonies_refresh_colony_state
+AFTER INSERT ON colonies REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER queens_insert_refresh_colony_state
+AFTER INSERT ON queens REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER queens_update_refresh_colony_state
+AFTER UPDATE ON queens REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER queens_delete_refresh_colony_state
+AFTER DELETE ON queens REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER inspections_insert_refresh_colony_state
+AFTER INSERT ON inspections REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER inspections_update_refresh_colony_state
+AFTER UPDATE ON inspections REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER inspections_delete_refresh_colony_state
+AFTER DELETE ON inspections REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_rows();
+
+CREATE OR REPLACE TRIGGER observations_insert_refresh_colony_state
+AFTER INSERT ON observations REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_observations();
+
+CREATE OR REPLACE TRIGGER observations_update_refresh_colony_state
+AFTER UPDATE ON observations REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_observations();
+
+CREATE OR REPLACE TRIGGER observations_delete_refresh_colony_state
+AFTER DELETE ON observations REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_colony_states_of_observations();
+
+-- Migrations table. This file already includes every migration in
+-- sql/migrations, so each is recorded as applied and python -m db.migrations
+-- has nothing to do on a database created from it. A new migration's version is
+-- added here along with its changes.
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version text PRIMARY KEY,
+    applied_at timestamptz NOT NULL DEFAULT now()
 );
+
+INSERT INTO schema_migrations (version) VALUES
+    ('0001_lookup_indexes'),
+    ('0002_keyset_indexes'),
+    ('0003_colony_states'),
+    ('0004_partition_inspections'),
+    ('0005_notes_search'),
+    ('0006_colony_state_statement_triggers'),
+    ('0007_archive_refreshes_colony_states'),
+    ('0008_keyset_colony_queen_indexes');
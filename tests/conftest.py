@@ -0,0 +1,32 @@
+"""Shared pytest configuration"""
+
+from collections.abc import AsyncIterator, Callable, Iterator
+
+import pytest
+
+from db.instance import query_stats
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Psycopg's async interface only supports asyncio"""
+    return "asyncio"
+
+
+@pytest.fixture
+def async_rows() -> Callable[..., AsyncIterator]:
+    """Builds an async iterator over the given items, standing in for a streamed query"""
+
+    async def rows(*items: object) -> AsyncIterator:
+        for item in items:
+            yield item
+
+    return rows
+
+
+@pytest.fixture(autouse=True)
+def strict_query_budgets() -> Iterator[None]:
+    """Fail any request that makes more queries than its route's query_budget"""
+    query_stats.strict_budgets = True
+    yield
+    query_stats.strict_budgets = False
@@ -1,11 +1,15 @@
 """Tests for ActionRepository"""
 
-from unittest.mock import MagicMock
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
 
 import pytest
 
 from models.action import Action
-from repositories.action import ActionRepository
+from repositories.action import ROW_FACTORY, ActionRepository, AsyncActionRepository
+
+TIMESTAMP = datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC"))
 
 
 @pytest.fixture
@@ -40,7 +44,7 @@ class TestActionRepository:
         )
 
         mock_db.execute.assert_called_once_with(
-            "INSERT INTO actions (notes, inspection_id) VALUES (%s, %s) RETURNING action_id;",
+            "INSERT INTO actions (notes, inspection_id, inspection_timestamp) SELECT %s, inspection_id, inspection_timestamp FROM inspections WHERE inspection_id = %s RETURNING action_id;",
             [
                 self.test_action.notes,
                 self.test_action.inspection_id,
@@ -55,32 +59,33 @@ class TestActionRepository:
         mock_db.execute.return_value = []
         repo: ActionRepository = ActionRepository(db=mock_db)
 
-        result: Action | None = repo.create(
-            notes=self.test_action.notes,
-            inspection_id=999,
-        )
+        with pytest.raises(LookupError, match="No inspection with inspection_id 999"):
+            repo.create(
+                notes=self.test_action.notes,
+                inspection_id=999,
+            )
 
         mock_db.execute.assert_called_once_with(
-            "INSERT INTO actions (notes, inspection_id) VALUES (%s, %s) RETURNING action_id;",
+            "INSERT INTO actions (notes, inspection_id, inspection_timestamp) SELECT %s, inspection_id, inspection_timestamp FROM inspections WHERE inspection_id = %s RETURNING action_id;",
             [self.test_action.notes, 999],
         )
-        assert result is None
 
     def test_can_find_action_by_valid_action_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "action_id": self.test_action.action_id,
-                "notes": self.test_action.notes,
-                "inspection_id": self.test_action.inspection_id,
-            }
+            Action(
+                action_id=self.test_action.action_id,
+                notes=self.test_action.notes,
+                inspection_id=self.test_action.inspection_id,
+            )
         ]
         repo: ActionRepository = ActionRepository(db=mock_db)
 
         result: Action | None = repo.find_by_action_id(self.test_action.action_id)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM actions WHERE action_id = %s LIMIT 1;",
+            "SELECT action_id, notes, inspection_id FROM actions WHERE action_id = %s LIMIT 1;",
             [self.test_action.action_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(result, Action)
         assert result.action_id == self.test_action.action_id
@@ -94,17 +99,19 @@ class TestActionRepository:
         result: Action | None = repo.find_by_action_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM actions WHERE action_id = %s LIMIT 1;", [999]
+            "SELECT action_id, notes, inspection_id FROM actions WHERE action_id = %s LIMIT 1;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_can_find_actions_by_valid_inspection_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "action_id": self.test_action.action_id,
-                "notes": self.test_action.notes,
-                "inspection_id": self.test_action.inspection_id,
-            }
+            Action(
+                action_id=self.test_action.action_id,
+                notes=self.test_action.notes,
+                inspection_id=self.test_action.inspection_id,
+            )
         ]
         repo: ActionRepository = ActionRepository(db=mock_db)
 
@@ -113,8 +120,9 @@ class TestActionRepository:
         )
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM actions WHERE inspection_id = %s;",
+            "SELECT action_id, notes, inspection_id FROM actions WHERE inspection_id = %s ORDER BY action_id;",
             [self.test_action.inspection_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(results, list)
         assert results[0].action_id == self.test_action.action_id
@@ -128,33 +136,39 @@ class TestActionRepository:
         result: Action | None = repo.find_by_inspection_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM actions WHERE inspection_id = %s;", [999]
+            "SELECT action_id, notes, inspection_id FROM actions WHERE inspection_id = %s ORDER BY action_id;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_read_full_db_returns_all(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "action_id": self.test_action.action_id,
-                "notes": self.test_action.notes,
-                "inspection_id": self.test_action.inspection_id,
-            },
-            {
-                "action_id": self.test_action_2.action_id,
-                "notes": self.test_action_2.notes,
-                "inspection_id": self.test_action_2.inspection_id,
-            },
-            {
-                "action_id": self.test_action_3.action_id,
-                "notes": self.test_action_3.notes,
-                "inspection_id": self.test_action_3.inspection_id,
-            },
+            Action(
+                action_id=self.test_action.action_id,
+                notes=self.test_action.notes,
+                inspection_id=self.test_action.inspection_id,
+            ),
+            Action(
+                action_id=self.test_action_2.action_id,
+                notes=self.test_action_2.notes,
+                inspection_id=self.test_action_2.inspection_id,
+            ),
+            Action(
+                action_id=self.test_action_3.action_id,
+                notes=self.test_action_3.notes,
+                inspection_id=self.test_action_3.inspection_id,
+            ),
         ]
         repo: ActionRepository = ActionRepository(db=mock_db)
 
         results: list[Action] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM actions;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT action_id, notes, inspection_id FROM actions;",
+            [],
+            row_factory=ROW_FACTORY,
+        )
         assert isinstance(results, (list, Action))
         assert results[0].action_id == 1
         assert results[1].action_id == 2
@@ -167,7 +181,11 @@ class TestActionRepository:
 
         result: list[Action] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM actions;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT action_id, notes, inspection_id FROM actions;",
+            [],
+            row_factory=ROW_FACTORY,
+        )
         assert result is None
 
     def test_can_update_valid_action(self, mock_db: MagicMock) -> None:
@@ -185,7 +203,7 @@ class TestActionRepository:
         )
 
         mock_db.execute.assert_called_once_with(
-            "UPDATE actions SET notes = %s, inspection_id = %s RETURNING action_id;",
+            "UPDATE actions AS a SET notes = %s, inspection_id = target.inspection_id, inspection_timestamp = coalesce(i.inspection_timestamp, a.inspection_timestamp) FROM (SELECT %s::integer AS inspection_id) AS target LEFT JOIN inspections AS i ON i.inspection_id = target.inspection_id WHERE a.action_id = %s RETURNING a.action_id;",
             [self.test_action.notes, 999, 1],
         )
         assert isinstance(result, Action)
@@ -200,7 +218,7 @@ class TestActionRepository:
 
         result: list[Action] = repo.update(999, self.test_action.notes, 1)
         mock_db.execute.assert_called_once_with(
-            "UPDATE actions SET notes = %s, inspection_id = %s RETURNING action_id;",
+            "UPDATE actions AS a SET notes = %s, inspection_id = target.inspection_id, inspection_timestamp = coalesce(i.inspection_timestamp, a.inspection_timestamp) FROM (SELECT %s::integer AS inspection_id) AS target LEFT JOIN inspections AS i ON i.inspection_id = target.inspection_id WHERE a.action_id = %s RETURNING a.action_id;",
             [self.test_action.notes, 1, 999],
         )
         assert result is None
@@ -226,3 +244,108 @@ class TestActionRepository:
             [999],
         )
         assert result is False
+
+    def test_create_many_actions(self, mock_db: MagicMock) -> None:
+        mock_db.copy.return_value = 2
+        repo: ActionRepository = ActionRepository(db=mock_db)
+
+        result: int = repo.create_many(
+            [("added super", 1, TIMESTAMP), ("fed", 2, TIMESTAMP)]
+        )
+
+        mock_db.copy.assert_called_once_with(
+            "COPY actions (notes, inspection_id, inspection_timestamp) FROM STDIN;",
+            [["added super", 1, TIMESTAMP], ["fed", 2, TIMESTAMP]],
+        )
+        assert result == 2
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.mark.anyio
+class TestAsyncActionRepository:
+    test_action: Action = Action(action_id=1, notes="Added some feed", inspection_id=1)
+
+    async def test_create_action(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [{"action_id": 1}]
+        repo: AsyncActionRepository = AsyncActionRepository(db=mock_async_db)
+
+        result: Action | None = await repo.create("Added some feed", 1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "INSERT INTO actions (notes, inspection_id, inspection_timestamp) SELECT %s, inspection_id, inspection_timestamp FROM inspections WHERE inspection_id = %s RETURNING action_id;",
+            ["Added some feed", 1],
+        )
+        assert result == self.test_action
+
+    async def test_can_find_actions_by_valid_inspection_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = [
+            Action(action_id=1, notes="Added some feed", inspection_id=1)
+        ]
+        repo: AsyncActionRepository = AsyncActionRepository(db=mock_async_db)
+
+        result: list[Action] | None = await repo.find_by_inspection_id(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT action_id, notes, inspection_id FROM actions WHERE inspection_id = %s ORDER BY action_id;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [self.test_action]
+
+    async def test_can_not_find_action_by_invalid_action_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = []
+        repo: AsyncActionRepository = AsyncActionRepository(db=mock_async_db)
+
+        result: Action | None = await repo.find_by_action_id(999)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT action_id, notes, inspection_id FROM actions WHERE action_id = %s LIMIT 1;",
+            [999],
+            row_factory=ROW_FACTORY,
+        )
+        assert result is None
+
+    async def test_create_many_actions(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.copy.return_value = 1
+        repo: AsyncActionRepository = AsyncActionRepository(db=mock_async_db)
+
+        result: int = await repo.create_many([("fed", 2, TIMESTAMP)])
+
+        mock_async_db.copy.assert_awaited_once_with(
+            "COPY actions (notes, inspection_id, inspection_timestamp) FROM STDIN;",
+            [["fed", 2, TIMESTAMP]],
+        )
+        assert result == 1
+
+
+def test_find_by_ids(mock_db: MagicMock) -> None:
+    mock_db.execute.return_value = None
+    repo = ActionRepository(db=mock_db)
+
+    assert repo.find_by_ids([2, 1]) == []
+    mock_db.execute.assert_called_once_with(
+        "SELECT action_id, notes, inspection_id FROM actions WHERE action_id = ANY(%s) ORDER BY action_id;",
+        [[2, 1]],
+        row_factory=ROW_FACTORY,
+    )
+
+
+@pytest.mark.anyio
+async def test_async_find_by_ids(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = ["row"]
+    repo = AsyncActionRepository(db=mock_async_db)
+
+    assert await repo.find_by_ids((1, 2)) == ["row"]
+    mock_async_db.execute.assert_awaited_once_with(
+        "SELECT action_id, notes, inspection_id FROM actions WHERE action_id = ANY(%s) ORDER BY action_id;",
+        [[1, 2]],
+        row_factory=ROW_FACTORY,
+    )
@@ -1,7 +1,7 @@
 """Tests for Action routes"""
 
-from collections.abc import Generator
-from unittest.mock import MagicMock
+from collections.abc import AsyncIterator, Callable, Generator
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -16,8 +16,8 @@ client = TestClient(app)
 
 
 @pytest.fixture
-def mock_action_service() -> Generator[MagicMock, None, None]:
-    mock = MagicMock()
+def mock_action_service() -> Generator[AsyncMock, None, None]:
+    mock = AsyncMock()
     app.dependency_overrides[get_action_service] = lambda: mock
     yield mock
     app.dependency_overrides.clear()
@@ -52,7 +52,7 @@ class TestActionRoutes:
         assert isinstance(service, ActionService)
 
     def test_create_action_success(
-        self, mock_action_service: MagicMock, valid_action_read: ActionRead
+        self, mock_action_service: AsyncMock, valid_action_read: ActionRead
     ) -> None:
         mock_action_service.create_action.return_value = valid_action_read
 
@@ -73,7 +73,7 @@ class TestActionRoutes:
         mock_action_service.create_action.assert_called_once()
 
     def test_create_action_failure(
-        self, mock_action_service: MagicMock, invalid_action_read: ActionRead
+        self, mock_action_service: AsyncMock, invalid_action_read: ActionRead
     ) -> None:
         mock_action_service.create_action.side_effect = ValueError()
 
@@ -88,7 +88,7 @@ class TestActionRoutes:
         assert response.status_code == 422
 
     def test_get_actions_by_inspection_id_success(
-        self, mock_action_service: MagicMock, valid_action_read: ActionRead
+        self, mock_action_service: AsyncMock, valid_action_read: ActionRead
     ) -> None:
         mock_action_service.find_actions_by_inspection_id.return_value = [
             valid_action_read
@@ -105,11 +105,11 @@ class TestActionRoutes:
             }
         ]
         mock_action_service.find_actions_by_inspection_id.assert_called_once_with(
-            inspection_id=1
+            inspection_id=1, limit=101, after=None
         )
 
     def test_get_actions_by_inspection_id_not_found(
-        self, mock_action_service: MagicMock
+        self, mock_action_service: AsyncMock
     ) -> None:
         mock_action_service.find_actions_by_inspection_id.return_value = []
 
@@ -118,8 +118,25 @@ class TestActionRoutes:
         assert response.status_code == 404
         assert response.json()["detail"] == "No actions found for this inspection"
 
+    def test_stream_actions_by_inspection_id(
+        self,
+        mock_action_service: AsyncMock,
+        valid_action_read: ActionRead,
+        async_rows: Callable[..., AsyncIterator],
+    ) -> None:
+        mock_action_service.stream_actions_by_inspection_id = MagicMock(
+            return_value=async_rows(valid_action_read)
+        )
+
+        response = client.get(
+            "/inspections/1/actions", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.text == valid_action_read.model_dump_json() + "\n"
+
     def test_get_action_by_action_id_success(
-        self, mock_action_service: MagicMock, valid_action_read: ActionRead
+        self, mock_action_service: AsyncMock, valid_action_read: ActionRead
     ) -> None:
         mock_action_service.find_action_by_action_id.return_value = valid_action_read
 
@@ -136,7 +153,7 @@ class TestActionRoutes:
         )
 
     def test_get_action_by_action_id_not_found(
-        self, mock_action_service: MagicMock
+        self, mock_action_service: AsyncMock
     ) -> None:
         mock_action_service.find_action_by_action_id.return_value = None
 
@@ -145,7 +162,7 @@ class TestActionRoutes:
         assert response.status_code == 404
         assert response.json()["detail"] == "No actions found for this inspection"
 
-    def test_update_action_success(self, mock_action_service: MagicMock) -> None:
+    def test_update_action_success(self, mock_action_service: AsyncMock) -> None:
         updated_action = Action(
             action_id=1,
             notes="New notes",
@@ -172,7 +189,7 @@ class TestActionRoutes:
         )
 
     def test_update_action_failure(
-        self, mock_action_service: MagicMock, invalid_action_read: ActionRead
+        self, mock_action_service: AsyncMock, invalid_action_read: ActionRead
     ) -> None:
         mock_action_service.update_action.side_effect = ValueError()
 
@@ -186,7 +203,7 @@ class TestActionRoutes:
 
         assert response.status_code == 400
 
-    def test_delete_action_success(self, mock_action_service: MagicMock) -> None:
+    def test_delete_action_success(self, mock_action_service: AsyncMock) -> None:
         mock_action_service.delete_action.return_value = True
 
         response = client.delete("/actions/1")
@@ -195,10 +212,45 @@ class TestActionRoutes:
         assert response.json() is True
         mock_action_service.delete_action.assert_called_once_with(action_id=1)
 
-    def test_delete_action_not_found(self, mock_action_service: MagicMock) -> None:
+    def test_delete_action_not_found(self, mock_action_service: AsyncMock) -> None:
         mock_action_service.delete_action.side_effect = ValueError("Invalid action_id")
 
         response = client.delete("/actions/999")
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Invalid action_id"
+
+    def test_get_actions_by_ids(self, mock_action_service: AsyncMock) -> None:
+        mock_action_service.find_actions_by_action_ids.return_value = [
+            {"action_id": 1, "notes": "added super", "inspection_id": 1},
+            {"action_id": 3, "notes": "added super", "inspection_id": 1},
+        ]
+
+        response = client.get("/actions?ids=3,1,3")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == [
+            {"action_id": 1, "notes": "added super", "inspection_id": 1},
+            {"action_id": 3, "notes": "added super", "inspection_id": 1},
+        ]
+        mock_action_service.find_actions_by_action_ids.assert_called_once_with(
+            action_ids=[3, 1]
+        )
+
+    def test_get_actions_by_ids_not_found(self, mock_action_service: AsyncMock) -> None:
+        mock_action_service.find_actions_by_action_ids.return_value = []
+
+        response = client.get("/actions?ids=998,999")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No actions found"
+
+    def test_get_actions_by_invalid_ids(self, mock_action_service: AsyncMock) -> None:
+        mock_action_service.find_actions_by_action_ids.side_effect = ValueError(
+            "Invalid action_id"
+        )
+
+        response = client.get("/actions?ids=1,-1")
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid action_id"
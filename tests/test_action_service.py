@@ -1,11 +1,11 @@
 """Tests for ActionService"""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from models.action import Action
-from services.action import ActionService
+from services.action import ActionService, AsyncActionService
 
 
 @pytest.fixture
@@ -73,10 +73,9 @@ def test_can_not_create_action_invalid_inspection_id(
 
 
 def test_can_not_create_action_missing_inspection_id(
-    action_repo: MagicMock, inspection_repo: MagicMock, test_data: Action
+    action_repo: MagicMock, inspection_repo: MagicMock
 ) -> None:
-    action_repo.create.return_value = test_data
-    inspection_repo.find_by_inspection_id.return_value = None
+    action_repo.create.side_effect = LookupError
     notes = "Example note"
     inspection_id = 999
     action_service: ActionService = ActionService(action_repo, inspection_repo)
@@ -207,7 +206,7 @@ def test_can_not_update_action_missing_action_id(
     action_id = 999
     notes = "Example note"
     inspection_id = 1
-    action_repo.find_by_action_id.return_value = None
+    action_repo.update.return_value = None
     action_service: ActionService = ActionService(action_repo, inspection_repo)
 
     with pytest.raises(ValueError, match="Invalid action_id"):
@@ -253,10 +252,9 @@ def test_can_not_update_action_invalid_inspection_id(
 
 
 def test_can_not_update_action_missing_inspection_id(
-    action_repo: MagicMock, inspection_repo: MagicMock, test_data: Action
+    action_repo: MagicMock, inspection_repo: MagicMock
 ) -> None:
-    action_repo.update.return_value = test_data
-    inspection_repo.find_by_inspection_id.return_value = None
+    action_repo.update.side_effect = LookupError
     action_id = 1
     notes = "Example note"
     inspection_id = 999
@@ -300,3 +298,29 @@ def test_can_not_delete_action_invalid_action_id(
 
     with pytest.raises(ValueError, match="Invalid action_id"):
         action_service.delete_action(-1)
+
+
+@pytest.mark.anyio
+async def test_async_create_action(test_data: Action) -> None:
+    action_repo, inspection_repo = AsyncMock(), AsyncMock()
+    action_repo.create.return_value = test_data
+    action_service = AsyncActionService(action_repo, inspection_repo)
+
+    result: Action | None = await action_service.create_action(
+        notes=test_data.notes, inspection_id=test_data.inspection_id
+    )
+
+    inspection_repo.find_by_inspection_id.assert_not_awaited()
+    assert result == test_data
+
+
+@pytest.mark.anyio
+async def test_async_can_not_create_action_missing_inspection(
+    test_data: Action,
+) -> None:
+    action_repo, inspection_repo = AsyncMock(), AsyncMock()
+    action_repo.create.side_effect = LookupError
+    action_service = AsyncActionService(action_repo, inspection_repo)
+
+    with pytest.raises(ValueError, match="Invalid inspection_id"):
+        await action_service.create_action(notes=test_data.notes, inspection_id=999)
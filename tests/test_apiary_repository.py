@@ -1,11 +1,11 @@
 """Tests for the ApiaryRepository class"""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from models.apiary import Apiary
-from repositories.apiary import ApiaryRepository
+from repositories.apiary import ROW_FACTORY, ApiaryRepository, AsyncApiaryRepository
 
 
 @pytest.fixture
@@ -66,20 +66,21 @@ class TestApiaryRepository:
 
     def test_can_find_apiary_by_valid_apiary_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "apiary_id": self.test_apiary.apiary_id,
-                "name": self.test_apiary.name,
-                "location": self.test_apiary.location,
-                "user_id": self.test_apiary.user_id,
-            }
+            Apiary(
+                apiary_id=self.test_apiary.apiary_id,
+                name=self.test_apiary.name,
+                location=self.test_apiary.location,
+                user_id=self.test_apiary.user_id,
+            )
         ]
         repo: ApiaryRepository = ApiaryRepository(db=mock_db)
 
         result: Apiary | None = repo.find_by_apiary_id(self.test_apiary.apiary_id)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM apiaries WHERE apiary_id = %s LIMIT 1;",
+            "SELECT apiary_id, name, location, user_id FROM apiaries WHERE apiary_id = %s LIMIT 1;",
             [self.test_apiary.apiary_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(result, Apiary)
         assert result.apiary_id == self.test_apiary.apiary_id
@@ -94,32 +95,35 @@ class TestApiaryRepository:
         result: Apiary | None = repo.find_by_apiary_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM apiaries WHERE apiary_id = %s LIMIT 1;", [999]
+            "SELECT apiary_id, name, location, user_id FROM apiaries WHERE apiary_id = %s LIMIT 1;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_can_find_apiaries_by_valid_user_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "apiary_id": self.test_apiary.apiary_id,
-                "name": self.test_apiary.name,
-                "location": self.test_apiary.location,
-                "user_id": self.test_apiary.user_id,
-            },
-            {
-                "apiary_id": self.test_apiary_2.apiary_id,
-                "name": self.test_apiary_2.name,
-                "location": self.test_apiary_2.location,
-                "user_id": self.test_apiary_2.user_id,
-            },
+            Apiary(
+                apiary_id=self.test_apiary.apiary_id,
+                name=self.test_apiary.name,
+                location=self.test_apiary.location,
+                user_id=self.test_apiary.user_id,
+            ),
+            Apiary(
+                apiary_id=self.test_apiary_2.apiary_id,
+                name=self.test_apiary_2.name,
+                location=self.test_apiary_2.location,
+                user_id=self.test_apiary_2.user_id,
+            ),
         ]
         repo: ApiaryRepository = ApiaryRepository(db=mock_db)
 
         result: Apiary | None = repo.find_by_user_id(self.test_apiary.apiary_id)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM apiaries WHERE user_id = %s;",
+            "SELECT apiary_id, name, location, user_id FROM apiaries WHERE user_id = %s ORDER BY apiary_id;",
             [self.test_apiary.apiary_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(result, list)
         assert result[0].apiary_id == self.test_apiary.apiary_id
@@ -138,36 +142,42 @@ class TestApiaryRepository:
         result: Apiary | None = repo.find_by_user_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM apiaries WHERE user_id = %s;", [999]
+            "SELECT apiary_id, name, location, user_id FROM apiaries WHERE user_id = %s ORDER BY apiary_id;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_read_full_db_returns_all(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "apiary_id": self.test_apiary.apiary_id,
-                "name": self.test_apiary.name,
-                "location": self.test_apiary.location,
-                "user_id": self.test_apiary.user_id,
-            },
-            {
-                "apiary_id": self.test_apiary_2.apiary_id,
-                "name": self.test_apiary_2.name,
-                "location": self.test_apiary_2.location,
-                "user_id": self.test_apiary_2.user_id,
-            },
-            {
-                "apiary_id": self.test_apiary_3.apiary_id,
-                "name": self.test_apiary_3.name,
-                "location": self.test_apiary_3.location,
-                "user_id": self.test_apiary_3.user_id,
-            },
+            Apiary(
+                apiary_id=self.test_apiary.apiary_id,
+                name=self.test_apiary.name,
+                location=self.test_apiary.location,
+                user_id=self.test_apiary.user_id,
+            ),
+            Apiary(
+                apiary_id=self.test_apiary_2.apiary_id,
+                name=self.test_apiary_2.name,
+                location=self.test_apiary_2.location,
+                user_id=self.test_apiary_2.user_id,
+            ),
+            Apiary(
+                apiary_id=self.test_apiary_3.apiary_id,
+                name=self.test_apiary_3.name,
+                location=self.test_apiary_3.location,
+                user_id=self.test_apiary_3.user_id,
+            ),
         ]
         repo: ApiaryRepository = ApiaryRepository(db=mock_db)
 
         results: list[Apiary] = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM apiaries;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT apiary_id, name, location, user_id FROM apiaries;",
+            [],
+            row_factory=ROW_FACTORY,
+        )
         assert isinstance(results, (list, Apiary))
         assert results[0].apiary_id == 1
         assert results[1].apiary_id == 2
@@ -180,18 +190,15 @@ class TestApiaryRepository:
 
         result: list[Apiary] = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM apiaries;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT apiary_id, name, location, user_id FROM apiaries;",
+            [],
+            row_factory=ROW_FACTORY,
+        )
         assert result is None
 
     def test_can_update_valid_apiary(self, mock_db: MagicMock) -> None:
-        mock_db.execute.return_value = [
-            {
-                "apiary_id": self.test_apiary.apiary_id,
-                "name": "UPDATED",
-                "location": self.test_apiary.location,
-                "user_id": self.test_apiary.user_id,
-            }
-        ]
+        mock_db.execute.return_value = [{"apiary_id": self.test_apiary.apiary_id}]
         repo: ApiaryRepository = ApiaryRepository(mock_db)
 
         result: list[Apiary] = repo.update(1, "UPDATED", "Kent", 1)
@@ -244,3 +251,95 @@ class TestApiaryRepository:
             "DELETE FROM apiaries WHERE apiary_id = %s RETURNING apiary_id;", [999]
         )
         assert result is False
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.mark.anyio
+class TestAsyncApiaryRepository:
+    test_apiary: Apiary = Apiary(
+        apiary_id=1, name="Flowery Field", location="Kent", user_id=1
+    )
+
+    async def test_create_apiary(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [{"apiary_id": 1}]
+        repo: AsyncApiaryRepository = AsyncApiaryRepository(db=mock_async_db)
+
+        result: Apiary | None = await repo.create("Flowery Field", "Kent", 1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "INSERT INTO apiaries (name, location, user_id) VALUES (%s, %s, %s) RETURNING apiary_id;",
+            ["Flowery Field", "Kent", 1],
+        )
+        assert result == self.test_apiary
+
+    async def test_can_find_apiary_by_valid_apiary_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = [
+            Apiary(apiary_id=1, name="Flowery Field", location="Kent", user_id=1)
+        ]
+        repo: AsyncApiaryRepository = AsyncApiaryRepository(db=mock_async_db)
+
+        result: Apiary | None = await repo.find_by_apiary_id(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT apiary_id, name, location, user_id FROM apiaries WHERE apiary_id = %s LIMIT 1;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == self.test_apiary
+
+    async def test_can_not_find_apiaries_by_invalid_user_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = []
+        repo: AsyncApiaryRepository = AsyncApiaryRepository(db=mock_async_db)
+
+        result: list[Apiary] | None = await repo.find_by_user_id(999)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT apiary_id, name, location, user_id FROM apiaries WHERE user_id = %s ORDER BY apiary_id;",
+            [999],
+            row_factory=ROW_FACTORY,
+        )
+        assert result is None
+
+    async def test_can_delete_valid_apiary(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [{"apiary_id": 1}]
+        repo: AsyncApiaryRepository = AsyncApiaryRepository(db=mock_async_db)
+
+        result: bool = await repo.delete(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "DELETE FROM apiaries WHERE apiary_id = %s RETURNING apiary_id;", [1]
+        )
+        assert result is True
+
+
+def test_find_by_ids(mock_db: MagicMock) -> None:
+    mock_db.execute.return_value = None
+    repo = ApiaryRepository(db=mock_db)
+
+    assert repo.find_by_ids([2, 1]) == []
+    mock_db.execute.assert_called_once_with(
+        "SELECT apiary_id, name, location, user_id FROM apiaries WHERE apiary_id = ANY(%s) ORDER BY apiary_id;",
+        [[2, 1]],
+        row_factory=ROW_FACTORY,
+    )
+
+
+@pytest.mark.anyio
+async def test_async_find_by_ids(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = ["row"]
+    repo = AsyncApiaryRepository(db=mock_async_db)
+
+    assert await repo.find_by_ids((1, 2)) == ["row"]
+    mock_async_db.execute.assert_awaited_once_with(
+        "SELECT apiary_id, name, location, user_id FROM apiaries WHERE apiary_id = ANY(%s) ORDER BY apiary_id;",
+        [[1, 2]],
+        row_factory=ROW_FACTORY,
+    )
@@ -1,27 +1,37 @@
 """Tests for Apiary API Routes (with all keyword arguments)"""
 
-from collections.abc import Generator
-from unittest.mock import MagicMock
+from collections.abc import AsyncIterator, Callable, Generator
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
 from main import app
 from schemas.apiary import ApiaryRead
+from schemas.hierarchy import ApiaryTree, ColonyTree, HiveTree
 from services.apiary import ApiaryService
-from services.dependencies import get_apiary_service
+from services.dependencies import get_apiary_service, get_hierarchy_service
+from services.hierarchy import BRANCHES, HierarchyService
 
 client: TestClient = TestClient(app)
 
 
 @pytest.fixture
-def mock_apiary_service() -> Generator[MagicMock, None, None]:
-    mock: MagicMock = MagicMock()
+def mock_apiary_service() -> Generator[AsyncMock, None, None]:
+    mock: AsyncMock = AsyncMock()
     app.dependency_overrides[get_apiary_service] = lambda: mock
     yield mock
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def mock_hierarchy_service() -> Generator[AsyncMock, None, None]:
+    mock: AsyncMock = AsyncMock()
+    app.dependency_overrides[get_hierarchy_service] = lambda: mock
+    yield mock
+    app.dependency_overrides.clear()
+
+
 class TestApiaryRoutes:
     valid_apiary: ApiaryRead = ApiaryRead(
         apiary_id=1, name="Happy Bees", location="Kent", user_id=1
@@ -38,8 +48,8 @@ class TestApiaryRoutes:
         assert service is not None
         assert isinstance(service, ApiaryService)
 
-    def test_create_apiary_success(self, mock_apiary_service: MagicMock) -> None:
-        mock_apiary_service.create_apiary = MagicMock(return_value=self.valid_apiary)
+    def test_create_apiary_success(self, mock_apiary_service: AsyncMock) -> None:
+        mock_apiary_service.create_apiary = AsyncMock(return_value=self.valid_apiary)
 
         response = client.post(
             "/apiaries",
@@ -52,7 +62,7 @@ class TestApiaryRoutes:
             name="Happy Bees", location="Kent", user_id=1
         )
 
-    def test_create_apiary_missing_name(self, mock_apiary_service: MagicMock) -> None:
+    def test_create_apiary_missing_name(self, mock_apiary_service: AsyncMock) -> None:
         mock_apiary_service.create_apiary.side_effect = ValueError(
             "Apiary name is required"
         )
@@ -65,7 +75,7 @@ class TestApiaryRoutes:
         assert response.status_code in {400, 422}
         assert "Apiary name is required" in response.json()["detail"]
 
-    def test_create_apiary_invalid_user(self, mock_apiary_service: MagicMock) -> None:
+    def test_create_apiary_invalid_user(self, mock_apiary_service: AsyncMock) -> None:
         mock_apiary_service.create_apiary.side_effect = ValueError("Invalid user_id")
 
         response = client.post(
@@ -82,7 +92,7 @@ class TestApiaryRoutes:
         second_apiary = ApiaryRead(
             apiary_id=2, name="Golden Hives", location="Sussex", user_id=1
         )
-        mock_apiary_service.find_apiaries_by_user_id = MagicMock(
+        mock_apiary_service.find_apiaries_by_user_id = AsyncMock(
             return_value=[
                 self.valid_apiary,
                 second_apiary,
@@ -96,10 +106,12 @@ class TestApiaryRoutes:
             self.valid_apiary.model_dump(),
             second_apiary.model_dump(),
         ]
-        mock_apiary_service.find_apiaries_by_user_id.assert_called_once_with(user_id=1)
+        mock_apiary_service.find_apiaries_by_user_id.assert_called_once_with(
+            user_id=1, limit=101, after=None
+        )
 
     def test_list_apiaries_by_user_not_found(
-        self, mock_apiary_service: MagicMock
+        self, mock_apiary_service: AsyncMock
     ) -> None:
         mock_apiary_service.find_apiaries_by_user_id.return_value = None
 
@@ -108,7 +120,26 @@ class TestApiaryRoutes:
         assert response.status_code == 404
         assert response.json()["detail"] == "No apiaries found for this user"
 
-    def test_get_apiary_by_id_success(self, mock_apiary_service: MagicMock) -> None:
+    def test_stream_apiaries_by_user(
+        self,
+        mock_apiary_service: AsyncMock,
+        async_rows: Callable[..., AsyncIterator],
+    ) -> None:
+        mock_apiary_service.stream_apiaries_by_user_id = MagicMock(
+            return_value=async_rows(self.valid_apiary)
+        )
+
+        response = client.get(
+            "/users/1/apiaries", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        assert response.text == self.valid_apiary.model_dump_json() + "\n"
+        mock_apiary_service.stream_apiaries_by_user_id.assert_called_once_with(
+            user_id=1
+        )
+
+    def test_get_apiary_by_id_success(self, mock_apiary_service: AsyncMock) -> None:
         mock_apiary_service.find_apiary_by_apiary_id.return_value = self.valid_apiary
 
         response = client.get("/apiaries/1")
@@ -119,7 +150,7 @@ class TestApiaryRoutes:
             apiary_id=1
         )
 
-    def test_get_apiary_by_id_not_found(self, mock_apiary_service: MagicMock) -> None:
+    def test_get_apiary_by_id_not_found(self, mock_apiary_service: AsyncMock) -> None:
         mock_apiary_service.find_apiary_by_apiary_id.return_value = None
 
         response = client.get("/apiaries/999")
@@ -127,7 +158,7 @@ class TestApiaryRoutes:
         assert response.status_code == 404
         assert response.json()["detail"] == "Apiary not found"
 
-    def test_update_apiary_success(self, mock_apiary_service: MagicMock) -> None:
+    def test_update_apiary_success(self, mock_apiary_service: AsyncMock) -> None:
         updated = ApiaryRead(
             apiary_id=1, name="Buzz Nest", location="London", user_id=1
         )
@@ -144,7 +175,7 @@ class TestApiaryRoutes:
             apiary_id=1, name="Buzz Nest", location="London", user_id=1
         )
 
-    def test_update_apiary_invalid_id(self, mock_apiary_service: MagicMock) -> None:
+    def test_update_apiary_invalid_id(self, mock_apiary_service: AsyncMock) -> None:
         mock_apiary_service.update_apiary.side_effect = ValueError("Invalid apiary_id")
 
         response = client.post(
@@ -155,7 +186,7 @@ class TestApiaryRoutes:
         assert response.status_code == 400
         assert response.json()["detail"] == "Invalid apiary_id"
 
-    def test_delete_apiary_success(self, mock_apiary_service: MagicMock) -> None:
+    def test_delete_apiary_success(self, mock_apiary_service: AsyncMock) -> None:
         mock_apiary_service.delete_apiary.return_value = True
 
         response = client.delete("/apiaries/1")
@@ -164,10 +195,109 @@ class TestApiaryRoutes:
         assert response.json() is True
         mock_apiary_service.delete_apiary.assert_called_once_with(apiary_id=1)
 
-    def test_delete_apiary_not_found(self, mock_apiary_service: MagicMock) -> None:
+    def test_delete_apiary_not_found(self, mock_apiary_service: AsyncMock) -> None:
         mock_apiary_service.delete_apiary.side_effect = ValueError("Invalid apiary_id")
 
         response = client.delete("/apiaries/999")
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Invalid apiary_id"
+
+    def test_get_hierarchy_service_direct(self) -> None:
+        assert isinstance(get_hierarchy_service(), HierarchyService)
+
+    def test_get_apiary_tree(self, mock_hierarchy_service: AsyncMock) -> None:
+        tree = ApiaryTree(**self.valid_apiary.model_dump())
+        tree.hives = [HiveTree(hive_id=2, name="Hive 1", apiary_id=1)]
+        tree.hives[0].colonies = [ColonyTree(colony_id=3, hive_id=2)]
+        tree.hives[0].colonies[0].latest_inspection = None
+        mock_hierarchy_service.find_apiary_tree.return_value = tree
+
+        response = client.get("/apiaries/1/tree")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            **self.valid_apiary.model_dump(),
+            "hives": [
+                {
+                    "hive_id": 2,
+                    "name": "Hive 1",
+                    "apiary_id": 1,
+                    "colonies": [
+                        {"colony_id": 3, "hive_id": 2, "latest_inspection": None}
+                    ],
+                }
+            ],
+        }
+        mock_hierarchy_service.find_apiary_tree.assert_called_once_with(
+            apiary_id=1, depth=4, include=BRANCHES
+        )
+
+    def test_get_apiary_tree_with_depth_and_include(
+        self, mock_hierarchy_service: AsyncMock
+    ) -> None:
+        mock_hierarchy_service.find_apiary_tree.return_value = ApiaryTree(
+            **self.valid_apiary.model_dump()
+        )
+
+        response = client.get("/apiaries/1/tree?depth=3&include=queens")
+
+        assert response.status_code == 200
+        assert response.json() == self.valid_apiary.model_dump()
+        mock_hierarchy_service.find_apiary_tree.assert_called_once_with(
+            apiary_id=1, depth=3, include=frozenset({"queens"})
+        )
+
+    def test_get_apiary_tree_not_found(self, mock_hierarchy_service: AsyncMock) -> None:
+        mock_hierarchy_service.find_apiary_tree.return_value = None
+
+        response = client.get("/apiaries/999/tree")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Apiary not found"
+
+    @pytest.mark.parametrize("query", ["depth=5", "depth=-1", "include=actions"])
+    def test_get_apiary_tree_invalid_query(
+        self, mock_hierarchy_service: AsyncMock, query: str
+    ) -> None:
+        response = client.get(f"/apiaries/1/tree?{query}")
+
+        assert response.status_code == 422
+        mock_hierarchy_service.find_apiary_tree.assert_not_called()
+
+    def test_get_apiaries_by_ids(self, mock_apiary_service: AsyncMock) -> None:
+        mock_apiary_service.find_apiaries_by_apiary_ids.return_value = [
+            {"apiary_id": 1, "name": "Happy Bees", "location": "Kent", "user_id": 1},
+            {"apiary_id": 3, "name": "Happy Bees", "location": "Kent", "user_id": 1},
+        ]
+
+        response = client.get("/apiaries?ids=3,1,3")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == [
+            {"apiary_id": 1, "name": "Happy Bees", "location": "Kent", "user_id": 1},
+            {"apiary_id": 3, "name": "Happy Bees", "location": "Kent", "user_id": 1},
+        ]
+        mock_apiary_service.find_apiaries_by_apiary_ids.assert_called_once_with(
+            apiary_ids=[3, 1]
+        )
+
+    def test_get_apiaries_by_ids_not_found(
+        self, mock_apiary_service: AsyncMock
+    ) -> None:
+        mock_apiary_service.find_apiaries_by_apiary_ids.return_value = []
+
+        response = client.get("/apiaries?ids=998,999")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No apiaries found"
+
+    def test_get_apiaries_by_invalid_ids(self, mock_apiary_service: AsyncMock) -> None:
+        mock_apiary_service.find_apiaries_by_apiary_ids.side_effect = ValueError(
+            "Invalid apiary_id"
+        )
+
+        response = client.get("/apiaries?ids=1,-1")
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid apiary_id"
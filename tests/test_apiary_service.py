@@ -1,11 +1,11 @@
 """Test file for Apiary service"""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from models.apiary import Apiary
-from services.apiary import ApiaryService
+from services.apiary import ApiaryService, AsyncApiaryService
 
 
 @pytest.fixture
@@ -86,10 +86,9 @@ def test_create_apiary_invalid_user_id(
 
 
 def test_create_apiary_user_id_does_not_exist(
-    apiary_repo: MagicMock, user_repo: MagicMock, test_data: Apiary
+    apiary_repo: MagicMock, user_repo: MagicMock
 ) -> None:
-    apiary_repo.create.return_value = test_data
-    user_repo.find_by_user_id.return_value = None
+    apiary_repo.create.side_effect = LookupError
     name = "Happy Bees"
     location = "Kent"
     user_id = 999
@@ -187,7 +186,7 @@ def test_update_apiary_invalid_apiary_id(
 def test_update_apiary_apiary_id_does_not_exist(
     apiary_repo: MagicMock, user_repo: MagicMock
 ) -> None:
-    apiary_repo.find_by_apiary_id.return_value = None
+    apiary_repo.update.return_value = None
     apiary_service: ApiaryService = ApiaryService(apiary_repo, user_repo)
     apiary_id = 999
     name = "Happy Bees"
@@ -213,10 +212,9 @@ def test_update_apiary_invalid_user_id(
 
 
 def test_update_apiary_user_id_does_not_exist(
-    apiary_repo: MagicMock, user_repo: MagicMock, test_data: Apiary
+    apiary_repo: MagicMock, user_repo: MagicMock
 ) -> None:
-    apiary_repo.update.return_value = test_data
-    user_repo.find_by_user_id.return_value = None
+    apiary_repo.update.side_effect = LookupError
     apiary_id = 1
     name = "Happy Bees"
     location = "Kent"
@@ -256,3 +254,42 @@ def test_can_not_delete_apiary_invalid_apiary_id(
 
     with pytest.raises(ValueError, match="Invalid apiary_id"):
         apiary_service.delete_apiary(-1)
+
+
+@pytest.mark.anyio
+async def test_async_create_apiary(test_data: Apiary) -> None:
+    apiary_repo, user_repo = AsyncMock(), AsyncMock()
+    apiary_repo.create.return_value = test_data
+    apiary_service = AsyncApiaryService(apiary_repo, user_repo)
+
+    result: Apiary | None = await apiary_service.create_apiary(
+        name=" Happy Bees ", location="Kent", user_id=1
+    )
+
+    user_repo.find_by_user_id.assert_not_awaited()
+    apiary_repo.create.assert_awaited_once_with(
+        name="Happy Bees", location="Kent", user_id=1
+    )
+    assert result == test_data
+
+
+@pytest.mark.anyio
+async def test_async_can_not_create_apiary_missing_user() -> None:
+    apiary_repo, user_repo = AsyncMock(), AsyncMock()
+    apiary_repo.create.side_effect = LookupError
+    apiary_service = AsyncApiaryService(apiary_repo, user_repo)
+
+    with pytest.raises(ValueError, match="Invalid user_id"):
+        await apiary_service.create_apiary(
+            name="Happy Bees", location="Kent", user_id=1
+        )
+
+
+@pytest.mark.anyio
+async def test_async_can_not_delete_missing_apiary() -> None:
+    apiary_repo, user_repo = AsyncMock(), AsyncMock()
+    apiary_repo.delete.return_value = False
+    apiary_service = AsyncApiaryService(apiary_repo, user_repo)
+
+    with pytest.raises(ValueError, match="Invalid apiary_id"):
+        await apiary_service.delete_apiary(999)
@@ -0,0 +1,239 @@
+"""Integration tests for the asyncio PostgreSQL database connection."""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from db.async_database_connection import AsyncDatabaseConnection
+from db.database_configuration import DatabaseConfiguration
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def db() -> AsyncGenerator[AsyncDatabaseConnection, None]:
+    """Provides a connected AsyncDatabaseConnection instance for tests."""
+    config: DatabaseConfiguration = DatabaseConfiguration(".env")
+    config.pool_min_size = 1
+    config.pool_max_size = 2
+    db: AsyncDatabaseConnection = AsyncDatabaseConnection(config)
+    await db.connect()
+    yield db
+    await db.close()
+
+
+async def test_valid_connection_configuration(db: AsyncDatabaseConnection) -> None:
+    assert db.pool is not None
+    assert db.pool.closed is False
+
+
+async def test_execute(db: AsyncDatabaseConnection) -> None:
+    assert await db.execute("SELECT 1 AS one;", []) == [{"one": 1}]
+
+
+async def test_valid_seed_data(db: AsyncDatabaseConnection) -> None:
+    """Seed the database and verify data is inserted."""
+    await db.seed("seeds/valid_test_data.sql")
+    results = await db.execute("SELECT * FROM test_seed_data WHERE id = 1;", [])
+    assert results == [{"id": 1, "name": "jake"}]
+    await db.execute("TRUNCATE TABLE test_seed_data RESTART IDENTITY CASCADE;", [])
+
+
+async def test_invalid_seed_filename(db: AsyncDatabaseConnection) -> None:
+    """Seeding with a missing file should raise FileNotFoundError."""
+    with pytest.raises(FileNotFoundError) as excinfo:
+        await db.seed("seeds/nonexistent_seed.sql")
+    assert "does not exist" in str(excinfo.value)
+
+
+async def test_checkout_reuses_connection(db: AsyncDatabaseConnection) -> None:
+    """Queries inside a checkout block should share one backend connection."""
+    async with db.checkout():
+        first = await db.execute("SELECT pg_backend_pid() AS pid;", [])
+        second = await db.execute("SELECT pg_backend_pid() AS pid;", [])
+    assert first == second
+
+
+async def test_request_scope_reuses_connection(db: AsyncDatabaseConnection) -> None:
+    """Queries inside a request scope should share one backend connection."""
+    async with db.request_scope():
+        first = await db.execute("SELECT pg_backend_pid() AS pid;", [])
+        async with db.transaction():
+            second = await db.execute("SELECT pg_backend_pid() AS pid;", [])
+    assert first == second
+    assert db.pool.get_stats()["pool_available"] == db.pool.get_stats()["pool_size"]
+
+
+async def test_request_scope_without_queries(db: AsyncDatabaseConnection) -> None:
+    """A request scope that makes no queries should not take a connection."""
+    before = db.pool.get_stats().get("requests_num", 0)
+    async with db.request_scope():
+        pass
+    assert db.pool.get_stats().get("requests_num", 0) == before
+
+
+async def test_unit_of_work_commits_once(db: AsyncDatabaseConnection) -> None:
+    """Every query in a unit of work should run in one transaction, then commit."""
+    await db.seed("seeds/valid_test_data.sql")
+    await db.execute("TRUNCATE TABLE test_seed_data;", [])
+    async with db.request_scope():
+        async with db.unit_of_work():
+            first = await db.execute("SELECT txid_current() AS txid;", [])
+            await db.execute("INSERT INTO test_seed_data VALUES (6, 'wasp');", [])
+            second = await db.execute("SELECT txid_current() AS txid;", [])
+        third = await db.execute("SELECT txid_current() AS txid;", [])
+    assert first == second != third
+    assert await db.execute("SELECT * FROM test_seed_data;", []) == [
+        {"id": 6, "name": "wasp"}
+    ]
+    assert db.pool.get_stats()["pool_available"] == db.pool.get_stats()["pool_size"]
+
+
+async def test_unit_of_work_rolls_back_on_error(db: AsyncDatabaseConnection) -> None:
+    """A failed unit of work should write nothing, and a failed nested one only itself."""
+    await db.seed("seeds/valid_test_data.sql")
+    await db.execute("TRUNCATE TABLE test_seed_data;", [])
+
+    async def write_then_fail(row: list) -> None:
+        async with db.unit_of_work():
+            await db.execute("INSERT INTO test_seed_data VALUES (%s, %s);", row)
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await write_then_fail([7, "hornet"])
+    async with db.unit_of_work():
+        await db.execute("INSERT INTO test_seed_data VALUES (8, 'bee');", [])
+        with pytest.raises(RuntimeError):
+            await write_then_fail([9, "mite"])
+    assert await db.execute("SELECT * FROM test_seed_data;", []) == [
+        {"id": 8, "name": "bee"}
+    ]
+
+
+async def test_unit_of_work_without_queries(db: AsyncDatabaseConnection) -> None:
+    """A unit of work that makes no queries should not take a connection."""
+    before = db.pool.get_stats().get("requests_num", 0)
+    async with db.unit_of_work():
+        pass
+    assert db.pool.get_stats().get("requests_num", 0) == before
+
+
+async def test_close_connection(db: AsyncDatabaseConnection) -> None:
+    await db.close()
+    assert db.pool.closed is True
+
+
+async def test_invalid_connection_configuration() -> None:
+    """Connecting with invalid credentials should raise ConnectionError."""
+    config: DatabaseConfiguration = DatabaseConfiguration()
+    config.url = "host=invalid_host port=5432 user=invalid_user dbname=nonexistent_db"
+    config.pool_timeout = 0.5
+
+    db: AsyncDatabaseConnection = AsyncDatabaseConnection(config)
+    with pytest.raises(ConnectionError) as excinfo:
+        await db.connect()
+    assert "Couldn't connect" in str(excinfo.value)
+
+
+async def test_execute_without_connection() -> None:
+    """Executing without connecting should raise ConnectionError."""
+    config: DatabaseConfiguration = DatabaseConfiguration(".env")
+    db: AsyncDatabaseConnection = AsyncDatabaseConnection(config)
+    with pytest.raises(ConnectionError) as excinfo:
+        await db.execute("SELECT 1;", [])
+    assert "No connection to" in str(excinfo.value)
+
+
+async def test_connect_twice_keeps_pool(db: AsyncDatabaseConnection) -> None:
+    """A second connect() should not replace (and leak) the open pool."""
+    pool = db.pool
+    await db.connect()
+    assert db.pool is pool
+
+
+async def test_ping(db: AsyncDatabaseConnection) -> None:
+    assert await db.ping() is True
+
+
+async def test_ping_without_connection() -> None:
+    config: DatabaseConfiguration = DatabaseConfiguration(".env")
+    db: AsyncDatabaseConnection = AsyncDatabaseConnection(config)
+    assert await db.ping() is False
+
+
+async def test_executemany_returning(db: AsyncDatabaseConnection) -> None:
+    await db.seed("seeds/valid_test_data.sql")
+    results = await db.executemany(
+        "INSERT INTO test_seed_data (id, name) VALUES (%s, %s) RETURNING id;",
+        [[2, "bee"], [3, "wasp"]],
+        returning=True,
+    )
+    assert results == [{"id": 2}, {"id": 3}]
+    await db.execute("TRUNCATE TABLE test_seed_data RESTART IDENTITY CASCADE;", [])
+
+
+async def test_copy(db: AsyncDatabaseConnection) -> None:
+    await db.seed("seeds/valid_test_data.sql")
+    await db.execute("TRUNCATE TABLE test_seed_data;", [])
+    assert (
+        await db.copy("COPY test_seed_data (id, name) FROM STDIN;", [[4, "ant"]]) == 1
+    )
+    assert await db.execute("SELECT * FROM test_seed_data;", []) == [
+        {"id": 4, "name": "ant"}
+    ]
+    await db.execute("TRUNCATE TABLE test_seed_data RESTART IDENTITY CASCADE;", [])
+
+
+async def test_transaction_rolls_back_on_error(db: AsyncDatabaseConnection) -> None:
+    """Nothing written inside a failed transaction block should persist."""
+    await db.seed("seeds/valid_test_data.sql")
+    await db.execute("TRUNCATE TABLE test_seed_data;", [])
+
+    async def write_then_fail() -> None:
+        async with db.transaction():
+            await db.execute("INSERT INTO test_seed_data VALUES (5, 'moth');", [])
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await write_then_fail()
+    assert await db.execute("SELECT * FROM test_seed_data;", []) == []
+
+
+async def test_execute_missing_reference(db: AsyncDatabaseConnection) -> None:
+    """A write rejected by a foreign key should raise LookupError naming it."""
+
+    async def insert_orphan() -> None:
+        async with db.transaction():
+            await db.execute("CREATE TEMP TABLE parent (id integer PRIMARY KEY);", [])
+            await db.execute(
+                "CREATE TEMP TABLE child (parent_id integer REFERENCES parent (id));",
+                [],
+            )
+            await db.execute("INSERT INTO child VALUES (%s);", [1])
+
+    with pytest.raises(LookupError, match="child_parent_id_fkey"):
+        await insert_orphan()
+
+
+async def test_executemany_missing_reference(db: AsyncDatabaseConnection) -> None:
+    """A pipelined write rejected by a foreign key should raise LookupError too."""
+
+    async def insert_orphans() -> None:
+        async with db.transaction():
+            await db.execute("CREATE TEMP TABLE parent (id integer PRIMARY KEY);", [])
+            await db.execute(
+                "CREATE TEMP TABLE child (parent_id integer REFERENCES parent (id));",
+                [],
+            )
+            await db.executemany("INSERT INTO child VALUES (%s);", [[1], [2]])
+
+    with pytest.raises(LookupError, match="child_parent_id_fkey"):
+        await insert_orphans()
+
+
+async def test_stream(db: AsyncDatabaseConnection) -> None:
+    """Rows from a server-side cursor should arrive in order across fetches."""
+    rows = [
+        row async for row in db.stream("SELECT generate_series(1, 5) AS n;", [], size=2)
+    ]
+    assert rows == [{"n": n} for n in range(1, 6)]
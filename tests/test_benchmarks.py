@@ -0,0 +1,164 @@
+"""Tests for the benchmark harness"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from benchmarks.harness import (
+    BOUNDS_QUERY,
+    Case,
+    Ids,
+    QueryCounter,
+    Result,
+    compare,
+    crud_cases,
+    percentile,
+    read_results,
+    run_case,
+    write_results,
+)
+from db.instrumentation import QueryEvent
+
+BOUNDS = {
+    "users": 3,
+    "apiaries": 5,
+    "hives": 8,
+    "colonies": 8,
+    "queens": 8,
+    "inspections": 40,
+    "observations": 40,
+    "actions": 20,
+}
+
+
+def result(median_ms: float = 1.0, queries_per_call: float = 1.0) -> Result:
+    return Result(
+        group="repositories",
+        name="HiveRepository.create",
+        iterations=10,
+        mean_ms=median_ms,
+        median_ms=median_ms,
+        p95_ms=median_ms,
+        max_ms=median_ms,
+        ops_per_second=1000 / median_ms,
+        queries_per_call=queries_per_call,
+    )
+
+
+class TestHarness:
+    def test_percentile(self) -> None:
+        timings = [float(n) for n in range(1, 101)]
+
+        assert percentile(timings, 0.5) == 50.0
+        assert percentile(timings, 0.95) == 95.0
+        assert percentile([7.0], 0.95) == 7.0
+
+    def test_run_case_counts_only_timed_queries(self) -> None:
+        counter = QueryCounter()
+        seen: list[int] = []
+
+        def call(i: int) -> None:
+            seen.append(i)
+            counter(QueryEvent("SELECT 1;", 0.0, 1))
+            counter(QueryEvent("SELECT 2;", 0.0, 1))
+
+        outcome = run_case(
+            Case("repositories", "two", call), counter, iterations=5, warmup=3
+        )
+
+        assert seen == list(range(8))
+        assert outcome.iterations == 5
+        assert outcome.queries_per_call == 2.0
+        assert outcome.median_ms <= outcome.p95_ms <= outcome.max_ms
+
+    def test_crud_cases_update_and_delete_what_create_wrote(self) -> None:
+        ids = iter([101, 102])
+        updated: list[tuple[int, int]] = []
+        deleted: list[int] = []
+
+        cases = crud_cases(
+            "services",
+            "HiveService",
+            lambda _: next(ids),
+            {"read": lambda _: None},
+            lambda hive_id, i: updated.append((hive_id, i)),
+            deleted.append,
+        )
+        for case in cases:
+            for i in range(2):
+                case.call(i)
+
+        assert [case.name for case in cases] == [
+            "HiveService.create",
+            "HiveService.read",
+            "HiveService.update",
+            "HiveService.delete",
+        ]
+        assert updated == [(101, 0), (102, 1)]
+        assert deleted == [101, 102]
+
+    def test_crud_cases_without_update(self) -> None:
+        cases = crud_cases("repositories", "SessionRepository", int, {}, None, int)
+
+        assert [case.name for case in cases] == [
+            "SessionRepository.create",
+            "SessionRepository.delete",
+        ]
+
+    def test_ids_stay_within_bounds_and_repeat_by_seed(self) -> None:
+        db = MagicMock()
+        db.execute.return_value = [BOUNDS]
+
+        ids = Ids.of(db, seed=3)
+        picked = ids.many("hives", 100)
+
+        db.execute.assert_called_once_with(BOUNDS_QUERY, [], prepare=False)
+        assert set(picked) <= set(range(1, BOUNDS["hives"] + 1))
+        assert Ids(BOUNDS, seed=3).many("hives", 100) == picked
+
+    def test_ids_of_empty_table(self) -> None:
+        db = MagicMock()
+        db.execute.return_value = [{**BOUNDS, "actions": None}]
+
+        with pytest.raises(ValueError, match="actions"):
+            Ids.of(db, seed=0)
+
+    def test_write_then_read_results(self, tmp_path: Path) -> None:
+        path = tmp_path / "results" / "abc123.json"
+
+        write_results(path, {"commit": "abc123"}, [result()])
+
+        assert read_results(path) == {
+            "repositories/HiveRepository.create": {
+                "group": "repositories",
+                "name": "HiveRepository.create",
+                "iterations": 10,
+                "mean_ms": 1.0,
+                "median_ms": 1.0,
+                "p95_ms": 1.0,
+                "max_ms": 1.0,
+                "ops_per_second": 1000.0,
+                "queries_per_call": 1.0,
+            }
+        }
+
+    def test_compare(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline.json"
+        write_results(path, {}, [result()])
+        baseline = read_results(path)
+
+        assert compare(baseline, [result(median_ms=1.1)], 0.2) == []
+        assert compare(baseline, [result(queries_per_call=0.5)], 0.2) == []
+        slower = compare(baseline, [result(median_ms=1.5)], 0.2)
+        more_queries = compare(baseline, [result(queries_per_call=2.0)], 0.2)
+
+        assert slower == [
+            "repositories/HiveRepository.create: median 1.000 -> 1.500 ms"
+        ]
+        assert more_queries == [
+            "repositories/HiveRepository.create: 1 -> 2 queries per call"
+        ]
+
+    def test_compare_skips_new_cases(self) -> None:
+        assert compare({}, [result(median_ms=100.0)], 0.2) == []
@@ -0,0 +1,134 @@
+"""Tests for ColonyHealthRepository class"""
+
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from models.colony_health import ColonyHealth
+from repositories.colony_health import (
+    FIND_BY_APIARY_ID_QUERY,
+    FIND_BY_COLONY_ID_QUERY,
+    ROW_FACTORY,
+    AsyncColonyHealthRepository,
+    ColonyHealthRepository,
+)
+
+POINT = ColonyHealth(
+    colony_id=1,
+    inspection_id=2,
+    observation_id=3,
+    inspection_timestamp=datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC")),
+    varroa_count=12,
+    brood_frames=5,
+    store_frames=3,
+    temper=2,
+    queen_cells=0,
+    chalk_brood=False,
+    foul_brood=False,
+    varroa_mean=9.5,
+    brood_frames_mean=4.5,
+    store_frames_mean=3.0,
+    temper_mean=2.0,
+    varroa_slope=0.5,
+    brood_frames_slope=0.125,
+    varroa_growth_rate=0.5,
+)
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+def test_queries_compute_the_series_with_window_functions() -> None:
+    for query in (FIND_BY_COLONY_ID_QUERY, FIND_BY_APIARY_ID_QUERY):
+        assert "OVER w" in query
+        assert "lag(o.varroa_count) OVER p" in query
+        assert "ROWS BETWEEN %s PRECEDING AND CURRENT ROW" in query
+    assert "WHERE i.colony_id = %s" in FIND_BY_COLONY_ID_QUERY
+    assert "WHERE h.apiary_id = %s" in FIND_BY_APIARY_ID_QUERY
+
+
+class TestColonyHealthRepository:
+    def test_find_by_colony_id(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [POINT]
+        repo = ColonyHealthRepository(db=mock_db)
+
+        result = repo.find_by_colony_id(1, window=3)
+
+        mock_db.execute.assert_called_once_with(
+            FIND_BY_COLONY_ID_QUERY, [1, 2], row_factory=ROW_FACTORY
+        )
+        assert result == [POINT]
+
+    def test_find_by_colony_id_without_observations(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = []
+        repo = ColonyHealthRepository(db=mock_db)
+
+        assert repo.find_by_colony_id(1, window=1) is None
+        mock_db.execute.assert_called_once_with(
+            FIND_BY_COLONY_ID_QUERY, [1, 0], row_factory=ROW_FACTORY
+        )
+
+    def test_find_by_apiary_id(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [POINT]
+        repo = ColonyHealthRepository(db=mock_db)
+
+        result = repo.find_by_apiary_id(7, window=5)
+
+        mock_db.execute.assert_called_once_with(
+            FIND_BY_APIARY_ID_QUERY, [7, 4], row_factory=ROW_FACTORY
+        )
+        assert result == [POINT]
+
+    def test_stream_by_apiary_id(self, mock_db: MagicMock) -> None:
+        mock_db.stream.return_value = iter([POINT])
+        repo = ColonyHealthRepository(db=mock_db)
+
+        assert list(repo.stream_by_apiary_id(7, window=3)) == [POINT]
+        mock_db.stream.assert_called_once_with(
+            FIND_BY_APIARY_ID_QUERY, [7, 2], row_factory=ROW_FACTORY
+        )
+
+
+@pytest.mark.anyio
+class TestAsyncColonyHealthRepository:
+    async def test_find_by_colony_id(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [POINT]
+        repo = AsyncColonyHealthRepository(db=mock_async_db)
+
+        result = await repo.find_by_colony_id(1, window=3)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            FIND_BY_COLONY_ID_QUERY, [1, 2], row_factory=ROW_FACTORY
+        )
+        assert result == [POINT]
+
+    async def test_find_by_apiary_id_without_observations(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = None
+        repo = AsyncColonyHealthRepository(db=mock_async_db)
+
+        assert await repo.find_by_apiary_id(7, window=3) is None
+
+    async def test_stream_by_apiary_id(
+        self, mock_async_db: AsyncMock, async_rows: Callable[..., AsyncIterator]
+    ) -> None:
+        mock_async_db.stream = MagicMock(return_value=async_rows(POINT))
+        repo = AsyncColonyHealthRepository(db=mock_async_db)
+
+        result = [point async for point in repo.stream_by_apiary_id(7, window=3)]
+
+        mock_async_db.stream.assert_called_once_with(
+            FIND_BY_APIARY_ID_QUERY, [7, 2], row_factory=ROW_FACTORY
+        )
+        assert result == [POINT]
@@ -0,0 +1,165 @@
+"""Tests for ColonyHealth routes"""
+
+from collections.abc import AsyncIterator, Callable, Generator
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from models.colony_health import ColonyHealth
+from schemas.colony_health import ColonyHealthRead
+from services.colony_health import ColonyHealthService
+from services.dependencies import get_colony_health_service
+
+client = TestClient(app)
+
+POINT = ColonyHealth(
+    colony_id=1,
+    inspection_id=2,
+    observation_id=3,
+    inspection_timestamp=datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC")),
+    varroa_count=12,
+    brood_frames=5,
+    store_frames=3,
+    temper=2,
+    queen_cells=0,
+    chalk_brood=False,
+    foul_brood=False,
+    varroa_mean=9.5,
+    brood_frames_mean=4.5,
+    store_frames_mean=3.0,
+    temper_mean=2.0,
+    varroa_slope=0.5,
+    brood_frames_slope=0.125,
+    varroa_growth_rate=0.5,
+)
+
+
+@pytest.fixture
+def mock_health_service() -> Generator[AsyncMock, None, None]:
+    mock = AsyncMock()
+    app.dependency_overrides[get_colony_health_service] = lambda: mock
+    yield mock
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def point_read() -> ColonyHealthRead:
+    return ColonyHealthRead.model_validate(POINT, from_attributes=True)
+
+
+class TestColonyHealthRoutes:
+    def test_get_colony_health_service_direct(self) -> None:
+        service: ColonyHealthService = get_colony_health_service()
+        assert isinstance(service, ColonyHealthService)
+
+    def test_get_colony_health(
+        self, mock_health_service: AsyncMock, point_read: ColonyHealthRead
+    ) -> None:
+        mock_health_service.find_health_by_colony_id.return_value = [POINT]
+
+        response = client.get("/colonies/1/health?window=4")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == [point_read.model_dump(mode="json")]
+        mock_health_service.find_health_by_colony_id.assert_called_once_with(
+            colony_id=1, window=4
+        )
+
+    def test_get_colony_health_default_window(
+        self, mock_health_service: AsyncMock
+    ) -> None:
+        mock_health_service.find_health_by_colony_id.return_value = [POINT]
+
+        client.get("/colonies/1/health")
+
+        mock_health_service.find_health_by_colony_id.assert_called_once_with(
+            colony_id=1, window=3
+        )
+
+    def test_get_colony_health_not_found(self, mock_health_service: AsyncMock) -> None:
+        mock_health_service.find_health_by_colony_id.return_value = None
+
+        response = client.get("/colonies/999/health")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "No observations found for this colony"}
+
+    def test_get_colony_health_invalid_colony_id(
+        self, mock_health_service: AsyncMock
+    ) -> None:
+        mock_health_service.find_health_by_colony_id.side_effect = ValueError(
+            "Invalid colony_id"
+        )
+
+        response = client.get("/colonies/0/health")
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "Invalid colony_id"}
+
+    @pytest.mark.parametrize("window", [0, 53])
+    def test_get_colony_health_window_out_of_range(
+        self, mock_health_service: AsyncMock, window: int
+    ) -> None:
+        response = client.get(f"/colonies/1/health?window={window}")
+
+        assert response.status_code == 422
+        mock_health_service.find_health_by_colony_id.assert_not_called()
+
+    def test_get_apiary_health(
+        self, mock_health_service: AsyncMock, point_read: ColonyHealthRead
+    ) -> None:
+        mock_health_service.find_health_by_apiary_id.return_value = [POINT, POINT]
+
+        response = client.get("/apiaries/7/health")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == [point_read.model_dump(mode="json")] * 2
+        mock_health_service.find_health_by_apiary_id.assert_called_once_with(
+            apiary_id=7, window=3
+        )
+
+    def test_get_apiary_health_not_found(self, mock_health_service: AsyncMock) -> None:
+        mock_health_service.find_health_by_apiary_id.return_value = None
+
+        response = client.get("/apiaries/999/health")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "No observations found for this apiary"}
+
+    def test_get_apiary_health_as_ndjson(
+        self,
+        mock_health_service: AsyncMock,
+        point_read: ColonyHealthRead,
+        async_rows: Callable[..., AsyncIterator],
+    ) -> None:
+        mock_health_service.stream_health_by_apiary_id = MagicMock(
+            return_value=async_rows(POINT, POINT)
+        )
+
+        response = client.get(
+            "/apiaries/7/health?window=2", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.text.splitlines() == [point_read.model_dump_json()] * 2
+        mock_health_service.stream_health_by_apiary_id.assert_called_once_with(
+            apiary_id=7, window=2
+        )
+        mock_health_service.find_health_by_apiary_id.assert_not_called()
+
+    def test_get_apiary_health_as_ndjson_invalid_apiary_id(
+        self, mock_health_service: AsyncMock
+    ) -> None:
+        mock_health_service.stream_health_by_apiary_id = MagicMock(
+            side_effect=ValueError("Invalid apiary_id")
+        )
+
+        response = client.get(
+            "/apiaries/0/health", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 422
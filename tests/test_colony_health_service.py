@@ -0,0 +1,112 @@
+"""Tests for ColonyHealthService"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from models.colony_health import ColonyHealth
+from services.colony_health import (
+    DEFAULT_WINDOW,
+    AsyncColonyHealthService,
+    ColonyHealthService,
+)
+
+POINT = ColonyHealth(
+    colony_id=1,
+    inspection_id=2,
+    observation_id=3,
+    inspection_timestamp=datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC")),
+    varroa_count=12,
+    brood_frames=5,
+    store_frames=3,
+    temper=2,
+    queen_cells=0,
+    chalk_brood=False,
+    foul_brood=False,
+    varroa_mean=9.5,
+    brood_frames_mean=4.5,
+    store_frames_mean=3.0,
+    temper_mean=2.0,
+    varroa_slope=0.5,
+    brood_frames_slope=0.125,
+    varroa_growth_rate=0.5,
+)
+
+
+@pytest.fixture
+def health_repo() -> MagicMock:
+    return MagicMock()
+
+
+def test_find_health_by_colony_id(health_repo: MagicMock) -> None:
+    health_repo.find_by_colony_id.return_value = [POINT]
+    service = ColonyHealthService(health_repo)
+
+    assert service.find_health_by_colony_id(1) == [POINT]
+    health_repo.find_by_colony_id.assert_called_once_with(1, DEFAULT_WINDOW)
+
+
+def test_find_health_by_apiary_id(health_repo: MagicMock) -> None:
+    health_repo.find_by_apiary_id.return_value = [POINT]
+    service = ColonyHealthService(health_repo)
+
+    assert service.find_health_by_apiary_id(7, window=10) == [POINT]
+    health_repo.find_by_apiary_id.assert_called_once_with(7, 10)
+
+
+def test_stream_health_by_apiary_id(health_repo: MagicMock) -> None:
+    health_repo.stream_by_apiary_id.return_value = iter([POINT])
+    service = ColonyHealthService(health_repo)
+
+    assert list(service.stream_health_by_apiary_id(7)) == [POINT]
+
+
+@pytest.mark.parametrize("colony_id", [0, -1, "1"])
+def test_can_not_find_health_by_invalid_colony_id(
+    health_repo: MagicMock, colony_id: int
+) -> None:
+    service = ColonyHealthService(health_repo)
+
+    with pytest.raises(ValueError, match="Invalid colony_id"):
+        service.find_health_by_colony_id(colony_id)
+    health_repo.find_by_colony_id.assert_not_called()
+
+
+def test_can_not_find_health_by_invalid_apiary_id(health_repo: MagicMock) -> None:
+    service = ColonyHealthService(health_repo)
+
+    with pytest.raises(ValueError, match="Invalid apiary_id"):
+        service.stream_health_by_apiary_id(0)
+    health_repo.stream_by_apiary_id.assert_not_called()
+
+
+@pytest.mark.parametrize("window", [0, 53])
+def test_can_not_find_health_with_invalid_window(
+    health_repo: MagicMock, window: int
+) -> None:
+    service = ColonyHealthService(health_repo)
+
+    with pytest.raises(ValueError, match="window must be between 1 and 52"):
+        service.find_health_by_apiary_id(7, window=window)
+
+
+@pytest.mark.anyio
+async def test_async_find_health_by_colony_id() -> None:
+    health_repo = AsyncMock()
+    health_repo.find_by_colony_id.return_value = [POINT]
+    service = AsyncColonyHealthService(health_repo)
+
+    assert await service.find_health_by_colony_id(1, window=4) == [POINT]
+    health_repo.find_by_colony_id.assert_awaited_once_with(1, 4)
+
+
+@pytest.mark.anyio
+async def test_async_find_health_by_apiary_id() -> None:
+    health_repo = AsyncMock()
+    health_repo.find_by_apiary_id.return_value = None
+    service = AsyncColonyHealthService(health_repo)
+
+    assert await service.find_health_by_apiary_id(7) is None
+    health_repo.find_by_apiary_id.assert_awaited_once_with(7, DEFAULT_WINDOW)
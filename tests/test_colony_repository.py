@@ -1,11 +1,11 @@
 """Tests for the Colony Repository"""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from models.colony import Colony
-from repositories.colony import ColonyRepository
+from repositories.colony import ROW_FACTORY, AsyncColonyRepository, ColonyRepository
 
 
 @pytest.fixture
@@ -48,18 +48,18 @@ class TestColonyRepository:
 
     def test_can_find_colony_by_valid_colony_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "colony_id": self.test_colony.colony_id,
-                "hive_id": self.test_colony.hive_id,
-            }
+            Colony(
+                colony_id=self.test_colony.colony_id, hive_id=self.test_colony.hive_id
+            )
         ]
         repo: ColonyRepository = ColonyRepository(db=mock_db)
 
         result: Colony | None = repo.find_by_colony_id(self.test_colony.colony_id)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM colonies WHERE colony_id = %s LIMIT 1;",
+            "SELECT colony_id, hive_id FROM colonies WHERE colony_id = %s LIMIT 1;",
             [self.test_colony.colony_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(result, Colony)
         assert result.colony_id == self.test_colony.colony_id
@@ -72,60 +72,76 @@ class TestColonyRepository:
         result: Colony | None = repo.find_by_colony_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM colonies WHERE colony_id = %s LIMIT 1;", [999]
+            "SELECT colony_id, hive_id FROM colonies WHERE colony_id = %s LIMIT 1;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_can_find_colonies_by_valid_hive_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "colony_id": self.test_colony.colony_id,
-                "hive_id": self.test_colony.hive_id,
-            }
+            Colony(
+                colony_id=self.test_colony.colony_id, hive_id=self.test_colony.hive_id
+            )
         ]
         repo: ColonyRepository = ColonyRepository(db=mock_db)
 
-        result: Colony | None = repo.find_by_hive_id(self.test_colony.colony_id)
+        result: list[Colony] | None = repo.find_by_hive_id(self.test_colony.colony_id)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM colonies WHERE hive_id = %s LIMIT 1;",
+            "SELECT colony_id, hive_id FROM colonies WHERE hive_id = %s ORDER BY colony_id;",
             [self.test_colony.colony_id],
+            row_factory=ROW_FACTORY,
         )
-        assert isinstance(result, Colony)
-        assert result.colony_id == self.test_colony.colony_id
-        assert result.hive_id == self.test_colony.hive_id
+        assert result == [self.test_colony]
+
+    def test_find_page_by_hive_id(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [self.test_colony]
+        repo: ColonyRepository = ColonyRepository(db=mock_db)
+
+        result: list[Colony] | None = repo.find_by_hive_id(1, limit=2, after=0)
+
+        mock_db.execute.assert_called_once_with(
+            "SELECT colony_id, hive_id FROM colonies WHERE hive_id = %s AND colony_id > %s ORDER BY colony_id LIMIT %s;",
+            [1, 0, 2],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [self.test_colony]
 
     def test_can_not_find_colony_by_invalid_hive_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = []
         repo: ColonyRepository = ColonyRepository(db=mock_db)
 
-        result: Colony | None = repo.find_by_hive_id(999)
+        result: list[Colony] | None = repo.find_by_hive_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM colonies WHERE hive_id = %s LIMIT 1;", [999]
+            "SELECT colony_id, hive_id FROM colonies WHERE hive_id = %s ORDER BY colony_id;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_read_full_db_returns_all(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "colony_id": self.test_colony.colony_id,
-                "hive_id": self.test_colony.hive_id,
-            },
-            {
-                "colony_id": self.test_colony_2.colony_id,
-                "hive_id": self.test_colony_2.hive_id,
-            },
-            {
-                "colony_id": self.test_colony_3.colony_id,
-                "hive_id": self.test_colony_3.hive_id,
-            },
+            Colony(
+                colony_id=self.test_colony.colony_id, hive_id=self.test_colony.hive_id
+            ),
+            Colony(
+                colony_id=self.test_colony_2.colony_id,
+                hive_id=self.test_colony_2.hive_id,
+            ),
+            Colony(
+                colony_id=self.test_colony_3.colony_id,
+                hive_id=self.test_colony_3.hive_id,
+            ),
         ]
         repo: ColonyRepository = ColonyRepository(db=mock_db)
 
         results: list[Colony] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM colonies;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT colony_id, hive_id FROM colonies;", [], row_factory=ROW_FACTORY
+        )
         assert isinstance(results, (list, Colony))
         assert results[0].colony_id == 1
         assert results[1].colony_id == 2
@@ -138,7 +154,9 @@ class TestColonyRepository:
 
         result: list[Colony] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM colonies;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT colony_id, hive_id FROM colonies;", [], row_factory=ROW_FACTORY
+        )
         assert result is None
 
     def test_can_update_valid_colony(self, mock_db: MagicMock) -> None:
@@ -187,3 +205,139 @@ class TestColonyRepository:
             "DELETE FROM colonies WHERE colony_id = %s RETURNING colony_id;", [999]
         )
         assert result is False
+
+    def test_find_existing_colony_ids(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [{"colony_id": 1}, {"colony_id": 3}]
+        repo: ColonyRepository = ColonyRepository(db=mock_db)
+
+        result: set[int] = repo.find_existing_colony_ids([1, 2, 3])
+
+        mock_db.execute.assert_called_once_with(
+            "SELECT colony_id FROM colonies WHERE colony_id = ANY(%s);", [[1, 2, 3]]
+        )
+        assert result == {1, 3}
+
+    def test_find_by_hive_ids(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [self.test_colony]
+        repo: ColonyRepository = ColonyRepository(db=mock_db)
+
+        result = repo.find_by_hive_ids([1, 2])
+
+        mock_db.execute.assert_called_once_with(
+            "SELECT colony_id, hive_id FROM colonies WHERE hive_id = ANY(%s) ORDER BY colony_id;",
+            [[1, 2]],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [self.test_colony]
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.mark.anyio
+class TestAsyncColonyRepository:
+    test_colony: Colony = Colony(colony_id=1, hive_id=1)
+
+    async def test_create_colony(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [{"colony_id": 1}]
+        repo: AsyncColonyRepository = AsyncColonyRepository(db=mock_async_db)
+
+        result: Colony | None = await repo.create(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "INSERT INTO colonies (hive_id) VALUES (%s) RETURNING colony_id;", [1]
+        )
+        assert result == self.test_colony
+
+    async def test_can_find_colony_by_valid_colony_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = [Colony(colony_id=1, hive_id=1)]
+        repo: AsyncColonyRepository = AsyncColonyRepository(db=mock_async_db)
+
+        result: Colony | None = await repo.find_by_colony_id(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT colony_id, hive_id FROM colonies WHERE colony_id = %s LIMIT 1;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == self.test_colony
+
+    async def test_can_not_find_colony_by_invalid_hive_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = []
+        repo: AsyncColonyRepository = AsyncColonyRepository(db=mock_async_db)
+
+        result: list[Colony] | None = await repo.find_by_hive_id(999)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT colony_id, hive_id FROM colonies WHERE hive_id = %s ORDER BY colony_id;",
+            [999],
+            row_factory=ROW_FACTORY,
+        )
+        assert result is None
+
+    async def test_can_update_valid_colony(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [{"colony_id": 1}]
+        repo: AsyncColonyRepository = AsyncColonyRepository(db=mock_async_db)
+
+        result: Colony | None = await repo.update(colony_id=1, hive_id=2)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "UPDATE colonies SET hive_id = %s WHERE colony_id = %s RETURNING colony_id;",
+            [2, 1],
+        )
+        assert result == Colony(colony_id=1, hive_id=2)
+
+    async def test_find_existing_colony_ids(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = []
+        repo: AsyncColonyRepository = AsyncColonyRepository(db=mock_async_db)
+
+        result: set[int] = await repo.find_existing_colony_ids([999])
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT colony_id FROM colonies WHERE colony_id = ANY(%s);", [[999]]
+        )
+        assert result == set()
+
+    async def test_find_by_hive_ids_none_found(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = None
+        repo: AsyncColonyRepository = AsyncColonyRepository(db=mock_async_db)
+
+        result = await repo.find_by_hive_ids([999])
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT colony_id, hive_id FROM colonies WHERE hive_id = ANY(%s) ORDER BY colony_id;",
+            [[999]],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == []
+
+
+def test_find_by_ids(mock_db: MagicMock) -> None:
+    mock_db.execute.return_value = None
+    repo = ColonyRepository(db=mock_db)
+
+    assert repo.find_by_ids([2, 1]) == []
+    mock_db.execute.assert_called_once_with(
+        "SELECT colony_id, hive_id FROM colonies WHERE colony_id = ANY(%s) ORDER BY colony_id;",
+        [[2, 1]],
+        row_factory=ROW_FACTORY,
+    )
+
+
+@pytest.mark.anyio
+async def test_async_find_by_ids(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = ["row"]
+    repo = AsyncColonyRepository(db=mock_async_db)
+
+    assert await repo.find_by_ids((1, 2)) == ["row"]
+    mock_async_db.execute.assert_awaited_once_with(
+        "SELECT colony_id, hive_id FROM colonies WHERE colony_id = ANY(%s) ORDER BY colony_id;",
+        [[1, 2]],
+        row_factory=ROW_FACTORY,
+    )
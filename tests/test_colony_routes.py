@@ -1,7 +1,7 @@
 """Tests for Colony routes"""
 
 from collections.abc import Generator
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -10,13 +10,14 @@ from main import app
 from models.colony import Colony
 from services.colony import ColonyService
 from services.dependencies import get_colony_service
+from utils.page_cursor import PageCursor
 
 client: TestClient = TestClient(app)
 
 
 @pytest.fixture
-def mock_colony_service() -> Generator[MagicMock, None, None]:
-    mock: MagicMock = MagicMock()
+def mock_colony_service() -> Generator[AsyncMock, None, None]:
+    mock: AsyncMock = AsyncMock()
     app.dependency_overrides[get_colony_service] = lambda: mock
     yield mock
     app.dependency_overrides.clear()
@@ -35,8 +36,8 @@ class TestColonyRoutes:
         assert service is not None
         assert isinstance(service, ColonyService)
 
-    def test_create_colony_success(self, mock_colony_service: MagicMock) -> None:
-        mock_colony_service.create_colony = MagicMock(return_value=self.valid_colony)
+    def test_create_colony_success(self, mock_colony_service: AsyncMock) -> None:
+        mock_colony_service.create_colony = AsyncMock(return_value=self.valid_colony)
 
         response = client.post("/colony", json={"hive_id": "1"})
 
@@ -47,7 +48,7 @@ class TestColonyRoutes:
         }
         mock_colony_service.create_colony.assert_called_once_with(hive_id=1)
 
-    def test_create_colony_failure(self, mock_colony_service: MagicMock) -> None:
+    def test_create_colony_failure(self, mock_colony_service: AsyncMock) -> None:
         mock_colony_service.create_colony.side_effect = ValueError()
 
         response = client.post("/colony", json={"hive_id": "-1"})
@@ -55,9 +56,9 @@ class TestColonyRoutes:
         assert response.status_code == 422
 
     def test_get_colony_by_hive_id_success(
-        self, mock_colony_service: MagicMock
+        self, mock_colony_service: AsyncMock
     ) -> None:
-        mock_colony_service.find_colony_by_hive_id = MagicMock(
+        mock_colony_service.find_colony_by_hive_id = AsyncMock(
             return_value=[self.valid_colony]
         )
 
@@ -71,10 +72,31 @@ class TestColonyRoutes:
             }
         ]
 
-        mock_colony_service.find_colony_by_hive_id.assert_called_once_with(hive_id=1)
+        mock_colony_service.find_colony_by_hive_id.assert_called_once_with(
+            hive_id=1, limit=101, after=None
+        )
+
+    def test_get_colony_by_hive_id_links_next_page(
+        self, mock_colony_service: AsyncMock
+    ) -> None:
+        mock_colony_service.find_colony_by_hive_id = AsyncMock(
+            return_value=[self.valid_colony, Colony(colony_id=2, hive_id=1)]
+        )
+
+        response = client.get("/hives/1/colony", params={"limit": 1})
+
+        assert response.status_code == 200
+        assert response.json() == [{"colony_id": 1, "hive_id": 1}]
+        mock_colony_service.find_colony_by_hive_id.assert_called_once_with(
+            hive_id=1, limit=2, after=None
+        )
+        cursor = PageCursor.encode(1)
+        assert response.headers["link"] == (
+            f'<http://testserver/hives/1/colony?limit=1&after={cursor}>; rel="next"'
+        )
 
     def test_get_colony_by_hive_id_not_found(
-        self, mock_colony_service: MagicMock
+        self, mock_colony_service: AsyncMock
     ) -> None:
         mock_colony_service.find_colony_by_hive_id.return_value = []
 
@@ -84,9 +106,9 @@ class TestColonyRoutes:
         assert response.json()["detail"] == "No colonies found for this hive"
 
     def test_get_colony_by_colony_id_success(
-        self, mock_colony_service: MagicMock
+        self, mock_colony_service: AsyncMock
     ) -> None:
-        mock_colony_service.find_colony_by_colony_id = MagicMock(
+        mock_colony_service.find_colony_by_colony_id = AsyncMock(
             return_value=self.valid_colony
         )
 
@@ -102,7 +124,7 @@ class TestColonyRoutes:
         )
 
     def test_get_colony_by_colony_id_not_found(
-        self, mock_colony_service: MagicMock
+        self, mock_colony_service: AsyncMock
     ) -> None:
         mock_colony_service.find_colony_by_colony_id.return_value = None
 
@@ -111,7 +133,7 @@ class TestColonyRoutes:
         assert response.status_code == 404
         assert response.json()["detail"] == "No colonies found for this hive"
 
-    def test_update_colony_success(self, mock_colony_service: MagicMock) -> None:
+    def test_update_colony_success(self, mock_colony_service: AsyncMock) -> None:
         updated_colony = Colony(colony_id=1, hive_id=2)
         mock_colony_service.update_colony.return_value = updated_colony
 
@@ -126,14 +148,14 @@ class TestColonyRoutes:
             colony_id=1, hive_id=2
         )
 
-    def test_update_colony_failure(self, mock_colony_service: MagicMock) -> None:
+    def test_update_colony_failure(self, mock_colony_service: AsyncMock) -> None:
         mock_colony_service.update_colony.side_effect = ValueError()
 
         response = client.post("/colony/1", json={"hive_id": "-999"})
 
         assert response.status_code == 400
 
-    def test_delete_colony_success(self, mock_colony_service: MagicMock) -> None:
+    def test_delete_colony_success(self, mock_colony_service: AsyncMock) -> None:
         mock_colony_service.delete_colony.return_value = True
 
         response = client.delete("/colony/1")
@@ -142,10 +164,47 @@ class TestColonyRoutes:
         assert response.json() is True
         mock_colony_service.delete_colony.assert_called_once_with(colony_id=1)
 
-    def test_delete_colony_not_found(self, mock_colony_service: MagicMock) -> None:
+    def test_delete_colony_not_found(self, mock_colony_service: AsyncMock) -> None:
         mock_colony_service.delete_colony.side_effect = ValueError("Invalid colony_id")
 
         response = client.delete("/colony/999")
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Invalid colony_id"
+
+    def test_get_colonies_by_ids(self, mock_colony_service: AsyncMock) -> None:
+        mock_colony_service.find_colonies_by_colony_ids.return_value = [
+            {"colony_id": 1, "hive_id": 1},
+            {"colony_id": 3, "hive_id": 1},
+        ]
+
+        response = client.get("/colony?ids=3,1,3")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == [
+            {"colony_id": 1, "hive_id": 1},
+            {"colony_id": 3, "hive_id": 1},
+        ]
+        mock_colony_service.find_colonies_by_colony_ids.assert_called_once_with(
+            colony_ids=[3, 1]
+        )
+
+    def test_get_colonies_by_ids_not_found(
+        self, mock_colony_service: AsyncMock
+    ) -> None:
+        mock_colony_service.find_colonies_by_colony_ids.return_value = []
+
+        response = client.get("/colony?ids=998,999")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No colonies found"
+
+    def test_get_colonies_by_invalid_ids(self, mock_colony_service: AsyncMock) -> None:
+        mock_colony_service.find_colonies_by_colony_ids.side_effect = ValueError(
+            "Invalid colony_id"
+        )
+
+        response = client.get("/colony?ids=1,-1")
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid colony_id"
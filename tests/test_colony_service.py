@@ -1,12 +1,12 @@
 """Tests for ColonyService"""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from models.colony import Colony
 from models.hive import Hive
-from services.colony import ColonyService
+from services.colony import AsyncColonyService, ColonyService
 
 
 @pytest.fixture
@@ -55,10 +55,9 @@ def test_can_not_create_colony_invalid_hive_id(
 
 
 def test_can_not_create_colony_missing_hive_id(
-    colony_repo: MagicMock, hive_repo: MagicMock, test_data: Colony
+    colony_repo: MagicMock, hive_repo: MagicMock
 ) -> None:
-    colony_repo.create.return_value = test_data
-    hive_repo.find_by_hive_id.return_value = None
+    colony_repo.create.side_effect = LookupError
     hive_id = 999
     colony_service: ColonyService = ColonyService(colony_repo, hive_repo)
 
@@ -166,7 +165,7 @@ def test_can_not_update_colony_invalid_colony_id(
 def test_can_not_update_colony_missing_colony_id(
     colony_repo: MagicMock, hive_repo: MagicMock
 ) -> None:
-    colony_repo.find_by_colony_id.return_value = None
+    colony_repo.update.return_value = None
     colony_service: ColonyService = ColonyService(colony_repo, hive_repo)
     colony_id = 999
     hive_id = 1
@@ -188,10 +187,9 @@ def test_can_not_update_colony_invalid_hive_id(
 
 
 def test_can_not_update_colony_missing_hive_id(
-    colony_repo: MagicMock, hive_repo: MagicMock, test_data: Colony
+    colony_repo: MagicMock, hive_repo: MagicMock
 ) -> None:
-    colony_repo.update.return_value = test_data
-    hive_repo.find_by_hive_id.return_value = None
+    colony_repo.update.side_effect = LookupError
     colony_id = 1
     hive_id = 999
     colony_service: ColonyService = ColonyService(colony_repo, hive_repo)
@@ -230,3 +228,52 @@ def test_can_not_delete_colony_invalid_colony_id(
 
     with pytest.raises(ValueError, match="Invalid colony_id"):
         colony_service.delete_colony(-1)
+
+
+@pytest.mark.anyio
+async def test_async_create_colony(test_data: Colony) -> None:
+    colony_repo, hive_repo = AsyncMock(), AsyncMock()
+    colony_repo.create.return_value = test_data
+    colony_service = AsyncColonyService(colony_repo, hive_repo)
+
+    result: Colony | None = await colony_service.create_colony(hive_id=1)
+
+    hive_repo.find_by_hive_id.assert_not_awaited()
+    colony_repo.create.assert_awaited_once_with(1)
+    assert result == test_data
+
+
+@pytest.mark.anyio
+async def test_async_can_not_create_colony_missing_hive() -> None:
+    colony_repo, hive_repo = AsyncMock(), AsyncMock()
+    colony_repo.create.side_effect = LookupError
+    colony_service = AsyncColonyService(colony_repo, hive_repo)
+
+    with pytest.raises(ValueError, match="Invalid hive_id"):
+        await colony_service.create_colony(hive_id=999)
+
+
+def test_find_colonies_by_colony_ids(
+    colony_repo: MagicMock,
+    hive_repo: MagicMock,
+    test_data: Colony,
+    test_data_2: Colony,
+) -> None:
+    colony_repo.find_by_ids.return_value = [test_data, test_data_2]
+    colony_service = ColonyService(colony_repo, hive_repo)
+
+    assert colony_service.find_colonies_by_colony_ids([1, 2]) == [
+        test_data,
+        test_data_2,
+    ]
+    colony_repo.find_by_ids.assert_called_once_with([1, 2])
+
+
+def test_can_not_find_colonies_by_invalid_colony_ids(
+    colony_repo: MagicMock, hive_repo: MagicMock
+) -> None:
+    colony_service = ColonyService(colony_repo, hive_repo)
+
+    with pytest.raises(ValueError, match="Invalid colony_id"):
+        colony_service.find_colonies_by_colony_ids([-1])
+    colony_repo.find_by_ids.assert_not_called()
@@ -0,0 +1,123 @@
+"""Tests for ColonyStateRepository class"""
+
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from models.colony_state import ColonyState
+from repositories.colony_state import (
+    FIND_BY_APIARY_ID_QUERY,
+    FIND_BY_COLONY_ID_QUERY,
+    ROW_FACTORY,
+    AsyncColonyStateRepository,
+    ColonyStateRepository,
+)
+
+STATE = ColonyState(
+    colony_id=1,
+    inspection_id=2,
+    inspection_timestamp=datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC")),
+    observation_id=3,
+    queenright=True,
+    varroa_count=12,
+    chalk_brood=False,
+    foul_brood=False,
+    queen_id=4,
+    queen_colour="Yellow",
+    queen_clipped=True,
+)
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+class TestColonyStateRepository:
+    def test_find_by_colony_id(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [STATE]
+        repo = ColonyStateRepository(db=mock_db)
+
+        result = repo.find_by_colony_id(1)
+
+        mock_db.execute.assert_called_once_with(
+            "SELECT colony_id, inspection_id, inspection_timestamp, observation_id, queenright, varroa_count, chalk_brood, foul_brood, queen_id, queen_colour, queen_clipped FROM colony_states WHERE colony_id = %s LIMIT 1;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == STATE
+
+    def test_find_by_missing_colony_id(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = []
+        repo = ColonyStateRepository(db=mock_db)
+
+        assert repo.find_by_colony_id(999) is None
+
+    def test_find_by_apiary_id(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [STATE]
+        repo = ColonyStateRepository(db=mock_db)
+
+        result = repo.find_by_apiary_id(7)
+
+        mock_db.execute.assert_called_once_with(
+            "SELECT s.colony_id, s.inspection_id, s.inspection_timestamp, s.observation_id, s.queenright, s.varroa_count, s.chalk_brood, s.foul_brood, s.queen_id, s.queen_colour, s.queen_clipped FROM hives h JOIN colonies c ON c.hive_id = h.hive_id JOIN colony_states s ON s.colony_id = c.colony_id WHERE h.apiary_id = %s ORDER BY s.colony_id;",
+            [7],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [STATE]
+
+    def test_find_by_apiary_id_without_colonies(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = []
+        repo = ColonyStateRepository(db=mock_db)
+
+        assert repo.find_by_apiary_id(7) is None
+
+    def test_stream_by_apiary_id(self, mock_db: MagicMock) -> None:
+        mock_db.stream.return_value = iter([STATE])
+        repo = ColonyStateRepository(db=mock_db)
+
+        assert list(repo.stream_by_apiary_id(7)) == [STATE]
+        mock_db.stream.assert_called_once_with(
+            FIND_BY_APIARY_ID_QUERY, [7], row_factory=ROW_FACTORY
+        )
+
+
+@pytest.mark.anyio
+class TestAsyncColonyStateRepository:
+    async def test_find_by_colony_id(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [STATE]
+        repo = AsyncColonyStateRepository(db=mock_async_db)
+
+        result = await repo.find_by_colony_id(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            FIND_BY_COLONY_ID_QUERY, [1], row_factory=ROW_FACTORY
+        )
+        assert result == STATE
+
+    async def test_find_by_apiary_id(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = None
+        repo = AsyncColonyStateRepository(db=mock_async_db)
+
+        assert await repo.find_by_apiary_id(7) is None
+        mock_async_db.execute.assert_awaited_once_with(
+            FIND_BY_APIARY_ID_QUERY, [7], row_factory=ROW_FACTORY
+        )
+
+    async def test_stream_by_apiary_id(
+        self, mock_async_db: AsyncMock, async_rows: Callable[..., AsyncIterator]
+    ) -> None:
+        mock_async_db.stream = MagicMock(return_value=async_rows(STATE))
+        repo = AsyncColonyStateRepository(db=mock_async_db)
+
+        result = [state async for state in repo.stream_by_apiary_id(7)]
+
+        assert result == [STATE]
@@ -0,0 +1,141 @@
+"""Tests for ColonyState routes"""
+
+from collections.abc import AsyncIterator, Callable, Generator
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from models.colony_state import ColonyState
+from schemas.colony_state import ColonyStateRead
+from services.colony_state import ColonyStateService
+from services.dependencies import get_colony_state_service
+
+client = TestClient(app)
+
+STATE = ColonyState(
+    colony_id=1,
+    inspection_id=2,
+    inspection_timestamp=datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC")),
+    observation_id=3,
+    queenright=True,
+    varroa_count=12,
+    chalk_brood=False,
+    foul_brood=False,
+    queen_id=4,
+    queen_colour="Yellow",
+    queen_clipped=True,
+)
+EMPTY_STATE = ColonyState(2, None, None, None, None, None, None, None, None, None, None)
+
+
+@pytest.fixture
+def mock_state_service() -> Generator[AsyncMock, None, None]:
+    mock = AsyncMock()
+    app.dependency_overrides[get_colony_state_service] = lambda: mock
+    yield mock
+    app.dependency_overrides.clear()
+
+
+def read(state: ColonyState) -> dict:
+    return ColonyStateRead.model_validate(state, from_attributes=True).model_dump(
+        mode="json"
+    )
+
+
+class TestColonyStateRoutes:
+    def test_get_colony_state_service_direct(self) -> None:
+        service: ColonyStateService = get_colony_state_service()
+        assert isinstance(service, ColonyStateService)
+
+    def test_get_colony_state(self, mock_state_service: AsyncMock) -> None:
+        mock_state_service.find_state_by_colony_id.return_value = STATE
+
+        response = client.get("/colonies/1/state")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == {
+            "colony_id": 1,
+            "inspection_id": 2,
+            "inspection_timestamp": "2020-06-23T02:10:25Z",
+            "observation_id": 3,
+            "queenright": True,
+            "varroa_count": 12,
+            "chalk_brood": False,
+            "foul_brood": False,
+            "queen_id": 4,
+            "queen_colour": "Yellow",
+            "queen_clipped": True,
+        }
+        mock_state_service.find_state_by_colony_id.assert_called_once_with(colony_id=1)
+
+    def test_get_colony_state_never_inspected(
+        self, mock_state_service: AsyncMock
+    ) -> None:
+        mock_state_service.find_state_by_colony_id.return_value = EMPTY_STATE
+
+        response = client.get("/colonies/2/state")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == read(EMPTY_STATE)
+
+    def test_get_colony_state_not_found(self, mock_state_service: AsyncMock) -> None:
+        mock_state_service.find_state_by_colony_id.return_value = None
+
+        response = client.get("/colonies/999/state")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Colony not found"}
+
+    def test_get_colony_state_invalid_colony_id(
+        self, mock_state_service: AsyncMock
+    ) -> None:
+        mock_state_service.find_state_by_colony_id.side_effect = ValueError(
+            "Invalid colony_id"
+        )
+
+        response = client.get("/colonies/0/state")
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "Invalid colony_id"}
+
+    def test_get_apiary_colony_states(self, mock_state_service: AsyncMock) -> None:
+        mock_state_service.find_states_by_apiary_id.return_value = [STATE, EMPTY_STATE]
+
+        response = client.get("/apiaries/7/states")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == [read(STATE), read(EMPTY_STATE)]
+        mock_state_service.find_states_by_apiary_id.assert_called_once_with(apiary_id=7)
+
+    def test_get_apiary_colony_states_not_found(
+        self, mock_state_service: AsyncMock
+    ) -> None:
+        mock_state_service.find_states_by_apiary_id.return_value = None
+
+        response = client.get("/apiaries/999/states")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "No colonies found for this apiary"}
+
+    def test_get_apiary_colony_states_as_ndjson(
+        self,
+        mock_state_service: AsyncMock,
+        async_rows: Callable[..., AsyncIterator],
+    ) -> None:
+        mock_state_service.stream_states_by_apiary_id = MagicMock(
+            return_value=async_rows(STATE, EMPTY_STATE)
+        )
+
+        response = client.get(
+            "/apiaries/7/states", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert len(response.text.splitlines()) == 2
+        mock_state_service.stream_states_by_apiary_id.assert_called_once_with(
+            apiary_id=7
+        )
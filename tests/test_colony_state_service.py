@@ -0,0 +1,77 @@
+"""Tests for ColonyStateService"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from models.colony_state import ColonyState
+from services.colony_state import AsyncColonyStateService, ColonyStateService
+
+STATE = ColonyState(1, None, None, None, None, None, None, None, None, None, None)
+
+
+@pytest.fixture
+def state_repo() -> MagicMock:
+    return MagicMock()
+
+
+def test_find_state_by_colony_id(state_repo: MagicMock) -> None:
+    state_repo.find_by_colony_id.return_value = STATE
+    service = ColonyStateService(state_repo)
+
+    assert service.find_state_by_colony_id(1) == STATE
+    state_repo.find_by_colony_id.assert_called_once_with(1)
+
+
+def test_find_states_by_apiary_id(state_repo: MagicMock) -> None:
+    state_repo.find_by_apiary_id.return_value = [STATE]
+    service = ColonyStateService(state_repo)
+
+    assert service.find_states_by_apiary_id(7) == [STATE]
+    state_repo.find_by_apiary_id.assert_called_once_with(7)
+
+
+def test_stream_states_by_apiary_id(state_repo: MagicMock) -> None:
+    state_repo.stream_by_apiary_id.return_value = iter([STATE])
+    service = ColonyStateService(state_repo)
+
+    assert list(service.stream_states_by_apiary_id(7)) == [STATE]
+
+
+@pytest.mark.parametrize("colony_id", [0, -1, "1"])
+def test_can_not_find_state_by_invalid_colony_id(
+    state_repo: MagicMock, colony_id: int
+) -> None:
+    service = ColonyStateService(state_repo)
+
+    with pytest.raises(ValueError, match="Invalid colony_id"):
+        service.find_state_by_colony_id(colony_id)
+    state_repo.find_by_colony_id.assert_not_called()
+
+
+def test_can_not_find_states_by_invalid_apiary_id(state_repo: MagicMock) -> None:
+    service = ColonyStateService(state_repo)
+
+    with pytest.raises(ValueError, match="Invalid apiary_id"):
+        service.find_states_by_apiary_id(0)
+    with pytest.raises(ValueError, match="Invalid apiary_id"):
+        service.stream_states_by_apiary_id(-1)
+
+
+@pytest.mark.anyio
+async def test_async_find_state_by_colony_id() -> None:
+    state_repo = AsyncMock()
+    state_repo.find_by_colony_id.return_value = STATE
+    service = AsyncColonyStateService(state_repo)
+
+    assert await service.find_state_by_colony_id(1) == STATE
+    state_repo.find_by_colony_id.assert_awaited_once_with(1)
+
+
+@pytest.mark.anyio
+async def test_async_find_states_by_apiary_id() -> None:
+    state_repo = AsyncMock()
+    state_repo.find_by_apiary_id.return_value = [STATE]
+    service = AsyncColonyStateService(state_repo)
+
+    assert await service.find_states_by_apiary_id(7) == [STATE]
@@ -25,6 +25,26 @@ class TestDatabaseConfiguration:
         assert db_conf.user is None
         assert db_conf.dbname is None
         assert db_conf.password is None
+        assert db_conf.stream_itersize == 1000
+        assert db_conf.slow_query_ms == 200
+        assert db_conf.prepare_threshold == 0
+        assert db_conf.prepared_max == 256
+
+    def test_prepared_statements_configuration(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("POSTGRES_PREPARE_THRESHOLD", "5")
+        monkeypatch.setenv("POSTGRES_PREPARED_MAX", "50")
+        db_conf: DatabaseConfiguration = DatabaseConfiguration("invalid_filename.txt")
+        assert db_conf.prepare_threshold == 5
+        assert db_conf.prepared_max == 50
+
+    def test_prepared_statements_disabled(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("POSTGRES_PREPARE_THRESHOLD", "None")
+        db_conf: DatabaseConfiguration = DatabaseConfiguration("invalid_filename.txt")
+        assert db_conf.prepare_threshold is None
 
 
 if __name__ == "__main__":
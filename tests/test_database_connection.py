@@ -1,11 +1,14 @@
 """Integration tests for PostgreSQL database connection."""
 
 from collections.abc import Generator
+from unittest.mock import MagicMock
 
 import pytest
+from psycopg.rows import class_row
 
 from db.database_configuration import DatabaseConfiguration
 from db.database_connection import DatabaseConnection
+from models.hive import Hive
 
 
 @pytest.fixture(scope="module")
@@ -80,3 +83,187 @@ def test_seed_without_connection() -> None:
     with pytest.raises(ConnectionError) as excinfo:
         db.seed("seeds/valid_test_data.sql")
     assert "No connection to" in str(excinfo.value)
+
+
+@pytest.fixture
+def pooled_db() -> Generator[DatabaseConnection, None, None]:
+    """Provides a pooled DatabaseConnection instance for tests."""
+    config: DatabaseConfiguration = DatabaseConfiguration(".env")
+    config.pool_min_size = 1
+    config.pool_max_size = 2
+    db: DatabaseConnection = DatabaseConnection(config, pooled=True)
+    db.connect()
+    yield db
+    db.close()
+
+
+def test_pooled_connection_opens_pool(pooled_db: DatabaseConnection) -> None:
+    assert pooled_db.pool is not None
+    assert pooled_db.pool.closed is False
+    assert pooled_db.connection is None
+
+
+def test_pooled_execute(pooled_db: DatabaseConnection) -> None:
+    assert pooled_db.execute("SELECT 1 AS one;", []) == [{"one": 1}]
+
+
+def test_pooled_execute_with_row_factory(pooled_db: DatabaseConnection) -> None:
+    """A row factory builds each row directly, without an intermediate dict."""
+    results = pooled_db.execute(
+        "SELECT 1 AS hive_id, 'Hive 1' AS name, 2 AS apiary_id;",
+        [],
+        row_factory=class_row(Hive),
+    )
+    assert results == [Hive(hive_id=1, name="Hive 1", apiary_id=2)]
+
+
+def test_pooled_checkout_reuses_connection(pooled_db: DatabaseConnection) -> None:
+    """Queries inside a checkout block should share one backend connection."""
+    with pooled_db.checkout():
+        first = pooled_db.execute("SELECT pg_backend_pid() AS pid;", [])
+        second = pooled_db.execute("SELECT pg_backend_pid() AS pid;", [])
+    assert first == second
+
+
+def test_pooled_execute_prepares_statements(pooled_db: DatabaseConnection) -> None:
+    """Statements are prepared on their connection, and one-off ones can opt out."""
+    query = "SELECT %s::int AS n;"
+    with pooled_db.checkout() as connection:
+        assert connection.prepared_max == pooled_db.db.prepared_max
+        pooled_db.execute(query, [1])
+        pooled_db.execute("SELECT 2 AS n;", [], prepare=False)
+        prepared = pooled_db.execute(
+            "SELECT statement FROM pg_prepared_statements;", [], prepare=False
+        )
+    statements = [row["statement"] for row in prepared or []]
+    assert "SELECT $1::int AS n;" in statements
+    assert "SELECT 2 AS n;" not in statements
+
+
+def test_pooled_checkout_timeout_raises_connection_error(
+    pooled_db: DatabaseConnection,
+) -> None:
+    """Waiting longer than the pool timeout for a connection should raise ConnectionError."""
+    pooled_db.db.pool_timeout = 0.1
+    pooled_db.pool.timeout = 0.1
+    first = pooled_db.pool.getconn()
+    second = pooled_db.pool.getconn()
+    try:
+        with pytest.raises(ConnectionError) as excinfo:
+            pooled_db.execute("SELECT 1;", [])
+        assert "No free connection" in str(excinfo.value)
+    finally:
+        pooled_db.pool.putconn(first)
+        pooled_db.pool.putconn(second)
+
+
+def test_close_pool(pooled_db: DatabaseConnection) -> None:
+    pooled_db.close()
+    assert pooled_db.pool.closed is True
+
+
+def test_invalid_pooled_connection_configuration() -> None:
+    """Opening a pool with invalid credentials should raise ConnectionError."""
+    config: DatabaseConfiguration = DatabaseConfiguration()
+    config.url = "host=invalid_host port=5432 user=invalid_user dbname=nonexistent_db"
+    config.pool_timeout = 0.5
+
+    db: DatabaseConnection = DatabaseConnection(config, pooled=True)
+    with pytest.raises(ConnectionError) as excinfo:
+        db.connect()
+    assert "Couldn't connect" in str(excinfo.value)
+
+
+def test_pooled_connect_twice_keeps_pool(pooled_db: DatabaseConnection) -> None:
+    """A second connect() should not replace (and leak) the open pool."""
+    pool = pooled_db.pool
+    pooled_db.connect()
+    assert pooled_db.pool is pool
+
+
+def test_pooled_transaction_rolls_back_on_error(pooled_db: DatabaseConnection) -> None:
+    """Nothing written inside a failed transaction block should persist."""
+    pooled_db.seed("seeds/valid_test_data.sql")
+    pooled_db.execute("TRUNCATE TABLE test_seed_data;", [])
+
+    def write_then_fail() -> None:
+        with pooled_db.transaction():
+            pooled_db.copy("COPY test_seed_data (id, name) FROM STDIN;", [[5, "moth"]])
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        write_then_fail()
+    assert pooled_db.execute("SELECT * FROM test_seed_data;", []) == []
+
+
+def test_pooled_unit_of_work_rolls_back_on_error(
+    pooled_db: DatabaseConnection,
+) -> None:
+    """A failed nested unit of work should undo only its own writes."""
+    pooled_db.seed("seeds/valid_test_data.sql")
+    pooled_db.execute("TRUNCATE TABLE test_seed_data;", [])
+
+    def write_then_fail() -> None:
+        with pooled_db.unit_of_work():
+            pooled_db.execute("INSERT INTO test_seed_data VALUES (9, 'mite');", [])
+            raise RuntimeError
+
+    with pooled_db.unit_of_work():
+        pooled_db.execute("INSERT INTO test_seed_data VALUES (8, 'bee');", [])
+        with pytest.raises(RuntimeError):
+            write_then_fail()
+    assert pooled_db.execute("SELECT * FROM test_seed_data;", []) == [
+        {"id": 8, "name": "bee"}
+    ]
+
+
+def test_pooled_execute_missing_reference(pooled_db: DatabaseConnection) -> None:
+    """A write rejected by a foreign key should raise LookupError naming it."""
+
+    def insert_orphan() -> None:
+        with pooled_db.transaction():
+            pooled_db.execute("CREATE TEMP TABLE parent (id integer PRIMARY KEY);", [])
+            pooled_db.execute(
+                "CREATE TEMP TABLE child (parent_id integer REFERENCES parent (id));",
+                [],
+            )
+            pooled_db.execute("INSERT INTO child VALUES (%s);", [1])
+
+    with pytest.raises(LookupError, match="child_parent_id_fkey"):
+        insert_orphan()
+
+
+def test_pooled_executemany_missing_reference(pooled_db: DatabaseConnection) -> None:
+    """A pipelined write rejected by a foreign key should raise LookupError too."""
+
+    def insert_orphans() -> None:
+        with pooled_db.transaction():
+            pooled_db.execute("CREATE TEMP TABLE parent (id integer PRIMARY KEY);", [])
+            pooled_db.execute(
+                "CREATE TEMP TABLE child (parent_id integer REFERENCES parent (id));",
+                [],
+            )
+            pooled_db.executemany("INSERT INTO child VALUES (%s);", [[1], [2]])
+
+    with pytest.raises(LookupError, match="child_parent_id_fkey"):
+        insert_orphans()
+
+
+def test_pooled_execute_calls_hooks(pooled_db: DatabaseConnection) -> None:
+    """Every statement should be reported to the query hooks once it completes."""
+    hook = MagicMock()
+    pooled_db.hooks.append(hook)
+    try:
+        pooled_db.execute("SELECT generate_series(1, %s) AS n;", [3])
+    finally:
+        pooled_db.hooks.remove(hook)
+
+    event = hook.call_args.args[0]
+    assert event.statement == "SELECT generate_series(...) AS n"
+    assert event.rows == 3
+
+
+def test_pooled_stream(pooled_db: DatabaseConnection) -> None:
+    """Rows from a server-side cursor should arrive in order across fetches."""
+    rows = list(pooled_db.stream("SELECT generate_series(1, 5) AS n;", [], size=2))
+    assert rows == [{"n": n} for n in range(1, 6)]
@@ -0,0 +1,152 @@
+"""Tests for the dependency container and the providers routes depend on"""
+
+from collections.abc import AsyncIterator, Generator
+from contextlib import asynccontextmanager
+from typing import Annotated
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from main import app
+from models.hive import Hive
+from models.user import User
+from services.container import Container
+from services.dependencies import (
+    UnitOfWork,
+    container,
+    get_apiary_service,
+    get_hive_service,
+    get_ingest_service,
+    get_user_service,
+)
+from utils.instance import hashing_executor
+
+client = TestClient(app)
+
+
+class ScopedConnection:
+    """Stands in for async_db, counting the request scopes entered and queries made"""
+
+    def __init__(self, result: list) -> None:
+        self.result = result
+        self.scopes = 0
+        self.queries = 0
+        self.units: list[str] = []
+
+    @asynccontextmanager
+    async def request_scope(self) -> AsyncIterator[None]:
+        self.scopes += 1
+        yield
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        self.units.append("begin")
+        try:
+            yield
+        except HTTPException:
+            self.units.append("rollback")
+            raise
+        self.units.append("commit")
+
+    async def execute(self, _query: str, _params: list, **_options: object) -> list:
+        self.queries += 1
+        return self.result
+
+
+@pytest.fixture
+def scoped() -> Generator[ScopedConnection, None, None]:
+    connection = ScopedConnection([Hive(1, "Hive 1", 1)])
+    with patch(
+        "services.dependencies.container",
+        Container(db=connection, hasher=hashing_executor),
+    ):
+        yield connection
+
+
+class TestContainer:
+    def test_services_are_built_once(self) -> None:
+        assert get_hive_service() is get_hive_service()
+        assert get_hive_service() is container.hive_service
+        assert get_ingest_service() is container.ingest_service
+        assert get_user_service() is container.user_service
+
+    def test_services_share_repositories(self) -> None:
+        assert get_hive_service().apiary_repo is get_apiary_service().apiary_repo
+        assert container.hierarchy_service.hive_repo is container.hive_repo
+        assert container.ingest_service.colony_repo is container.colony_repo
+
+    def test_repositories_query_through_one_connection(self) -> None:
+        db = MagicMock()
+
+        built = Container(db=db, hasher=hashing_executor)
+
+        assert built.hive_repo.db is db
+        assert built.observation_repo.db is db
+        assert built.ingest_service.db is db
+        assert built.user_service.rounds == hashing_executor.rounds
+
+
+class TestRequestScope:
+    def test_a_request_is_served_in_one_scope(self, scoped: ScopedConnection) -> None:
+        response = client.get("/hives/1")
+
+        assert response.status_code == 200, response.text
+        assert scoped.scopes == 1
+        assert scoped.queries == 1
+
+    def test_overridden_services_enter_no_scope(self, scoped: ScopedConnection) -> None:
+        service = AsyncMock()
+        service.find_hive_by_hive_id.return_value = Hive(1, "Hive 1", 1)
+        app.dependency_overrides[get_hive_service] = lambda: service
+        try:
+            response = client.get("/hives/1")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert scoped.scopes == 0
+
+    def test_user_routes_enter_no_scope(self, scoped: ScopedConnection) -> None:
+        scoped.result = [User(1, "user1", "hash")]
+
+        response = client.get("/users/id/1")
+
+        assert response.status_code == 200, response.text
+        assert scoped.scopes == 0
+
+
+class TestUnitOfWork:
+    @pytest.fixture
+    def unit_client(self) -> TestClient:
+        unit_app = FastAPI()
+
+        @unit_app.get("/hives/{hive_id}", dependencies=[UnitOfWork])
+        async def read_hive(
+            hive_id: int, service: Annotated[object, Depends(get_hive_service)]
+        ) -> dict:
+            hive = await service.find_hive_by_hive_id(hive_id)
+            if hive_id == 2:
+                raise HTTPException(status_code=409, detail="Conflict")
+            return {"hive_id": hive.hive_id}
+
+        return TestClient(unit_app)
+
+    def test_a_request_commits_as_one_unit(
+        self, scoped: ScopedConnection, unit_client: TestClient
+    ) -> None:
+        response = unit_client.get("/hives/1")
+
+        assert response.status_code == 200, response.text
+        assert scoped.units == ["begin", "commit"]
+        assert scoped.scopes == 1
+        assert scoped.queries == 1
+
+    def test_a_failed_request_rolls_back(
+        self, scoped: ScopedConnection, unit_client: TestClient
+    ) -> None:
+        response = unit_client.get("/hives/2")
+
+        assert response.status_code == 409
+        assert scoped.units == ["begin", "rollback"]
@@ -0,0 +1,64 @@
+"""Tests for HashingExecutor class"""
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+
+from utils.hashing import PasswordHasher
+from utils.hashing_executor import (
+    HashingBusyError,
+    HashingConfiguration,
+    HashingExecutor,
+)
+
+
+@pytest.fixture(scope="module")
+def hasher() -> Iterator[HashingExecutor]:
+    config = HashingConfiguration("missing.env")
+    config.rounds, config.workers, config.max_pending = 4, 1, 2
+    executor = HashingExecutor(config)
+    yield executor
+    executor.close()
+
+
+def test_default_configuration_values() -> None:
+    config = HashingConfiguration("missing.env")
+
+    assert config.rounds == PasswordHasher.DEFAULT_ROUNDS
+    assert config.workers >= 1
+    assert config.max_pending == config.workers * 4
+
+
+@pytest.mark.anyio
+async def test_hash_and_verify(hasher: HashingExecutor) -> None:
+    hashed_password = await hasher.hash("password")
+
+    assert hashed_password.startswith("$2b$04$")
+    assert await hasher.verify("password", hashed_password) is True
+    assert await hasher.verify("wrong password", hashed_password) is False
+    assert hasher.pending == 0
+
+
+@pytest.mark.anyio
+async def test_busy_when_queue_is_full(hasher: HashingExecutor) -> None:
+    jobs = [asyncio.create_task(hasher.hash("password")) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(HashingBusyError):
+        await hasher.hash("password")
+    await asyncio.gather(*jobs)
+    assert hasher.pending == 0
+
+
+def test_needs_rehash(hasher: HashingExecutor) -> None:
+    assert hasher.needs_rehash(PasswordHasher.hash("password", rounds=4)) is False
+    assert hasher.needs_rehash(PasswordHasher.hash("password", rounds=5)) is True
+
+
+def test_close_without_start() -> None:
+    executor = HashingExecutor(HashingConfiguration("missing.env"))
+
+    executor.close()
+
+    assert executor.pool is None
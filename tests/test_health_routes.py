@@ -0,0 +1,47 @@
+"""Tests for health routes"""
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from services.dependencies import get_async_db
+
+client: TestClient = TestClient(app)
+
+
+@pytest.fixture
+def mock_async_db() -> Generator[AsyncMock, None, None]:
+    mock: AsyncMock = AsyncMock()
+    app.dependency_overrides[get_async_db] = lambda: mock
+    yield mock
+    app.dependency_overrides.clear()
+
+
+class TestHealthRoutes:
+    def test_live(self) -> None:
+        response = client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    def test_ready_when_database_answers(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.ping.return_value = True
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+        mock_async_db.ping.assert_awaited_once()
+
+    def test_not_ready_when_database_unavailable(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.ping.return_value = False
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json() == {"detail": "Database unavailable"}
@@ -0,0 +1,263 @@
+"""Tests for HierarchyService"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from models.apiary import Apiary
+from models.colony import Colony
+from models.hive import Hive
+from models.inspection import Inspection
+from models.observation import Observation
+from models.queen import Queen
+from services.hierarchy import AsyncHierarchyService, HierarchyService
+
+TIMESTAMP = datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC"))
+
+APIARY = Apiary(apiary_id=1, name="Happy Bees", location="Kent", user_id=1)
+HIVES = [
+    Hive(hive_id=1, name="Hive 1", apiary_id=1),
+    Hive(hive_id=2, name="Hive 2", apiary_id=1),
+]
+COLONIES = [Colony(colony_id=10, hive_id=1), Colony(colony_id=20, hive_id=2)]
+QUEENS = [Queen(queen_id=100, colour="Yellow", clipped=True, colony_id=10)]
+INSPECTIONS = [
+    Inspection(inspection_id=1000, inspection_timestamp=TIMESTAMP, colony_id=10)
+]
+OBSERVATIONS = [
+    Observation(
+        observation_id=5,
+        queenright=True,
+        queen_cells=0,
+        bias=True,
+        brood_frames=4,
+        store_frames=2,
+        chalk_brood=False,
+        foul_brood=False,
+        varroa_count=3,
+        temper=1,
+        notes="calm",
+        inspection_id=1000,
+    )
+]
+
+
+def repos(mock: type[MagicMock]) -> dict[str, MagicMock]:
+    apiary_repo, hive_repo, colony_repo = mock(), mock(), mock()
+    queen_repo, inspection_repo, observation_repo = mock(), mock(), mock()
+    apiary_repo.find_by_apiary_id.return_value = APIARY
+    hive_repo.find_by_apiary_id.return_value = HIVES
+    colony_repo.find_by_hive_ids.return_value = COLONIES
+    queen_repo.find_by_colony_ids.return_value = QUEENS
+    inspection_repo.find_latest_by_colony_ids.return_value = INSPECTIONS
+    observation_repo.find_by_inspection_ids.return_value = OBSERVATIONS
+    return {
+        "apiary_repo": apiary_repo,
+        "hive_repo": hive_repo,
+        "colony_repo": colony_repo,
+        "queen_repo": queen_repo,
+        "inspection_repo": inspection_repo,
+        "observation_repo": observation_repo,
+    }
+
+
+@pytest.fixture
+def mock_repos() -> dict[str, MagicMock]:
+    return repos(MagicMock)
+
+
+@pytest.fixture
+def mock_async_repos() -> dict[str, AsyncMock]:
+    return repos(AsyncMock)
+
+
+class TestHierarchyService:
+    def test_full_tree(self, mock_repos: dict[str, MagicMock]) -> None:
+        service = HierarchyService(**mock_repos)
+
+        tree = service.find_apiary_tree(1)
+
+        assert tree.model_dump(exclude_unset=True) == {
+            "apiary_id": 1,
+            "name": "Happy Bees",
+            "location": "Kent",
+            "user_id": 1,
+            "hives": [
+                {
+                    "hive_id": 1,
+                    "name": "Hive 1",
+                    "apiary_id": 1,
+                    "colonies": [
+                        {
+                            "colony_id": 10,
+                            "hive_id": 1,
+                            "queens": [
+                                {
+                                    "queen_id": 100,
+                                    "colour": "Yellow",
+                                    "clipped": True,
+                                    "colony_id": 10,
+                                }
+                            ],
+                            "latest_inspection": {
+                                "inspection_id": 1000,
+                                "inspection_timestamp": TIMESTAMP,
+                                "colony_id": 10,
+                                "observations": [
+                                    {
+                                        "observation_id": 5,
+                                        "queenright": True,
+                                        "queen_cells": 0,
+                                        "bias": True,
+                                        "brood_frames": 4,
+                                        "store_frames": 2,
+                                        "chalk_brood": False,
+                                        "foul_brood": False,
+                                        "varroa_count": 3,
+                                        "temper": 1,
+                                        "notes": "calm",
+                                        "inspection_id": 1000,
+                                    }
+                                ],
+                            },
+                        }
+                    ],
+                },
+                {
+                    "hive_id": 2,
+                    "name": "Hive 2",
+                    "apiary_id": 1,
+                    "colonies": [
+                        {
+                            "colony_id": 20,
+                            "hive_id": 2,
+                            "queens": [],
+                            "latest_inspection": None,
+                        }
+                    ],
+                },
+            ],
+        }
+
+    def test_one_query_per_level(self, mock_repos: dict[str, MagicMock]) -> None:
+        service = HierarchyService(**mock_repos)
+
+        service.find_apiary_tree(1)
+
+        mock_repos["hive_repo"].find_by_apiary_id.assert_called_once_with(apiary_id=1)
+        mock_repos["colony_repo"].find_by_hive_ids.assert_called_once_with([1, 2])
+        mock_repos["queen_repo"].find_by_colony_ids.assert_called_once_with([10, 20])
+        mock_repos["inspection_repo"].find_latest_by_colony_ids.assert_called_once_with(
+            [10, 20]
+        )
+        mock_repos["observation_repo"].find_by_inspection_ids.assert_called_once_with(
+            [1000]
+        )
+
+    def test_depth_zero_is_the_apiary_alone(
+        self, mock_repos: dict[str, MagicMock]
+    ) -> None:
+        service = HierarchyService(**mock_repos)
+
+        tree = service.find_apiary_tree(1, depth=0)
+
+        assert "hives" not in tree.model_dump(exclude_unset=True)
+        mock_repos["hive_repo"].find_by_apiary_id.assert_not_called()
+
+    def test_depth_stops_at_colonies(self, mock_repos: dict[str, MagicMock]) -> None:
+        service = HierarchyService(**mock_repos)
+
+        tree = service.find_apiary_tree(1, depth=2)
+
+        assert tree.hives[0].colonies[0].model_dump(exclude_unset=True) == {
+            "colony_id": 10,
+            "hive_id": 1,
+        }
+        mock_repos["queen_repo"].find_by_colony_ids.assert_not_called()
+        mock_repos["inspection_repo"].find_latest_by_colony_ids.assert_not_called()
+
+    def test_include_skips_other_branches(
+        self, mock_repos: dict[str, MagicMock]
+    ) -> None:
+        service = HierarchyService(**mock_repos)
+
+        tree = service.find_apiary_tree(1, include=frozenset({"queens"}))
+
+        colony = tree.hives[0].colonies[0].model_dump(exclude_unset=True)
+        assert "queens" in colony
+        assert "latest_inspection" not in colony
+        mock_repos["inspection_repo"].find_latest_by_colony_ids.assert_not_called()
+        mock_repos["observation_repo"].find_by_inspection_ids.assert_not_called()
+
+    def test_apiary_without_hives(self, mock_repos: dict[str, MagicMock]) -> None:
+        mock_repos["hive_repo"].find_by_apiary_id.return_value = None
+        service = HierarchyService(**mock_repos)
+
+        tree = service.find_apiary_tree(1)
+
+        assert tree.hives == []
+        mock_repos["colony_repo"].find_by_hive_ids.assert_not_called()
+
+    def test_apiary_not_found(self, mock_repos: dict[str, MagicMock]) -> None:
+        mock_repos["apiary_repo"].find_by_apiary_id.return_value = None
+        service = HierarchyService(**mock_repos)
+
+        assert service.find_apiary_tree(999) is None
+        mock_repos["hive_repo"].find_by_apiary_id.assert_not_called()
+
+    @pytest.mark.parametrize("depth", [-1, 5])
+    def test_invalid_depth(self, mock_repos: dict[str, MagicMock], depth: int) -> None:
+        service = HierarchyService(**mock_repos)
+
+        with pytest.raises(ValueError, match="depth must be between 0 and 4"):
+            service.find_apiary_tree(1, depth=depth)
+
+    def test_invalid_include(self, mock_repos: dict[str, MagicMock]) -> None:
+        service = HierarchyService(**mock_repos)
+
+        with pytest.raises(ValueError, match="include must be one of"):
+            service.find_apiary_tree(1, include=frozenset({"actions"}))
+
+
+@pytest.mark.anyio
+class TestAsyncHierarchyService:
+    async def test_full_tree(self, mock_async_repos: dict[str, AsyncMock]) -> None:
+        service = AsyncHierarchyService(**mock_async_repos)
+
+        tree = await service.find_apiary_tree(1)
+
+        colony = tree.hives[0].colonies[0]
+        assert colony.queens[0].queen_id == 100
+        assert colony.latest_inspection.inspection_id == 1000
+        assert colony.latest_inspection.observations[0].observation_id == 5
+        assert tree.hives[1].colonies[0].latest_inspection is None
+        mock_async_repos["colony_repo"].find_by_hive_ids.assert_awaited_once_with(
+            [1, 2]
+        )
+
+    async def test_depth_stops_at_latest_inspection(
+        self, mock_async_repos: dict[str, AsyncMock]
+    ) -> None:
+        service = AsyncHierarchyService(**mock_async_repos)
+
+        tree = await service.find_apiary_tree(1, depth=3)
+
+        inspection = tree.hives[0].colonies[0].latest_inspection
+        assert "observations" not in inspection.model_dump(exclude_unset=True)
+        mock_async_repos["observation_repo"].find_by_inspection_ids.assert_not_awaited()
+
+    async def test_apiary_not_found(
+        self, mock_async_repos: dict[str, AsyncMock]
+    ) -> None:
+        mock_async_repos["apiary_repo"].find_by_apiary_id.return_value = None
+        service = AsyncHierarchyService(**mock_async_repos)
+
+        assert await service.find_apiary_tree(999) is None
+
+    async def test_invalid_depth(self, mock_async_repos: dict[str, AsyncMock]) -> None:
+        service = AsyncHierarchyService(**mock_async_repos)
+
+        with pytest.raises(ValueError, match="depth must be between 0 and 4"):
+            await service.find_apiary_tree(1, depth=9)
@@ -1,11 +1,12 @@
 """Tests for the HiveRepository class"""
 
-from unittest.mock import MagicMock
+from collections.abc import AsyncIterator, Callable
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from models.hive import Hive
-from repositories.hive import HiveRepository
+from repositories.hive import ROW_FACTORY, AsyncHiveRepository, HiveRepository
 
 
 @pytest.fixture
@@ -50,19 +51,20 @@ class TestHiveRepository:
 
     def test_can_find_hive_by_valid_hive_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "hive_id": self.test_hive.hive_id,
-                "name": self.test_hive.name,
-                "apiary_id": self.test_hive.apiary_id,
-            }
+            Hive(
+                hive_id=self.test_hive.hive_id,
+                name=self.test_hive.name,
+                apiary_id=self.test_hive.apiary_id,
+            )
         ]
         repo: HiveRepository = HiveRepository(db=mock_db)
 
         result: Hive | None = repo.find_by_hive_id(self.test_hive.hive_id)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM hives WHERE hive_id = %s LIMIT 1;",
+            "SELECT hive_id, name, apiary_id FROM hives WHERE hive_id = %s LIMIT 1;",
             [self.test_hive.hive_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(result, Hive)
         assert result.hive_id == self.test_hive.hive_id
@@ -76,30 +78,33 @@ class TestHiveRepository:
         result: Hive | None = repo.find_by_hive_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM hives WHERE hive_id = %s LIMIT 1;", [999]
+            "SELECT hive_id, name, apiary_id FROM hives WHERE hive_id = %s LIMIT 1;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_can_find_hives_by_valid_apiary_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "hive_id": self.test_hive.hive_id,
-                "name": self.test_hive.name,
-                "apiary_id": self.test_hive.apiary_id,
-            },
-            {
-                "hive_id": self.test_hive_2.hive_id,
-                "name": self.test_hive_2.name,
-                "apiary_id": self.test_hive_2.apiary_id,
-            },
+            Hive(
+                hive_id=self.test_hive.hive_id,
+                name=self.test_hive.name,
+                apiary_id=self.test_hive.apiary_id,
+            ),
+            Hive(
+                hive_id=self.test_hive_2.hive_id,
+                name=self.test_hive_2.name,
+                apiary_id=self.test_hive_2.apiary_id,
+            ),
         ]
         repo: HiveRepository = HiveRepository(db=mock_db)
 
         result: Hive | None = repo.find_by_apiary_id(self.test_hive.hive_id)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM hives WHERE apiary_id = %s;",
+            "SELECT hive_id, name, apiary_id FROM hives WHERE apiary_id = %s ORDER BY hive_id;",
             [self.test_hive.hive_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(result, list)
         assert result[0].hive_id == self.test_hive.hive_id
@@ -116,33 +121,37 @@ class TestHiveRepository:
         result: Hive | None = repo.find_by_apiary_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM hives WHERE apiary_id = %s;", [999]
+            "SELECT hive_id, name, apiary_id FROM hives WHERE apiary_id = %s ORDER BY hive_id;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_read_full_db_returns_all(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "hive_id": self.test_hive.hive_id,
-                "name": self.test_hive.name,
-                "apiary_id": self.test_hive.apiary_id,
-            },
-            {
-                "hive_id": self.test_hive_2.hive_id,
-                "name": self.test_hive_2.name,
-                "apiary_id": self.test_hive_2.apiary_id,
-            },
-            {
-                "hive_id": self.test_hive_3.hive_id,
-                "name": self.test_hive_3.name,
-                "apiary_id": self.test_hive_3.apiary_id,
-            },
+            Hive(
+                hive_id=self.test_hive.hive_id,
+                name=self.test_hive.name,
+                apiary_id=self.test_hive.apiary_id,
+            ),
+            Hive(
+                hive_id=self.test_hive_2.hive_id,
+                name=self.test_hive_2.name,
+                apiary_id=self.test_hive_2.apiary_id,
+            ),
+            Hive(
+                hive_id=self.test_hive_3.hive_id,
+                name=self.test_hive_3.name,
+                apiary_id=self.test_hive_3.apiary_id,
+            ),
         ]
         repo: HiveRepository = HiveRepository(db=mock_db)
 
         results: list[Hive] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM hives;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT hive_id, name, apiary_id FROM hives;", [], row_factory=ROW_FACTORY
+        )
         assert isinstance(results, (list, Hive))
         assert results[0].hive_id == 1
         assert results[1].hive_id == 2
@@ -155,17 +164,13 @@ class TestHiveRepository:
 
         result: list[Hive] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM hives;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT hive_id, name, apiary_id FROM hives;", [], row_factory=ROW_FACTORY
+        )
         assert result is None
 
     def test_can_update_valid_hive(self, mock_db: MagicMock) -> None:
-        mock_db.execute.return_value = [
-            {
-                "hive_id": self.test_hive.hive_id,
-                "name": "UPDATED",
-                "apiary_id": self.test_hive.apiary_id,
-            }
-        ]
+        mock_db.execute.return_value = [{"hive_id": self.test_hive.hive_id}]
         repo: HiveRepository = HiveRepository(mock_db)
 
         result: list[Hive] = repo.update(1, "UPDATED", 1)
@@ -215,3 +220,155 @@ class TestHiveRepository:
             "DELETE FROM hives WHERE hive_id = %s RETURNING hive_id;", [999]
         )
         assert result is False
+
+    def test_read_page(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [Hive(hive_id=3, name="Hive 3", apiary_id=1)]
+        repo: HiveRepository = HiveRepository(db=mock_db)
+
+        result: list[Hive] | None = repo.read(limit=1, after=2)
+
+        mock_db.execute.assert_called_once_with(
+            "SELECT hive_id, name, apiary_id FROM hives WHERE hive_id > %s ORDER BY hive_id LIMIT %s;",
+            [2, 1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [Hive(3, "Hive 3", 1)]
+
+    def test_find_page_by_apiary_id(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = []
+        repo: HiveRepository = HiveRepository(db=mock_db)
+
+        result: list[Hive] | None = repo.find_by_apiary_id(1, limit=10)
+
+        mock_db.execute.assert_called_once_with(
+            "SELECT hive_id, name, apiary_id FROM hives WHERE apiary_id = %s AND hive_id > %s ORDER BY hive_id LIMIT %s;",
+            [1, 0, 10],
+            row_factory=ROW_FACTORY,
+        )
+        assert result is None
+
+    def test_stream_by_apiary_id(self, mock_db: MagicMock) -> None:
+        mock_db.stream.return_value = iter(
+            [Hive(hive_id=1, name="Hive 1", apiary_id=1)]
+        )
+        repo: HiveRepository = HiveRepository(db=mock_db)
+
+        result: list[Hive] = list(repo.stream_by_apiary_id(1))
+
+        mock_db.stream.assert_called_once_with(
+            "SELECT hive_id, name, apiary_id FROM hives WHERE apiary_id = %s ORDER BY hive_id;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [Hive(1, "Hive 1", 1)]
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.mark.anyio
+class TestAsyncHiveRepository:
+    test_hive: Hive = Hive(hive_id=1, name="Hive 1", apiary_id=1)
+
+    async def test_create_hive(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [{"hive_id": self.test_hive.hive_id}]
+        repo: AsyncHiveRepository = AsyncHiveRepository(db=mock_async_db)
+
+        result: Hive | None = await repo.create(
+            self.test_hive.name, self.test_hive.apiary_id
+        )
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "INSERT INTO hives (name, apiary_id) VALUES (%s, %s) RETURNING hive_id;",
+            [self.test_hive.name, self.test_hive.apiary_id],
+        )
+        assert result == self.test_hive
+
+    async def test_can_find_hive_by_valid_hive_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = [
+            Hive(hive_id=1, name="Hive 1", apiary_id=1)
+        ]
+        repo: AsyncHiveRepository = AsyncHiveRepository(db=mock_async_db)
+
+        result: Hive | None = await repo.find_by_hive_id(self.test_hive.hive_id)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT hive_id, name, apiary_id FROM hives WHERE hive_id = %s LIMIT 1;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == self.test_hive
+
+    async def test_can_find_hives_by_valid_apiary_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = [
+            Hive(hive_id=1, name="Hive 1", apiary_id=1)
+        ]
+        repo: AsyncHiveRepository = AsyncHiveRepository(db=mock_async_db)
+
+        result: list[Hive] | None = await repo.find_by_apiary_id(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT hive_id, name, apiary_id FROM hives WHERE apiary_id = %s ORDER BY hive_id;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [self.test_hive]
+
+    async def test_can_not_delete_invalid_hive(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = []
+        repo: AsyncHiveRepository = AsyncHiveRepository(db=mock_async_db)
+
+        result: bool = await repo.delete(999)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "DELETE FROM hives WHERE hive_id = %s RETURNING hive_id;", [999]
+        )
+        assert result is False
+
+    async def test_stream_by_apiary_id(
+        self, mock_async_db: AsyncMock, async_rows: Callable[..., AsyncIterator]
+    ) -> None:
+        mock_async_db.stream = MagicMock(
+            return_value=async_rows(Hive(hive_id=1, name="Hive 1", apiary_id=1))
+        )
+        repo: AsyncHiveRepository = AsyncHiveRepository(db=mock_async_db)
+
+        result: list[Hive] = [hive async for hive in repo.stream_by_apiary_id(1)]
+
+        mock_async_db.stream.assert_called_once_with(
+            "SELECT hive_id, name, apiary_id FROM hives WHERE apiary_id = %s ORDER BY hive_id;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [Hive(1, "Hive 1", 1)]
+
+
+def test_find_by_ids(mock_db: MagicMock) -> None:
+    mock_db.execute.return_value = None
+    repo = HiveRepository(db=mock_db)
+
+    assert repo.find_by_ids([2, 1]) == []
+    mock_db.execute.assert_called_once_with(
+        "SELECT hive_id, name, apiary_id FROM hives WHERE hive_id = ANY(%s) ORDER BY hive_id;",
+        [[2, 1]],
+        row_factory=ROW_FACTORY,
+    )
+
+
+@pytest.mark.anyio
+async def test_async_find_by_ids(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = ["row"]
+    repo = AsyncHiveRepository(db=mock_async_db)
+
+    assert await repo.find_by_ids((1, 2)) == ["row"]
+    mock_async_db.execute.assert_awaited_once_with(
+        "SELECT hive_id, name, apiary_id FROM hives WHERE hive_id = ANY(%s) ORDER BY hive_id;",
+        [[1, 2]],
+        row_factory=ROW_FACTORY,
+    )
@@ -1,7 +1,8 @@
 """Tests for hive routes"""
 
-from collections.abc import Generator
-from unittest.mock import MagicMock
+import json
+from collections.abc import AsyncIterator, Callable, Generator
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -10,13 +11,14 @@ from main import app
 from models.hive import Hive
 from services.dependencies import get_hive_service
 from services.hive import HiveService
+from utils.page_cursor import PageCursor
 
 client: TestClient = TestClient(app)
 
 
 @pytest.fixture
-def mock_hive_service() -> Generator[MagicMock, None, None]:
-    mock: MagicMock = MagicMock()
+def mock_hive_service() -> Generator[AsyncMock, None, None]:
+    mock: AsyncMock = AsyncMock()
     app.dependency_overrides[get_hive_service] = lambda: mock
     yield mock
     app.dependency_overrides.clear()
@@ -35,8 +37,8 @@ class TestHiveRoutes:
         assert service is not None
         assert isinstance(service, HiveService)
 
-    def test_create_hive_success(self, mock_hive_service: MagicMock) -> None:
-        mock_hive_service.create_hive = MagicMock(return_value=self.valid_hive)
+    def test_create_hive_success(self, mock_hive_service: AsyncMock) -> None:
+        mock_hive_service.create_hive = AsyncMock(return_value=self.valid_hive)
 
         response = client.post("/hives", json={"name": "Test Hive", "apiary_id": "1"})
 
@@ -50,7 +52,7 @@ class TestHiveRoutes:
             name="Test Hive", apiary_id=1
         )
 
-    def test_create_hive_validation_error(self, mock_hive_service: MagicMock) -> None:
+    def test_create_hive_validation_error(self, mock_hive_service: AsyncMock) -> None:
         mock_hive_service.create_hive.side_effect = ValueError("Hive name is required")
 
         response = client.post("hives", json={"name": "", "apiary_id": "1"})
@@ -58,8 +60,8 @@ class TestHiveRoutes:
         assert response.status_code == 422
         assert response.json()["detail"] == "Hive name is required"
 
-    def test_list_hives_success(self, mock_hive_service: MagicMock) -> None:
-        mock_hive_service.find_hives_by_apiary_id = MagicMock(
+    def test_list_hives_success(self, mock_hive_service: AsyncMock) -> None:
+        mock_hive_service.find_hives_by_apiary_id = AsyncMock(
             return_value=[self.valid_hive]
         )
 
@@ -73,9 +75,59 @@ class TestHiveRoutes:
                 "apiary_id": self.valid_hive.apiary_id,
             }
         ]
-        mock_hive_service.find_hives_by_apiary_id.assert_called_once_with(apiary_id=1)
+        mock_hive_service.find_hives_by_apiary_id.assert_called_once_with(
+            apiary_id=1, limit=101, after=None
+        )
+
+    def test_list_hives_links_next_page(self, mock_hive_service: AsyncMock) -> None:
+        second_hive = Hive(hive_id=2, name="Second Hive", apiary_id=1)
+        mock_hive_service.find_hives_by_apiary_id = AsyncMock(
+            return_value=[self.valid_hive, second_hive]
+        )
+
+        response = client.get("/apiaries/1/hives", params={"limit": 1})
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"hive_id": 1, "name": "Test Hive", "apiary_id": 1},
+        ]
+        mock_hive_service.find_hives_by_apiary_id.assert_called_once_with(
+            apiary_id=1, limit=2, after=None
+        )
+        cursor = PageCursor.encode(1)
+        assert response.headers["link"] == (
+            f'<http://testserver/apiaries/1/hives?limit=1&after={cursor}>; rel="next"'
+        )
+
+    def test_list_hives_after_cursor(self, mock_hive_service: AsyncMock) -> None:
+        mock_hive_service.find_hives_by_apiary_id = AsyncMock(
+            return_value=[self.valid_hive]
+        )
+
+        response = client.get(
+            "/apiaries/1/hives", params={"limit": 1, "after": PageCursor.encode(5)}
+        )
 
-    def test_list_hives_not_found(self, mock_hive_service: MagicMock) -> None:
+        assert response.status_code == 200
+        assert "link" not in response.headers
+        mock_hive_service.find_hives_by_apiary_id.assert_called_once_with(
+            apiary_id=1, limit=2, after=5
+        )
+
+    def test_list_hives_invalid_cursor(self, mock_hive_service: AsyncMock) -> None:
+        response = client.get("/apiaries/1/hives", params={"after": "nonsense"})
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid cursor"
+        mock_hive_service.find_hives_by_apiary_id.assert_not_called()
+
+    def test_list_hives_limit_out_of_range(self, mock_hive_service: AsyncMock) -> None:
+        response = client.get("/apiaries/1/hives", params={"limit": 0})
+
+        assert response.status_code == 422
+        mock_hive_service.find_hives_by_apiary_id.assert_not_called()
+
+    def test_list_hives_not_found(self, mock_hive_service: AsyncMock) -> None:
         mock_hive_service.find_hives_by_apiary_id.return_value = []
 
         response = client.get("/apiaries/1/hives")
@@ -83,8 +135,43 @@ class TestHiveRoutes:
         assert response.status_code == 404
         assert response.json()["detail"] == "No hives found for this apiary"
 
-    def test_get_hive_success(self, mock_hive_service: MagicMock) -> None:
-        mock_hive_service.find_hive_by_hive_id = MagicMock(return_value=self.valid_hive)
+    def test_stream_hives(
+        self, mock_hive_service: AsyncMock, async_rows: Callable[..., AsyncIterator]
+    ) -> None:
+        second_hive = Hive(hive_id=2, name="Second Hive", apiary_id=1)
+        mock_hive_service.stream_hives_by_apiary_id = MagicMock(
+            return_value=async_rows(self.valid_hive, second_hive)
+        )
+
+        response = client.get(
+            "/apiaries/1/hives", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"hive_id": 1, "name": "Test Hive", "apiary_id": 1},
+            {"hive_id": 2, "name": "Second Hive", "apiary_id": 1},
+        ]
+        mock_hive_service.stream_hives_by_apiary_id.assert_called_once_with(apiary_id=1)
+        mock_hive_service.find_hives_by_apiary_id.assert_not_called()
+
+    def test_stream_hives_not_found(
+        self, mock_hive_service: AsyncMock, async_rows: Callable[..., AsyncIterator]
+    ) -> None:
+        mock_hive_service.stream_hives_by_apiary_id = MagicMock(
+            return_value=async_rows()
+        )
+
+        response = client.get(
+            "/apiaries/1/hives", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No hives found for this apiary"
+
+    def test_get_hive_success(self, mock_hive_service: AsyncMock) -> None:
+        mock_hive_service.find_hive_by_hive_id = AsyncMock(return_value=self.valid_hive)
 
         response = client.get("/hives/1")
 
@@ -96,7 +183,7 @@ class TestHiveRoutes:
         }
         mock_hive_service.find_hive_by_hive_id.assert_called_once_with(hive_id=1)
 
-    def test_get_hive_not_found(self, mock_hive_service: MagicMock) -> None:
+    def test_get_hive_not_found(self, mock_hive_service: AsyncMock) -> None:
         mock_hive_service.find_hive_by_hive_id.return_value = None
 
         response = client.get("/hives/999")
@@ -104,7 +191,7 @@ class TestHiveRoutes:
         assert response.status_code == 404
         assert response.json()["detail"] == "Hive not found"
 
-    def test_update_hive_success(self, mock_hive_service: MagicMock) -> None:
+    def test_update_hive_success(self, mock_hive_service: AsyncMock) -> None:
         updated_hive = Hive(hive_id=1, name="Updated Hive", apiary_id=1)
         mock_hive_service.update_hive.return_value = updated_hive
 
@@ -122,7 +209,7 @@ class TestHiveRoutes:
             hive_id=1, name="Updated Hive", apiary_id=1
         )
 
-    def test_update_hive_validation_error(self, mock_hive_service: MagicMock) -> None:
+    def test_update_hive_validation_error(self, mock_hive_service: AsyncMock) -> None:
         mock_hive_service.update_hive.side_effect = ValueError("Hive name is required")
 
         response = client.post("/hives/1", json={"name": "", "apiary_id": "1"})
@@ -130,7 +217,7 @@ class TestHiveRoutes:
         assert response.status_code == 400
         assert response.json()["detail"] == "Hive name is required"
 
-    def test_delete_hive_success(self, mock_hive_service: MagicMock) -> None:
+    def test_delete_hive_success(self, mock_hive_service: AsyncMock) -> None:
         mock_hive_service.delete_hive.return_value = True
 
         response = client.delete("/hives/1")
@@ -139,10 +226,71 @@ class TestHiveRoutes:
         assert response.json() is True
         mock_hive_service.delete_hive.assert_called_once_with(hive_id=1)
 
-    def test_delete_hive_not_found(self, mock_hive_service: MagicMock) -> None:
+    def test_delete_hive_not_found(self, mock_hive_service: AsyncMock) -> None:
         mock_hive_service.delete_hive.side_effect = ValueError("Invalid hive_id")
 
         response = client.delete("/hives/999")
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Invalid hive_id"
+
+    def test_get_hives_by_ids(self, mock_hive_service: AsyncMock) -> None:
+        mock_hive_service.find_hives_by_hive_ids.return_value = [
+            {"hive_id": 1, "name": "Hive 1", "apiary_id": 1},
+            {"hive_id": 3, "name": "Hive 1", "apiary_id": 1},
+        ]
+
+        response = client.get("/hives?ids=3,1,3")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == [
+            {"hive_id": 1, "name": "Hive 1", "apiary_id": 1},
+            {"hive_id": 3, "name": "Hive 1", "apiary_id": 1},
+        ]
+        mock_hive_service.find_hives_by_hive_ids.assert_called_once_with(
+            hive_ids=[3, 1]
+        )
+
+    def test_get_hives_by_ids_not_found(self, mock_hive_service: AsyncMock) -> None:
+        mock_hive_service.find_hives_by_hive_ids.return_value = []
+
+        response = client.get("/hives?ids=998,999")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No hives found"
+
+    def test_get_hives_by_invalid_ids(self, mock_hive_service: AsyncMock) -> None:
+        mock_hive_service.find_hives_by_hive_ids.side_effect = ValueError(
+            "Invalid hive_id"
+        )
+
+        response = client.get("/hives?ids=1,-1")
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid hive_id"
+
+    @pytest.mark.parametrize(
+        ("ids", "detail"),
+        [
+            ("1,two", "ids must be comma-separated integers"),
+            (",", "ids is required"),
+            (
+                ",".join(str(n) for n in range(1, 1002)),
+                "ids must hold at most 1000 ids",
+            ),
+        ],
+    )
+    def test_get_hives_by_malformed_ids(
+        self, mock_hive_service: AsyncMock, ids: str, detail: str
+    ) -> None:
+        response = client.get(f"/hives?ids={ids}")
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == detail
+        mock_hive_service.find_hives_by_hive_ids.assert_not_called()
+
+    def test_get_hives_without_ids(self, mock_hive_service: AsyncMock) -> None:
+        response = client.get("/hives")
+
+        assert response.status_code == 422
+        mock_hive_service.find_hives_by_hive_ids.assert_not_called()
@@ -1,12 +1,12 @@
 """Test file for Hive service"""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from models.apiary import Apiary
 from models.hive import Hive
-from services.hive import HiveService
+from services.hive import AsyncHiveService, HiveService
 
 
 @pytest.fixture
@@ -70,10 +70,9 @@ def test_can_not_create_hive_invalid_apiary_id(
 
 
 def test_can_not_create_hive_missing_apiary_id(
-    hive_repo: MagicMock, apiary_repo: MagicMock, test_data: Hive
+    hive_repo: MagicMock, apiary_repo: MagicMock
 ) -> None:
-    hive_repo.create.return_value = test_data
-    apiary_repo.find_by_apiary_id.return_value = None
+    hive_repo.create.side_effect = LookupError
     name = "Hive 1"
     apiary_id = 999
     hive_service: HiveService = HiveService(hive_repo, apiary_repo)
@@ -187,7 +186,7 @@ def test_can_not_update_hive_invalid_hive_id(
 def test_can_not_update_hive_missing_hive_id(
     hive_repo: MagicMock, apiary_repo: MagicMock
 ) -> None:
-    hive_repo.find_by_hive_id.return_value = None
+    hive_repo.update.return_value = None
     hive_service: HiveService = HiveService(hive_repo, apiary_repo)
     hive_id = 999
     name = "Hive 1"
@@ -211,10 +210,9 @@ def test_can_not_update_hive_invalid_apiary_id(
 
 
 def test_can_not_update_hive_missing_apiary_id(
-    hive_repo: MagicMock, apiary_repo: MagicMock, test_data: Hive
+    hive_repo: MagicMock, apiary_repo: MagicMock
 ) -> None:
-    hive_repo.update.return_value = test_data
-    apiary_repo.find_by_apiary_id.return_value = None
+    hive_repo.update.side_effect = LookupError
     hive_id = 1
     name = "Hive 1"
     apiary_id = 999
@@ -254,3 +252,90 @@ def test_can_not_delete_hive_invalid_hive_id(
 
     with pytest.raises(ValueError, match="Invalid hive_id"):
         hive_service.delete_hive(-1)
+
+
+@pytest.mark.anyio
+async def test_async_create_hive(test_data: Hive) -> None:
+    hive_repo, apiary_repo = AsyncMock(), AsyncMock()
+    hive_repo.create.return_value = test_data
+    hive_service = AsyncHiveService(hive_repo, apiary_repo)
+
+    result: Hive | None = await hive_service.create_hive(
+        name=test_data.name, apiary_id=test_data.apiary_id
+    )
+
+    apiary_repo.find_by_apiary_id.assert_not_awaited()
+    assert result == test_data
+
+
+@pytest.mark.anyio
+async def test_async_can_not_update_hive_missing_apiary(test_data: Hive) -> None:
+    hive_repo, apiary_repo = AsyncMock(), AsyncMock()
+    hive_repo.find_by_hive_id.return_value = test_data
+    hive_repo.update.side_effect = LookupError
+    hive_service = AsyncHiveService(hive_repo, apiary_repo)
+
+    with pytest.raises(ValueError, match="Invalid apiary_id"):
+        await hive_service.update_hive(hive_id=1, name="Hive 1", apiary_id=999)
+
+
+@pytest.mark.anyio
+async def test_async_can_not_find_hive_invalid_hive_id() -> None:
+    hive_service = AsyncHiveService(AsyncMock(), AsyncMock())
+
+    with pytest.raises(ValueError, match="Invalid hive_id"):
+        await hive_service.find_hive_by_hive_id(-1)
+
+
+def test_stream_hives_by_apiary_id(
+    hive_repo: MagicMock, apiary_repo: MagicMock
+) -> None:
+    hive_repo.stream_by_apiary_id.return_value = iter([])
+    hive_service: HiveService = HiveService(hive_repo, apiary_repo)
+
+    result = hive_service.stream_hives_by_apiary_id(1)
+
+    hive_repo.stream_by_apiary_id.assert_called_once_with(1)
+    assert result is hive_repo.stream_by_apiary_id.return_value
+
+
+def test_can_not_stream_hives_invalid_apiary_id(
+    hive_repo: MagicMock, apiary_repo: MagicMock
+) -> None:
+    hive_service: HiveService = HiveService(hive_repo, apiary_repo)
+
+    with pytest.raises(ValueError, match="Invalid apiary_id"):
+        hive_service.stream_hives_by_apiary_id(-1)
+    hive_repo.stream_by_apiary_id.assert_not_called()
+
+
+def test_find_hives_by_hive_ids(
+    hive_repo: MagicMock, apiary_repo: MagicMock, test_data: Hive, test_data_2: Hive
+) -> None:
+    hive_repo.find_by_ids.return_value = [test_data, test_data_2]
+    hive_service: HiveService = HiveService(hive_repo, apiary_repo)
+
+    results: list[Hive] = hive_service.find_hives_by_hive_ids([2, 1])
+
+    hive_repo.find_by_ids.assert_called_once_with([2, 1])
+    assert results == [test_data, test_data_2]
+
+
+def test_can_not_find_hives_by_invalid_hive_ids(
+    hive_repo: MagicMock, apiary_repo: MagicMock
+) -> None:
+    hive_service: HiveService = HiveService(hive_repo, apiary_repo)
+
+    with pytest.raises(ValueError, match="Invalid hive_id"):
+        hive_service.find_hives_by_hive_ids([1, 0])
+    hive_repo.find_by_ids.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_async_find_hives_by_hive_ids(test_data: Hive) -> None:
+    hive_repo = AsyncMock()
+    hive_repo.find_by_ids.return_value = [test_data]
+    hive_service = AsyncHiveService(hive_repo, AsyncMock())
+
+    assert await hive_service.find_hives_by_hive_ids([1]) == [test_data]
+    hive_repo.find_by_ids.assert_awaited_once_with([1])
@@ -0,0 +1,181 @@
+"""Tests for IngestService"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, call
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from models.inspection import Inspection
+from schemas.action import ActionIngest
+from schemas.inspection import InspectionIngest
+from schemas.observation import ObservationIngest
+from services.ingest import AsyncIngestService, IngestService
+
+TIMESTAMP = datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC"))
+
+
+@pytest.fixture
+def records() -> list[InspectionIngest]:
+    return [
+        InspectionIngest(
+            inspection_timestamp=TIMESTAMP,
+            colony_id=1,
+            observations=[
+                ObservationIngest(
+                    queenright=True,
+                    queen_cells=0,
+                    bias=True,
+                    brood_frames=4,
+                    store_frames=2,
+                    chalk_brood=False,
+                    foul_brood=False,
+                    varroa_count=3,
+                    temper=1,
+                    notes="calm",
+                )
+            ],
+            actions=[ActionIngest(notes="added super")],
+        ),
+        InspectionIngest(inspection_timestamp=TIMESTAMP, colony_id=2),
+    ]
+
+
+@pytest.fixture
+def repos() -> dict[str, MagicMock]:
+    return {
+        "db": MagicMock(),
+        "inspection_repo": MagicMock(),
+        "observation_repo": MagicMock(),
+        "action_repo": MagicMock(),
+        "colony_repo": MagicMock(),
+    }
+
+
+def test_ingest_inspections(
+    repos: dict[str, MagicMock], records: list[InspectionIngest]
+) -> None:
+    repos["inspection_repo"].create_many.return_value = [
+        Inspection(10, TIMESTAMP, 1),
+        Inspection(11, TIMESTAMP, 2),
+    ]
+    repos["observation_repo"].create_many.return_value = 1
+    repos["action_repo"].create_many.return_value = 1
+    service = IngestService(**repos)
+
+    result: dict = service.ingest_inspections(records)
+
+    repos["colony_repo"].find_existing_colony_ids.assert_not_called()
+    repos["inspection_repo"].create_many.assert_called_once_with(
+        [(TIMESTAMP, 1), (TIMESTAMP, 2)]
+    )
+    repos["observation_repo"].create_many.assert_called_once_with(
+        [(True, 0, True, 4, 2, False, False, 3, 1, "calm", 10, TIMESTAMP)]
+    )
+    repos["action_repo"].create_many.assert_called_once_with(
+        [("added super", 10, TIMESTAMP)]
+    )
+    repos["db"].unit_of_work.assert_called_once_with()
+    assert result == {"inspection_ids": [10, 11], "observations": 1, "actions": 1}
+
+
+def test_ingest_inspections_skips_empty_children(
+    repos: dict[str, MagicMock],
+) -> None:
+    repos["inspection_repo"].create_many.return_value = [Inspection(11, TIMESTAMP, 2)]
+    service = IngestService(**repos)
+
+    result: dict = service.ingest_inspections(
+        [InspectionIngest(inspection_timestamp=TIMESTAMP, colony_id=2)]
+    )
+
+    repos["observation_repo"].create_many.assert_not_called()
+    repos["action_repo"].create_many.assert_not_called()
+    assert result == {"inspection_ids": [11], "observations": 0, "actions": 0}
+
+
+def test_ingest_nothing(repos: dict[str, MagicMock]) -> None:
+    service = IngestService(**repos)
+
+    result: dict = service.ingest_inspections([])
+
+    repos["colony_repo"].find_existing_colony_ids.assert_not_called()
+    repos["db"].unit_of_work.assert_not_called()
+    assert result == {"inspection_ids": [], "observations": 0, "actions": 0}
+
+
+def test_can_not_ingest_missing_colony(
+    repos: dict[str, MagicMock], records: list[InspectionIngest]
+) -> None:
+    repos["inspection_repo"].create_many.side_effect = LookupError
+    repos["colony_repo"].find_existing_colony_ids.return_value = {1}
+    service = IngestService(**repos)
+
+    with pytest.raises(ValueError, match=r"Invalid colony_id: \[2\]"):
+        service.ingest_inspections(records)
+    repos["colony_repo"].find_existing_colony_ids.assert_called_once_with([1, 2])
+    repos["observation_repo"].create_many.assert_not_called()
+
+
+def test_can_not_ingest_colony_deleted_during_ingest(
+    repos: dict[str, MagicMock], records: list[InspectionIngest]
+) -> None:
+    repos["inspection_repo"].create_many.side_effect = LookupError
+    repos["colony_repo"].find_existing_colony_ids.return_value = {1, 2}
+    service = IngestService(**repos)
+
+    with pytest.raises(ValueError, match="Invalid colony_id"):
+        service.ingest_inspections(records)
+
+
+def test_can_not_ingest_invalid_colony_id(repos: dict[str, MagicMock]) -> None:
+    service = IngestService(**repos)
+
+    with pytest.raises(ValueError, match="Invalid colony_id"):
+        service.ingest_inspections(
+            [InspectionIngest(inspection_timestamp=TIMESTAMP, colony_id=-1)]
+        )
+    repos["colony_repo"].find_existing_colony_ids.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_async_ingest_inspections(records: list[InspectionIngest]) -> None:
+    db = MagicMock()
+    inspection_repo, observation_repo, action_repo, colony_repo = (
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+    )
+    inspection_repo.create_many.return_value = [
+        Inspection(10, TIMESTAMP, 1),
+        Inspection(11, TIMESTAMP, 2),
+    ]
+    observation_repo.create_many.return_value = 1
+    action_repo.create_many.return_value = 1
+    service = AsyncIngestService(
+        db, inspection_repo, observation_repo, action_repo, colony_repo
+    )
+
+    result: dict = await service.ingest_inspections(records)
+
+    colony_repo.find_existing_colony_ids.assert_not_awaited()
+    assert db.unit_of_work.mock_calls[:2] == [call(), call().__aenter__()]
+    action_repo.create_many.assert_awaited_once_with([("added super", 10, TIMESTAMP)])
+    assert result == {"inspection_ids": [10, 11], "observations": 1, "actions": 1}
+
+
+@pytest.mark.anyio
+async def test_async_can_not_ingest_missing_colony(
+    records: list[InspectionIngest],
+) -> None:
+    db, inspection_repo, colony_repo = MagicMock(), AsyncMock(), AsyncMock()
+    inspection_repo.create_many.side_effect = LookupError
+    colony_repo.find_existing_colony_ids.return_value = set()
+    service = AsyncIngestService(
+        db, inspection_repo, AsyncMock(), AsyncMock(), colony_repo
+    )
+
+    with pytest.raises(ValueError, match=r"Invalid colony_id: \[1, 2\]"):
+        await service.ingest_inspections(records)
+    colony_repo.find_existing_colony_ids.assert_awaited_once_with([1, 2])
@@ -1,13 +1,19 @@
 """Tests for InspectionRepository class"""
 
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from models.inspection import Inspection
-from repositories.inspection import InspectionRepository
+from repositories.inspection import (
+    CREATE_MANY_QUERY,
+    ROW_FACTORY,
+    AsyncInspectionRepository,
+    InspectionRepository,
+)
 
 
 @pytest.fixture
@@ -76,15 +82,38 @@ class TestInspectionRepository:
         )
         assert result is None
 
+    def test_create_many_inspections(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [{"inspection_id": 2}, {"inspection_id": 1}]
+        repo: InspectionRepository = InspectionRepository(db=mock_db)
+
+        result: list[Inspection] = repo.create_many(
+            [
+                (self.test_inspection.inspection_timestamp, 1),
+                (self.test_inspection_2.inspection_timestamp, 2),
+            ]
+        )
+
+        mock_db.execute.assert_called_once_with(
+            CREATE_MANY_QUERY,
+            [
+                [
+                    self.test_inspection.inspection_timestamp,
+                    self.test_inspection_2.inspection_timestamp,
+                ],
+                [1, 2],
+            ],
+        )
+        assert result == [self.test_inspection, self.test_inspection_2]
+
     def test_can_find_inspection_by_valid_inspection_id(
         self, mock_db: MagicMock
     ) -> None:
         mock_db.execute.return_value = [
-            {
-                "inspection_id": self.test_inspection.inspection_id,
-                "inspection_timestamp": self.test_inspection.inspection_timestamp,
-                "colony_id": self.test_inspection.colony_id,
-            }
+            Inspection(
+                inspection_id=self.test_inspection.inspection_id,
+                inspection_timestamp=self.test_inspection.inspection_timestamp,
+                colony_id=self.test_inspection.colony_id,
+            )
         ]
         repo: InspectionRepository = InspectionRepository(db=mock_db)
 
@@ -93,8 +122,9 @@ class TestInspectionRepository:
         )
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM inspections WHERE inspection_id = %s LIMIT 1;",
+            "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE inspection_id = %s LIMIT 1;",
             [self.test_inspection.inspection_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(result, Inspection)
         assert result.inspection_id == self.test_inspection.inspection_id
@@ -110,17 +140,19 @@ class TestInspectionRepository:
         result: Inspection | None = repo.find_by_inspection_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM inspections WHERE inspection_id = %s LIMIT 1;", [999]
+            "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE inspection_id = %s LIMIT 1;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_can_find_inspections_by_valid_colony_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "inspection_id": self.test_inspection.inspection_id,
-                "inspection_timestamp": self.test_inspection.inspection_timestamp,
-                "colony_id": self.test_inspection.colony_id,
-            }
+            Inspection(
+                inspection_id=self.test_inspection.inspection_id,
+                inspection_timestamp=self.test_inspection.inspection_timestamp,
+                colony_id=self.test_inspection.colony_id,
+            )
         ]
         repo: InspectionRepository = InspectionRepository(db=mock_db)
 
@@ -129,8 +161,9 @@ class TestInspectionRepository:
         )
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM inspections WHERE colony_id = %s;",
+            "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = %s ORDER BY inspection_timestamp, inspection_id;",
             [self.test_inspection.colony_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(results, list)
         assert results[0].inspection_id == self.test_inspection.inspection_id
@@ -144,33 +177,39 @@ class TestInspectionRepository:
         result: Inspection | None = repo.find_by_colony_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM inspections WHERE colony_id = %s;", [999]
+            "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = %s ORDER BY inspection_timestamp, inspection_id;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_read_full_db_returns_all(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "inspection_id": self.test_inspection.inspection_id,
-                "inspection_timestamp": self.test_inspection.inspection_timestamp,
-                "colony_id": self.test_inspection.colony_id,
-            },
-            {
-                "inspection_id": self.test_inspection_2.inspection_id,
-                "inspection_timestamp": self.test_inspection_2.inspection_timestamp,
-                "colony_id": self.test_inspection_2.colony_id,
-            },
-            {
-                "inspection_id": self.test_inspection_3.inspection_id,
-                "inspection_timestamp": self.test_inspection_3.inspection_timestamp,
-                "colony_id": self.test_inspection_3.colony_id,
-            },
+            Inspection(
+                inspection_id=self.test_inspection.inspection_id,
+                inspection_timestamp=self.test_inspection.inspection_timestamp,
+                colony_id=self.test_inspection.colony_id,
+            ),
+            Inspection(
+                inspection_id=self.test_inspection_2.inspection_id,
+                inspection_timestamp=self.test_inspection_2.inspection_timestamp,
+                colony_id=self.test_inspection_2.colony_id,
+            ),
+            Inspection(
+                inspection_id=self.test_inspection_3.inspection_id,
+                inspection_timestamp=self.test_inspection_3.inspection_timestamp,
+                colony_id=self.test_inspection_3.colony_id,
+            ),
         ]
         repo: InspectionRepository = InspectionRepository(db=mock_db)
 
         results: list[Inspection] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM inspections;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections;",
+            [],
+            row_factory=ROW_FACTORY,
+        )
         assert isinstance(results, (list, Inspection))
         assert results[0].inspection_id == 1
         assert results[1].inspection_id == 2
@@ -183,7 +222,11 @@ class TestInspectionRepository:
 
         result: list[Inspection] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM inspections;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections;",
+            [],
+            row_factory=ROW_FACTORY,
+        )
         assert result is None
 
     def test_can_update_valid_inspection(self, mock_db: MagicMock) -> None:
@@ -201,7 +244,7 @@ class TestInspectionRepository:
         )
 
         mock_db.execute.assert_called_once_with(
-            "UPDATE inspections SET inspection_timestamp = %s, colony_id = %s RETURNING inspection_id;",
+            "UPDATE inspections SET inspection_timestamp = %s, colony_id = %s WHERE inspection_id = %s RETURNING inspection_id;",
             [self.test_inspection.inspection_timestamp, 999, 1],
         )
         assert isinstance(result, Inspection)
@@ -218,7 +261,7 @@ class TestInspectionRepository:
             999, self.test_inspection.inspection_timestamp, 1
         )
         mock_db.execute.assert_called_once_with(
-            "UPDATE inspections SET inspection_timestamp = %s, colony_id = %s RETURNING inspection_id;",
+            "UPDATE inspections SET inspection_timestamp = %s, colony_id = %s WHERE inspection_id = %s RETURNING inspection_id;",
             [self.test_inspection.inspection_timestamp, 1, 999],
         )
         assert result is None
@@ -244,3 +287,200 @@ class TestInspectionRepository:
             [999],
         )
         assert result is False
+
+    def test_find_latest_by_colony_ids(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [self.test_inspection]
+        repo: InspectionRepository = InspectionRepository(db=mock_db)
+
+        result = repo.find_latest_by_colony_ids([1, 2])
+
+        mock_db.execute.assert_called_once_with(
+            "SELECT DISTINCT ON (colony_id) inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = ANY(%s) ORDER BY colony_id, inspection_timestamp DESC, inspection_id DESC;",
+            [[1, 2]],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [self.test_inspection]
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.mark.anyio
+class TestAsyncInspectionRepository:
+    test_inspection: Inspection = Inspection(
+        inspection_id=1,
+        inspection_timestamp=datetime(
+            2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC")
+        ),
+        colony_id=1,
+    )
+
+    async def test_create_inspection(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [{"inspection_id": 1}]
+        repo: AsyncInspectionRepository = AsyncInspectionRepository(db=mock_async_db)
+
+        result: Inspection | None = await repo.create(
+            inspection_timestamp=self.test_inspection.inspection_timestamp,
+            colony_id=1,
+        )
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "INSERT INTO inspections (inspection_timestamp, colony_id) VALUES (%s, %s) RETURNING inspection_id;",
+            [self.test_inspection.inspection_timestamp, 1],
+        )
+        assert result == self.test_inspection
+
+    async def test_can_find_inspections_by_valid_colony_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = [
+            Inspection(
+                inspection_id=1,
+                inspection_timestamp=self.test_inspection.inspection_timestamp,
+                colony_id=1,
+            )
+        ]
+        repo: AsyncInspectionRepository = AsyncInspectionRepository(db=mock_async_db)
+
+        result: list[Inspection] | None = await repo.find_by_colony_id(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = %s ORDER BY inspection_timestamp, inspection_id;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [self.test_inspection]
+
+    async def test_can_not_find_inspection_by_invalid_inspection_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = []
+        repo: AsyncInspectionRepository = AsyncInspectionRepository(db=mock_async_db)
+
+        result: Inspection | None = await repo.find_by_inspection_id(999)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE inspection_id = %s LIMIT 1;",
+            [999],
+            row_factory=ROW_FACTORY,
+        )
+        assert result is None
+
+    async def test_can_delete_valid_inspection(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [{"inspection_id": 1}]
+        repo: AsyncInspectionRepository = AsyncInspectionRepository(db=mock_async_db)
+
+        result: bool = await repo.delete(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "DELETE FROM inspections WHERE inspection_id = %s RETURNING inspection_id;",
+            [1],
+        )
+        assert result is True
+
+    async def test_create_many_inspections(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [{"inspection_id": 1}]
+        repo: AsyncInspectionRepository = AsyncInspectionRepository(db=mock_async_db)
+
+        result: list[Inspection] = await repo.create_many(
+            [(self.test_inspection.inspection_timestamp, 1)]
+        )
+
+        mock_async_db.execute.assert_awaited_once_with(
+            CREATE_MANY_QUERY, [[self.test_inspection.inspection_timestamp], [1]]
+        )
+        assert result == [self.test_inspection]
+
+    async def test_stream_by_colony_id(
+        self, mock_async_db: AsyncMock, async_rows: Callable[..., AsyncIterator]
+    ) -> None:
+        mock_async_db.stream = MagicMock(
+            return_value=async_rows(
+                Inspection(
+                    inspection_id=1,
+                    inspection_timestamp=self.test_inspection.inspection_timestamp,
+                    colony_id=1,
+                )
+            )
+        )
+        repo: AsyncInspectionRepository = AsyncInspectionRepository(db=mock_async_db)
+
+        result: list[Inspection] = [
+            inspection async for inspection in repo.stream_by_colony_id(1)
+        ]
+
+        mock_async_db.stream.assert_called_once_with(
+            "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = %s ORDER BY inspection_timestamp, inspection_id;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [self.test_inspection]
+
+    async def test_find_first_page_by_colony_id(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = []
+        repo: AsyncInspectionRepository = AsyncInspectionRepository(db=mock_async_db)
+
+        await repo.find_by_colony_id(1, limit=50)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = %s ORDER BY inspection_timestamp, inspection_id LIMIT %s;",
+            [1, 50],
+            row_factory=ROW_FACTORY,
+        )
+
+    async def test_find_page_by_colony_id_after_key(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = []
+        repo: AsyncInspectionRepository = AsyncInspectionRepository(db=mock_async_db)
+        timestamp = self.test_inspection.inspection_timestamp
+
+        await repo.find_by_colony_id(1, limit=50, after=(timestamp, 7))
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = %s AND (inspection_timestamp, inspection_id) > (%s, %s) ORDER BY inspection_timestamp, inspection_id LIMIT %s;",
+            [1, timestamp, 7, 50],
+            row_factory=ROW_FACTORY,
+        )
+
+    async def test_find_latest_by_colony_ids_none_found(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = None
+        repo: AsyncInspectionRepository = AsyncInspectionRepository(db=mock_async_db)
+
+        result = await repo.find_latest_by_colony_ids([999])
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT DISTINCT ON (colony_id) inspection_id, inspection_timestamp, colony_id FROM inspections WHERE colony_id = ANY(%s) ORDER BY colony_id, inspection_timestamp DESC, inspection_id DESC;",
+            [[999]],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == []
+
+
+def test_find_by_ids(mock_db: MagicMock) -> None:
+    mock_db.execute.return_value = None
+    repo = InspectionRepository(db=mock_db)
+
+    assert repo.find_by_ids([2, 1]) == []
+    mock_db.execute.assert_called_once_with(
+        "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE inspection_id = ANY(%s) ORDER BY inspection_id;",
+        [[2, 1]],
+        row_factory=ROW_FACTORY,
+    )
+
+
+@pytest.mark.anyio
+async def test_async_find_by_ids(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = ["row"]
+    repo = AsyncInspectionRepository(db=mock_async_db)
+
+    assert await repo.find_by_ids((1, 2)) == ["row"]
+    mock_async_db.execute.assert_awaited_once_with(
+        "SELECT inspection_id, inspection_timestamp, colony_id FROM inspections WHERE inspection_id = ANY(%s) ORDER BY inspection_id;",
+        [[1, 2]],
+        row_factory=ROW_FACTORY,
+    )
@@ -1,8 +1,8 @@
 """Tests for Inspection routes"""
 
-from collections.abc import Generator
+from collections.abc import AsyncIterator, Callable, Generator
 from datetime import UTC, datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -10,20 +10,29 @@ from fastapi.testclient import TestClient
 from main import app
 from models.inspection import Inspection
 from schemas.inspection import InspectionRead
-from services.dependencies import get_inspection_service
+from services.dependencies import get_ingest_service, get_inspection_service
 from services.inspection import InspectionService
+from utils.page_cursor import PageCursor
 
 client = TestClient(app)
 
 
 @pytest.fixture
-def mock_inspection_service() -> Generator[MagicMock, None, None]:
-    mock = MagicMock()
+def mock_inspection_service() -> Generator[AsyncMock, None, None]:
+    mock = AsyncMock()
     app.dependency_overrides[get_inspection_service] = lambda: mock
     yield mock
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def mock_ingest_service() -> Generator[AsyncMock, None, None]:
+    mock = AsyncMock()
+    app.dependency_overrides[get_ingest_service] = lambda: mock
+    yield mock
+    app.dependency_overrides.clear()
+
+
 @pytest.fixture
 def valid_inspection_read() -> InspectionRead:
     return InspectionRead(
@@ -44,7 +53,7 @@ class TestInspectionRoutes:
         assert isinstance(service, InspectionService)
 
     def test_create_inspection_success(
-        self, mock_inspection_service: MagicMock, valid_inspection_read: InspectionRead
+        self, mock_inspection_service: AsyncMock, valid_inspection_read: InspectionRead
     ) -> None:
         mock_inspection_service.create_inspection.return_value = valid_inspection_read
 
@@ -70,7 +79,7 @@ class TestInspectionRoutes:
         mock_inspection_service.create_inspection.assert_called_once()
 
     def test_create_inspection_failure(
-        self, mock_inspection_service: MagicMock
+        self, mock_inspection_service: AsyncMock
     ) -> None:
         mock_inspection_service.create_inspection.side_effect = ValueError()
 
@@ -85,7 +94,7 @@ class TestInspectionRoutes:
         assert response.status_code == 422
 
     def test_get_inspections_by_colony_id_success(
-        self, mock_inspection_service: MagicMock, valid_inspection_read: InspectionRead
+        self, mock_inspection_service: AsyncMock, valid_inspection_read: InspectionRead
     ) -> None:
         mock_inspection_service.find_inspections_by_colony_id.return_value = [
             valid_inspection_read
@@ -106,11 +115,33 @@ class TestInspectionRoutes:
             }
         ]
         mock_inspection_service.find_inspections_by_colony_id.assert_called_once_with(
-            colony_id=valid_inspection_read.colony_id
+            colony_id=valid_inspection_read.colony_id, limit=101, after=None
+        )
+
+    def test_get_inspections_by_colony_id_pages_by_timestamp(
+        self, mock_inspection_service: AsyncMock, valid_inspection_read: InspectionRead
+    ) -> None:
+        later = valid_inspection_read.model_copy(update={"inspection_id": 2})
+        mock_inspection_service.find_inspections_by_colony_id.return_value = [
+            valid_inspection_read,
+            later,
+        ]
+        after = PageCursor.encode(datetime(2025, 1, 1, tzinfo=UTC), 9)
+
+        response = client.get(
+            "/colonies/1/inspections", params={"limit": 1, "after": after}
+        )
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert len(response.json()) == 1
+        mock_inspection_service.find_inspections_by_colony_id.assert_called_once_with(
+            colony_id=1, limit=2, after=(datetime(2025, 1, 1, tzinfo=UTC), 9)
         )
+        next_cursor = PageCursor.encode(valid_inspection_read.inspection_timestamp, 1)
+        assert f"after={next_cursor}" in response.headers["link"]
 
     def test_get_inspection_by_colony_id_not_found(
-        self, mock_inspection_service: MagicMock
+        self, mock_inspection_service: AsyncMock
     ) -> None:
         mock_inspection_service.find_inspections_by_colony_id.return_value = []
 
@@ -119,8 +150,31 @@ class TestInspectionRoutes:
         assert response.status_code == 404
         assert response.json()["detail"] == "No inspections found for this colony"
 
+    def test_stream_inspections_by_colony_id(
+        self,
+        mock_inspection_service: AsyncMock,
+        valid_inspection_read: InspectionRead,
+        async_rows: Callable[..., AsyncIterator],
+    ) -> None:
+        mock_inspection_service.stream_inspections_by_colony_id = MagicMock(
+            return_value=async_rows(valid_inspection_read, valid_inspection_read)
+        )
+
+        response = client.get(
+            "/colonies/1/inspections", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.text.splitlines() == [
+            valid_inspection_read.model_dump_json(),
+            valid_inspection_read.model_dump_json(),
+        ]
+        mock_inspection_service.stream_inspections_by_colony_id.assert_called_once_with(
+            colony_id=1
+        )
+
     def test_get_inspection_by_inspection_id_success(
-        self, mock_inspection_service: MagicMock, valid_inspection_read: InspectionRead
+        self, mock_inspection_service: AsyncMock, valid_inspection_read: InspectionRead
     ) -> None:
         mock_inspection_service.find_inspection_by_inspection_id.return_value = (
             valid_inspection_read
@@ -141,7 +195,7 @@ class TestInspectionRoutes:
         )
 
     def test_get_inspection_by_inspection_id_not_found(
-        self, mock_inspection_service: MagicMock
+        self, mock_inspection_service: AsyncMock
     ) -> None:
         mock_inspection_service.find_inspection_by_inspection_id.return_value = None
 
@@ -151,7 +205,7 @@ class TestInspectionRoutes:
         assert response.json()["detail"] == "No inspections found for this colony"
 
     def test_update_inspection_success(
-        self, mock_inspection_service: MagicMock
+        self, mock_inspection_service: AsyncMock
     ) -> None:
         updated_inspection = Inspection(
             inspection_id=1,
@@ -185,7 +239,7 @@ class TestInspectionRoutes:
         )
 
     def test_update_inspection_failure(
-        self, mock_inspection_service: MagicMock
+        self, mock_inspection_service: AsyncMock
     ) -> None:
         mock_inspection_service.update_inspection.side_effect = ValueError()
 
@@ -200,7 +254,7 @@ class TestInspectionRoutes:
         assert response.status_code == 400
 
     def test_delete_inspection_success(
-        self, mock_inspection_service: MagicMock
+        self, mock_inspection_service: AsyncMock
     ) -> None:
         mock_inspection_service.delete_inspection.return_value = True
 
@@ -213,7 +267,7 @@ class TestInspectionRoutes:
         )
 
     def test_delete_inspection_not_found(
-        self, mock_inspection_service: MagicMock
+        self, mock_inspection_service: AsyncMock
     ) -> None:
         mock_inspection_service.delete_inspection.side_effect = ValueError(
             "Invalid inspection_id"
@@ -223,3 +277,136 @@ class TestInspectionRoutes:
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Invalid inspection_id"
+
+    def test_ingest_inspections_from_json_array(
+        self, mock_ingest_service: AsyncMock
+    ) -> None:
+        mock_ingest_service.ingest_inspections.return_value = {
+            "inspection_ids": [1, 2],
+            "observations": 0,
+            "actions": 1,
+        }
+
+        response = client.post(
+            "/inspections/bulk",
+            json=[
+                {
+                    "inspection_timestamp": "2025-06-23T02:10:25Z",
+                    "colony_id": 1,
+                    "actions": [{"notes": "added super"}],
+                },
+                {"inspection_timestamp": "2025-06-24T02:10:25Z", "colony_id": 2},
+            ],
+        )
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == {
+            "inspection_ids": [1, 2],
+            "observations": 0,
+            "actions": 1,
+        }
+        records = mock_ingest_service.ingest_inspections.call_args.args[0]
+        assert [record.colony_id for record in records] == [1, 2]
+        assert records[0].actions[0].notes == "added super"
+
+    def test_ingest_inspections_from_ndjson(
+        self, mock_ingest_service: AsyncMock
+    ) -> None:
+        mock_ingest_service.ingest_inspections.return_value = {
+            "inspection_ids": [1, 2],
+            "observations": 0,
+            "actions": 0,
+        }
+        body = (
+            '{"inspection_timestamp": "2025-06-23T02:10:25Z", "colony_id": 1}\n'
+            "\n"
+            '{"inspection_timestamp": "2025-06-24T02:10:25Z", "colony_id": 2}'
+        )
+
+        response = client.post(
+            "/inspections/bulk",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        records = mock_ingest_service.ingest_inspections.call_args.args[0]
+        assert [record.colony_id for record in records] == [1, 2]
+
+    def test_ingest_inspections_invalid_payload(
+        self, mock_ingest_service: AsyncMock
+    ) -> None:
+        response = client.post("/inspections/bulk", json=[{"colony_id": 1}])
+
+        assert response.status_code == 422
+        mock_ingest_service.ingest_inspections.assert_not_called()
+
+    def test_ingest_inspections_missing_colony(
+        self, mock_ingest_service: AsyncMock
+    ) -> None:
+        mock_ingest_service.ingest_inspections.side_effect = ValueError(
+            "Invalid colony_id: [999]"
+        )
+
+        response = client.post(
+            "/inspections/bulk",
+            json=[{"inspection_timestamp": "2025-06-23T02:10:25Z", "colony_id": 999}],
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid colony_id: [999]"
+
+    def test_get_inspections_by_ids(self, mock_inspection_service: AsyncMock) -> None:
+        mock_inspection_service.find_inspections_by_inspection_ids.return_value = [
+            {
+                "inspection_id": 1,
+                "inspection_timestamp": "2025-06-30T13:00:00Z",
+                "colony_id": 1,
+            },
+            {
+                "inspection_id": 3,
+                "inspection_timestamp": "2025-06-30T13:00:00Z",
+                "colony_id": 1,
+            },
+        ]
+
+        response = client.get("/inspections?ids=3,1,3")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == [
+            {
+                "inspection_id": 1,
+                "inspection_timestamp": "2025-06-30T13:00:00Z",
+                "colony_id": 1,
+            },
+            {
+                "inspection_id": 3,
+                "inspection_timestamp": "2025-06-30T13:00:00Z",
+                "colony_id": 1,
+            },
+        ]
+        mock_inspection_service.find_inspections_by_inspection_ids.assert_called_once_with(
+            inspection_ids=[3, 1]
+        )
+
+    def test_get_inspections_by_ids_not_found(
+        self, mock_inspection_service: AsyncMock
+    ) -> None:
+        mock_inspection_service.find_inspections_by_inspection_ids.return_value = []
+
+        response = client.get("/inspections?ids=998,999")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No inspections found"
+
+    def test_get_inspections_by_invalid_ids(
+        self, mock_inspection_service: AsyncMock
+    ) -> None:
+        mock_inspection_service.find_inspections_by_inspection_ids.side_effect = (
+            ValueError("Invalid inspection_id")
+        )
+
+        response = client.get("/inspections?ids=1,-1")
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid inspection_id"
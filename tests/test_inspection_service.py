@@ -1,14 +1,14 @@
 """Tests for InspectionService"""
 
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from models.colony import Colony
 from models.inspection import Inspection
-from services.inspection import InspectionService
+from services.inspection import AsyncInspectionService, InspectionService
 
 
 @pytest.fixture
@@ -88,10 +88,9 @@ def test_can_not_create_inspection_invalid_colony_id(
 
 
 def test_can_not_create_inspection_missing_colony_id(
-    inspection_repo: MagicMock, colony_repo: MagicMock, test_data: Inspection
+    inspection_repo: MagicMock, colony_repo: MagicMock
 ) -> None:
-    inspection_repo.create.return_value = test_data
-    colony_repo.find_by_colony_id.return_value = None
+    inspection_repo.create.side_effect = LookupError
     inspection_timestamp = datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC"))
     colony_id = 999
     inspection_service: InspectionService = InspectionService(
@@ -246,7 +245,7 @@ def test_can_not_update_inspection_missing_inspection_id(
     inspection_id = 999
     inspection_timestamp = datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC"))
     colony_id = 1
-    inspection_repo.find_by_inspection_id.return_value = None
+    inspection_repo.update.return_value = None
     inspection_service: InspectionService = InspectionService(
         inspection_repo, colony_repo
     )
@@ -298,10 +297,9 @@ def test_can_not_update_inspection_invalid_colony_id(
 
 
 def test_can_not_update_inspection_missing_colony_id(
-    inspection_repo: MagicMock, colony_repo: MagicMock, test_data: Inspection
+    inspection_repo: MagicMock, colony_repo: MagicMock
 ) -> None:
-    inspection_repo.update.return_value = test_data
-    colony_repo.find_by_colony_id.return_value = None
+    inspection_repo.update.side_effect = LookupError
     inspection_id = 1
     inspection_timestamp = datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC"))
     colony_id = 999
@@ -353,3 +351,43 @@ def test_can_not_delete_inspection_invalid_inspection_id(
 
     with pytest.raises(ValueError, match="Invalid inspection_id"):
         inspection_service.delete_inspection(-1)
+
+
+@pytest.mark.anyio
+async def test_async_create_inspection(test_data: Inspection) -> None:
+    inspection_repo, colony_repo = AsyncMock(), AsyncMock()
+    inspection_repo.create.return_value = test_data
+    inspection_service = AsyncInspectionService(inspection_repo, colony_repo)
+
+    result: Inspection | None = await inspection_service.create_inspection(
+        inspection_timestamp=test_data.inspection_timestamp, colony_id=1
+    )
+
+    colony_repo.find_by_colony_id.assert_not_awaited()
+    assert result == test_data
+
+
+@pytest.mark.anyio
+async def test_async_can_not_update_inspection_missing_colony(
+    test_data: Inspection,
+) -> None:
+    inspection_repo, colony_repo = AsyncMock(), AsyncMock()
+    inspection_repo.find_by_inspection_id.return_value = test_data
+    inspection_repo.update.side_effect = LookupError
+    inspection_service = AsyncInspectionService(inspection_repo, colony_repo)
+
+    with pytest.raises(ValueError, match="Invalid colony_id"):
+        await inspection_service.update_inspection(
+            inspection_id=1,
+            inspection_timestamp=test_data.inspection_timestamp,
+            colony_id=999,
+        )
+
+
+@pytest.mark.anyio
+async def test_async_delete_inspection() -> None:
+    inspection_repo, colony_repo = AsyncMock(), AsyncMock()
+    inspection_repo.delete.return_value = True
+    inspection_service = AsyncInspectionService(inspection_repo, colony_repo)
+
+    assert await inspection_service.delete_inspection(1) is True
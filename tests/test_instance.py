@@ -0,0 +1,14 @@
+"""Tests for the shared database instances"""
+
+import importlib
+
+import db.instance
+
+
+def test_importing_instance_does_not_connect() -> None:
+    """Connections are opened by the app lifespan, not at import time."""
+    instance = importlib.reload(db.instance)
+
+    assert instance.db.pool is None
+    assert instance.db.connection is None
+    assert instance.async_db.pool is None
@@ -0,0 +1,223 @@
+"""Tests for query instrumentation"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from db.instrumentation import (
+    NO_ROUTE,
+    QueryBudgetExceededError,
+    QueryEvent,
+    QueryStats,
+    emit,
+    fingerprint,
+)
+from routes.instrumentation import QueryStatsMiddleware, query_budget
+
+
+def budgeted_app(stats: QueryStats) -> FastAPI:
+    """An app whose one route may make a single query, and makes hive_id of them"""
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, stats=stats)
+
+    @app.get("/hives/{hive_id}")
+    @query_budget(1)
+    async def get_hive(hive_id: int) -> int:
+        for _ in range(hive_id):
+            stats.record(QueryEvent("SELECT ?", 0.01, 1))
+        return hive_id
+
+    return app
+
+
+class TestFingerprint:
+    def test_placeholders_and_whitespace(self) -> None:
+        query = "SELECT *\n  FROM hives   WHERE apiary_id = %s LIMIT 1;"
+
+        assert fingerprint(query) == "SELECT * FROM hives WHERE apiary_id = ? LIMIT ?"
+
+    def test_literals(self) -> None:
+        query = "SELECT * FROM users WHERE username = 'o''hare' AND user_id > -2.5"
+
+        assert fingerprint(query) == (
+            "SELECT * FROM users WHERE username = ? AND user_id > ?"
+        )
+
+    def test_value_lists_collapse(self) -> None:
+        short = "SELECT * FROM hives WHERE hive_id IN (%s, %s)"
+        long = "SELECT * FROM hives WHERE hive_id IN (1,2,3,4)"
+
+        assert fingerprint(short) == fingerprint(long)
+        assert fingerprint(short) == "SELECT * FROM hives WHERE hive_id IN (...)"
+
+    def test_identifiers_with_digits_are_kept(self) -> None:
+        assert fingerprint("SELECT t1.x FROM t1") == "SELECT t1.x FROM t1"
+
+
+class TestQueryStats:
+    def test_emit_calls_every_hook(self) -> None:
+        first, second = MagicMock(), MagicMock()
+
+        emit([first, second], "SELECT 1;", time.perf_counter(), 1)
+
+        event = first.call_args.args[0]
+        assert isinstance(event, QueryEvent)
+        assert event.statement == "SELECT ?"
+        assert event.rows == 1
+        assert event.duration >= 0
+        second.assert_called_once_with(event)
+
+    def test_record_outside_a_request(self) -> None:
+        stats = QueryStats(slow_query_threshold=1)
+
+        stats.record(QueryEvent("SELECT ?", 0.25, 3))
+        stats.record(QueryEvent("SELECT ?", 0.5, 1))
+
+        assert stats.top() == [
+            {
+                "route": NO_ROUTE,
+                "statement": "SELECT ?",
+                "calls": 2,
+                "rows": 4,
+                "total_time": 0.75,
+                "mean_time": 0.375,
+                "max_time": 0.5,
+            }
+        ]
+
+    def test_top_orders_and_limits(self) -> None:
+        stats = QueryStats(slow_query_threshold=1)
+        stats.record(QueryEvent("SELECT a", 0.1, 1))
+        stats.record(QueryEvent("SELECT b", 0.3, 1))
+        stats.record(QueryEvent("SELECT c", 0.2, 1))
+
+        assert [row["statement"] for row in stats.top(2)] == ["SELECT b", "SELECT c"]
+
+    def test_slow_queries_are_logged(self) -> None:
+        stats = QueryStats(slow_query_threshold=0.1)
+
+        with patch("db.instrumentation.logger") as logger:
+            stats.record(QueryEvent("SELECT fast", 0.05, 1))
+            logger.warning.assert_not_called()
+            stats.record(QueryEvent("SELECT slow", 0.2, 1))
+
+        logger.warning.assert_called_once()
+        assert "SELECT slow" in logger.warning.call_args.args
+
+    def test_reset(self) -> None:
+        stats = QueryStats(slow_query_threshold=1)
+        stats.record(QueryEvent("SELECT ?", 0.1, 1))
+
+        stats.reset()
+
+        assert stats.top() == []
+        assert stats.routes() == []
+
+
+class TestQueryStatsMiddleware:
+    def test_queries_are_grouped_by_route(self) -> None:
+        stats = QueryStats(slow_query_threshold=1)
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware, stats=stats)
+
+        @app.get("/hives/{hive_id}")
+        async def get_hive(hive_id: int) -> int:
+            for _ in range(hive_id):
+                stats.record(QueryEvent("SELECT ?", 0.01, 1))
+            return hive_id
+
+        client = TestClient(app)
+        client.get("/hives/1")
+        client.get("/hives/3")
+
+        [route] = stats.routes()
+        assert route["route"] == "GET /hives/{hive_id}"
+        assert route["requests"] == 2
+        assert route["queries"] == 4
+        assert route["queries_per_request"] == 2
+        assert route["max_queries"] == 3
+        assert stats.top()[0]["route"] == "GET /hives/{hive_id}"
+
+    def test_unmatched_requests(self) -> None:
+        stats = QueryStats(slow_query_threshold=1)
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware, stats=stats)
+
+        TestClient(app).get("/missing")
+
+        assert stats.routes()[0]["route"] == NO_ROUTE
+
+    def test_requests_within_budget(self) -> None:
+        stats = QueryStats(slow_query_threshold=1, strict_budgets=True)
+        client = TestClient(budgeted_app(stats))
+
+        with patch("db.instrumentation.logger") as logger:
+            client.get("/hives/1")
+
+        logger.warning.assert_not_called()
+        [route] = stats.routes()
+        assert route["budget"] == 1
+        assert route["over_budget"] == 0
+
+    def test_requests_over_budget_are_logged(self) -> None:
+        stats = QueryStats(slow_query_threshold=1)
+        client = TestClient(budgeted_app(stats))
+
+        with patch("db.instrumentation.logger") as logger:
+            response = client.get("/hives/3")
+
+        assert response.status_code == 200
+        logger.warning.assert_called_once()
+        assert "GET /hives/{hive_id}" in logger.warning.call_args.args
+        assert stats.routes()[0]["over_budget"] == 1
+
+    def test_requests_over_budget_raise_when_strict(self) -> None:
+        stats = QueryStats(slow_query_threshold=1, strict_budgets=True)
+        client = TestClient(budgeted_app(stats))
+
+        with pytest.raises(QueryBudgetExceededError, match="3 queries"):
+            client.get("/hives/3")
+
+        assert stats.routes()[0]["over_budget"] == 1
+
+    def test_failed_requests_over_budget_keep_their_error(self) -> None:
+        stats = QueryStats(slow_query_threshold=1, strict_budgets=True)
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware, stats=stats)
+
+        @app.get("/hives")
+        @query_budget(1)
+        async def get_hives() -> None:
+            for _ in range(3):
+                stats.record(QueryEvent("SELECT ?", 0.01, 1))
+            error_message = "handler failed"
+            raise RuntimeError(error_message)
+
+        with (
+            patch("db.instrumentation.logger") as logger,
+            pytest.raises(RuntimeError, match="handler failed"),
+        ):
+            TestClient(app).get("/hives")
+
+        logger.warning.assert_called_once()
+        [route] = stats.routes()
+        assert route["requests"] == 1
+        assert route["over_budget"] == 1
+
+    def test_routes_without_a_budget(self) -> None:
+        stats = QueryStats(slow_query_threshold=1, strict_budgets=True)
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware, stats=stats)
+
+        @app.get("/hives")
+        async def get_hives() -> None:
+            for _ in range(5):
+                stats.record(QueryEvent("SELECT ?", 0.01, 1))
+
+        TestClient(app).get("/hives")
+
+        assert stats.routes()[0]["budget"] is None
+        assert stats.routes()[0]["over_budget"] == 0
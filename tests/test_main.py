@@ -0,0 +1,29 @@
+"""Tests for the application lifespan"""
+
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import main
+
+
+@pytest.mark.anyio
+async def test_lifespan_closes_hashing_executor_off_the_event_loop() -> None:
+    closed_on: list[threading.Thread] = []
+
+    with (
+        patch.object(main, "async_db") as async_db,
+        patch.object(main, "hashing_executor") as hashing_executor,
+    ):
+        async_db.connect = AsyncMock()
+        async_db.close = AsyncMock()
+        hashing_executor.close.side_effect = lambda: closed_on.append(
+            threading.current_thread()
+        )
+        async with main.lifespan(main.app):
+            hashing_executor.start.assert_called_once()
+
+    assert len(closed_on) == 1
+    assert closed_on[0] is not threading.current_thread()
+    async_db.close.assert_awaited_once()
@@ -0,0 +1,78 @@
+"""Tests for the metrics primitives"""
+
+import pytest
+
+from utils.metrics import Counter, Gauge, Histogram, Metric, Registry
+
+
+class TestMetrics:
+    def test_counter(self) -> None:
+        counter = Counter("jobs_total", "Jobs done", ("kind",))
+
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        counter.inc(kind="b")
+
+        assert counter.render() == [
+            "# HELP jobs_total Jobs done",
+            "# TYPE jobs_total counter",
+            'jobs_total{kind="a"} 3',
+            'jobs_total{kind="b"} 1',
+        ]
+
+    def test_wrong_labels(self) -> None:
+        counter = Counter("jobs_total", "Jobs done", ("kind",))
+
+        with pytest.raises(ValueError, match="takes labels"):
+            counter.inc(colour="red")
+
+    def test_metric_is_abstract(self) -> None:
+        with pytest.raises(TypeError, match="_samples"):
+            Metric("jobs_total", "Jobs done")  # type: ignore[abstract]
+
+    def test_gauge(self) -> None:
+        gauge = Gauge("in_flight", "Requests in flight")
+
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        assert gauge.render()[-1] == "in_flight 1"
+
+    def test_gauge_function(self) -> None:
+        gauge = Gauge("queue_depth", "Jobs queued", function=lambda: 7)
+
+        assert gauge.render()[-1] == "queue_depth 7"
+
+    def test_histogram(self) -> None:
+        histogram = Histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        assert histogram.render()[2:] == [
+            'latency_seconds_bucket{le="0.1"} 1',
+            'latency_seconds_bucket{le="1"} 2',
+            'latency_seconds_bucket{le="+Inf"} 3',
+            "latency_seconds_sum 5.55",
+            "latency_seconds_count 3",
+        ]
+
+    def test_label_values_are_escaped(self) -> None:
+        counter = Counter("paths_total", "Paths", ("path",))
+
+        counter.inc(path='a "quoted"\\path')
+
+        assert counter.render()[-1] == 'paths_total{path="a \\"quoted\\"\\\\path"} 1'
+
+    def test_registry_renders_every_metric(self) -> None:
+        registry = Registry()
+        counter = registry.register(Counter("a_total", "A"))
+        registry.register(Gauge("b", "B", function=lambda: 2))
+        counter.inc()
+
+        assert registry.render() == (
+            "# HELP a_total A\n# TYPE a_total counter\na_total 1\n"
+            "# HELP b B\n# TYPE b gauge\nb 2\n"
+        )
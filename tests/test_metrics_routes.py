@@ -0,0 +1,78 @@
+"""Tests for the /metrics route and the hooks feeding it"""
+
+from unittest.mock import MagicMock
+
+from fastapi.testclient import TestClient
+
+from db.instrumentation import QueryEvent
+from main import app
+from routes.metrics import (
+    CHECKOUT_WAIT,
+    QUERY_DURATION,
+    instrument,
+    observe_checkout,
+    observe_query,
+)
+from utils.metrics import CONTENT_TYPE
+
+client: TestClient = TestClient(app)
+
+
+class TestMetricsRoutes:
+    def test_metrics_exposition(self) -> None:
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        for name in (
+            "http_request_duration_seconds",
+            "http_requests_in_flight",
+            "db_query_duration_seconds",
+            "db_pool_checkout_wait_seconds",
+            "db_pool_size",
+            "password_hashing_pending",
+        ):
+            assert f"# TYPE {name} " in response.text
+
+    def test_requests_are_labelled_by_router(self) -> None:
+        client.get("/health/live")
+        client.get("/hives/not-a-number")
+        client.get("/no/such/route")
+
+        response = client.get("/metrics")
+
+        assert (
+            'http_request_duration_seconds_count{router="health",method="GET",status="200"}'
+            in response.text
+        )
+        assert (
+            'http_request_duration_seconds_count{router="hives",method="GET",status="422"}'
+            in response.text
+        )
+        assert (
+            'http_request_duration_seconds_count{router="unmatched",method="GET",status="404"}'
+            in response.text
+        )
+
+    def test_router_labels_are_lowercase(self) -> None:
+        labels = {route.tags[0] for route in app.routes if getattr(route, "tags", None)}
+        assert "observations" in labels
+        assert all(label == label.lower() for label in labels)
+
+    def test_hooks_feed_database_histograms(self) -> None:
+        queries = QUERY_DURATION.render()[-1]
+        checkouts = CHECKOUT_WAIT.render()[-1] if CHECKOUT_WAIT.render()[2:] else ""
+
+        observe_query(QueryEvent("SELECT ?", 0.002, 1))
+        observe_checkout(0.001)
+
+        assert QUERY_DURATION.render()[-1] != queries
+        assert CHECKOUT_WAIT.render()[-1] != checkouts
+
+    def test_instrument_registers_hooks(self) -> None:
+        db = MagicMock(hooks=[], checkout_hooks=[])
+
+        instrument(db)
+
+        assert db.hooks == [observe_query]
+        assert db.checkout_hooks == [observe_checkout]
@@ -0,0 +1,316 @@
+"""Tests for MigrationRunner class"""
+
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from psycopg.errors import DivisionByZero
+
+from db.database_configuration import DatabaseConfiguration
+from db.database_connection import DatabaseConnection
+from db.migrations import (
+    APPLIED_QUERY,
+    CREATE_MIGRATIONS_TABLE_QUERY,
+    NO_TRANSACTION_MARKER,
+    RECORD_QUERY,
+    MigrationRunner,
+    runs_in_transaction,
+    split_statements,
+)
+
+# inspections, observations and actions as they were before
+# 0004_partition_inspections, with no migration recorded
+UNPARTITIONED_SCHEMA: str = """
+TRUNCATE schema_migrations;
+DROP TABLE inspections, observations, actions CASCADE;
+CREATE TABLE inspections (
+    inspection_id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    inspection_timestamp timestamptz NOT NULL,
+    colony_id integer NOT NULL REFERENCES colonies(colony_id) ON DELETE CASCADE
+);
+CREATE TABLE observations (
+    observation_id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    queenright boolean NOT NULL,
+    queen_cells integer NOT NULL,
+    bias boolean NOT NULL,
+    brood_frames integer NOT NULL,
+    store_frames integer NOT NULL,
+    chalk_brood boolean NOT NULL,
+    foul_brood boolean NOT NULL,
+    varroa_count integer NOT NULL,
+    temper integer NOT NULL,
+    notes text,
+    inspection_id integer NOT NULL REFERENCES inspections(inspection_id) ON DELETE CASCADE
+);
+CREATE TABLE actions (
+    action_id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    notes text,
+    inspection_id integer NOT NULL REFERENCES inspections(inspection_id) ON DELETE CASCADE
+);
+"""
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def migrations_directory(tmp_path: Path) -> Path:
+    (tmp_path / "0001_first.sql").write_text(
+        "-- A comment\nCREATE INDEX a ON t (\n    x\n);\n\nCREATE INDEX b ON t (y);\n"
+    )
+    (tmp_path / "0002_second.sql").write_text("CREATE INDEX c ON t (z);\n")
+    return tmp_path
+
+
+@pytest.fixture
+def schema_db() -> Generator[DatabaseConnection, None, None]:
+    db = DatabaseConnection(config=DatabaseConfiguration())
+    db.connect()
+    db.seed("./sql/schema.sql")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def db() -> Generator[DatabaseConnection, None, None]:
+    db = DatabaseConnection(config=DatabaseConfiguration())
+    db.connect()
+    db.seed("./sql/schema.sql")
+    db.execute(UNPARTITIONED_SCHEMA, [], prepare=False)
+    db.execute(
+        "INSERT INTO users (username, password) VALUES (%s, %s);", ["jake", "password"]
+    )
+    db.execute(
+        "INSERT INTO apiaries (name, location, user_id) VALUES (%s, %s, %s);",
+        ["Flowery Field", "123 Example Road, Kent", 1],
+    )
+    db.execute("INSERT INTO hives (name, apiary_id) VALUES (%s, %s);", ["Hive 1", 1])
+    db.execute("INSERT INTO colonies (hive_id) VALUES (%s);", [1])
+    db.execute(
+        "INSERT INTO inspections (inspection_timestamp, colony_id) VALUES (%s, %s);",
+        ["2020-06-22 19:10:25-07", 1],
+    )
+    db.execute(
+        "INSERT INTO actions (notes, inspection_id) VALUES (%s, %s);",
+        ["Added some feed", 1],
+    )
+    yield db
+    db.close()
+
+
+class TestSplitStatements:
+    def test_splits_on_line_ending_semicolons(self) -> None:
+        sql = "-- A comment\nCREATE INDEX a ON t (\n    x\n);\n\nCREATE INDEX b ON t (y);\n"
+        assert split_statements(sql) == [
+            "CREATE INDEX a ON t (\n    x\n);",
+            "CREATE INDEX b ON t (y);",
+        ]
+
+    def test_keeps_function_bodies_whole(self) -> None:
+        sql = (
+            "CREATE FUNCTION f() RETURNS void LANGUAGE plpgsql AS $$\n"
+            "BEGIN\n"
+            "    -- Kept, as part of the body\n"
+            "    PERFORM 1;\n"
+            "END;\n"
+            "$$;\n"
+            "SELECT f();\n"
+        )
+        assert split_statements(sql) == [
+            "CREATE FUNCTION f() RETURNS void LANGUAGE plpgsql AS $$\n"
+            "BEGIN\n"
+            "    -- Kept, as part of the body\n"
+            "    PERFORM 1;\n"
+            "END;\n"
+            "$$;",
+            "SELECT f();",
+        ]
+
+    def test_keeps_trailing_statement_without_semicolon(self) -> None:
+        assert split_statements("SELECT 1") == ["SELECT 1"]
+
+    def test_empty_file_has_no_statements(self) -> None:
+        assert split_statements("-- Nothing to do\n") == []
+
+
+class TestRunsInTransaction:
+    def test_runs_in_transaction_by_default(self) -> None:
+        assert runs_in_transaction("-- A comment\nCREATE INDEX a ON t (x);\n")
+
+    def test_marker_opts_out(self) -> None:
+        assert not runs_in_transaction(
+            f"{NO_TRANSACTION_MARKER}\nCREATE INDEX CONCURRENTLY a ON t (x);\n"
+        )
+
+
+class TestMigrationRunner:
+    def test_init(self, mock_db: MagicMock) -> None:
+        runner = MigrationRunner(mock_db)
+        assert runner.db == mock_db
+        assert runner.directory == Path("sql/migrations")
+
+    def test_applied(self, mock_db: MagicMock) -> None:
+        mock_db.execute.side_effect = [None, [{"version": "0001_first"}]]
+        runner = MigrationRunner(mock_db)
+        assert runner.applied() == {"0001_first"}
+        mock_db.execute.assert_any_call(CREATE_MIGRATIONS_TABLE_QUERY, [])
+        mock_db.execute.assert_any_call(APPLIED_QUERY, [])
+
+    def test_pending_skips_applied_migrations(
+        self, mock_db: MagicMock, migrations_directory: Path
+    ) -> None:
+        mock_db.execute.side_effect = [None, [{"version": "0001_first"}]]
+        runner = MigrationRunner(mock_db, str(migrations_directory))
+        assert runner.pending() == [migrations_directory / "0002_second.sql"]
+
+    def test_apply_runs_pending_statements_in_order(
+        self, mock_db: MagicMock, migrations_directory: Path
+    ) -> None:
+        mock_db.execute.side_effect = lambda query, params, **kwargs: None  # noqa: ARG005
+        runner = MigrationRunner(mock_db, str(migrations_directory))
+        assert runner.apply() == ["0001_first", "0002_second"]
+        executed = [
+            (*call.args, call.kwargs) for call in mock_db.execute.call_args_list[2:]
+        ]
+        assert executed == [
+            ("CREATE INDEX a ON t (\n    x\n);", [], {"prepare": False}),
+            ("CREATE INDEX b ON t (y);", [], {"prepare": False}),
+            (RECORD_QUERY, ["0001_first"], {}),
+            ("CREATE INDEX c ON t (z);", [], {"prepare": False}),
+            (RECORD_QUERY, ["0002_second"], {}),
+        ]
+
+    def test_apply_runs_each_migration_in_a_transaction(
+        self, mock_db: MagicMock, migrations_directory: Path
+    ) -> None:
+        mock_db.execute.side_effect = lambda query, params, **kwargs: None  # noqa: ARG005
+        runner = MigrationRunner(mock_db, str(migrations_directory))
+        runner.apply()
+        assert mock_db.transaction.call_count == 2
+        mock_db.checkout.assert_not_called()
+
+    def test_apply_runs_opted_out_migration_on_one_connection(
+        self, mock_db: MagicMock, migrations_directory: Path
+    ) -> None:
+        (migrations_directory / "0002_second.sql").write_text(
+            f"{NO_TRANSACTION_MARKER}\nCREATE INDEX CONCURRENTLY c ON t (z);\n"
+        )
+        mock_db.execute.side_effect = lambda query, params, **kwargs: None  # noqa: ARG005
+        runner = MigrationRunner(mock_db, str(migrations_directory))
+        assert runner.apply() == ["0001_first", "0002_second"]
+        assert mock_db.transaction.call_count == 1
+        assert mock_db.checkout.call_count == 1
+
+    def test_apply_failure_leaves_migration_unrecorded(
+        self, mock_db: MagicMock, migrations_directory: Path
+    ) -> None:
+        def execute(query: str, params: list, **kwargs: object) -> None:  # noqa: ARG001
+            if query == "CREATE INDEX c ON t (z);":
+                error_message = "failed"
+                raise ValueError(error_message)
+
+        mock_db.execute.side_effect = execute
+        runner = MigrationRunner(mock_db, str(migrations_directory))
+        with pytest.raises(ValueError, match="failed"):
+            runner.apply()
+        mock_db.execute.assert_any_call(RECORD_QUERY, ["0001_first"])
+        assert mock_db.execute.call_args_list[-1].args[0] != RECORD_QUERY
+        assert mock_db.transaction.return_value.__exit__.call_args.args[0] is ValueError
+
+    def test_apply_with_nothing_pending(
+        self, mock_db: MagicMock, migrations_directory: Path
+    ) -> None:
+        mock_db.execute.side_effect = [
+            None,
+            [{"version": "0001_first"}, {"version": "0002_second"}],
+        ]
+        runner = MigrationRunner(mock_db, str(migrations_directory))
+        assert runner.apply() == []
+        assert mock_db.execute.call_count == 2
+
+    def test_stamp_records_pending_without_running_them(
+        self, mock_db: MagicMock, migrations_directory: Path
+    ) -> None:
+        mock_db.execute.side_effect = [None, [{"version": "0001_first"}], None]
+        runner = MigrationRunner(mock_db, str(migrations_directory))
+        assert runner.stamp() == ["0002_second"]
+        assert mock_db.execute.call_args_list[2:] == [
+            ((RECORD_QUERY, ["0002_second"]),)
+        ]
+        mock_db.transaction.assert_called_once()
+
+    def test_schema_records_every_migration(self) -> None:
+        schema = Path("sql/schema.sql").read_text()
+        for path in Path("sql/migrations").glob("*.sql"):
+            assert f"('{path.stem}')" in schema
+
+    def test_repository_migrations_parse(self) -> None:
+        for path in sorted(Path("sql/migrations").glob("*.sql")):
+            statements = split_statements(path.read_text())
+            assert statements
+            assert all(statement.endswith(";") for statement in statements)
+
+
+class TestMigrationsApplied:
+    def test_schema_needs_no_migrations(self, schema_db: DatabaseConnection) -> None:
+        runner = MigrationRunner(schema_db)
+        assert runner.pending() == []
+        assert runner.apply() == []
+
+    def test_failed_partition_migration_changes_nothing(
+        self, db: DatabaseConnection, tmp_path: Path
+    ) -> None:
+        migration = Path("sql/migrations/0004_partition_inspections.sql")
+        (tmp_path / migration.name).write_text(
+            migration.read_text() + "SELECT 1 / 0;\n"
+        )
+
+        with pytest.raises(DivisionByZero):
+            MigrationRunner(db, str(tmp_path)).apply()
+
+        assert db.execute(
+            "SELECT relname, relkind FROM pg_class WHERE relname IN ('inspections', 'observations', 'actions', 'inspections_unpartitioned') ORDER BY relname;",
+            [],
+        ) == [
+            {"relname": "actions", "relkind": "r"},
+            {"relname": "inspections", "relkind": "r"},
+            {"relname": "observations", "relkind": "r"},
+        ]
+        assert db.execute("SELECT inspection_id, colony_id FROM inspections;", []) == [
+            {"inspection_id": 1, "colony_id": 1}
+        ]
+        assert db.execute("SELECT notes FROM actions;", []) == [
+            {"notes": "Added some feed"}
+        ]
+        assert db.execute(
+            "SELECT to_regprocedure('create_inspection_partitions(integer)') AS function;",
+            [],
+        ) == [{"function": None}]
+        assert MigrationRunner(db, str(tmp_path)).applied() == set()
+
+    def test_partitioned_database_stamped(self, schema_db: DatabaseConnection) -> None:
+        schema_db.execute("TRUNCATE schema_migrations;", [])
+        runner = MigrationRunner(schema_db)
+
+        assert runner.stamp() == sorted(
+            path.stem for path in Path("sql/migrations").glob("*.sql")
+        )
+        assert runner.apply() == []
+
+    def test_partition_migration_applied(
+        self, db: DatabaseConnection, tmp_path: Path
+    ) -> None:
+        migration = Path("sql/migrations/0004_partition_inspections.sql")
+        (tmp_path / migration.name).write_text(migration.read_text())
+
+        assert MigrationRunner(db, str(tmp_path)).apply() == [migration.stem]
+
+        assert db.execute(
+            "SELECT relkind FROM pg_class WHERE relname = 'inspections';", []
+        ) == [{"relkind": "p"}]
+        assert db.execute("SELECT notes, inspection_id FROM actions;", []) == [
+            {"notes": "Added some feed", "inspection_id": 1}
+        ]
@@ -0,0 +1,75 @@
+"""Tests for the NDJSON response helper"""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from routes.ndjson import stream_response
+
+
+class Item(BaseModel):
+    item_id: int
+
+
+class Rows:
+    """An async generator of item dicts that records whether it was closed"""
+
+    def __init__(self, rows: list[dict], *, fail: bool = False) -> None:
+        self.closed = False
+        self.iterator = self._rows(rows, fail=fail)
+
+    async def _rows(self, rows: list[dict], *, fail: bool) -> AsyncIterator[dict]:
+        try:
+            if fail:
+                error_message = "cursor failed"
+                raise RuntimeError(error_message)
+            for row in rows:
+                yield row
+        finally:
+            self.closed = True
+
+
+@pytest.mark.anyio
+async def test_streams_every_item() -> None:
+    rows = Rows([{"item_id": 1}, {"item_id": 2}])
+
+    response = await stream_response(rows.iterator, Item, "No items")
+    body = [chunk async for chunk in response.body_iterator]
+
+    assert body == [b'{"item_id":1}\n', b'{"item_id":2}\n']
+    assert rows.closed is True
+
+
+@pytest.mark.anyio
+async def test_empty_result_is_not_found() -> None:
+    rows = Rows([])
+
+    with pytest.raises(HTTPException) as error:
+        await stream_response(rows.iterator, Item, "No items")
+
+    assert error.value.status_code == 404
+    assert rows.closed is True
+
+
+@pytest.mark.anyio
+async def test_closed_when_first_read_fails() -> None:
+    rows = Rows([], fail=True)
+
+    with pytest.raises(RuntimeError, match="cursor failed"):
+        await stream_response(rows.iterator, Item, "No items")
+
+    assert rows.closed is True
+
+
+@pytest.mark.anyio
+async def test_closed_by_background_task_when_body_never_read() -> None:
+    rows = Rows([{"item_id": 1}, {"item_id": 2}])
+
+    response = await stream_response(rows.iterator, Item, "No items")
+    assert rows.closed is False
+    assert response.background is not None
+    await response.background()
+
+    assert rows.closed is True
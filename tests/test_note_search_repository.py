@@ -0,0 +1,128 @@
+"""Tests for NoteSearchRepository class"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from models.note_match import NoteMatch
+from repositories.note_search import (
+    ROW_FACTORY,
+    SCOPES,
+    SEARCH_AFTER_QUERIES,
+    SEARCH_QUERIES,
+    AsyncNoteSearchRepository,
+    NoteSearchRepository,
+)
+
+TIMESTAMP = datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC"))
+SINCE = datetime(2020, 1, 1, tzinfo=ZoneInfo("Etc/UTC"))
+MATCH = NoteMatch(
+    kind="observation",
+    note_id=3,
+    inspection_id=2,
+    inspection_timestamp=TIMESTAMP,
+    colony_id=1,
+    notes="Swarm cells on frame 4",
+    headline="<b>Swarm</b> cells on frame 4",
+    rank=0.0607927,
+)
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+def test_queries_search_both_tables_through_the_index() -> None:
+    for query in [*SEARCH_QUERIES.values(), *SEARCH_AFTER_QUERIES.values()]:
+        assert query.count("n.notes_tsv @@ q") == 2
+        assert "FROM websearch_to_tsquery('english', %s) AS q, observations n" in query
+        assert "FROM websearch_to_tsquery('english', %s) AS q, actions n" in query
+        assert "n.inspection_timestamp >= coalesce(%s::timestamptz" in query
+        assert query.endswith(
+            "ORDER BY rank DESC, inspection_timestamp DESC, kind DESC, note_id DESC;"
+        )
+    assert "i.colony_id = %s" in SEARCH_QUERIES["colony_id"]
+    assert "h.apiary_id = %s" in SEARCH_QUERIES["apiary_id"]
+    assert "a.user_id = %s" in SEARCH_QUERIES["user_id"]
+
+
+def test_headlines_only_the_page() -> None:
+    for scope in SCOPES:
+        query = SEARCH_AFTER_QUERIES[scope]
+        assert query.index("ts_headline") < query.index("FROM (")
+        assert query.index("(m.rank, m.inspection_timestamp") < query.index("LIMIT")
+
+
+class TestNoteSearchRepository:
+    def test_search(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [MATCH]
+        repo = NoteSearchRepository(db=mock_db)
+
+        result = repo.search("swarm", "colony_id", 1, limit=11)
+
+        matches = ["swarm", 1, None, None]
+        mock_db.execute.assert_called_once_with(
+            SEARCH_QUERIES["colony_id"],
+            ["swarm", *matches, *matches, 11],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [MATCH]
+
+    def test_search_after(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [MATCH]
+        repo = NoteSearchRepository(db=mock_db)
+        after = (0.1, TIMESTAMP, "action", 9)
+
+        repo.search(
+            '"fed syrup"',
+            "user_id",
+            4,
+            limit=3,
+            since=SINCE,
+            until=TIMESTAMP,
+            after=after,
+        )
+
+        matches = ['"fed syrup"', 4, SINCE, TIMESTAMP]
+        mock_db.execute.assert_called_once_with(
+            SEARCH_AFTER_QUERIES["user_id"],
+            ['"fed syrup"', *matches, *matches, *after, 3],
+            row_factory=ROW_FACTORY,
+        )
+
+    def test_search_without_matches(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = None
+        repo = NoteSearchRepository(db=mock_db)
+
+        assert repo.search("supersedure", "apiary_id", 2, limit=11) == []
+
+
+@pytest.mark.anyio
+class TestAsyncNoteSearchRepository:
+    async def test_search(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [MATCH]
+        repo = AsyncNoteSearchRepository(db=mock_async_db)
+
+        result = await repo.search("swarm", "apiary_id", 2, limit=11, since=SINCE)
+
+        matches = ["swarm", 2, SINCE, None]
+        mock_async_db.execute.assert_awaited_once_with(
+            SEARCH_QUERIES["apiary_id"],
+            ["swarm", *matches, *matches, 11],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [MATCH]
+
+    async def test_search_without_matches(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = []
+        repo = AsyncNoteSearchRepository(db=mock_async_db)
+
+        assert await repo.search("swarm", "colony_id", 1, limit=11) == []
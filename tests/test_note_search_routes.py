@@ -0,0 +1,146 @@
+"""Tests for note search routes"""
+
+from collections.abc import Generator
+from datetime import datetime
+from unittest.mock import AsyncMock
+from zoneinfo import ZoneInfo
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from models.note_match import NoteMatch
+from schemas.note_match import NoteMatchRead
+from services.dependencies import get_note_search_service
+from services.note_search import NoteSearchService
+from utils.page_cursor import PageCursor
+
+client = TestClient(app)
+
+TIMESTAMP = datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC"))
+MATCHES = [
+    NoteMatch(
+        kind="observation",
+        note_id=3,
+        inspection_id=2,
+        inspection_timestamp=TIMESTAMP,
+        colony_id=1,
+        notes="Swarm cells on frame 4",
+        headline="<b>Swarm</b> cells on frame 4",
+        rank=0.0607927,
+    ),
+    NoteMatch(
+        kind="action",
+        note_id=9,
+        inspection_id=2,
+        inspection_timestamp=TIMESTAMP,
+        colony_id=1,
+        notes="Split to prevent swarming",
+        headline="Split to prevent <b>swarming</b>",
+        rank=0.0573088,
+    ),
+]
+
+
+@pytest.fixture
+def mock_search_service() -> Generator[AsyncMock, None, None]:
+    mock = AsyncMock()
+    app.dependency_overrides[get_note_search_service] = lambda: mock
+    yield mock
+    app.dependency_overrides.clear()
+
+
+class TestNoteSearchRoutes:
+    def test_get_note_search_service_direct(self) -> None:
+        service: NoteSearchService = get_note_search_service()
+        assert isinstance(service, NoteSearchService)
+
+    def test_search_notes(self, mock_search_service: AsyncMock) -> None:
+        mock_search_service.search_notes.return_value = MATCHES
+
+        response = client.get(
+            "/search/notes",
+            params={
+                "q": "swarm",
+                "apiary_id": 7,
+                "since": "2020-01-01T00:00:00Z",
+                "until": "2021-01-01T00:00:00Z",
+            },
+        )
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == [
+            NoteMatchRead.model_validate(match, from_attributes=True).model_dump(
+                mode="json"
+            )
+            for match in MATCHES
+        ]
+        assert "Link" not in response.headers
+        mock_search_service.search_notes.assert_called_once_with(
+            "swarm",
+            user_id=None,
+            apiary_id=7,
+            colony_id=None,
+            since=datetime(2020, 1, 1, tzinfo=ZoneInfo("Etc/UTC")),
+            until=datetime(2021, 1, 1, tzinfo=ZoneInfo("Etc/UTC")),
+            limit=PageCursor.DEFAULT_LIMIT + 1,
+            after=None,
+        )
+
+    def test_search_notes_links_to_the_next_page(
+        self, mock_search_service: AsyncMock
+    ) -> None:
+        mock_search_service.search_notes.return_value = MATCHES
+
+        response = client.get("/search/notes?q=swarm&colony_id=1&limit=1")
+
+        assert response.status_code == 200
+        assert [match["note_id"] for match in response.json()] == [3]
+        cursor = PageCursor.encode(0.0607927, TIMESTAMP, "observation", 3)
+        assert f"after={cursor}" in response.headers["Link"]
+
+        client.get(f"/search/notes?q=swarm&colony_id=1&limit=1&after={cursor}")
+
+        assert mock_search_service.search_notes.call_args.kwargs["after"] == (
+            0.0607927,
+            TIMESTAMP,
+            "observation",
+            3,
+        )
+
+    def test_search_notes_without_matches(self, mock_search_service: AsyncMock) -> None:
+        mock_search_service.search_notes.return_value = []
+
+        response = client.get("/search/notes?q=supersedure&user_id=1")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_search_notes_invalid_scope(self, mock_search_service: AsyncMock) -> None:
+        mock_search_service.search_notes.side_effect = ValueError(
+            "Give exactly one of user_id, apiary_id or colony_id"
+        )
+
+        response = client.get("/search/notes?q=swarm")
+
+        assert response.status_code == 422
+        assert response.json() == {
+            "detail": "Give exactly one of user_id, apiary_id or colony_id"
+        }
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "q=&colony_id=1",
+            "colony_id=1",
+            "q=swarm&colony_id=1&since=2020-01-01T00:00:00",
+            "q=swarm&colony_id=1&after=not-a-cursor",
+        ],
+    )
+    def test_search_notes_rejects_bad_parameters(
+        self, mock_search_service: AsyncMock, query: str
+    ) -> None:
+        response = client.get(f"/search/notes?{query}")
+
+        assert response.status_code == 422
+        mock_search_service.search_notes.assert_not_called()
@@ -0,0 +1,111 @@
+"""Tests for NoteSearchService"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from models.note_match import NoteMatch
+from services.note_search import (
+    MAX_SEARCH_LENGTH,
+    AsyncNoteSearchService,
+    NoteSearchService,
+)
+
+TIMESTAMP = datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC"))
+SINCE = datetime(2020, 1, 1, tzinfo=ZoneInfo("Etc/UTC"))
+MATCH = NoteMatch(
+    kind="action",
+    note_id=9,
+    inspection_id=2,
+    inspection_timestamp=TIMESTAMP,
+    colony_id=1,
+    notes="Fed syrup",
+    headline="<b>Fed</b> <b>syrup</b>",
+    rank=0.0991032,
+)
+
+
+@pytest.fixture
+def search_repo() -> MagicMock:
+    return MagicMock()
+
+
+class TestNoteSearchService:
+    def test_search_notes(self, search_repo: MagicMock) -> None:
+        search_repo.search.return_value = [MATCH]
+        service = NoteSearchService(search_repo=search_repo)
+
+        result = service.search_notes(
+            "fed syrup", apiary_id=3, since=SINCE, until=TIMESTAMP, limit=11
+        )
+
+        search_repo.search.assert_called_once_with(
+            "fed syrup",
+            "apiary_id",
+            3,
+            limit=11,
+            since=SINCE,
+            until=TIMESTAMP,
+            after=None,
+        )
+        assert result == [MATCH]
+
+    @pytest.mark.parametrize("text", ["", "   ", "x" * (MAX_SEARCH_LENGTH + 1)])
+    def test_invalid_search(self, search_repo: MagicMock, text: str) -> None:
+        service = NoteSearchService(search_repo=search_repo)
+
+        with pytest.raises(ValueError, match="q must hold"):
+            service.search_notes(text, colony_id=1, limit=11)
+        search_repo.search.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "scope", [{}, {"user_id": 1, "colony_id": 2}, {"apiary_id": 1, "colony_id": 1}]
+    )
+    def test_needs_exactly_one_scope(
+        self, search_repo: MagicMock, scope: dict[str, int]
+    ) -> None:
+        service = NoteSearchService(search_repo=search_repo)
+
+        with pytest.raises(ValueError, match="exactly one of"):
+            service.search_notes("swarm", limit=11, **scope)
+
+    def test_invalid_scope_id(self, search_repo: MagicMock) -> None:
+        service = NoteSearchService(search_repo=search_repo)
+
+        with pytest.raises(ValueError, match="Invalid user_id"):
+            service.search_notes("swarm", user_id=0, limit=11)
+
+    def test_since_must_be_before_until(self, search_repo: MagicMock) -> None:
+        service = NoteSearchService(search_repo=search_repo)
+
+        with pytest.raises(ValueError, match="since must be before until"):
+            service.search_notes(
+                "swarm", colony_id=1, since=TIMESTAMP, until=SINCE, limit=11
+            )
+        search_repo.search.assert_not_called()
+
+
+@pytest.mark.anyio
+class TestAsyncNoteSearchService:
+    async def test_search_notes(self) -> None:
+        search_repo = AsyncMock()
+        search_repo.search.return_value = [MATCH]
+        service = AsyncNoteSearchService(search_repo=search_repo)
+        after = (0.2, TIMESTAMP, "observation", 4)
+
+        result = await service.search_notes("syrup", user_id=5, limit=3, after=after)
+
+        search_repo.search.assert_awaited_once_with(
+            "syrup", "user_id", 5, limit=3, since=None, until=None, after=after
+        )
+        assert result == [MATCH]
+
+    async def test_invalid_scope(self) -> None:
+        search_repo = AsyncMock()
+        service = AsyncNoteSearchService(search_repo=search_repo)
+
+        with pytest.raises(ValueError, match="exactly one of"):
+            await service.search_notes("syrup", limit=3)
+        search_repo.search.assert_not_awaited()
@@ -1,11 +1,19 @@
 """Tests for ObservationRepository"""
 
-from unittest.mock import MagicMock
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
 
 import pytest
 
 from models.observation import Observation
-from repositories.observation import ObservationRepository
+from repositories.observation import (
+    ROW_FACTORY,
+    AsyncObservationRepository,
+    ObservationRepository,
+)
+
+TIMESTAMP = datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC"))
 
 
 @pytest.fixture
@@ -78,7 +86,7 @@ class TestObservationRepository:
         )
 
         mock_db.execute.assert_called_once_with(
-            "INSERT INTO observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)  RETURNING observation_id;",
+            "INSERT INTO observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id, inspection_timestamp) SELECT %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, inspection_id, inspection_timestamp FROM inspections WHERE inspection_id = %s RETURNING observation_id;",
             [
                 self.test_observation.queenright,
                 self.test_observation.queen_cells,
@@ -111,22 +119,23 @@ class TestObservationRepository:
         mock_db.execute.return_value = []
         repo: ObservationRepository = ObservationRepository(db=mock_db)
 
-        result: Observation | None = repo.create(
-            queenright=self.test_observation.queenright,
-            queen_cells=self.test_observation.queen_cells,
-            bias=self.test_observation.bias,
-            brood_frames=self.test_observation.brood_frames,
-            store_frames=self.test_observation.store_frames,
-            chalk_brood=self.test_observation.chalk_brood,
-            foul_brood=self.test_observation.foul_brood,
-            varroa_count=self.test_observation.varroa_count,
-            temper=self.test_observation.temper,
-            notes=self.test_observation.notes,
-            inspection_id=999,
-        )
+        with pytest.raises(LookupError, match="No inspection with inspection_id 999"):
+            repo.create(
+                queenright=self.test_observation.queenright,
+                queen_cells=self.test_observation.queen_cells,
+                bias=self.test_observation.bias,
+                brood_frames=self.test_observation.brood_frames,
+                store_frames=self.test_observation.store_frames,
+                chalk_brood=self.test_observation.chalk_brood,
+                foul_brood=self.test_observation.foul_brood,
+                varroa_count=self.test_observation.varroa_count,
+                temper=self.test_observation.temper,
+                notes=self.test_observation.notes,
+                inspection_id=999,
+            )
 
         mock_db.execute.assert_called_once_with(
-            "INSERT INTO observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)  RETURNING observation_id;",
+            "INSERT INTO observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id, inspection_timestamp) SELECT %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, inspection_id, inspection_timestamp FROM inspections WHERE inspection_id = %s RETURNING observation_id;",
             [
                 self.test_observation.queenright,
                 self.test_observation.queen_cells,
@@ -141,26 +150,25 @@ class TestObservationRepository:
                 999,
             ],
         )
-        assert result is None
 
     def test_can_find_observation_by_valid_observation_id(
         self, mock_db: MagicMock
     ) -> None:
         mock_db.execute.return_value = [
-            {
-                "observation_id": self.test_observation.observation_id,
-                "queenright": self.test_observation.queenright,
-                "queen_cells": self.test_observation.queen_cells,
-                "bias": self.test_observation.bias,
-                "brood_frames": self.test_observation.brood_frames,
-                "store_frames": self.test_observation.store_frames,
-                "chalk_brood": self.test_observation.chalk_brood,
-                "foul_brood": self.test_observation.foul_brood,
-                "varroa_count": self.test_observation.varroa_count,
-                "temper": self.test_observation.temper,
-                "notes": self.test_observation.notes,
-                "inspection_id": self.test_observation.inspection_id,
-            }
+            Observation(
+                observation_id=self.test_observation.observation_id,
+                queenright=self.test_observation.queenright,
+                queen_cells=self.test_observation.queen_cells,
+                bias=self.test_observation.bias,
+                brood_frames=self.test_observation.brood_frames,
+                store_frames=self.test_observation.store_frames,
+                chalk_brood=self.test_observation.chalk_brood,
+                foul_brood=self.test_observation.foul_brood,
+                varroa_count=self.test_observation.varroa_count,
+                temper=self.test_observation.temper,
+                notes=self.test_observation.notes,
+                inspection_id=self.test_observation.inspection_id,
+            )
         ]
         repo: ObservationRepository = ObservationRepository(db=mock_db)
 
@@ -169,8 +177,9 @@ class TestObservationRepository:
         )
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM observations WHERE observation_id = %s LIMIT 1;",
+            "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE observation_id = %s LIMIT 1;",
             [self.test_observation.observation_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(result, Observation)
         assert result.observation_id == self.test_observation.observation_id
@@ -195,7 +204,9 @@ class TestObservationRepository:
         result: Observation | None = repo.find_by_observation_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM observations WHERE observation_id = %s LIMIT 1;", [999]
+            "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE observation_id = %s LIMIT 1;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
@@ -203,20 +214,20 @@ class TestObservationRepository:
         self, mock_db: MagicMock
     ) -> None:
         mock_db.execute.return_value = [
-            {
-                "observation_id": self.test_observation.observation_id,
-                "queenright": self.test_observation.queenright,
-                "queen_cells": self.test_observation.queen_cells,
-                "bias": self.test_observation.bias,
-                "brood_frames": self.test_observation.brood_frames,
-                "store_frames": self.test_observation.store_frames,
-                "chalk_brood": self.test_observation.chalk_brood,
-                "foul_brood": self.test_observation.foul_brood,
-                "varroa_count": self.test_observation.varroa_count,
-                "temper": self.test_observation.temper,
-                "notes": self.test_observation.notes,
-                "inspection_id": self.test_observation.inspection_id,
-            }
+            Observation(
+                observation_id=self.test_observation.observation_id,
+                queenright=self.test_observation.queenright,
+                queen_cells=self.test_observation.queen_cells,
+                bias=self.test_observation.bias,
+                brood_frames=self.test_observation.brood_frames,
+                store_frames=self.test_observation.store_frames,
+                chalk_brood=self.test_observation.chalk_brood,
+                foul_brood=self.test_observation.foul_brood,
+                varroa_count=self.test_observation.varroa_count,
+                temper=self.test_observation.temper,
+                notes=self.test_observation.notes,
+                inspection_id=self.test_observation.inspection_id,
+            )
         ]
         repo: ObservationRepository = ObservationRepository(db=mock_db)
 
@@ -225,8 +236,9 @@ class TestObservationRepository:
         )
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM observations WHERE inspection_id = %s LIMIT 1;",
+            "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE inspection_id = %s LIMIT 1;",
             [self.test_observation.observation_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(result, Observation)
         assert result.observation_id == self.test_observation.observation_id
@@ -251,60 +263,66 @@ class TestObservationRepository:
         result: Observation | None = repo.find_by_inspection_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM observations WHERE inspection_id = %s LIMIT 1;", [999]
+            "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE inspection_id = %s LIMIT 1;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_read_full_db_returns_all(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "observation_id": self.test_observation.observation_id,
-                "queenright": self.test_observation.queenright,
-                "queen_cells": self.test_observation.queen_cells,
-                "bias": self.test_observation.bias,
-                "brood_frames": self.test_observation.brood_frames,
-                "store_frames": self.test_observation.store_frames,
-                "chalk_brood": self.test_observation.chalk_brood,
-                "foul_brood": self.test_observation.foul_brood,
-                "varroa_count": self.test_observation.varroa_count,
-                "temper": self.test_observation.temper,
-                "notes": self.test_observation.notes,
-                "inspection_id": self.test_observation.inspection_id,
-            },
-            {
-                "observation_id": self.test_observation_2.observation_id,
-                "queenright": self.test_observation_2.queenright,
-                "queen_cells": self.test_observation_2.queen_cells,
-                "bias": self.test_observation_2.bias,
-                "brood_frames": self.test_observation_2.brood_frames,
-                "store_frames": self.test_observation_2.store_frames,
-                "chalk_brood": self.test_observation_2.chalk_brood,
-                "foul_brood": self.test_observation_2.foul_brood,
-                "varroa_count": self.test_observation_2.varroa_count,
-                "temper": self.test_observation_2.temper,
-                "notes": self.test_observation_2.notes,
-                "inspection_id": self.test_observation_2.inspection_id,
-            },
-            {
-                "observation_id": self.test_observation_3.observation_id,
-                "queenright": self.test_observation_3.queenright,
-                "queen_cells": self.test_observation_3.queen_cells,
-                "bias": self.test_observation_3.bias,
-                "brood_frames": self.test_observation_3.brood_frames,
-                "store_frames": self.test_observation_3.store_frames,
-                "chalk_brood": self.test_observation_3.chalk_brood,
-                "foul_brood": self.test_observation_3.foul_brood,
-                "varroa_count": self.test_observation_3.varroa_count,
-                "temper": self.test_observation_3.temper,
-                "notes": self.test_observation_3.notes,
-                "inspection_id": self.test_observation_3.inspection_id,
-            },
+            Observation(
+                observation_id=self.test_observation.observation_id,
+                queenright=self.test_observation.queenright,
+                queen_cells=self.test_observation.queen_cells,
+                bias=self.test_observation.bias,
+                brood_frames=self.test_observation.brood_frames,
+                store_frames=self.test_observation.store_frames,
+                chalk_brood=self.test_observation.chalk_brood,
+                foul_brood=self.test_observation.foul_brood,
+                varroa_count=self.test_observation.varroa_count,
+                temper=self.test_observation.temper,
+                notes=self.test_observation.notes,
+                inspection_id=self.test_observation.inspection_id,
+            ),
+            Observation(
+                observation_id=self.test_observation_2.observation_id,
+                queenright=self.test_observation_2.queenright,
+                queen_cells=self.test_observation_2.queen_cells,
+                bias=self.test_observation_2.bias,
+                brood_frames=self.test_observation_2.brood_frames,
+                store_frames=self.test_observation_2.store_frames,
+                chalk_brood=self.test_observation_2.chalk_brood,
+                foul_brood=self.test_observation_2.foul_brood,
+                varroa_count=self.test_observation_2.varroa_count,
+                temper=self.test_observation_2.temper,
+                notes=self.test_observation_2.notes,
+                inspection_id=self.test_observation_2.inspection_id,
+            ),
+            Observation(
+                observation_id=self.test_observation_3.observation_id,
+                queenright=self.test_observation_3.queenright,
+                queen_cells=self.test_observation_3.queen_cells,
+                bias=self.test_observation_3.bias,
+                brood_frames=self.test_observation_3.brood_frames,
+                store_frames=self.test_observation_3.store_frames,
+                chalk_brood=self.test_observation_3.chalk_brood,
+                foul_brood=self.test_observation_3.foul_brood,
+                varroa_count=self.test_observation_3.varroa_count,
+                temper=self.test_observation_3.temper,
+                notes=self.test_observation_3.notes,
+                inspection_id=self.test_observation_3.inspection_id,
+            ),
         ]
         repo: ObservationRepository = ObservationRepository(db=mock_db)
 
         results: list[Observation] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM observations;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations;",
+            [],
+            row_factory=ROW_FACTORY,
+        )
         assert isinstance(results, (list, Observation))
         assert results[0].observation_id == 1
         assert results[1].observation_id == 2
@@ -317,7 +335,11 @@ class TestObservationRepository:
 
         result: list[Observation] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM observations;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations;",
+            [],
+            row_factory=ROW_FACTORY,
+        )
         assert result is None
 
     def test_can_update_valid_observation(self, mock_db: MagicMock) -> None:
@@ -344,7 +366,7 @@ class TestObservationRepository:
         )
 
         mock_db.execute.assert_called_once_with(
-            "UPDATE observations SET queenright = %s, queen-cells = %s, bias = %s, brood_frames = %s, store_frames = %s, chalk_brood = %s, foul_brood = %s, varroa_count = %s, temper = %s, notes = %s, inspection_id = %s RETURNING observation_id;",
+            "UPDATE observations AS o SET queenright = %s, queen_cells = %s, bias = %s, brood_frames = %s, store_frames = %s, chalk_brood = %s, foul_brood = %s, varroa_count = %s, temper = %s, notes = %s, inspection_id = target.inspection_id, inspection_timestamp = coalesce(i.inspection_timestamp, o.inspection_timestamp) FROM (SELECT %s::integer AS inspection_id) AS target LEFT JOIN inspections AS i ON i.inspection_id = target.inspection_id WHERE o.observation_id = %s RETURNING o.observation_id;",
             [
                 self.test_observation.queenright,
                 self.test_observation.queen_cells,
@@ -395,7 +417,7 @@ class TestObservationRepository:
         )
 
         mock_db.execute.assert_called_once_with(
-            "UPDATE observations SET queenright = %s, queen-cells = %s, bias = %s, brood_frames = %s, store_frames = %s, chalk_brood = %s, foul_brood = %s, varroa_count = %s, temper = %s, notes = %s, inspection_id = %s RETURNING observation_id;",
+            "UPDATE observations AS o SET queenright = %s, queen_cells = %s, bias = %s, brood_frames = %s, store_frames = %s, chalk_brood = %s, foul_brood = %s, varroa_count = %s, temper = %s, notes = %s, inspection_id = target.inspection_id, inspection_timestamp = coalesce(i.inspection_timestamp, o.inspection_timestamp) FROM (SELECT %s::integer AS inspection_id) AS target LEFT JOIN inspections AS i ON i.inspection_id = target.inspection_id WHERE o.observation_id = %s RETURNING o.observation_id;",
             [
                 self.test_observation.queenright,
                 self.test_observation.queen_cells,
@@ -434,3 +456,149 @@ class TestObservationRepository:
             [999],
         )
         assert result is False
+
+    def test_create_many_observations(self, mock_db: MagicMock) -> None:
+        mock_db.copy.return_value = 1
+        repo: ObservationRepository = ObservationRepository(db=mock_db)
+
+        result: int = repo.create_many(
+            [(True, 0, True, 4, 2, False, False, 3, 1, "calm", 1, TIMESTAMP)]
+        )
+
+        mock_db.copy.assert_called_once_with(
+            "COPY observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id, inspection_timestamp) FROM STDIN;",
+            [[True, 0, True, 4, 2, False, False, 3, 1, "calm", 1, TIMESTAMP]],
+        )
+        assert result == 1
+
+    def test_find_by_inspection_ids(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [self.test_observation]
+        repo: ObservationRepository = ObservationRepository(db=mock_db)
+
+        result = repo.find_by_inspection_ids([1, 2])
+
+        mock_db.execute.assert_called_once_with(
+            "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE inspection_id = ANY(%s) ORDER BY observation_id;",
+            [[1, 2]],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [self.test_observation]
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.mark.anyio
+class TestAsyncObservationRepository:
+    test_observation: Observation = Observation(
+        observation_id=1,
+        queenright=True,
+        queen_cells=0,
+        bias=True,
+        brood_frames=6,
+        store_frames=5,
+        chalk_brood=False,
+        foul_brood=False,
+        varroa_count=10,
+        temper=5,
+        notes="Happy bees!",
+        inspection_id=1,
+    )
+
+    async def test_can_find_observation_by_valid_observation_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = [self.test_observation]
+        repo: AsyncObservationRepository = AsyncObservationRepository(db=mock_async_db)
+
+        result: Observation | None = await repo.find_by_observation_id(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE observation_id = %s LIMIT 1;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == self.test_observation
+
+    async def test_can_not_find_observation_by_invalid_inspection_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = []
+        repo: AsyncObservationRepository = AsyncObservationRepository(db=mock_async_db)
+
+        result: Observation | None = await repo.find_by_inspection_id(999)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE inspection_id = %s LIMIT 1;",
+            [999],
+            row_factory=ROW_FACTORY,
+        )
+        assert result is None
+
+    async def test_can_delete_valid_observation(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [{"observation_id": 1}]
+        repo: AsyncObservationRepository = AsyncObservationRepository(db=mock_async_db)
+
+        result: bool = await repo.delete(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "DELETE FROM observations WHERE observation_id = %s RETURNING observation_id;",
+            [1],
+        )
+        assert result is True
+
+    async def test_create_many_observations(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.copy.return_value = 1
+        repo: AsyncObservationRepository = AsyncObservationRepository(db=mock_async_db)
+
+        result: int = await repo.create_many(
+            [(True, 0, True, 4, 2, False, False, 3, 1, "calm", 1, TIMESTAMP)]
+        )
+
+        mock_async_db.copy.assert_awaited_once_with(
+            "COPY observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id, inspection_timestamp) FROM STDIN;",
+            [[True, 0, True, 4, 2, False, False, 3, 1, "calm", 1, TIMESTAMP]],
+        )
+        assert result == 1
+
+    async def test_find_by_inspection_ids_none_found(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = None
+        repo: AsyncObservationRepository = AsyncObservationRepository(db=mock_async_db)
+
+        result = await repo.find_by_inspection_ids([999])
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE inspection_id = ANY(%s) ORDER BY observation_id;",
+            [[999]],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == []
+
+
+def test_find_by_ids(mock_db: MagicMock) -> None:
+    mock_db.execute.return_value = None
+    repo = ObservationRepository(db=mock_db)
+
+    assert repo.find_by_ids([2, 1]) == []
+    mock_db.execute.assert_called_once_with(
+        "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE observation_id = ANY(%s) ORDER BY observation_id;",
+        [[2, 1]],
+        row_factory=ROW_FACTORY,
+    )
+
+
+@pytest.mark.anyio
+async def test_async_find_by_ids(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = ["row"]
+    repo = AsyncObservationRepository(db=mock_async_db)
+
+    assert await repo.find_by_ids((1, 2)) == ["row"]
+    mock_async_db.execute.assert_awaited_once_with(
+        "SELECT observation_id, queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id FROM observations WHERE observation_id = ANY(%s) ORDER BY observation_id;",
+        [[1, 2]],
+        row_factory=ROW_FACTORY,
+    )
@@ -1,7 +1,7 @@
 """Tests for Observation routes"""
 
 from collections.abc import Generator
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -16,8 +16,8 @@ client = TestClient(app)
 
 
 @pytest.fixture
-def mock_observation_service() -> Generator[MagicMock, None, None]:
-    mock = MagicMock()
+def mock_observation_service() -> Generator[AsyncMock, None, None]:
+    mock = AsyncMock()
     app.dependency_overrides[get_observation_service] = lambda: mock
     yield mock
     app.dependency_overrides.clear()
@@ -53,7 +53,7 @@ class TestObservationRoutes:
 
     def test_create_observation_success(
         self,
-        mock_observation_service: MagicMock,
+        mock_observation_service: AsyncMock,
         valid_observation_read: ObservationRead,
     ) -> None:
         mock_observation_service.create_observation.return_value = (
@@ -107,7 +107,7 @@ class TestObservationRoutes:
         )
 
     def test_create_observation_failure(
-        self, mock_observation_service: MagicMock
+        self, mock_observation_service: AsyncMock
     ) -> None:
         mock_observation_service.create_observation.side_effect = ValueError()
 
@@ -144,7 +144,7 @@ class TestObservationRoutes:
 
     def test_get_observations_by_inspection_id_success(
         self,
-        mock_observation_service: MagicMock,
+        mock_observation_service: AsyncMock,
         valid_observation_read: ObservationRead,
     ) -> None:
         mock_observation_service.find_observation_by_inspection_id.return_value = (
@@ -173,7 +173,7 @@ class TestObservationRoutes:
         )
 
     def test_get_observation_by_inspection_id_not_found(
-        self, mock_observation_service: MagicMock
+        self, mock_observation_service: AsyncMock
     ) -> None:
         mock_observation_service.find_observation_by_inspection_id.return_value = None
 
@@ -187,7 +187,7 @@ class TestObservationRoutes:
 
     def test_get_observation_by_observation_id_success(
         self,
-        mock_observation_service: MagicMock,
+        mock_observation_service: AsyncMock,
         valid_observation_read: ObservationRead,
     ) -> None:
         mock_observation_service.find_observation_by_observation_id.return_value = (
@@ -216,7 +216,7 @@ class TestObservationRoutes:
         )
 
     def test_get_observation_by_observation_id_not_found(
-        self, mock_observation_service: MagicMock
+        self, mock_observation_service: AsyncMock
     ) -> None:
         mock_observation_service.find_observation_by_observation_id.return_value = None
 
@@ -226,7 +226,7 @@ class TestObservationRoutes:
         assert response.json()["detail"] == "No observations found for this inspection"
 
     def test_update_observation_success(
-        self, mock_observation_service: MagicMock
+        self, mock_observation_service: AsyncMock
     ) -> None:
         updated_observation = Observation(
             observation_id=1,
@@ -292,7 +292,7 @@ class TestObservationRoutes:
         )
 
     def test_update_observation_failure(
-        self, mock_observation_service: MagicMock
+        self, mock_observation_service: AsyncMock
     ) -> None:
         mock_observation_service.update_observation.side_effect = ValueError()
 
@@ -330,7 +330,7 @@ class TestObservationRoutes:
         )
 
     def test_delete_observation_success(
-        self, mock_observation_service: MagicMock
+        self, mock_observation_service: AsyncMock
     ) -> None:
         mock_observation_service.delete_observation.return_value = True
 
@@ -343,7 +343,7 @@ class TestObservationRoutes:
         )
 
     def test_delete_observation_not_found(
-        self, mock_observation_service: MagicMock
+        self, mock_observation_service: AsyncMock
     ) -> None:
         mock_observation_service.delete_observation.side_effect = ValueError(
             "Invalid observation_id"
@@ -353,3 +353,94 @@ class TestObservationRoutes:
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Invalid observation_id"
+
+    def test_get_observations_by_ids(self, mock_observation_service: AsyncMock) -> None:
+        mock_observation_service.find_observations_by_observation_ids.return_value = [
+            {
+                "observation_id": 1,
+                "queenright": True,
+                "queen_cells": 0,
+                "bias": True,
+                "brood_frames": 4,
+                "store_frames": 2,
+                "chalk_brood": False,
+                "foul_brood": False,
+                "varroa_count": 3,
+                "temper": 1,
+                "notes": "calm",
+                "inspection_id": 1,
+            },
+            {
+                "observation_id": 3,
+                "queenright": True,
+                "queen_cells": 0,
+                "bias": True,
+                "brood_frames": 4,
+                "store_frames": 2,
+                "chalk_brood": False,
+                "foul_brood": False,
+                "varroa_count": 3,
+                "temper": 1,
+                "notes": "calm",
+                "inspection_id": 1,
+            },
+        ]
+
+        response = client.get("/observations?ids=3,1,3")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == [
+            {
+                "observation_id": 1,
+                "queenright": True,
+                "queen_cells": 0,
+                "bias": True,
+                "brood_frames": 4,
+                "store_frames": 2,
+                "chalk_brood": False,
+                "foul_brood": False,
+                "varroa_count": 3,
+                "temper": 1,
+                "notes": "calm",
+                "inspection_id": 1,
+            },
+            {
+                "observation_id": 3,
+                "queenright": True,
+                "queen_cells": 0,
+                "bias": True,
+                "brood_frames": 4,
+                "store_frames": 2,
+                "chalk_brood": False,
+                "foul_brood": False,
+                "varroa_count": 3,
+                "temper": 1,
+                "notes": "calm",
+                "inspection_id": 1,
+            },
+        ]
+        mock_observation_service.find_observations_by_observation_ids.assert_called_once_with(
+            observation_ids=[3, 1]
+        )
+
+    def test_get_observations_by_ids_not_found(
+        self, mock_observation_service: AsyncMock
+    ) -> None:
+        mock_observation_service.find_observations_by_observation_ids.return_value = []
+
+        response = client.get("/observations?ids=998,999")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No observations found"
+
+    def test_get_observations_by_invalid_ids(
+        self, mock_observation_service: AsyncMock
+    ) -> None:
+        mock_observation_service.find_observations_by_observation_ids.side_effect = (
+            ValueError("Invalid observation_id")
+        )
+
+        response = client.get("/observations?ids=1,-1")
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid observation_id"
@@ -1,14 +1,15 @@
 """Tests for ObservationService"""
 
+from dataclasses import asdict
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from models.inspection import Inspection
 from models.observation import Observation
-from services.observation import ObservationService
+from services.observation import AsyncObservationService, ObservationService
 
 
 @pytest.fixture
@@ -148,10 +149,9 @@ def test_can_not_create_observation_invalid_inspection_id(
 
 
 def test_can_not_create_observation_missing_inspection_id(
-    observation_repo: MagicMock, inspection_repo: MagicMock, test_data: Observation
+    observation_repo: MagicMock, inspection_repo: MagicMock
 ) -> None:
-    observation_repo.create.return_value = test_data
-    inspection_repo.find_by_inspection_id.return_value = None
+    observation_repo.create.side_effect = LookupError
     queenright = True
     queen_cells = 5
     bias = True
@@ -374,7 +374,7 @@ def test_can_not_update_observation_missing_observation_id(
     temper = 5
     notes = "Example notes"
     inspection_id = 1
-    observation_repo.find_by_observation_id.return_value = None
+    observation_repo.update.return_value = None
     observation_service: ObservationService = ObservationService(
         observation_repo, inspection_repo
     )
@@ -485,7 +485,7 @@ def test_can_not_update_observation_missing_inspection_id(
     temper = 5
     notes = "Example note"
     inspection_id = 999
-    inspection_repo.find_by_inspection_id.return_value = None
+    observation_repo.update.side_effect = LookupError
     observation_service: ObservationService = ObservationService(
         observation_repo, inspection_repo
     )
@@ -545,3 +545,29 @@ def test_can_not_delete_observation_invalid_observation_id(
 
     with pytest.raises(ValueError, match="Invalid observation_id"):
         observation_service.delete_observation(-1)
+
+
+@pytest.mark.anyio
+async def test_async_create_observation(test_data: Observation) -> None:
+    observation_repo, inspection_repo = AsyncMock(), AsyncMock()
+    observation_repo.create.return_value = test_data
+    observation_service = AsyncObservationService(observation_repo, inspection_repo)
+    payload = {k: v for k, v in asdict(test_data).items() if k != "observation_id"}
+
+    result: Observation | None = await observation_service.create_observation(**payload)
+
+    inspection_repo.find_by_inspection_id.assert_not_awaited()
+    observation_repo.create.assert_awaited_once_with(**payload)
+    assert result == test_data
+
+
+@pytest.mark.anyio
+async def test_async_can_not_update_missing_observation(
+    test_data: Observation,
+) -> None:
+    observation_repo, inspection_repo = AsyncMock(), AsyncMock()
+    observation_repo.update.return_value = None
+    observation_service = AsyncObservationService(observation_repo, inspection_repo)
+
+    with pytest.raises(ValueError, match="Invalid observation_id"):
+        await observation_service.update_observation(**asdict(test_data))
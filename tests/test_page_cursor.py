@@ -0,0 +1,51 @@
+"""Tests for PageCursor class"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from utils.page_cursor import PageCursor
+
+
+class TestPageCursor:
+    def test_round_trip_primary_key(self) -> None:
+        cursor = PageCursor.encode(42)
+
+        assert PageCursor.decode(cursor, int) == (42,)
+
+    def test_round_trip_timestamp_key(self) -> None:
+        timestamp = datetime(2025, 6, 23, 2, 10, 25, tzinfo=UTC)
+        cursor = PageCursor.encode(timestamp, 7)
+
+        assert PageCursor.decode(cursor, datetime, int) == (timestamp, 7)
+
+    def test_round_trip_ranked_key(self) -> None:
+        timestamp = datetime(2025, 6, 23, 2, 10, 25, tzinfo=UTC)
+        cursor = PageCursor.encode(0.0607927, timestamp, "observation", 7)
+
+        assert PageCursor.decode(cursor, float, datetime, str, int) == (
+            0.0607927,
+            timestamp,
+            "observation",
+            7,
+        )
+
+    def test_whole_float_decodes_as_float(self) -> None:
+        assert PageCursor.decode(PageCursor.encode(1), float) == (1.0,)
+
+    def test_cursor_is_url_safe(self) -> None:
+        cursor = PageCursor.encode(datetime(2025, 6, 23, tzinfo=UTC), 2**40)
+
+        assert cursor.replace("-", "").replace("_", "").isalnum()
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["not a cursor", "", PageCursor.encode(1, 2), PageCursor.encode("1")],
+    )
+    def test_invalid_cursor(self, cursor: str) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            PageCursor.decode(cursor, int)
+
+    def test_invalid_timestamp(self) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            PageCursor.decode(PageCursor.encode(1, 2), datetime, int)
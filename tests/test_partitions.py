@@ -0,0 +1,84 @@
+"""Tests for PartitionManager class"""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from db.partitions import ARCHIVE_QUERY, CREATE_QUERY, YEARS_QUERY, PartitionManager
+
+THIS_YEAR = datetime.now(UTC).year
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    return MagicMock()
+
+
+class TestPartitionManager:
+    def test_years(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [{"year": 2024}, {"year": 2025}]
+        manager = PartitionManager(mock_db)
+
+        assert manager.years() == [2024, 2025]
+        mock_db.execute.assert_called_once_with(YEARS_QUERY, [], prepare=False)
+
+    def test_no_years(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = None
+        manager = PartitionManager(mock_db)
+
+        assert manager.years() == []
+
+    def test_create(self, mock_db: MagicMock) -> None:
+        manager = PartitionManager(mock_db)
+
+        manager.create(2030)
+
+        mock_db.execute.assert_called_once_with(CREATE_QUERY, [2030], prepare=False)
+
+    def test_ensure_creates_missing_years(self, mock_db: MagicMock) -> None:
+        mock_db.execute.side_effect = [[{"year": THIS_YEAR}], None, None]
+        manager = PartitionManager(mock_db)
+
+        assert manager.ensure(ahead=2) == [THIS_YEAR + 1, THIS_YEAR + 2]
+        assert mock_db.execute.call_args_list[1:] == [
+            call(CREATE_QUERY, [THIS_YEAR + 1], prepare=False),
+            call(CREATE_QUERY, [THIS_YEAR + 2], prepare=False),
+        ]
+
+    def test_ensure_with_every_year_created(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [{"year": THIS_YEAR}, {"year": THIS_YEAR + 1}]
+        manager = PartitionManager(mock_db)
+
+        assert manager.ensure() == []
+        mock_db.execute.assert_called_once_with(YEARS_QUERY, [], prepare=False)
+
+    def test_archive(self, mock_db: MagicMock) -> None:
+        mock_db.execute.side_effect = [[{"year": 2019}], None]
+        manager = PartitionManager(mock_db)
+
+        manager.archive(2019)
+
+        mock_db.execute.assert_called_with(ARCHIVE_QUERY, [2019], prepare=False)
+
+    def test_archive_year_without_partitions(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [{"year": 2020}]
+        manager = PartitionManager(mock_db)
+
+        with pytest.raises(ValueError, match="No partitions attached for 2019"):
+            manager.archive(2019)
+        mock_db.execute.assert_called_once_with(YEARS_QUERY, [], prepare=False)
+
+    def test_archive_before(self, mock_db: MagicMock) -> None:
+        mock_db.execute.side_effect = [
+            [{"year": 2018}, {"year": 2019}, {"year": 2020}],
+            None,
+            None,
+        ]
+        manager = PartitionManager(mock_db)
+
+        assert manager.archive_before(2020) == [2018, 2019]
+        assert mock_db.execute.call_args_list[1:] == [
+            call(ARCHIVE_QUERY, [2018], prepare=False),
+            call(ARCHIVE_QUERY, [2019], prepare=False),
+        ]
@@ -10,3 +10,21 @@ def test_password_is_hashed() -> None:
     hashed_password = hasher.hash(password)
 
     assert hasher.verify(password, hashed_password) is True
+
+
+def test_password_is_hashed_at_given_cost() -> None:
+    hashed_password = PasswordHasher.hash("password", rounds=4)
+
+    assert hashed_password.startswith("$2b$04$")
+    assert PasswordHasher.verify("password", hashed_password) is True
+
+
+def test_needs_rehash_when_cost_changes() -> None:
+    hashed_password = PasswordHasher.hash("password", rounds=4)
+
+    assert PasswordHasher.needs_rehash(hashed_password, rounds=4) is False
+    assert PasswordHasher.needs_rehash(hashed_password, rounds=5) is True
+
+
+def test_needs_rehash_for_unrecognised_hash() -> None:
+    assert PasswordHasher.needs_rehash("not a bcrypt hash") is True
@@ -1,11 +1,11 @@
 """Tests for the Queen Repository"""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from models.queen import Queen
-from repositories.queen import QueenRepository
+from repositories.queen import ROW_FACTORY, AsyncQueenRepository, QueenRepository
 
 
 @pytest.fixture
@@ -64,20 +64,21 @@ class TestQueenRepository:
 
     def test_can_find_queen_by_valid_queen_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "queen_id": self.test_queen.queen_id,
-                "colour": self.test_queen.colour,
-                "clipped": self.test_queen.clipped,
-                "colony_id": self.test_queen.colony_id,
-            }
+            Queen(
+                queen_id=self.test_queen.queen_id,
+                colour=self.test_queen.colour,
+                clipped=self.test_queen.clipped,
+                colony_id=self.test_queen.colony_id,
+            )
         ]
         repo: QueenRepository = QueenRepository(db=mock_db)
 
         result: Queen | None = repo.find_by_queen_id(self.test_queen.queen_id)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM queens WHERE queen_id = %s LIMIT 1;",
+            "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE queen_id = %s LIMIT 1;",
             [self.test_queen.queen_id],
+            row_factory=ROW_FACTORY,
         )
         assert isinstance(result, Queen)
         assert result.queen_id == self.test_queen.queen_id
@@ -92,70 +93,88 @@ class TestQueenRepository:
         result: Queen | None = repo.find_by_queen_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM queens WHERE queen_id = %s LIMIT 1;", [999]
+            "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE queen_id = %s LIMIT 1;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_can_find_queens_by_valid_colony_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "queen_id": self.test_queen.queen_id,
-                "colour": self.test_queen.colour,
-                "clipped": self.test_queen.clipped,
-                "colony_id": self.test_queen.colony_id,
-            }
+            Queen(
+                queen_id=self.test_queen.queen_id,
+                colour=self.test_queen.colour,
+                clipped=self.test_queen.clipped,
+                colony_id=self.test_queen.colony_id,
+            )
         ]
         repo: QueenRepository = QueenRepository(db=mock_db)
 
-        result: Queen | None = repo.find_by_colony_id(self.test_queen.colony_id)
+        result: list[Queen] | None = repo.find_by_colony_id(self.test_queen.colony_id)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM queens WHERE colony_id = %s LIMIT 1;",
+            "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE colony_id = %s ORDER BY queen_id;",
             [self.test_queen.colony_id],
+            row_factory=ROW_FACTORY,
         )
-        assert isinstance(result, Queen)
-        assert result.queen_id == self.test_queen.queen_id
-        assert result.colour == self.test_queen.colour
-        assert result.clipped == self.test_queen.clipped
-        assert result.colony_id == self.test_queen.colony_id
+        assert result == [self.test_queen]
+
+    def test_find_page_by_colony_id(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [self.test_queen]
+        repo: QueenRepository = QueenRepository(db=mock_db)
+
+        result: list[Queen] | None = repo.find_by_colony_id(1, limit=2, after=0)
+
+        mock_db.execute.assert_called_once_with(
+            "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE colony_id = %s AND queen_id > %s ORDER BY queen_id LIMIT %s;",
+            [1, 0, 2],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [self.test_queen]
 
     def test_can_not_find_queen_by_invalid_colony_id(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = []
         repo: QueenRepository = QueenRepository(db=mock_db)
 
-        result: Queen | None = repo.find_by_colony_id(999)
+        result: list[Queen] | None = repo.find_by_colony_id(999)
 
         mock_db.execute.assert_called_once_with(
-            "SELECT * FROM queens WHERE colony_id = %s LIMIT 1;", [999]
+            "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE colony_id = %s ORDER BY queen_id;",
+            [999],
+            row_factory=ROW_FACTORY,
         )
         assert result is None
 
     def test_read_full_db_returns_all(self, mock_db: MagicMock) -> None:
         mock_db.execute.return_value = [
-            {
-                "queen_id": self.test_queen.queen_id,
-                "colour": self.test_queen.colour,
-                "clipped": self.test_queen.clipped,
-                "colony_id": self.test_queen.colony_id,
-            },
-            {
-                "queen_id": self.test_queen_2.queen_id,
-                "colour": self.test_queen_2.colour,
-                "clipped": self.test_queen_2.clipped,
-                "colony_id": self.test_queen_2.colony_id,
-            },
-            {
-                "queen_id": self.test_queen_3.queen_id,
-                "colour": self.test_queen_3.colour,
-                "clipped": self.test_queen_3.clipped,
-                "colony_id": self.test_queen_3.colony_id,
-            },
+            Queen(
+                queen_id=self.test_queen.queen_id,
+                colour=self.test_queen.colour,
+                clipped=self.test_queen.clipped,
+                colony_id=self.test_queen.colony_id,
+            ),
+            Queen(
+                queen_id=self.test_queen_2.queen_id,
+                colour=self.test_queen_2.colour,
+                clipped=self.test_queen_2.clipped,
+                colony_id=self.test_queen_2.colony_id,
+            ),
+            Queen(
+                queen_id=self.test_queen_3.queen_id,
+                colour=self.test_queen_3.colour,
+                clipped=self.test_queen_3.clipped,
+                colony_id=self.test_queen_3.colony_id,
+            ),
         ]
         repo: QueenRepository = QueenRepository(db=mock_db)
 
         results: list[Queen] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM queens;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT queen_id, colour, clipped, colony_id FROM queens;",
+            [],
+            row_factory=ROW_FACTORY,
+        )
         assert isinstance(results, (list, Queen))
         assert results[0].queen_id == 1
         assert results[1].queen_id == 2
@@ -168,7 +187,11 @@ class TestQueenRepository:
 
         result: list[Queen] | None = repo.read()
 
-        mock_db.execute.assert_called_once_with("SELECT * FROM queens;", [])
+        mock_db.execute.assert_called_once_with(
+            "SELECT queen_id, colour, clipped, colony_id FROM queens;",
+            [],
+            row_factory=ROW_FACTORY,
+        )
         assert result is None
 
     def test_can_update_valid_queen(self, mock_db: MagicMock) -> None:
@@ -221,3 +244,110 @@ class TestQueenRepository:
             "DELETE FROM queens WHERE queen_id = %s RETURNING queen_id;", [999]
         )
         assert result is False
+
+    def test_find_by_colony_ids(self, mock_db: MagicMock) -> None:
+        mock_db.execute.return_value = [self.test_queen]
+        repo: QueenRepository = QueenRepository(db=mock_db)
+
+        result = repo.find_by_colony_ids([1, 2])
+
+        mock_db.execute.assert_called_once_with(
+            "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE colony_id = ANY(%s) ORDER BY queen_id;",
+            [[1, 2]],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [self.test_queen]
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.mark.anyio
+class TestAsyncQueenRepository:
+    test_queen: Queen = Queen(queen_id=1, colour="Yellow", clipped=True, colony_id=1)
+
+    async def test_create_queen(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = [{"queen_id": 1}]
+        repo: AsyncQueenRepository = AsyncQueenRepository(db=mock_async_db)
+
+        result: Queen | None = await repo.create(
+            colour="Yellow", clipped=True, colony_id=1
+        )
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "INSERT INTO queens (colour, clipped, colony_id) VALUES (%s, %s, %s) RETURNING queen_id;",
+            ["Yellow", True, 1],
+        )
+        assert result == self.test_queen
+
+    async def test_can_find_queen_by_valid_colony_id(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = [
+            Queen(queen_id=1, colour="Yellow", clipped=True, colony_id=1)
+        ]
+        repo: AsyncQueenRepository = AsyncQueenRepository(db=mock_async_db)
+
+        result: list[Queen] | None = await repo.find_by_colony_id(1)
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE colony_id = %s ORDER BY queen_id;",
+            [1],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == [self.test_queen]
+
+    async def test_read_empty_db_returns_none(self, mock_async_db: AsyncMock) -> None:
+        mock_async_db.execute.return_value = []
+        repo: AsyncQueenRepository = AsyncQueenRepository(db=mock_async_db)
+
+        result: list[Queen] | None = await repo.read()
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT queen_id, colour, clipped, colony_id FROM queens;",
+            [],
+            row_factory=ROW_FACTORY,
+        )
+        assert result is None
+
+    async def test_find_by_colony_ids_none_found(
+        self, mock_async_db: AsyncMock
+    ) -> None:
+        mock_async_db.execute.return_value = None
+        repo: AsyncQueenRepository = AsyncQueenRepository(db=mock_async_db)
+
+        result = await repo.find_by_colony_ids([999])
+
+        mock_async_db.execute.assert_awaited_once_with(
+            "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE colony_id = ANY(%s) ORDER BY queen_id;",
+            [[999]],
+            row_factory=ROW_FACTORY,
+        )
+        assert result == []
+
+
+def test_find_by_ids(mock_db: MagicMock) -> None:
+    mock_db.execute.return_value = None
+    repo = QueenRepository(db=mock_db)
+
+    assert repo.find_by_ids([2, 1]) == []
+    mock_db.execute.assert_called_once_with(
+        "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE queen_id = ANY(%s) ORDER BY queen_id;",
+        [[2, 1]],
+        row_factory=ROW_FACTORY,
+    )
+
+
+@pytest.mark.anyio
+async def test_async_find_by_ids(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = ["row"]
+    repo = AsyncQueenRepository(db=mock_async_db)
+
+    assert await repo.find_by_ids((1, 2)) == ["row"]
+    mock_async_db.execute.assert_awaited_once_with(
+        "SELECT queen_id, colour, clipped, colony_id FROM queens WHERE queen_id = ANY(%s) ORDER BY queen_id;",
+        [[1, 2]],
+        row_factory=ROW_FACTORY,
+    )
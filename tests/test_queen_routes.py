@@ -1,7 +1,7 @@
 """Tests for Queen routes"""
 
 from collections.abc import Generator
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -10,13 +10,14 @@ from main import app
 from models.queen import Queen
 from services.dependencies import get_queen_service
 from services.queen import QueenService
+from utils.page_cursor import PageCursor
 
 client: TestClient = TestClient(app)
 
 
 @pytest.fixture
-def mock_queen_service() -> Generator[MagicMock, None, None]:
-    mock: MagicMock = MagicMock()
+def mock_queen_service() -> Generator[AsyncMock, None, None]:
+    mock: AsyncMock = AsyncMock()
     app.dependency_overrides[get_queen_service] = lambda: mock
     yield mock
     app.dependency_overrides.clear()
@@ -35,8 +36,8 @@ class TestQueenRoutes:
         assert service is not None
         assert isinstance(service, QueenService)
 
-    def test_create_queen_success(self, mock_queen_service: MagicMock) -> None:
-        mock_queen_service.create_queen = MagicMock(return_value=self.valid_queen)
+    def test_create_queen_success(self, mock_queen_service: AsyncMock) -> None:
+        mock_queen_service.create_queen = AsyncMock(return_value=self.valid_queen)
 
         response = client.post(
             "/queens", json={"colour": "Yellow", "clipped": True, "colony_id": 1}
@@ -53,7 +54,7 @@ class TestQueenRoutes:
             colour="Yellow", clipped=True, colony_id=1
         )
 
-    def test_create_queen_failure(self, mock_queen_service: MagicMock) -> None:
+    def test_create_queen_failure(self, mock_queen_service: AsyncMock) -> None:
         mock_queen_service.create_queen.side_effect = ValueError()
 
         response = client.post(
@@ -63,9 +64,9 @@ class TestQueenRoutes:
         assert response.status_code == 422
 
     def test_get_queen_by_colony_id_success(
-        self, mock_queen_service: MagicMock
+        self, mock_queen_service: AsyncMock
     ) -> None:
-        mock_queen_service.find_queen_by_colony_id = MagicMock(
+        mock_queen_service.find_queen_by_colony_id = AsyncMock(
             return_value=[self.valid_queen]
         )
 
@@ -81,10 +82,33 @@ class TestQueenRoutes:
             }
         ]
 
-        mock_queen_service.find_queen_by_colony_id.assert_called_once_with(colony_id=1)
+        mock_queen_service.find_queen_by_colony_id.assert_called_once_with(
+            colony_id=1, limit=101, after=None
+        )
+
+    def test_get_queen_by_colony_id_links_next_page(
+        self, mock_queen_service: AsyncMock
+    ) -> None:
+        second_queen = Queen(queen_id=2, colour="Blue", clipped=False, colony_id=1)
+        mock_queen_service.find_queen_by_colony_id = AsyncMock(
+            return_value=[self.valid_queen, second_queen]
+        )
+
+        response = client.get(
+            "/colonies/1/queens", params={"limit": 1, "after": PageCursor.encode(0)}
+        )
+
+        assert response.status_code == 200
+        assert [queen["queen_id"] for queen in response.json()] == [
+            self.valid_queen.queen_id
+        ]
+        mock_queen_service.find_queen_by_colony_id.assert_called_once_with(
+            colony_id=1, limit=2, after=0
+        )
+        assert 'rel="next"' in response.headers["link"]
 
     def test_get_queen_by_colony_id_not_found(
-        self, mock_queen_service: MagicMock
+        self, mock_queen_service: AsyncMock
     ) -> None:
         mock_queen_service.find_queen_by_colony_id.return_value = []
 
@@ -93,8 +117,8 @@ class TestQueenRoutes:
         assert response.status_code == 404
         assert response.json()["detail"] == "No queens found for this colony"
 
-    def test_get_queen_by_queen_id_success(self, mock_queen_service: MagicMock) -> None:
-        mock_queen_service.find_queen_by_queen_id = MagicMock(
+    def test_get_queen_by_queen_id_success(self, mock_queen_service: AsyncMock) -> None:
+        mock_queen_service.find_queen_by_queen_id = AsyncMock(
             return_value=self.valid_queen
         )
 
@@ -110,7 +134,7 @@ class TestQueenRoutes:
         mock_queen_service.find_queen_by_queen_id.assert_called_once_with(queen_id=1)
 
     def test_get_queen_by_queen_id_not_found(
-        self, mock_queen_service: MagicMock
+        self, mock_queen_service: AsyncMock
     ) -> None:
         mock_queen_service.find_queen_by_queen_id.return_value = None
 
@@ -119,7 +143,7 @@ class TestQueenRoutes:
         assert response.status_code == 404
         assert response.json()["detail"] == "No queens found for this colony"
 
-    def test_update_queen_success(self, mock_queen_service: MagicMock) -> None:
+    def test_update_queen_success(self, mock_queen_service: AsyncMock) -> None:
         updated_queen = Queen(queen_id=1, colour="Yellow", clipped=True, colony_id=2)
         mock_queen_service.update_queen.return_value = updated_queen
 
@@ -138,7 +162,7 @@ class TestQueenRoutes:
             queen_id=1, colour="Yellow", clipped=True, colony_id=2
         )
 
-    def test_update_queen_failure(self, mock_queen_service: MagicMock) -> None:
+    def test_update_queen_failure(self, mock_queen_service: AsyncMock) -> None:
         mock_queen_service.update_queen.side_effect = ValueError()
 
         response = client.post(
@@ -147,7 +171,7 @@ class TestQueenRoutes:
 
         assert response.status_code == 400
 
-    def test_delete_queen_success(self, mock_queen_service: MagicMock) -> None:
+    def test_delete_queen_success(self, mock_queen_service: AsyncMock) -> None:
         mock_queen_service.delete_queen.return_value = True
 
         response = client.delete("/queens/1")
@@ -156,10 +180,45 @@ class TestQueenRoutes:
         assert response.json() is True
         mock_queen_service.delete_queen.assert_called_once_with(queen_id=1)
 
-    def test_delete_queen_not_found(self, mock_queen_service: MagicMock) -> None:
+    def test_delete_queen_not_found(self, mock_queen_service: AsyncMock) -> None:
         mock_queen_service.delete_queen.side_effect = ValueError("Invalid queen_id")
 
         response = client.delete("/queens/999")
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Invalid queen_id"
+
+    def test_get_queens_by_ids(self, mock_queen_service: AsyncMock) -> None:
+        mock_queen_service.find_queens_by_queen_ids.return_value = [
+            {"queen_id": 1, "colour": "Yellow", "clipped": True, "colony_id": 1},
+            {"queen_id": 3, "colour": "Yellow", "clipped": True, "colony_id": 1},
+        ]
+
+        response = client.get("/queens?ids=3,1,3")
+
+        assert response.status_code == 200, f"Unexpected status: {response.text}"
+        assert response.json() == [
+            {"queen_id": 1, "colour": "Yellow", "clipped": True, "colony_id": 1},
+            {"queen_id": 3, "colour": "Yellow", "clipped": True, "colony_id": 1},
+        ]
+        mock_queen_service.find_queens_by_queen_ids.assert_called_once_with(
+            queen_ids=[3, 1]
+        )
+
+    def test_get_queens_by_ids_not_found(self, mock_queen_service: AsyncMock) -> None:
+        mock_queen_service.find_queens_by_queen_ids.return_value = []
+
+        response = client.get("/queens?ids=998,999")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No queens found"
+
+    def test_get_queens_by_invalid_ids(self, mock_queen_service: AsyncMock) -> None:
+        mock_queen_service.find_queens_by_queen_ids.side_effect = ValueError(
+            "Invalid queen_id"
+        )
+
+        response = client.get("/queens?ids=1,-1")
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid queen_id"
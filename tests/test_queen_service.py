@@ -1,12 +1,12 @@
 """Tests for QueenService"""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from models.colony import Colony
 from models.queen import Queen
-from services.queen import QueenService
+from services.queen import AsyncQueenService, QueenService
 
 
 @pytest.fixture
@@ -63,13 +63,12 @@ def test_can_not_create_queen_invalid_colony_id(
 
 
 def test_can_not_create_queen_missing_colony_id(
-    queen_repo: MagicMock, colony_repo: MagicMock, test_data: Queen
+    queen_repo: MagicMock, colony_repo: MagicMock
 ) -> None:
     colour = "Yellow"
     clipped = True
     colony_id = 999
-    queen_repo.create.return_value = test_data
-    colony_repo.find_by_colony_id.return_value = None
+    queen_repo.create.side_effect = LookupError
     queen_service: QueenService = QueenService(queen_repo, colony_repo)
 
     with pytest.raises(ValueError, match="Invalid colony_id"):
@@ -199,7 +198,7 @@ def test_can_not_update_queen_invalid_queen_id(
 def test_can_not_update_queen_missing_queen_id(
     queen_repo: MagicMock, colony_repo: MagicMock
 ) -> None:
-    queen_repo.find_by_queen_id.return_value = None
+    queen_repo.update.return_value = None
     queen_service: QueenService = QueenService(queen_repo, colony_repo)
     queen_id = 999
     colour = "Yellow"
@@ -229,10 +228,9 @@ def test_can_not_update_queen_invalid_colony_id(
 
 
 def test_can_not_update_queen_missing_colony_id(
-    queen_repo: MagicMock, colony_repo: MagicMock, test_data: Queen
+    queen_repo: MagicMock, colony_repo: MagicMock
 ) -> None:
-    queen_repo.update.return_value = test_data
-    colony_repo.find_by_colony_id.return_value = None
+    queen_repo.update.side_effect = LookupError
     queen_id = 1
     colour = "Yellow"
     clipped = True
@@ -278,3 +276,32 @@ def test_can_not_delete_queen_invalid_queen_id(
 
     with pytest.raises(ValueError, match="Invalid queen_id"):
         queen_service.delete_queen(queen_id)
+
+
+@pytest.mark.anyio
+async def test_async_create_queen(test_data: Queen) -> None:
+    queen_repo, colony_repo = AsyncMock(), AsyncMock()
+    queen_repo.create.return_value = test_data
+    queen_service = AsyncQueenService(queen_repo, colony_repo)
+
+    result: Queen | None = await queen_service.create_queen(
+        colour=test_data.colour, clipped=test_data.clipped, colony_id=1
+    )
+
+    colony_repo.find_by_colony_id.assert_not_awaited()
+    assert result == test_data
+
+
+@pytest.mark.anyio
+async def test_async_can_not_update_missing_queen(test_data: Queen) -> None:
+    queen_repo, colony_repo = AsyncMock(), AsyncMock()
+    queen_repo.update.return_value = None
+    queen_service = AsyncQueenService(queen_repo, colony_repo)
+
+    with pytest.raises(ValueError, match="Invalid queen_id"):
+        await queen_service.update_queen(
+            queen_id=999,
+            colour=test_data.colour,
+            clipped=test_data.clipped,
+            colony_id=1,
+        )
@@ -0,0 +1,174 @@
+"""Tests that routes stay within their query budgets, through the real services"""
+
+import time
+from collections.abc import AsyncIterator, Generator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from db.instance import query_stats
+from db.instrumentation import BUDGET_ATTRIBUTE, QueryBudgetExceededError, emit
+from main import app
+from models.apiary import Apiary
+from models.colony import Colony
+from models.hive import Hive
+from models.inspection import Inspection
+from models.observation import Observation
+from models.queen import Queen
+from services.container import Container
+from services.dependencies import get_observation_service
+from utils.instance import hashing_executor
+
+client = TestClient(app)
+
+TIMESTAMP = datetime(2025, 6, 1, 10, 0, tzinfo=UTC)
+OBSERVATION = {
+    "queenright": True,
+    "queen_cells": 0,
+    "bias": True,
+    "brood_frames": 6,
+    "store_frames": 4,
+    "chalk_brood": False,
+    "foul_brood": False,
+    "varroa_count": 12,
+    "temper": 2,
+    "notes": "Calm",
+}
+
+
+class CountingConnection:
+    """
+    Stands in for async_db, answering each statement with the next canned result
+
+    Every statement is reported to query_stats as the real connection would,
+    so the request it belongs to is checked against its route's budget.
+    """
+
+    def __init__(self) -> None:
+        self.results: list[list] = []
+        self.statements: list[str] = []
+
+    def _answer(self, query: str) -> list:
+        self.statements.append(query)
+        emit([query_stats.record], query, time.perf_counter(), 1)
+        return self.results.pop(0) if self.results else []
+
+    async def execute(self, query: str, _params: list, **_options: object) -> list:
+        return self._answer(query)
+
+    async def executemany(
+        self, query: str, _params_seq: list[list], **_options: object
+    ) -> list:
+        return self._answer(query)
+
+    async def copy(self, statement: str, rows: list[list]) -> int:
+        self._answer(statement)
+        return len(rows)
+
+    @asynccontextmanager
+    async def request_scope(self) -> AsyncIterator[None]:
+        yield
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        yield
+
+
+@pytest.fixture
+def connection() -> Generator[CountingConnection, None, None]:
+    connection = CountingConnection()
+    container = Container(db=connection, hasher=hashing_executor)
+    with patch("services.dependencies.container", container):
+        yield connection
+
+
+class TestQueryBudgets:
+    def test_every_route_declares_a_budget(self) -> None:
+        undeclared = [
+            route.path
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            and not hasattr(route.endpoint, BUDGET_ATTRIBUTE)
+        ]
+
+        assert undeclared == []
+
+    def test_create_observation(self, connection: CountingConnection) -> None:
+        connection.results = [[{"observation_id": 1}]]
+
+        response = client.post(
+            "/observations", json={**OBSERVATION, "inspection_id": 1}
+        )
+
+        assert response.status_code == 200, response.text
+        assert len(connection.statements) == 1
+
+    def test_create_hive(self, connection: CountingConnection) -> None:
+        connection.results = [[{"hive_id": 1}]]
+
+        response = client.post("/hives", json={"name": "Hive 1", "apiary_id": 1})
+
+        assert response.status_code == 200, response.text
+        assert len(connection.statements) == 1
+
+    def test_apiary_tree_reads_one_query_per_level(
+        self, connection: CountingConnection
+    ) -> None:
+        connection.results = [
+            [Apiary(1, "Home", "Kent", 1)],
+            [Hive(1, "Hive 1", 1), Hive(2, "Hive 2", 1)],
+            [Colony(1, 1), Colony(2, 2)],
+            [
+                Queen(1, "Blue", clipped=True, colony_id=1),
+                Queen(2, "Red", clipped=False, colony_id=2),
+            ],
+            [Inspection(1, TIMESTAMP, 1), Inspection(2, TIMESTAMP, 2)],
+            [Observation(1, **OBSERVATION, inspection_id=1)],
+        ]
+
+        response = client.get("/apiaries/1/tree")
+
+        assert response.status_code == 200, response.text
+        assert len(connection.statements) == 6
+
+    def test_ingest_inspections(self, connection: CountingConnection) -> None:
+        connection.results = [[{"inspection_id": 1}, {"inspection_id": 2}]]
+        record = {
+            "inspection_timestamp": TIMESTAMP.isoformat(),
+            "colony_id": 1,
+            "observations": [OBSERVATION],
+            "actions": [{"notes": "Added a super"}],
+        }
+
+        response = client.post("/inspections/bulk", json=[record, record])
+
+        assert response.status_code == 200, response.text
+        assert len(connection.statements) == 3
+
+    def test_search_notes(self, connection: CountingConnection) -> None:
+        connection.results = [[]]
+
+        response = client.get("/search/notes?q=swarm&user_id=1")
+
+        assert response.status_code == 200, response.text
+        assert len(connection.statements) == 1
+
+    def test_a_query_over_budget_fails(self) -> None:
+        def create_observation(**fields: object) -> Observation:
+            # An existence check creeping back in ahead of the insert
+            emit([query_stats.record], "SELECT 1", time.perf_counter(), 1)
+            emit([query_stats.record], "INSERT", time.perf_counter(), 1)
+            return Observation(1, **fields)
+
+        service = AsyncMock()
+        service.create_observation.side_effect = create_observation
+        app.dependency_overrides[get_observation_service] = lambda: service
+        try:
+            with pytest.raises(QueryBudgetExceededError, match="budget of 1"):
+                client.post("/observations", json={**OBSERVATION, "inspection_id": 1})
+        finally:
+            app.dependency_overrides.clear()
@@ -2,13 +2,13 @@
 
 from collections.abc import Callable
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from models.session import Session
-from repositories.session import SessionRepository
+from repositories.session import ROW_FACTORY, AsyncSessionRepository, SessionRepository
 
 
 @pytest.fixture
@@ -67,16 +67,18 @@ def test_can_find_session_by_session_id(
         1, datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC")), 1
     )
     mock_db.execute.return_value = [
-        {
-            "session_id": test_case.session_id,
-            "session_start": test_case.session_start,
-            "user_id": test_case.user_id,
-        }
+        Session(
+            session_id=test_case.session_id,
+            session_start=test_case.session_start,
+            user_id=test_case.user_id,
+        )
     ]
     repo = SessionRepository(mock_db)
     result = repo.find_by_session_id(1)
     mock_db.execute.assert_called_once_with(
-        "SELECT * FROM sessions WHERE session_id = %s LIMIT 1;", [test_case.session_id]
+        "SELECT session_id, session_start, user_id FROM sessions WHERE session_id = %s LIMIT 1;",
+        [test_case.session_id],
+        row_factory=ROW_FACTORY,
     )
     assert result.session_id == test_case.session_id
     assert result.session_start == test_case.session_start
@@ -89,8 +91,9 @@ def test_can_not_find_session_by_session_id(mock_db: MagicMock) -> None:
     repo = SessionRepository(mock_db)
     result = repo.find_by_session_id(999)
     mock_db.execute.assert_called_once_with(
-        "SELECT * FROM sessions WHERE session_id = %s LIMIT 1;",
+        "SELECT session_id, session_start, user_id FROM sessions WHERE session_id = %s LIMIT 1;",
         [999],
+        row_factory=ROW_FACTORY,
     )
     assert result is None
 
@@ -103,17 +106,18 @@ def test_can_find_session_by_user_id(
         1, datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC")), 1
     )
     mock_db.execute.return_value = [
-        {
-            "session_id": test_case.session_id,
-            "session_start": test_case.session_start,
-            "user_id": test_case.user_id,
-        }
+        Session(
+            session_id=test_case.session_id,
+            session_start=test_case.session_start,
+            user_id=test_case.user_id,
+        )
     ]
     repo = SessionRepository(mock_db)
     result = repo.find_by_user_id(test_case.user_id)
     mock_db.execute.assert_called_once_with(
-        "SELECT * FROM sessions WHERE user_id = %s;",
+        "SELECT session_id, session_start, user_id FROM sessions WHERE user_id = %s;",
         [test_case.user_id],
+        row_factory=ROW_FACTORY,
     )
     assert isinstance(result, list)
     assert result[0].session_id == test_case.session_id
@@ -127,8 +131,9 @@ def test_can_not_find_session_by_user_id(mock_db: MagicMock) -> None:
     repo = SessionRepository(mock_db)
     result = repo.find_by_user_id(999)
     mock_db.execute.assert_called_once_with(
-        "SELECT * FROM sessions WHERE user_id = %s;",
+        "SELECT session_id, session_start, user_id FROM sessions WHERE user_id = %s;",
         [999],
+        row_factory=ROW_FACTORY,
     )
     assert result is None
 
@@ -148,20 +153,24 @@ def test_read_sessions_returns_all(
         999,
     )
     mock_db.execute.return_value = [
-        {
-            "session_id": test_case.session_id,
-            "session_start": test_case.session_start,
-            "user_id": test_case.user_id,
-        },
-        {
-            "session_id": test_case_2.session_id,
-            "session_start": test_case_2.session_start,
-            "user_id": test_case_2.user_id,
-        },
+        Session(
+            session_id=test_case.session_id,
+            session_start=test_case.session_start,
+            user_id=test_case.user_id,
+        ),
+        Session(
+            session_id=test_case_2.session_id,
+            session_start=test_case_2.session_start,
+            user_id=test_case_2.user_id,
+        ),
     ]
     repo = SessionRepository(mock_db)
     results = repo.read()
-    mock_db.execute.assert_called_once_with("SELECT * FROM sessions;", [])
+    mock_db.execute.assert_called_once_with(
+        "SELECT session_id, session_start, user_id FROM sessions;",
+        [],
+        row_factory=ROW_FACTORY,
+    )
     assert results == [test_case, test_case_2]
     assert results[0].session_id == 1
     assert results[0].user_id == 1
@@ -174,7 +183,11 @@ def test_read_no_sessions_returns_none(mock_db: MagicMock) -> None:
     mock_db.execute.return_value = []
     repo = SessionRepository(mock_db)
     result = repo.read()
-    mock_db.execute.assert_called_once_with("SELECT * FROM sessions;", [])
+    mock_db.execute.assert_called_once_with(
+        "SELECT session_id, session_start, user_id FROM sessions;",
+        [],
+        row_factory=ROW_FACTORY,
+    )
     assert result is None
 
 
@@ -222,3 +235,65 @@ def test_can_not_delete_sessions_by_invalid_user_id(mock_db: MagicMock) -> None:
         "DELETE FROM sessions WHERE user_id = %s RETURNING user_id;", [999]
     )
     assert result is False
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.mark.anyio
+async def test_async_create_session(mock_async_db: AsyncMock) -> None:
+    session_start = datetime(2020, 6, 23, 2, 10, 25, tzinfo=ZoneInfo("Etc/UTC"))
+    mock_async_db.execute.return_value = [{"session_id": 1}]
+    repo: AsyncSessionRepository = AsyncSessionRepository(mock_async_db)
+
+    result: Session | None = await repo.create(session_start, 1)
+
+    mock_async_db.execute.assert_awaited_once_with(
+        "INSERT INTO sessions (session_start, user_id) VALUES (%s, %s) RETURNING session_id;",
+        [session_start, 1],
+    )
+    assert result == Session(1, session_start, 1)
+
+
+@pytest.mark.anyio
+async def test_async_find_sessions_by_invalid_user_id(
+    mock_async_db: AsyncMock,
+) -> None:
+    mock_async_db.execute.return_value = []
+    repo: AsyncSessionRepository = AsyncSessionRepository(mock_async_db)
+
+    result: list[Session] | None = await repo.find_by_user_id(999)
+
+    mock_async_db.execute.assert_awaited_once_with(
+        "SELECT session_id, session_start, user_id FROM sessions WHERE user_id = %s;",
+        [999],
+        row_factory=ROW_FACTORY,
+    )
+    assert result is None
+
+
+def test_find_by_ids(mock_db: MagicMock) -> None:
+    mock_db.execute.return_value = None
+    repo = SessionRepository(mock_db)
+
+    assert repo.find_by_ids([2, 1]) == []
+    mock_db.execute.assert_called_once_with(
+        "SELECT session_id, session_start, user_id FROM sessions WHERE session_id = ANY(%s) ORDER BY session_id;",
+        [[2, 1]],
+        row_factory=ROW_FACTORY,
+    )
+
+
+@pytest.mark.anyio
+async def test_async_find_by_ids(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = ["row"]
+    repo = AsyncSessionRepository(mock_async_db)
+
+    assert await repo.find_by_ids((1, 2)) == ["row"]
+    mock_async_db.execute.assert_awaited_once_with(
+        "SELECT session_id, session_start, user_id FROM sessions WHERE session_id = ANY(%s) ORDER BY session_id;",
+        [[1, 2]],
+        row_factory=ROW_FACTORY,
+    )
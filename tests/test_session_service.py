@@ -1,14 +1,13 @@
 """Tests for SessionService class"""
 
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from models.session import Session
-from models.user import User
-from services.session import SessionService
+from services.session import AsyncSessionService, SessionService
 
 
 @pytest.fixture
@@ -30,13 +29,12 @@ def test_create_session(
     user_repo: MagicMock, session_repo: MagicMock, test_timestamp: datetime
 ) -> None:
     session_repo.create.return_value = Session(1, test_timestamp, 1)
-    user_repo.find_by_user_id.return_value = User(1, "Jake", "hashedpassword")
     session_service = SessionService(session_repo, user_repo)
 
     results = session_service.create_session(user_id=1)
 
     session_repo.create.assert_called_once()
-    user_repo.find_by_user_id.assert_called_once_with(1)
+    user_repo.find_by_user_id.assert_not_called()
     assert isinstance(results, Session)
     assert results.session_id == 1
     assert results.user_id == 1
@@ -45,7 +43,7 @@ def test_create_session(
 def test_can_not_create_session_invalid_user(
     user_repo: MagicMock, session_repo: MagicMock
 ) -> None:
-    user_repo.find_by_user_id.return_value = None
+    session_repo.create.side_effect = LookupError
     session_service = SessionService(session_repo, user_repo)
 
     with pytest.raises(ValueError, match="User does not exist"):
@@ -129,3 +127,26 @@ def test_can_not_delete_session_by_invalid_user_id(session_repo: MagicMock) -> N
     session_service = SessionService(session_repo, user_repo)
 
     assert session_service.delete_session_by_user_id(999) is False
+
+
+@pytest.mark.anyio
+async def test_async_create_session(test_timestamp: datetime) -> None:
+    session_repo, user_repo = AsyncMock(), AsyncMock()
+    session_repo.create.return_value = Session(1, test_timestamp, 1)
+    session_service = AsyncSessionService(session_repo, user_repo)
+
+    results = await session_service.create_session(user_id=1)
+
+    user_repo.find_by_user_id.assert_not_awaited()
+    session_repo.create.assert_awaited_once()
+    assert results == Session(1, test_timestamp, 1)
+
+
+@pytest.mark.anyio
+async def test_async_can_not_create_session_missing_user() -> None:
+    session_repo, user_repo = AsyncMock(), AsyncMock()
+    session_repo.create.side_effect = LookupError
+    session_service = AsyncSessionService(session_repo, user_repo)
+
+    with pytest.raises(ValueError, match="User does not exist"):
+        await session_service.create_session(user_id=999)
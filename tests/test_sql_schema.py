@@ -7,6 +7,7 @@ import pytest
 
 from db.database_configuration import DatabaseConfiguration
 from db.database_connection import DatabaseConnection
+from repositories.note_search import NoteSearchRepository
 
 
 @pytest.fixture
@@ -34,12 +35,25 @@ def db() -> DatabaseConnection:
         ["2020-06-22 19:10:25-07", 1],
     )
     db.execute(
-        "INSERT INTO actions (notes, inspection_id) VALUES (%s, %s);",
-        ["Added some feed", 1],
+        "INSERT INTO actions (notes, inspection_id, inspection_timestamp) VALUES (%s, %s, %s);",
+        ["Added some feed", 1, "2020-06-22 19:10:25-07"],
     )
     db.execute(
-        "INSERT INTO observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s);",
-        [True, 0, True, 6, 5, False, False, 10, 5, "Happy bees!", 1],
+        "INSERT INTO observations (queenright, queen_cells, bias, brood_frames, store_frames, chalk_brood, foul_brood, varroa_count, temper, notes, inspection_id, inspection_timestamp) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s);",
+        [
+            True,
+            0,
+            True,
+            6,
+            5,
+            False,
+            False,
+            10,
+            5,
+            "Happy bees!",
+            1,
+            "2020-06-22 19:10:25-07",
+        ],
     )
     return db
 
@@ -133,12 +147,177 @@ class TestSqlSchema:
                 "varroa_count": 10,
                 "temper": 5,
                 "notes": "Happy bees!",
+                "notes_tsv": "'bee':2 'happi':1",
                 "inspection_id": 1,
+                "inspection_timestamp": datetime.datetime(
+                    2020, 6, 23, 2, 10, 25, tzinfo=zoneinfo.ZoneInfo(key="Etc/UTC")
+                ),
             }
         ]
 
     def test_actions_table_seeded_correctly(self, db: DatabaseConnection) -> None:
         results = db.execute("SELECT * FROM actions;", [])
         assert results == [
-            {"action_id": 1, "notes": "Added some feed", "inspection_id": 1}
+            {
+                "action_id": 1,
+                "notes": "Added some feed",
+                "notes_tsv": "'ad':1 'feed':3",
+                "inspection_id": 1,
+                "inspection_timestamp": datetime.datetime(
+                    2020, 6, 23, 2, 10, 25, tzinfo=zoneinfo.ZoneInfo(key="Etc/UTC")
+                ),
+            }
         ]
+
+    def test_foreign_keys_and_lookups_indexed(self, db: DatabaseConnection) -> None:
+        results = db.execute(
+            "SELECT indexname FROM pg_indexes WHERE schemaname = 'public';", []
+        )
+        index_names = {row["indexname"] for row in results}
+        assert {
+            "users_username_key",
+            "sessions_user_id_session_id_idx",
+            "apiaries_user_id_apiary_id_idx",
+            "hives_apiary_id_hive_id_idx",
+            "colonies_hive_id_colony_id_idx",
+            "queens_colony_id_queen_id_idx",
+            "inspections_colony_id_inspection_timestamp_inspection_id_idx",
+            "observations_inspection_id_idx",
+            "actions_inspection_id_action_id_idx",
+            "observations_notes_tsv_idx",
+            "actions_notes_tsv_idx",
+        } <= index_names
+
+    def test_colony_states_kept_current(self, db: DatabaseConnection) -> None:
+        query = "SELECT colony_id, inspection_id, queenright, varroa_count, queen_colour, queen_clipped FROM colony_states ORDER BY colony_id;"
+        assert db.execute(query, []) == [
+            {
+                "colony_id": 1,
+                "inspection_id": 1,
+                "queenright": True,
+                "varroa_count": 10,
+                "queen_colour": "Yellow",
+                "queen_clipped": True,
+            }
+        ]
+
+        db.execute("UPDATE observations SET varroa_count = %s;", [25])
+        db.execute("DELETE FROM queens;", [])
+        assert db.execute(query, []) == [
+            {
+                "colony_id": 1,
+                "inspection_id": 1,
+                "queenright": True,
+                "varroa_count": 25,
+                "queen_colour": None,
+                "queen_clipped": None,
+            }
+        ]
+
+        db.execute("DELETE FROM inspections;", [])
+        db.execute("INSERT INTO colonies (hive_id) VALUES (%s);", [1])
+        assert db.execute(query, []) == [
+            {
+                "colony_id": colony_id,
+                "inspection_id": None,
+                "queenright": None,
+                "varroa_count": None,
+                "queen_colour": None,
+                "queen_clipped": None,
+            }
+            for colony_id in (1, 2)
+        ]
+
+    def test_colony_states_refreshed_per_statement(
+        self, db: DatabaseConnection
+    ) -> None:
+        row_triggers = "SELECT tgname FROM pg_trigger WHERE tgname LIKE '%%refresh_colony_state' AND tgtype & 1 = 1;"
+        assert db.execute(row_triggers, []) == []
+
+        db.execute(
+            "INSERT INTO inspections (inspection_timestamp, colony_id) VALUES (%s, %s), (%s, %s);",
+            ["2020-07-01 10:00:00+00", 1, "2020-07-08 10:00:00+00", 1],
+        )
+        assert db.execute(
+            "SELECT inspection_id, observation_id FROM colony_states;", []
+        ) == [{"inspection_id": 3, "observation_id": None}]
+
+    def test_inspections_partitioned_by_year(self, db: DatabaseConnection) -> None:
+        query = "SELECT tableoid::regclass::text AS partition FROM {} ORDER BY 1;"
+        assert db.execute(query.format("inspections"), []) == [
+            {"partition": "inspections_default"}
+        ]
+
+        db.execute("SELECT create_inspection_partitions(%s);", [2019])
+        db.execute(
+            "INSERT INTO inspections (inspection_timestamp, colony_id) VALUES (%s, %s);",
+            ["2019-05-01 10:00:00+00", 1],
+        )
+        db.execute(
+            "INSERT INTO actions (notes, inspection_id, inspection_timestamp) SELECT %s, inspection_id, inspection_timestamp FROM inspections WHERE inspection_id = %s;",
+            ["Added a super", 2],
+        )
+        assert db.execute(query.format("actions"), []) == [
+            {"partition": "actions_default"},
+            {"partition": "actions_y2019"},
+        ]
+
+        db.execute(
+            "UPDATE inspections SET inspection_timestamp = %s WHERE inspection_id = %s;",
+            ["2020-05-01 10:00:00+00", 2],
+        )
+        assert db.execute(query.format("actions"), []) == [
+            {"partition": "actions_default"},
+            {"partition": "actions_default"},
+        ]
+
+    def test_inspection_partitions_archived(self, db: DatabaseConnection) -> None:
+        db.execute("SELECT create_inspection_partitions(%s);", [2019])
+        db.execute(
+            "INSERT INTO inspections (inspection_timestamp, colony_id) VALUES (%s, %s);",
+            ["2019-05-01 10:00:00+00", 1],
+        )
+        db.execute("INSERT INTO colonies (hive_id) VALUES (%s);", [1])
+        db.execute(
+            "INSERT INTO inspections (inspection_timestamp, colony_id) VALUES (%s, %s);",
+            ["2019-06-01 10:00:00+00", 2],
+        )
+        db.execute("DROP SCHEMA IF EXISTS archive CASCADE;", [])
+
+        db.execute("SELECT archive_inspection_partitions(%s);", [2019])
+
+        assert db.execute("SELECT inspection_id FROM inspections;", []) == [
+            {"inspection_id": 1}
+        ]
+        assert db.execute(
+            "SELECT inspection_id FROM archive.inspections_y2019 ORDER BY 1;", []
+        ) == [{"inspection_id": 2}, {"inspection_id": 3}]
+        assert db.execute(
+            "SELECT colony_id, inspection_id FROM colony_states ORDER BY colony_id;", []
+        ) == [
+            {"colony_id": 1, "inspection_id": 1},
+            {"colony_id": 2, "inspection_id": None},
+        ]
+
+    def test_notes_searchable(self, db: DatabaseConnection) -> None:
+        repo = NoteSearchRepository(db)
+
+        matches = repo.search("feeding OR bee", "user_id", 1, limit=10)
+
+        assert sorted((match.kind, match.headline) for match in matches) == [
+            ("action", "Added some <b>feed</b>"),
+            ("observation", "Happy <b>bees</b>!"),
+        ]
+        assert repo.search("feed", "colony_id", 2, limit=10) == []
+        assert (
+            repo.search(
+                "feed",
+                "apiary_id",
+                1,
+                limit=10,
+                since=datetime.datetime(
+                    2021, 1, 1, tzinfo=zoneinfo.ZoneInfo("Etc/UTC")
+                ),
+            )
+            == []
+        )
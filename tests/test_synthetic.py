@@ -0,0 +1,106 @@
+"""Tests for SyntheticDataset class"""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from db.partitions import CREATE_QUERY
+from db.synthetic import (
+    ANALYZE_QUERY,
+    COPY_ACTIONS_QUERY,
+    COPY_INSPECTIONS_QUERY,
+    COPY_USERS_QUERY,
+    PASSWORD,
+    REFRESH_COLONY_STATES_QUERY,
+    TRUNCATE_QUERY,
+    Scale,
+    SyntheticDataset,
+)
+from utils.hashing import PasswordHasher
+
+SCALE = Scale(users=3, apiaries=5, hives=8, inspections=40)
+
+
+@pytest.fixture
+def dataset() -> SyntheticDataset:
+    return SyntheticDataset(SCALE, seed=7, first_year=2020, years=3)
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    db = MagicMock()
+    db.copy.side_effect = lambda _, rows: len(list(rows))
+    return db
+
+
+class TestSyntheticDataset:
+    def test_same_seed_same_rows(self, dataset: SyntheticDataset) -> None:
+        again = SyntheticDataset(SCALE, seed=7, first_year=2020, years=3)
+
+        assert list(dataset.users()) == list(again.users())
+        assert list(dataset.hives()) == list(again.hives())
+        assert list(dataset.observations()) == list(again.observations())
+        assert list(dataset.actions()) == list(again.actions())
+
+    def test_other_seed_other_rows(self, dataset: SyntheticDataset) -> None:
+        other = SyntheticDataset(SCALE, seed=8, first_year=2020, years=3)
+
+        assert list(dataset.inspections()) != list(other.inspections())
+
+    def test_row_counts_follow_scale(self, dataset: SyntheticDataset) -> None:
+        assert len(list(dataset.users())) == SCALE.users
+        assert len(list(dataset.apiaries())) == SCALE.apiaries
+        assert len(list(dataset.hives())) == SCALE.hives
+        assert len(list(dataset.colonies())) == SCALE.hives
+        assert len(list(dataset.queens())) == SCALE.hives
+        assert len(list(dataset.inspections())) == SCALE.inspections
+        assert len(list(dataset.observations())) == SCALE.inspections
+        assert 0 < len(list(dataset.actions())) < SCALE.inspections
+
+    def test_rows_refer_to_existing_parents(self, dataset: SyntheticDataset) -> None:
+        assert {row[2] for row in dataset.apiaries()} <= set(range(1, SCALE.users + 1))
+        assert {row[1] for row in dataset.hives()} <= set(range(1, SCALE.apiaries + 1))
+        assert {row[1] for row in dataset.inspections()} <= set(
+            range(1, SCALE.hives + 1)
+        )
+
+    def test_inspections_fall_in_the_years(self, dataset: SyntheticDataset) -> None:
+        for inspection_timestamp, _ in dataset.inspections():
+            assert datetime(2020, 1, 1, tzinfo=UTC) <= inspection_timestamp
+            assert inspection_timestamp < datetime(2023, 1, 1, tzinfo=UTC)
+
+    def test_children_carry_their_inspection_timestamp(
+        self, dataset: SyntheticDataset
+    ) -> None:
+        timestamps = [row[0] for row in dataset.inspections()]
+
+        for row in dataset.observations():
+            assert row[-1] == timestamps[row[-2] - 1]
+        for row in dataset.actions():
+            assert row[-1] == timestamps[row[-2] - 1]
+
+    def test_users_share_a_verifiable_password(self, dataset: SyntheticDataset) -> None:
+        passwords = {row[1] for row in dataset.users()}
+
+        assert len(passwords) == 1
+        assert PasswordHasher.verify(PASSWORD, passwords.pop())
+
+    def test_load(self, dataset: SyntheticDataset, mock_db: MagicMock) -> None:
+        counts = dataset.load(mock_db)
+
+        assert counts["users"] == SCALE.users
+        assert counts["observations"] == SCALE.inspections
+        mock_db.transaction.assert_called_once_with()
+        assert mock_db.execute.call_args_list[0] == call(
+            TRUNCATE_QUERY, [], prepare=False
+        )
+        for year in (2020, 2021, 2022):
+            mock_db.execute.assert_any_call(CREATE_QUERY, [year], prepare=False)
+        mock_db.execute.assert_any_call(REFRESH_COLONY_STATES_QUERY, [], prepare=False)
+        assert mock_db.execute.call_args_list[-1] == call(
+            ANALYZE_QUERY, [], prepare=False
+        )
+        copied = [c.args[0] for c in mock_db.copy.call_args_list]
+        assert copied[0] == COPY_USERS_QUERY
+        assert copied.index(COPY_INSPECTIONS_QUERY) < copied.index(COPY_ACTIONS_QUERY)
@@ -1,12 +1,13 @@
 """Tests for UserRepository class"""
 
 from collections.abc import Callable
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from psycopg.errors import UniqueViolation
 
 from models.user import User
-from repositories.user import UserRepository
+from repositories.user import ROW_FACTORY, AsyncUserRepository, UserRepository
 
 
 @pytest.fixture
@@ -63,18 +64,20 @@ def test_can_find_user_by_user_id(
     """Respository CAN FIND a single valid user in the database"""
     test_case: User = user_factory(user_id=1, username="test", password="password")
     mock_db.execute.return_value = [
-        {
-            "user_id": test_case.user_id,
-            "username": test_case.username,
-            "password": test_case.password,
-        }
+        User(
+            user_id=test_case.user_id,
+            username=test_case.username,
+            password=test_case.password,
+        )
     ]
     repo: UserRepository = UserRepository(db=mock_db)
 
     result: User | None = repo.find_by_user_id(user_id=1)
 
     mock_db.execute.assert_called_once_with(
-        "SELECT * FROM users WHERE user_id = %s LIMIT 1;", [1]
+        "SELECT user_id, username, password FROM users WHERE user_id = %s LIMIT 1;",
+        [1],
+        row_factory=ROW_FACTORY,
     )
     assert isinstance(result, User)
     assert result.user_id == test_case.user_id
@@ -90,7 +93,9 @@ def test_can_not_find_user_by_user_id(mock_db: MagicMock) -> None:
     result: User | None = repo.find_by_user_id(user_id=999)
 
     mock_db.execute.assert_called_once_with(
-        "SELECT * FROM users WHERE user_id = %s LIMIT 1;", [999]
+        "SELECT user_id, username, password FROM users WHERE user_id = %s LIMIT 1;",
+        [999],
+        row_factory=ROW_FACTORY,
     )
     assert result is None
 
@@ -101,18 +106,20 @@ def test_can_find_user_by_username(
     """Respository CAN FIND a single valid user in the database"""
     test_case: User = user_factory(user_id=1, username="test", password="password")
     mock_db.execute.return_value = [
-        {
-            "user_id": test_case.user_id,
-            "username": test_case.username,
-            "password": test_case.password,
-        }
+        User(
+            user_id=test_case.user_id,
+            username=test_case.username,
+            password=test_case.password,
+        )
     ]
     repo: UserRepository = UserRepository(db=mock_db)
 
     result: User | None = repo.find_by_username(username="test")
 
     mock_db.execute.assert_called_once_with(
-        "SELECT * FROM users WHERE username = %s LIMIT 1;", [test_case.username]
+        "SELECT user_id, username, password FROM users WHERE username = %s LIMIT 1;",
+        [test_case.username],
+        row_factory=ROW_FACTORY,
     )
     assert isinstance(result, User)
     assert result.user_id == test_case.user_id
@@ -128,7 +135,9 @@ def test_can_not_find_user_by_username(mock_db: MagicMock) -> None:
     result: User | None = repo.find_by_username(username="BADNAME")
 
     mock_db.execute.assert_called_once_with(
-        "SELECT * FROM users WHERE username = %s LIMIT 1;", ["BADNAME"]
+        "SELECT user_id, username, password FROM users WHERE username = %s LIMIT 1;",
+        ["BADNAME"],
+        row_factory=ROW_FACTORY,
     )
     assert result is None
 
@@ -140,22 +149,24 @@ def test_read_users_returns_all(
     test_case: User = user_factory(user_id=1, username="test", password="password")
     test_case_2: User = user_factory(user_id=2, username="test_2", password="password")
     mock_db.execute.return_value = [
-        {
-            "user_id": test_case.user_id,
-            "username": test_case.username,
-            "password": test_case.password,
-        },
-        {
-            "user_id": test_case_2.user_id,
-            "username": test_case_2.username,
-            "password": test_case_2.password,
-        },
+        User(
+            user_id=test_case.user_id,
+            username=test_case.username,
+            password=test_case.password,
+        ),
+        User(
+            user_id=test_case_2.user_id,
+            username=test_case_2.username,
+            password=test_case_2.password,
+        ),
     ]
 
     repo = UserRepository(mock_db)
     result = repo.read()
 
-    mock_db.execute.assert_called_once_with("SELECT * FROM users;", [])
+    mock_db.execute.assert_called_once_with(
+        "SELECT user_id, username, password FROM users;", [], row_factory=ROW_FACTORY
+    )
     assert result == [test_case, test_case_2]
 
 
@@ -164,7 +175,9 @@ def test_read_users_returns_none(mock_db: MagicMock) -> None:
     mock_db.execute.return_value = []
     repo = UserRepository(mock_db)
     result = repo.read()
-    mock_db.execute.assert_called_once_with("SELECT * FROM users;", [])
+    mock_db.execute.assert_called_once_with(
+        "SELECT user_id, username, password FROM users;", [], row_factory=ROW_FACTORY
+    )
     assert result is None
 
 
@@ -173,9 +186,7 @@ def test_can_update_valid_user(
 ) -> None:
     """Respository CAN UPDATE a single valid user in the database"""
     test_case: User = user_factory(user_id=1, username="test", password="password")
-    mock_db.execute.return_value = [
-        {"user_id": 1, "username": "UPDATED", "password": "password"}
-    ]
+    mock_db.execute.return_value = [{"user_id": 1}]
     repo = UserRepository(mock_db)
 
     result = repo.update(1, "UPDATED", "password")
@@ -202,6 +213,15 @@ def test_can_not_update_invalid_user(mock_db: MagicMock) -> None:
     assert result is None
 
 
+def test_taken_username_on_update_is_value_error(mock_db: MagicMock) -> None:
+    """Respository reports the username unique key rejecting an UPDATE as ValueError"""
+    mock_db.execute.side_effect = UniqueViolation()
+    repo = UserRepository(mock_db)
+
+    with pytest.raises(ValueError, match="Row already exists"):
+        repo.update(1, "taken", "password")
+
+
 def test_can_delete_valid_user(mock_db: MagicMock) -> None:
     """Respository CAN DELETE a single valid user in the database"""
     mock_db.execute.return_value = [1]
@@ -222,3 +242,77 @@ def test_can_not_delete_invalid_user(mock_db: MagicMock) -> None:
         "DELETE FROM users WHERE user_id = %s RETURNING user_id;", [999]
     )
     assert result is False
+
+
+@pytest.fixture
+def mock_async_db() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.mark.anyio
+async def test_async_create_valid_user(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = [{"user_id": 1}]
+    repo: AsyncUserRepository = AsyncUserRepository(db=mock_async_db)
+
+    result: User | None = await repo.create(username="test", password="password")
+
+    mock_async_db.execute.assert_awaited_once_with(
+        "INSERT INTO users (username, password) VALUES (%s, %s) RETURNING user_id;",
+        ["test", "password"],
+    )
+    assert result == User(1, "test", "password")
+
+
+@pytest.mark.anyio
+async def test_async_find_user_by_valid_username(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = [
+        User(user_id=1, username="test", password="password")
+    ]
+    repo: AsyncUserRepository = AsyncUserRepository(db=mock_async_db)
+
+    result: User | None = await repo.find_by_username("test")
+
+    mock_async_db.execute.assert_awaited_once_with(
+        "SELECT user_id, username, password FROM users WHERE username = %s LIMIT 1;",
+        ["test"],
+        row_factory=ROW_FACTORY,
+    )
+    assert result == User(1, "test", "password")
+
+
+@pytest.mark.anyio
+async def test_async_delete_invalid_user(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = []
+    repo: AsyncUserRepository = AsyncUserRepository(db=mock_async_db)
+
+    result: bool = await repo.delete(999)
+
+    mock_async_db.execute.assert_awaited_once_with(
+        "DELETE FROM users WHERE user_id = %s RETURNING user_id;", [999]
+    )
+    assert result is False
+
+
+def test_find_by_ids(mock_db: MagicMock) -> None:
+    mock_db.execute.return_value = None
+    repo = UserRepository(db=mock_db)
+
+    assert repo.find_by_ids([2, 1]) == []
+    mock_db.execute.assert_called_once_with(
+        "SELECT user_id, username, password FROM users WHERE user_id = ANY(%s) ORDER BY user_id;",
+        [[2, 1]],
+        row_factory=ROW_FACTORY,
+    )
+
+
+@pytest.mark.anyio
+async def test_async_find_by_ids(mock_async_db: AsyncMock) -> None:
+    mock_async_db.execute.return_value = ["row"]
+    repo = AsyncUserRepository(db=mock_async_db)
+
+    assert await repo.find_by_ids((1, 2)) == ["row"]
+    mock_async_db.execute.assert_awaited_once_with(
+        "SELECT user_id, username, password FROM users WHERE user_id = ANY(%s) ORDER BY user_id;",
+        [[1, 2]],
+        row_factory=ROW_FACTORY,
+    )
@@ -1,7 +1,7 @@
 """Tests for User API Routes"""
 
 from collections.abc import Generator
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -10,13 +10,14 @@ from main import app
 from schemas.user import UserRead
 from services.dependencies import get_user_service
 from services.user import UserService
+from utils.hashing_executor import HashingBusyError
 
 client: TestClient = TestClient(app)
 
 
 @pytest.fixture
-def mock_user_service() -> Generator[MagicMock]:
-    mock: MagicMock = MagicMock()
+def mock_user_service() -> Generator[AsyncMock]:
+    mock: AsyncMock = AsyncMock()
     app.dependency_overrides[get_user_service] = lambda: mock
     return mock
 
@@ -40,7 +41,7 @@ class TestUserRoutes:
     def test_can_create_user_with_valid_data(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.create_user = MagicMock(return_value=self.valid_user)
+        mock_user_service.create_user = AsyncMock(return_value=self.valid_user)
 
         response = client.post(
             "/users",
@@ -56,10 +57,49 @@ class TestUserRoutes:
             username="validuser", password="securepassword123"
         )
 
+    def test_create_user_when_hashing_is_busy(
+        self, mock_user_service: UserService
+    ) -> None:
+        mock_user_service.create_user = AsyncMock(
+            side_effect=HashingBusyError("Password hashing is busy, try again shortly")
+        )
+
+        response = client.post(
+            "/users",
+            json={
+                "username": self.valid_user.username,
+                "password": self.valid_user.password,
+            },
+        )
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert response.json() == {
+            "detail": "Password hashing is busy, try again shortly"
+        }
+
+    def test_update_user_when_hashing_is_busy(
+        self, mock_user_service: UserService
+    ) -> None:
+        mock_user_service.update_user = AsyncMock(
+            side_effect=HashingBusyError("Password hashing is busy, try again shortly")
+        )
+
+        response = client.post(
+            "/users/id/1",
+            json={
+                "username": self.valid_user.username,
+                "password": self.valid_user.password,
+            },
+        )
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+
     def test_can_not_create_user_with_duplicate_username(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.create_user = MagicMock(
+        mock_user_service.create_user = AsyncMock(
             side_effect=ValueError("Username taken")
         )
 
@@ -77,7 +117,7 @@ class TestUserRoutes:
     def test_can_not_create_user_when_service_returns_none(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.create_user = MagicMock(return_value=None)
+        mock_user_service.create_user = AsyncMock(return_value=None)
 
         response = client.post(
             "/users", json={"username": "validuser", "password": "validpassword123"}
@@ -92,7 +132,7 @@ class TestUserRoutes:
     def test_can_not_create_user_with_short_username(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.create_user = MagicMock(
+        mock_user_service.create_user = AsyncMock(
             side_effect=ValueError("Username invalid")
         )
 
@@ -105,7 +145,7 @@ class TestUserRoutes:
     def test_can_not_create_user_with_long_username(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.create_user = MagicMock(
+        mock_user_service.create_user = AsyncMock(
             side_effect=ValueError("Username invalid")
         )
 
@@ -121,7 +161,7 @@ class TestUserRoutes:
     def test_can_not_create_user_with_non_alphanumeric_username(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.create_user = MagicMock(
+        mock_user_service.create_user = AsyncMock(
             side_effect=ValueError("Username invalid")
         )
 
@@ -134,7 +174,7 @@ class TestUserRoutes:
     def test_can_not_create_user_with_short_password(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.create_user = MagicMock(
+        mock_user_service.create_user = AsyncMock(
             side_effect=ValueError("Username invalid")
         )
 
@@ -147,7 +187,7 @@ class TestUserRoutes:
     def test_can_find_user_by_valid_username(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.find_user_by_username = MagicMock(
+        mock_user_service.find_user_by_username = AsyncMock(
             return_value=self.valid_user
         )
 
@@ -162,7 +202,7 @@ class TestUserRoutes:
     def test_can_not_find_user_by_invalid_username(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.find_user_by_username = MagicMock(return_value=None)
+        mock_user_service.find_user_by_username = AsyncMock(return_value=None)
 
         response = client.get("/users/username/ghostuser")
 
@@ -172,7 +212,7 @@ class TestUserRoutes:
     def test_can_find_user_by_valid_user_id(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.find_user_by_user_id = MagicMock(return_value=self.valid_user)
+        mock_user_service.find_user_by_user_id = AsyncMock(return_value=self.valid_user)
 
         response = client.get("/users/id/1")
 
@@ -183,7 +223,7 @@ class TestUserRoutes:
     def test_can_not_find_user_by_invalid_user_id(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.find_user_by_user_id = MagicMock(return_value=None)
+        mock_user_service.find_user_by_user_id = AsyncMock(return_value=None)
 
         response = client.get("/users/id/999")
 
@@ -194,8 +234,8 @@ class TestUserRoutes:
         updated_user: UserRead = UserRead(
             user_id=1, username="updateduser", password="newpassword123"
         )
-        mock_user_service.update_user = MagicMock(return_value=updated_user)
-        mock_user_service.find_user_by_user_id = MagicMock(return_value=updated_user)
+        mock_user_service.update_user = AsyncMock(return_value=updated_user)
+        mock_user_service.find_user_by_user_id = AsyncMock(return_value=updated_user)
 
         response = client.post(
             "/users/id/1",
@@ -211,7 +251,7 @@ class TestUserRoutes:
     def test_can_not_update_user_with_invalid_data(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.update_user = MagicMock(
+        mock_user_service.update_user = AsyncMock(
             side_effect=ValueError("Invalid update")
         )
 
@@ -226,7 +266,7 @@ class TestUserRoutes:
     def test_can_not_update_nonexistent_user(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.update_user = MagicMock(return_value=None)
+        mock_user_service.update_user = AsyncMock(return_value=None)
 
         response = client.post(
             "/users/id/999",
@@ -237,7 +277,7 @@ class TestUserRoutes:
         assert response.json()["detail"] == "Update failed: does user exist?"
 
     def test_can_delete_existing_user(self, mock_user_service: UserService) -> None:
-        mock_user_service.delete_user = MagicMock(return_value=True)
+        mock_user_service.delete_user = AsyncMock(return_value=True)
 
         response = client.delete("/users/id/1")
 
@@ -248,7 +288,7 @@ class TestUserRoutes:
     def test_can_not_delete_nonexistent_user(
         self, mock_user_service: UserService
     ) -> None:
-        mock_user_service.delete_user = MagicMock(return_value=False)
+        mock_user_service.delete_user = AsyncMock(return_value=False)
 
         response = client.delete("/users/id/999")
 
@@ -1,11 +1,12 @@
 """Tests for UserService class"""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from models.user import User
-from services.user import UserService
+from services.user import AsyncUserService, UserService
+from utils.hashing import PasswordHasher
 
 
 @pytest.fixture
@@ -13,6 +14,19 @@ def mock_repo() -> MagicMock:
     return MagicMock()
 
 
+@pytest.fixture
+def mock_hasher() -> MagicMock:
+    hasher = MagicMock(rounds=4)
+    hasher.hash = AsyncMock(
+        side_effect=lambda password: PasswordHasher.hash(password, 4)
+    )
+    hasher.verify = AsyncMock(side_effect=PasswordHasher.verify)
+    hasher.needs_rehash.side_effect = lambda hashed: PasswordHasher.needs_rehash(
+        hashed, 4
+    )
+    return hasher
+
+
 def test_create_user(mock_repo: MagicMock) -> None:
     username = "Jake"
     password = "Avalidpasswordlongerthanten"
@@ -152,34 +166,36 @@ def test_can_not_find_user_by_invalid_username(mock_repo: MagicMock) -> None:
 
 
 def test_update_user(mock_repo: MagicMock) -> None:
-    mock_repo.find_by_user_id.return_value = User(1, "jake", "hashedpassword")
-    mock_repo.find_by_username.return_value = User(1, "jake", "hashedpassword")
-    mock_repo.update.return_value = User(1, "UPDATED", "hashedpassword")
+    mock_repo.update.return_value = User(1, "updated", "hashedpassword")
     user_service = UserService(mock_repo)
-    results = User(1, "Jake", "hashedpassword")
 
     results = user_service.update_user(
         user_id=1, username="UPDATED", password="hashedpassword"
     )
 
     assert results.user_id == 1
-    assert results.username == "UPDATED"
+    assert results.username == "updated"
     assert results.password == "hashedpassword"
+    mock_repo.find_by_user_id.assert_not_called()
+    mock_repo.find_by_username.assert_not_called()
+    mock_repo.update.assert_called_once()
 
 
 def test_can_not_update_user_with_invalid_user_id(mock_repo: MagicMock) -> None:
-    mock_repo.find_by_user_id.return_value = None
+    mock_repo.update.return_value = None
     user_service = UserService(mock_repo)
 
-    with pytest.raises(ValueError, match="User does not exist"):
-        user_service.update_user(
-            user_id=1, username="UPDATED", password="hashedpassword"
-        )
+    results = user_service.update_user(
+        user_id=1, username="UPDATED", password="hashedpassword"
+    )
+
+    assert results is None
 
 
 def test_can_not_update_user_username_taken(mock_repo: MagicMock) -> None:
-    mock_repo.find_by_user_id.return_value = User(1, "jake", "hashedpassword")
-    mock_repo.find_by_username.return_value = User(2, "AlreadyTaken", "hashedpassword")
+    mock_repo.update.side_effect = ValueError(
+        "Row already exists for users_username_key"
+    )
     user_service = UserService(mock_repo)
 
     with pytest.raises(ValueError, match="Username already taken"):
@@ -204,6 +220,60 @@ def test_can_not_update_user_password_invalid(mock_repo: MagicMock) -> None:
         user_service.update_user(user_id=1, username="jake", password="tooshort")
 
 
+def test_rejected_update_is_not_hashed(mock_repo: MagicMock) -> None:
+    user_service = UserService(mock_repo)
+
+    with patch.object(PasswordHasher, "hash") as hash_password:
+        with pytest.raises(ValueError, match="Username invalid"):
+            user_service.update_user(
+                user_id=1, username="taken!!", password="Avalidpasswordlongerthanten"
+            )
+        hash_password.assert_not_called()
+    mock_repo.update.assert_not_called()
+
+
+def test_authenticate(mock_repo: MagicMock) -> None:
+    hashed_password = PasswordHasher.hash("Avalidpassword", rounds=4)
+    mock_repo.find_by_username.return_value = User(1, "jake", hashed_password)
+    user_service = UserService(mock_repo, rounds=4)
+
+    user = user_service.authenticate("Jake", "Avalidpassword")
+
+    assert user == User(1, "jake", hashed_password)
+    mock_repo.find_by_username.assert_called_once_with(username="jake")
+    mock_repo.update.assert_not_called()
+
+
+def test_authenticate_wrong_password(mock_repo: MagicMock) -> None:
+    hashed_password = PasswordHasher.hash("Avalidpassword", rounds=4)
+    mock_repo.find_by_username.return_value = User(1, "jake", hashed_password)
+    user_service = UserService(mock_repo, rounds=4)
+
+    assert user_service.authenticate("jake", "Thewrongpassword") is None
+
+
+def test_authenticate_unknown_user(mock_repo: MagicMock) -> None:
+    mock_repo.find_by_username.return_value = None
+    user_service = UserService(mock_repo, rounds=4)
+
+    assert user_service.authenticate("nobody", "Avalidpassword") is None
+
+
+def test_authenticate_rehashes_when_cost_changes(mock_repo: MagicMock) -> None:
+    old_hash = PasswordHasher.hash("Avalidpassword", rounds=4)
+    mock_repo.find_by_username.return_value = User(1, "jake", old_hash)
+    user_service = UserService(mock_repo, rounds=5)
+
+    user = user_service.authenticate("jake", "Avalidpassword")
+
+    assert user is not None
+    assert user.password.startswith("$2b$05$")
+    assert PasswordHasher.verify("Avalidpassword", user.password) is True
+    mock_repo.update.assert_called_once_with(
+        user_id=1, username="jake", password=user.password
+    )
+
+
 def test_delete_user(mock_repo: MagicMock) -> None:
     mock_repo.delete.return_value = True
     user_service = UserService(mock_repo)
@@ -216,3 +286,94 @@ def test_can_not_delete_invalid_user(mock_repo: MagicMock) -> None:
     user_service = UserService(mock_repo)
 
     assert user_service.delete_user(999) is False
+
+
+@pytest.mark.anyio
+async def test_async_create_user(mock_hasher: MagicMock) -> None:
+    username = "Jake"
+    password = "Avalidpasswordlongerthanten"
+    mock_async_repo = AsyncMock()
+    mock_async_repo.find_by_username.return_value = None
+    mock_async_repo.create.return_value = User(1, "jake", "hashed")
+    user_service = AsyncUserService(mock_async_repo, mock_hasher)
+
+    results = await user_service.create_user(username=username, password=password)
+
+    mock_async_repo.find_by_username.assert_awaited_once_with(username="jake")
+    create_args = mock_async_repo.create.await_args.args
+    assert create_args[0] == "jake"
+    assert PasswordHasher.verify(password, create_args[1]) is True
+    assert results == User(1, "jake", "hashed")
+
+
+@pytest.mark.anyio
+async def test_async_update_user_does_not_exist(mock_hasher: MagicMock) -> None:
+    mock_async_repo = AsyncMock()
+    mock_async_repo.update.return_value = None
+    user_service = AsyncUserService(mock_async_repo, mock_hasher)
+
+    results = await user_service.update_user(
+        user_id=999, username="jake", password="Avalidpasswordlongerthanten"
+    )
+
+    assert results is None
+    mock_async_repo.find_by_user_id.assert_not_awaited()
+    mock_async_repo.update.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_async_update_user_username_taken(mock_hasher: MagicMock) -> None:
+    mock_async_repo = AsyncMock()
+    mock_async_repo.update.side_effect = ValueError(
+        "Row already exists for users_username_key"
+    )
+    user_service = AsyncUserService(mock_async_repo, mock_hasher)
+
+    with pytest.raises(ValueError, match="Username already taken"):
+        await user_service.update_user(
+            user_id=1, username="taken", password="Avalidpasswordlongerthanten"
+        )
+    mock_async_repo.find_by_username.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_async_rejected_create_is_not_hashed(mock_hasher: MagicMock) -> None:
+    mock_async_repo = AsyncMock()
+    mock_async_repo.find_by_username.return_value = User(1, "jake", "hashed")
+    user_service = AsyncUserService(mock_async_repo, mock_hasher)
+
+    with pytest.raises(ValueError, match="Username already taken"):
+        await user_service.create_user(
+            username="jake", password="Avalidpasswordlongerthanten"
+        )
+    mock_hasher.hash.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_async_authenticate_rehashes_when_cost_changes(
+    mock_hasher: MagicMock,
+) -> None:
+    old_hash = PasswordHasher.hash("Avalidpassword", rounds=5)
+    mock_async_repo = AsyncMock()
+    mock_async_repo.find_by_username.return_value = User(1, "jake", old_hash)
+    user_service = AsyncUserService(mock_async_repo, mock_hasher)
+
+    user = await user_service.authenticate("jake", "Avalidpassword")
+
+    assert user is not None
+    assert user.password.startswith("$2b$04$")
+    mock_async_repo.update.assert_awaited_once_with(
+        user_id=1, username="jake", password=user.password
+    )
+
+
+@pytest.mark.anyio
+async def test_async_authenticate_wrong_password(mock_hasher: MagicMock) -> None:
+    mock_async_repo = AsyncMock()
+    mock_async_repo.find_by_username.return_value = User(
+        1, "jake", PasswordHasher.hash("Avalidpassword", rounds=4)
+    )
+    user_service = AsyncUserService(mock_async_repo, mock_hasher)
+
+    assert await user_service.authenticate("jake", "Thewrongpassword") is None
+    mock_async_repo.update.assert_not_awaited()
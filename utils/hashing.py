@@ -6,10 +6,22 @@ import bcrypt
 class PasswordHasher:
     """Hashes and verifies passwords using Bcrypt"""
 
+    DEFAULT_ROUNDS: int = 12
+
     @classmethod
-    def hash(cls, password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    def hash(cls, password: str, rounds: int = DEFAULT_ROUNDS) -> str:
+        return bcrypt.hashpw(
+            password.encode("utf-8"), bcrypt.gensalt(rounds=rounds)
+        ).decode("utf-8")
 
     @classmethod
     def verify(cls, password: str, hashed_password: str) -> bool:
         return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    @classmethod
+    def needs_rehash(cls, hashed_password: str, rounds: int = DEFAULT_ROUNDS) -> bool:
+        """Returns True if the hash was made with a cost other than rounds"""
+        try:
+            return int(hashed_password.split("$")[2]) != rounds
+        except (IndexError, ValueError):
+            return True
@@ -0,0 +1,108 @@
+"""Runs password hashing in a bounded pool of worker processes"""
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+from dotenv import dotenv_values
+
+from utils.hashing import PasswordHasher
+
+T = TypeVar("T")
+
+
+class HashingBusyError(RuntimeError):
+    """Raised when every hashing worker is busy and the queue is full"""
+
+
+class HashingConfiguration:
+    def __init__(self, filename: str = ".env") -> None:
+        file_path: Path = Path(filename)
+
+        if file_path.exists():
+            config: dict[str, str | None] = dotenv_values(file_path)
+        else:
+            config: dict[str, str | None] = dict(os.environ)
+
+        self.rounds: int = int(
+            config.get("BCRYPT_ROUNDS") or PasswordHasher.DEFAULT_ROUNDS
+        )
+        self.workers: int = int(
+            config.get("HASHING_WORKERS") or min(4, os.cpu_count() or 1)
+        )
+        self.max_pending: int = int(
+            config.get("HASHING_MAX_PENDING") or self.workers * 4
+        )
+
+
+class HashingExecutor:
+    """
+    Hashes and verifies passwords off the event loop, in worker processes
+
+    Bcrypt is deliberately slow, CPU-bound work. Running it in processes keeps
+    it from holding the event loop or the GIL, and the pool bounds how many
+    cores it can take. At most max_pending jobs are accepted at once, queued
+    ones included; beyond that a call fails fast with HashingBusyError rather
+    than letting the backlog grow.
+    """
+
+    def __init__(self, config: HashingConfiguration) -> None:
+        self.config: HashingConfiguration = config
+        self.rounds: int = config.rounds
+        self.pool: ProcessPoolExecutor | None = None
+        self.pending: int = 0
+        self.busy = "Password hashing is busy, try again shortly"
+
+    def start(self) -> None:
+        """Create the worker pool. Workers are spawned on first use."""
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.config.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def close(self) -> None:
+        """Shut the worker pool down, waiting for running jobs to finish."""
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+
+    async def _run(self, func: Callable[..., T], *args: object) -> T:
+        if self.pending >= self.config.max_pending:
+            raise HashingBusyError(self.busy)
+        self.start()
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.pool, func, *args
+            )
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password at the configured cost
+
+        Raises:
+            HashingBusyError: if max_pending jobs are already in progress.
+
+        """
+        return await self._run(PasswordHasher.hash, password, self.rounds)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Check a password against a stored hash
+
+        Raises:
+            HashingBusyError: if max_pending jobs are already in progress.
+
+        """
+        return await self._run(PasswordHasher.verify, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Returns True if a stored hash was made at a different cost"""
+        return PasswordHasher.needs_rehash(hashed_password, self.rounds)
@@ -0,0 +1,7 @@
+"""Creates instances that can be shared across the codebase"""
+
+from utils.hashing_executor import HashingConfiguration, HashingExecutor
+
+# Worker processes are spawned on first use; main.lifespan shuts them down.
+hashing_config = HashingConfiguration(".env")
+hashing_executor = HashingExecutor(config=hashing_config)
@@ -0,0 +1,68 @@
+"""PageCursor utility class"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+
+class PageCursor:
+    """Encodes keyset pagination keys as opaque, URL-safe cursors"""
+
+    DEFAULT_LIMIT: int = 100
+    MAX_LIMIT: int = 1000
+    invalid_cursor: str = "Invalid cursor"
+
+    @classmethod
+    def encode(cls, *key: float | str | datetime) -> str:
+        values = [
+            value.isoformat() if isinstance(value, datetime) else value for value in key
+        ]
+        payload = json.dumps(values, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str, *types: type[int | float | str | datetime]) -> tuple:
+        """
+        Decode a cursor made by encode() back into its key
+
+        Args:
+            cursor: the opaque cursor
+            types: the type of each value in the key: int, float, str or datetime
+
+        Returns:
+            The key as a tuple of values of the given types
+
+        Raises:
+            ValueError: if the cursor is malformed or does not match the given types.
+
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (UnicodeError, binascii.Error, json.JSONDecodeError) as e:
+            raise ValueError(cls.invalid_cursor) from e
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cls.invalid_cursor)
+        return tuple(
+            cls._decode_value(value, t) for value, t in zip(values, types, strict=True)
+        )
+
+    @classmethod
+    def _decode_value(
+        cls, value: object, t: type[int | float | str | datetime]
+    ) -> int | float | str | datetime:
+        if t is datetime and isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError as e:
+                raise ValueError(cls.invalid_cursor) from e
+        # JSON true and false decode as bool, a subclass of int
+        number = isinstance(value, int | float) and not isinstance(value, bool)
+        if t is int and number and isinstance(value, int):
+            return value
+        if t is float and number:
+            return float(value)
+        if t is str and isinstance(value, str):
+            return value
+        raise ValueError(cls.invalid_cursor)